@@ -0,0 +1,86 @@
+"""
+Compare the binary result codec with the CLI's JSON path.
+
+Usage:
+    python benchmarks/bench_codec.py [paths...] [--repeat N]
+
+Without paths, every Python file of the ``codehem`` package and the
+TypeScript fixtures under ``tests/fixtures`` are used. Prints one JSON report
+with total encode/decode times and output sizes for both formats.
+"""
+import argparse
+import glob
+import json
+import os
+import time
+
+from codehem import CodeHem
+from codehem.models import codec
+from codehem.models.code_element import CodeElementsResult
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _default_paths():
+    paths = glob.glob(os.path.join(ROOT, 'codehem', '**', '*.py'), recursive=True)
+    paths += glob.glob(os.path.join(ROOT, 'tests', 'fixtures', 'typescript', '**', '*.txt'), recursive=True)
+    return sorted(paths)
+
+
+def _json_dumps(result):
+    # Same shape as ``codehem extract --raw-json``
+    return json.dumps([element.model_dump(exclude={'range': {'node'}}) for element in result.elements], default=str)
+
+
+def _json_loads(text):
+    return CodeElementsResult(elements=json.loads(text))
+
+
+def _timed(func, items, repeat):
+    best = float('inf')
+    out = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = [func(item) for item in items]
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='*', help='Source files (default: bundled corpus)')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement; the best is reported')
+    args = parser.parse_args()
+
+    results = []
+    for path in args.paths or _default_paths():
+        language = 'typescript' if path.endswith(('.ts', '.tsx', '.txt')) else 'python'
+        with open(path, encoding='utf8') as fh:
+            results.append(CodeHem(language).extract(fh.read()))
+
+    json_dump_s, json_blobs = _timed(_json_dumps, results, args.repeat)
+    json_load_s, _ = _timed(_json_loads, json_blobs, args.repeat)
+    bin_dump_s, bin_blobs = _timed(codec.dumps, results, args.repeat)
+    bin_load_s, _ = _timed(codec.loads, bin_blobs, args.repeat)
+    bin_load_fast_s, _ = _timed(lambda blob: codec.loads(blob, fast=True), bin_blobs, args.repeat)
+
+    report = {
+        'files': len(results),
+        'elements': sum(len(result.elements) for result in results),
+        'json': {
+            'dumps_s': round(json_dump_s, 4),
+            'loads_s': round(json_load_s, 4),
+            'bytes': sum(len(blob.encode('utf8')) for blob in json_blobs),
+        },
+        'binary': {
+            'dumps_s': round(bin_dump_s, 4),
+            'loads_s': round(bin_load_s, 4),
+            'loads_fast_s': round(bin_load_fast_s, 4),
+            'bytes': sum(len(blob) for blob in bin_blobs),
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
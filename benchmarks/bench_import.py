@@ -0,0 +1,51 @@
+"""
+Measure CodeHem start-up cost in fresh interpreters.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat N]
+
+Each scenario runs in a new ``python`` process N times and reports the median
+and best wall time in milliseconds, plus the number of ``codehem`` modules
+loaded. Scenarios: bare ``import codehem``, first Python-only use
+(``CodeHem('python')`` and one extraction), and loading every language.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_TEMPLATE = '''
+import sys, time
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+print(elapsed, len([m for m in sys.modules if m.startswith('codehem')]), 'rich' in sys.modules)
+'''
+
+SCENARIOS = {
+    'import': 'import codehem',
+    'python_first_use': "import codehem\ncodehem.CodeHem('python').extract('def f():\\n    return 1\\n')",
+    'all_languages': 'import codehem\ncodehem.core.registry.registry.initialize_components()',
+}
+
+
+def run(body: str, repeat: int):
+    times, modules, rich_loaded = [], 0, False
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', _TEMPLATE.format(body=body)], cwd=ROOT, check=True,
+                             capture_output=True, text=True).stdout.split()
+        times.append(float(out[0]) * 1000)
+        modules, rich_loaded = int(out[1]), out[2] == 'True'
+    return {'median_ms': round(statistics.median(times), 2), 'best_ms': round(min(times), 2),
+            'codehem_modules': modules, 'rich_imported': rich_loaded}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args()
+    print(json.dumps({name: run(body, args.repeat) for name, body in SCENARIOS.items()}, indent=2))
@@ -0,0 +1,25 @@
+"""
+End-to-end pipeline benchmark (same as ``codehem bench``).
+
+Usage:
+    python benchmarks/bench_pipeline.py [--corpus DIR ...] [--repeat N] [--output FILE] [--baseline FILE]
+
+Runs parse, extract, filter, get_text, apply_patch and Workspace indexing over
+``tests/fixtures`` plus synthetic large files and prints a JSON report with
+per-stage latency percentiles, files/sec and peak memory. With ``--baseline``
+the report includes a comparison and the exit status is 1 on regressions.
+"""
+import os
+import sys
+
+from codehem import cli
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+if __name__ == '__main__':
+    argv = sys.argv[1:]
+    if '--corpus' not in argv and '--compare' not in argv:
+        argv = ['--corpus', os.path.join(ROOT, 'tests', 'fixtures')] + argv
+    sys.argv = ['codehem', 'bench'] + argv
+    cli.main()
@@ -6,8 +6,8 @@ from .core.workspace import Workspace
 from .core.registry import registry
 from .core.post_processors.factory import PostProcessorFactory
 
-# Initialize all components
-registry.initialize_components()
+# Language components are registered lazily on first use (see codehem.core.manifest);
+# call registry.initialize_components() to load every language up front.
 
 __version__ = "1.0.0"
 __all__ = [
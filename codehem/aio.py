@@ -0,0 +1,301 @@
+"""
+Asyncio facade for CodeHem (``codehem.aio``).
+
+Extraction and patching are CPU-bound, so ``AsyncCodeHem`` runs them on an
+executor (the event loop's default thread pool unless one is given; process
+pools work too) and file reads and writes go through ``asyncio.to_thread``,
+keeping the event loop free:
+
+    hem = AsyncCodeHem('python')
+    result = await hem.extract(code)
+    ws = await AsyncWorkspace.open(repo_root)
+    await ws.apply_patch('pkg/mod.py', 'main[function]', new_code)
+
+Concurrent identical requests (same operation, content hash and arguments)
+are coalesced into a single computation whose result every caller receives,
+so results must be treated as read-only. Cancelling one caller does not
+cancel the computation the others are waiting for.
+"""
+import asyncio
+import functools
+import os
+import weakref
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from codehem.batch import _worker_hem
+from codehem.core.error_handling import BudgetExceededError, WriteConflictError
+from codehem.core.utils.budget import Budget
+from codehem.core.utils.hashing import sha1_code
+from codehem.core.utils.instrumentation import count
+from codehem.core.workspace import LOCK_POLL_INTERVAL, Workspace
+
+# Files extracted at once while a workspace is indexed
+DEFAULT_CONCURRENCY = 8
+
+# Event loop -> {request key: future of the computation serving it}
+_inflight: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future]]' = \
+    weakref.WeakKeyDictionary()
+
+
+def _call(language_code: str, hash_algorithm: str, method: str, *args: Any, **kwargs: Any) -> Any:
+    """Run ``CodeHem.<method>`` on the executor thread's (or process's) own instance."""
+    return getattr(_worker_hem(language_code, hash_algorithm), method)(*args, **kwargs)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def _request_key(operation: str, code: str, *args: Any, **kwargs: Any) -> Optional[Hashable]:
+    """Key identifying a request, or None if its arguments are not hashable."""
+    key = (operation, sha1_code(code), _freeze(args), frozenset((name, _freeze(value)) for name, value in kwargs.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _finished(inflight: Dict[Hashable, asyncio.Future], key: Hashable, future: asyncio.Future) -> None:
+    if inflight.get(key) is future:
+        del inflight[key]
+    if not future.cancelled():
+        future.exception()  # Mark the outcome as retrieved if every caller was cancelled
+
+
+async def _coalesced(key: Optional[Hashable], executor: Optional[Executor], fn: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Await ``fn(*args, **kwargs)`` on ``executor``, sharing a running computation with the same key."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(fn, *args, **kwargs)
+    if key is None:
+        return await loop.run_in_executor(executor, call)
+    inflight = _inflight.setdefault(loop, {})
+    future = inflight.get(key)
+    if future is None:
+        future = loop.run_in_executor(executor, call)
+        inflight[key] = future
+        future.add_done_callback(functools.partial(_finished, inflight, key))
+    else:
+        count('aio.coalesced')
+    return await asyncio.shield(future)
+
+
+class AsyncCodeHem:
+    """Async counterpart of ``CodeHem`` for one language."""
+
+    def __init__(self, language_code: str, hash_algorithm: str = 'sha256', executor: Optional[Executor] = None):
+        """
+        Args:
+            language_code: Language of the code handled by this instance
+            hash_algorithm: Algorithm for element hashes (see ``CodeHem``)
+            executor: Where CPU-bound work runs; None uses the event loop's
+                default executor. Each executor thread or process keeps its
+                own warm ``CodeHem``.
+        """
+        self.language_code = language_code.lower()
+        self.hash_algorithm = hash_algorithm
+        self.executor = executor
+
+    @classmethod
+    def from_file_path(cls, file_path: str, hash_algorithm: str = 'sha256',
+                       executor: Optional[Executor] = None) -> 'AsyncCodeHem':
+        """
+        Create an instance based on file extension.
+
+        Raises:
+            ValueError: If the file extension is not supported
+        """
+        from codehem.languages import get_language_for_file
+
+        language_code = get_language_for_file(file_path)
+        if language_code is None:
+            raise ValueError(f'Unsupported file extension: {os.path.splitext(file_path)[1]}')
+        return cls(language_code, hash_algorithm, executor)
+
+    async def _run(self, operation: str, code: str, *args: Any, **kwargs: Any) -> Any:
+        key = _request_key(operation, code, self.language_code, self.hash_algorithm, *args, **kwargs)
+        return await _coalesced(key, self.executor, _call, self.language_code, self.hash_algorithm,
+                                operation, code, *args, **kwargs)
+
+    async def extract(self, code: str, **options: Any):
+        """Async ``CodeHem.extract``; ``options`` are passed through."""
+        return await self._run('extract', code, **options)
+
+    async def get_text_by_xpath(self, code: str, xpath: str, return_hash: bool = False):
+        """Async ``CodeHem.get_text_by_xpath``."""
+        return await self._run('get_text_by_xpath', code, xpath, return_hash=return_hash)
+
+    async def find_by_xpath(self, code: str, xpath: str) -> Optional[Tuple[int, int]]:
+        """Async ``CodeHem.find_by_xpath``."""
+        return await self._run('find_by_xpath', code, xpath)
+
+    async def get_element_hash(self, code: str, xpath: str) -> Optional[str]:
+        """Async ``CodeHem.get_element_hash``."""
+        return await self._run('get_element_hash', code, xpath)
+
+    async def apply_patch(self, original_code: str, xpath: str, new_code: str, mode: str = 'replace',
+                          original_hash: Optional[str] = None, dry_run: bool = False,
+                          return_format: str = 'json') -> object:
+        """Async ``CodeHem.apply_patch`` (the code is patched in memory, nothing is written)."""
+        return await self._run('apply_patch', original_code, xpath, new_code, mode=mode,
+                               original_hash=original_hash, dry_run=dry_run, return_format=return_format)
+
+
+def _write_text(path: Path, text: str) -> None:
+    with open(path, 'w', encoding='utf8') as fh:
+        fh.write(text)
+
+
+def _list_files(root: Path):
+    return [path for path in root.rglob('*') if path.is_file()]
+
+
+class AsyncWorkspace:
+    """
+    Async counterpart of ``Workspace``.
+
+    The index lives in the wrapped ``Workspace`` (``self.workspace``); files
+    are read and written off the event loop and extracted on the executor.
+    Patches to a file are serialized by an ``asyncio.Lock`` within the process
+    and by the workspace's lock file across processes, which is polled with
+    ``asyncio.sleep`` rather than blocking. Files over ``budget`` are listed
+    in ``self.workspace.skipped``.
+    """
+
+    def __init__(self, root: str, executor: Optional[Executor] = None, hash_algorithm: str = 'sha256',
+                 budget: Optional[Budget] = None):
+        self.workspace = Workspace(root, budget)
+        self.executor = executor
+        self.hash_algorithm = hash_algorithm
+        self._hems: Dict[str, AsyncCodeHem] = {}
+        # Path -> (its lock, callers holding or waiting for it); dropped when unused
+        self._locks: Dict[Path, Tuple[asyncio.Lock, int]] = {}
+
+    @property
+    def root(self) -> Path:
+        return self.workspace.root
+
+    @property
+    def budget(self) -> Optional[Budget]:
+        return self.workspace.budget
+
+    @classmethod
+    async def open(cls, root: str, executor: Optional[Executor] = None,
+                   concurrency: int = DEFAULT_CONCURRENCY, budget: Optional[Budget] = None) -> 'AsyncWorkspace':
+        """Index every supported file under ``root``, extracting up to ``concurrency`` files at once."""
+        ws = cls(root, executor, budget=budget)
+        await ws._build_index(concurrency)
+        return ws
+
+    def _hem(self, path: Path) -> AsyncCodeHem:
+        hem = AsyncCodeHem.from_file_path(str(path), self.hash_algorithm, self.executor)
+        return self._hems.setdefault(hem.language_code, hem)
+
+    async def _extract(self, path: Path):
+        from codehem.main import CodeHem
+
+        hem = self._hem(path)
+        if self.budget is not None:
+            await asyncio.to_thread(self.budget.check_file, path)
+        code = await asyncio.to_thread(CodeHem.load_file_bytes, str(path))
+        return hem, await hem.extract(code, budget=self.budget)
+
+    async def _extract_within_budget(self, path: Path):
+        """``_extract``, or None (and a ``skipped`` entry) if ``path`` is over budget."""
+        current_file = str(path.relative_to(self.root))
+        try:
+            extracted = await self._extract(path)
+        except BudgetExceededError as e:
+            self.workspace.skipped[current_file] = str(e)
+            return None
+        self.workspace.skipped.pop(current_file, None)
+        return extracted
+
+    def _index(self, path: Path, hem: AsyncCodeHem, elements) -> bool:
+        # short_xpath only filters the result, any instance of the language will do
+        return self.workspace._index_file(path, _worker_hem(hem.language_code, hem.hash_algorithm), elements)
+
+    async def _build_index(self, concurrency: int) -> None:
+        from codehem.languages import get_language_for_file
+
+        self.workspace.index.clear()
+        self.workspace.file_hashes.clear()
+        self.workspace._file_keys.clear()
+        self.workspace.tables.clear()
+        self.workspace.skipped.clear()
+        paths = [path for path in await asyncio.to_thread(_list_files, self.root)
+                 if get_language_for_file(str(path)) is not None]
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def extract(path: Path):
+            async with semaphore:
+                return await self._extract_within_budget(path)
+
+        # Index in directory order, as Workspace does, so find() picks the same match
+        for path, extracted in zip(paths, await asyncio.gather(*(extract(path) for path in paths))):
+            if extracted is not None:
+                self._index(path, *extracted)
+
+    async def refresh(self, file_path: str) -> bool:
+        """Async ``Workspace.refresh``."""
+        path = self.root / file_path
+        if not await asyncio.to_thread(path.exists):
+            self.workspace._remove_file(str(path.relative_to(self.root)))
+            return True
+        extracted = await self._extract_within_budget(path)
+        if extracted is None:
+            return self.workspace._forget_file(str(path.relative_to(self.root)))
+        return self._index(path, *extracted)
+
+    async def find(self, name: str, kind: str) -> Optional[Tuple[str, str]]:
+        """Async ``Workspace.find`` (an index lookup; never blocks)."""
+        return self.workspace.find(name, kind)
+
+    @asynccontextmanager
+    async def _file_lock(self, path: Path):
+        lock, users = self._locks.get(path, (None, 0))
+        lock = lock or asyncio.Lock()
+        self._locks[path] = (lock, users + 1)
+        try:
+            async with lock:
+                lock_path = Workspace._lock_path(path)
+                while not Workspace._try_lock(lock_path):
+                    await asyncio.sleep(LOCK_POLL_INTERVAL)
+                try:
+                    yield
+                finally:
+                    Workspace._unlock(lock_path)
+        finally:
+            _, users = self._locks[path]
+            if users == 1:
+                del self._locks[path]
+            else:
+                self._locks[path] = (lock, users - 1)
+
+    async def apply_patch(self, file_path: str, xpath: str, new_code: str, *, mode: str = 'replace',
+                          original_hash: Optional[str] = None, on_conflict=None) -> object:
+        """Async ``Workspace.apply_patch``: patch, write and re-index ``file_path``."""
+        from codehem.main import CodeHem
+
+        abs_path = self.root / file_path
+        hem = self._hem(abs_path)
+        async with self._file_lock(abs_path):
+            # Load file content inside the lock to avoid race conditions
+            text = await asyncio.to_thread(CodeHem.load_file, str(abs_path))
+            try:
+                result = await hem.apply_patch(text, xpath, new_code, mode=mode, original_hash=original_hash)
+            except WriteConflictError as e:
+                if on_conflict:
+                    return on_conflict(e)
+                raise
+            await asyncio.to_thread(_write_text, abs_path, result['code'])
+            # Re-index inside the lock, so an older version never overwrites a newer one
+            self._index(abs_path, hem, await hem.extract(result['code']))
+        return result
@@ -0,0 +1,228 @@
+"""
+Batch extraction over many files (``CodeHem.extract_many``).
+
+Items are dispatched in chunks to a process (default) or thread pool. At most
+``2 * workers`` chunks are in flight, so memory stays bounded however many
+items the input iterable yields, and results stream back as a generator:
+
+    for outcome in CodeHem.extract_many(paths, workers=4):
+        if outcome.ok:
+            use(outcome.path, outcome.result)
+
+Each worker keeps one ``CodeHem`` per language, so language services,
+parsers and compiled queries are warmed once per worker rather than once per
+file. A file failing or exceeding its ``timeout`` or ``budget`` yields an
+outcome with ``error`` set instead of stopping the batch.
+"""
+import dataclasses
+import os
+import signal
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from codehem.core.error_handling import BudgetExceededError
+from codehem.core.utils.budget import Budget
+from codehem.core.utils.source_io import SourceCode, as_text
+
+DEFAULT_CHUNK_SIZE = 8
+
+# A path, or (name, code) / (name, code, language) for in-memory sources
+BatchItem = Union[str, 'os.PathLike[str]', Tuple[str, str], Tuple[str, str, Optional[str]]]
+
+
+@dataclass
+class ExtractOutcome:
+    """Result of one batch item."""
+    index: int
+    path: str
+    language: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ExtractTimeout(Exception):
+    """Raised inside a worker when a file exceeds its time limit."""
+
+
+_local = threading.local()
+
+
+def _worker_hem(language_code: str, hash_algorithm: str = 'sha256'):
+    """The worker's ``CodeHem`` for ``language_code`` (one per process, or per thread for thread pools)."""
+    from codehem.main import CodeHem
+
+    hems: Dict[Tuple[str, str], Any] = getattr(_local, 'hems', None)
+    if hems is None:
+        hems = _local.hems = {}
+    key = (language_code, hash_algorithm)
+    hem = hems.get(key)
+    if hem is None:
+        hem = hems[key] = CodeHem(language_code, hash_algorithm=hash_algorithm)
+    return hem
+
+
+def _load(item: BatchItem, budget: Optional[Budget]) -> Tuple[str, SourceCode, Optional[str]]:
+    from codehem.languages import detect_language, get_language_for_file
+    from codehem.main import CodeHem
+
+    if isinstance(item, tuple):
+        name, code = item[0], item[1]
+        language = item[2] if len(item) > 2 else None
+    else:
+        name = os.fspath(item)
+        if budget is not None:
+            budget.check_file(name)
+        # Bytes go to the parser as they are; only content detection needs text
+        code = CodeHem.load_file_bytes(name)
+        language = None
+    language = language or get_language_for_file(name) or detect_language(as_text(code))
+    return name, code, language
+
+
+def _on_alarm(signum, frame):
+    raise ExtractTimeout()
+
+
+def _arm(seconds: Optional[float]) -> Any:
+    """
+    Arm SIGALRM for ``seconds`` and return the previous handler.
+
+    Returns None where that is not possible (no timeout, threads, Windows).
+    """
+    if not seconds or not hasattr(signal, 'setitimer') or threading.current_thread() is not threading.main_thread():
+        return None
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    return previous if previous is not None else signal.SIG_DFL
+
+
+def _disarm(previous: Any) -> None:
+    if previous is not None:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _extract_one(index: int, item: BatchItem, timeout: Optional[float], options: Dict[str, Any]) -> ExtractOutcome:
+    start = time.perf_counter()
+    outcome = ExtractOutcome(index=index, path=os.fspath(item[0] if isinstance(item, tuple) else item))
+    previous = _arm(timeout)
+    try:
+        try:
+            outcome.path, code, outcome.language = _load(item, options.get('budget'))
+            if outcome.language is None:
+                outcome.error = 'unsupported_or_detection_failed'
+            else:
+                outcome.result = _worker_hem(outcome.language).extract(code, **options)
+        finally:
+            _disarm(previous)
+    except ExtractTimeout:
+        outcome.result, outcome.error = None, 'timeout'
+    except BudgetExceededError as e:
+        outcome.error = e.reason
+    except Exception as e:
+        outcome.error = str(e) or e.__class__.__name__
+    outcome.elapsed = time.perf_counter() - start
+    if timeout and outcome.error is None and outcome.elapsed > timeout:
+        # Finished after the deadline's last check
+        outcome.result, outcome.error = None, 'timeout'
+    return outcome
+
+
+def _extract_chunk(chunk: Sequence[Tuple[int, BatchItem]], timeout: Optional[float],
+                   options: Dict[str, Any]) -> List[ExtractOutcome]:
+    return [_extract_one(index, item, timeout, options) for index, item in chunk]
+
+
+def _chunks(items: Iterable[BatchItem], size: int) -> Iterator[List[Tuple[int, BatchItem]]]:
+    chunk: List[Tuple[int, BatchItem]] = []
+    for index, item in enumerate(items):
+        chunk.append((index, item))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def extract_many(items: Iterable[BatchItem], workers: Optional[int] = None, ordered: bool = True,
+                 executor: str = 'process', chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 timeout: Optional[float] = None, **options: Any) -> Iterator[ExtractOutcome]:
+    """
+    Extract many files, yielding one ``ExtractOutcome`` per item.
+
+    Args:
+        items: Paths, or ``(name, code)`` / ``(name, code, language)`` tuples
+            for in-memory sources. The language comes from the tuple, the
+            extension of the path/name, or content detection.
+        workers: Pool size (default: CPU count); 1 extracts in the calling thread
+        ordered: Yield outcomes in input order; otherwise as they complete
+        executor: 'process' or 'thread'
+        chunk_size: Items sent to a worker at a time
+        timeout: Per-file limit in seconds. It becomes the time limit of the
+            file's ``budget``, which parsing and extraction check
+            cooperatively; process workers (and the calling thread with
+            ``workers=1``) additionally interrupt the file with SIGALRM where
+            available.
+        **options: Passed to ``CodeHem.extract`` (e.g. ``fast``, ``level``,
+            ``types``, ``budget``). Files over ``budget`` yield the reason
+            ('timeout' or 'too_large') as ``error``.
+
+    Returns:
+        Generator of ``ExtractOutcome``; results of process workers are pickled
+        back, so ``node_retention`` other than 'none' only applies to threads.
+    """
+    if executor not in ('process', 'thread'):
+        raise ValueError(f"executor must be 'process' or 'thread', not {executor!r}")
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, chunk_size)
+    if timeout:
+        budget = options.get('budget') or Budget()
+        if budget.max_seconds is None or budget.max_seconds > timeout:
+            options['budget'] = dataclasses.replace(budget, max_seconds=timeout)
+    if workers <= 1:
+        for chunk in _chunks(items, chunk_size):
+            yield from _extract_chunk(chunk, timeout, options)
+        return
+    pool_cls = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+    with pool_cls(max_workers=workers) as pool:
+        yield from _dispatch(pool, _chunks(items, chunk_size), 2 * workers, ordered, timeout, options)
+
+
+def _dispatch(pool: Executor, chunks: Iterator[List[Tuple[int, BatchItem]]], max_in_flight: int,
+              ordered: bool, timeout: Optional[float], options: Dict[str, Any]) -> Iterator[ExtractOutcome]:
+    pending = {}
+    done_chunks: Dict[int, List[ExtractOutcome]] = {}
+    next_chunk = 0
+    submitted = 0
+    exhausted = False
+    while True:
+        # Completed-but-unyielded chunks count towards the window, so ordered
+        # mode cannot buffer without bound behind a slow chunk
+        while not exhausted and len(pending) + len(done_chunks) < max_in_flight:
+            chunk = next(chunks, None)
+            if chunk is None:
+                exhausted = True
+                break
+            pending[pool.submit(_extract_chunk, chunk, timeout, options)] = submitted
+            submitted += 1
+        if not pending:
+            break
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            number = pending.pop(future)
+            outcomes = future.result()
+            if not ordered:
+                yield from outcomes
+            else:
+                done_chunks[number] = outcomes
+        while next_chunk in done_chunks:
+            yield from done_chunks.pop(next_chunk)
+            next_chunk += 1
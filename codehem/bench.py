@@ -0,0 +1,309 @@
+"""
+Throughput benchmarks for CodeHem (``codehem bench``).
+
+Runs the main pipeline stages over a corpus of source files and reports
+per-stage latency percentiles, files/sec and peak memory as JSON:
+
+    parse       tree-sitter parse of each file
+    extract     ``CodeHem.extract``
+    filter      ``CodeHem.filter`` for the classes, methods and functions of each file
+    get_text    ``CodeHem.get_text_by_xpath`` for the same XPaths
+    apply_patch ``CodeHem.apply_patch`` replacing one element with its own text
+    workspace   ``Workspace.open`` over the whole corpus written to a temp dir
+
+The corpus is made of source files found under the given directories (the
+``## key: value`` headers of ``tests/fixtures`` files are stripped) plus
+optional synthetic large files. ``compare_reports`` diffs two reports and
+flags stages whose latency grew beyond a threshold.
+"""
+import gc
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+REPORT_VERSION = 1
+STAGES = ('parse', 'extract', 'filter', 'get_text', 'apply_patch', 'workspace')
+# Stages whose samples are one per file (files/sec is meaningful for them)
+_PER_FILE_STAGES = ('parse', 'extract', 'apply_patch')
+_SOURCE_EXTENSIONS = {'.py': 'python', '.ts': 'typescript', '.tsx': 'typescript', '.js': 'typescript',
+                      '.jsx': 'typescript'}
+_FIXTURE_LANGUAGES = ('python', 'typescript')
+
+
+@dataclass
+class BenchFile:
+    """One corpus entry."""
+    name: str
+    language: str
+    code: str
+
+
+def _fixture_language(path: str) -> Optional[str]:
+    parts = os.path.normpath(path).split(os.sep)
+    for language in _FIXTURE_LANGUAGES:
+        if language in parts:
+            return language
+    return None
+
+
+def load_corpus(directories: Iterable[str]) -> List[BenchFile]:
+    """
+    Collect benchmark files from ``directories``.
+
+    Regular source files are detected by extension; ``.txt`` fixtures are
+    taken from ``python``/``typescript`` fixture folders with their metadata
+    header removed.
+    """
+    files: List[BenchFile] = []
+    for directory in directories:
+        for root, _, names in os.walk(directory):
+            for name in sorted(names):
+                path = os.path.join(root, name)
+                ext = os.path.splitext(name)[1].lower()
+                language = _SOURCE_EXTENSIONS.get(ext)
+                if language is None and ext == '.txt':
+                    language = _fixture_language(path)
+                if language is None or name == '__init__.py':
+                    continue
+                with open(path, encoding='utf8', errors='replace') as fh:
+                    code = fh.read()
+                if ext == '.txt':
+                    code = '\n'.join(line for line in code.splitlines() if not line.startswith('## ')).strip() + '\n'
+                if code.strip():
+                    files.append(BenchFile(os.path.relpath(path, directory), language, code))
+    return files
+
+
+def synthetic_files(count: int = 2, lines: int = 2000) -> List[BenchFile]:
+    """Generate ``count`` large files (alternating Python and TypeScript) of roughly ``lines`` lines."""
+    files = []
+    for index in range(count):
+        language = 'python' if index % 2 == 0 else 'typescript'
+        out: List[str] = ['import os', ''] if language == 'python' else ["import { readFile } from 'fs';", '']
+        cls = 0
+        while len(out) < lines:
+            if language == 'python':
+                out += [f'class Synthetic{cls}:', f'    """Synthetic class {cls}."""', f'    value: int = {cls}', '']
+                for method in range(10):
+                    out += [f'    def method_{method}(self, x: int) -> int:', f'        y = x + {method}',
+                            '        return y * self.value', '']
+                out += [f'def helper_{cls}(a: int) -> int:', '    return a + 1', '', '']
+            else:
+                out += [f'export class Synthetic{cls} {{', f'    value: number = {cls};', '']
+                for method in range(10):
+                    out += [f'    method{method}(x: number): number {{', f'        const y = x + {method};',
+                            '        return y * this.value;', '    }', '']
+                out += ['}', '', f'export function helper{cls}(a: number): number {{', '    return a + 1;', '}', '']
+            cls += 1
+        files.append(BenchFile(f'synthetic_{index}.{"py" if language == "python" else "ts"}', language,
+                               '\n'.join(out) + '\n'))
+    return files
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(samples: Sequence[float], files: Optional[int] = None) -> Dict[str, Any]:
+    """Latency statistics (milliseconds) for a list of durations in seconds."""
+    ordered = sorted(samples)
+    total = sum(ordered)
+    stats = {
+        'count': len(ordered),
+        'total_s': round(total, 6),
+        'mean_ms': round(total / len(ordered) * 1000, 4) if ordered else 0.0,
+        'p50_ms': round(_percentile(ordered, 0.50) * 1000, 4),
+        'p90_ms': round(_percentile(ordered, 0.90) * 1000, 4),
+        'p99_ms': round(_percentile(ordered, 0.99) * 1000, 4),
+        'max_ms': round(ordered[-1] * 1000, 4) if ordered else 0.0,
+    }
+    if files is not None and total > 0:
+        stats['files_per_s'] = round(files / total, 2)
+    return stats
+
+
+def _peak_rss_kb() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _xpaths(result, limit: int) -> List[str]:
+    xpaths = []
+    for element in result.elements:
+        if element.is_class or element.is_interface:
+            xpaths.append(element.name)
+            xpaths.extend(f'{element.name}.{child.name}' for child in element.children if child.is_method)
+        elif element.is_function:
+            xpaths.append(element.name)
+    return xpaths[:limit]
+
+
+def _timed(func: Callable[[], Any], samples: List[float]) -> Any:
+    start = time.perf_counter()
+    value = func()
+    samples.append(time.perf_counter() - start)
+    return value
+
+
+def run_benchmarks(files: Sequence[BenchFile], repeat: int = 1, stages: Sequence[str] = STAGES,
+                   max_queries: int = 20, trace_memory: bool = False) -> Dict[str, Any]:
+    """
+    Benchmark ``stages`` over ``files`` and return a JSON-serializable report.
+
+    Args:
+        files: Corpus to run on
+        repeat: Number of passes over the corpus
+        stages: Subset of STAGES to run
+        max_queries: Maximum XPaths queried per file by filter/get_text
+        trace_memory: Also record the peak traced Python allocation of each stage
+            (tracemalloc slows everything down; latencies are then not comparable)
+    """
+    from codehem import CodeHem
+    from codehem.core.engine.languages import get_parser
+    from codehem.core.workspace import Workspace
+
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise ValueError(f'Unknown benchmark stage(s): {sorted(unknown)}')
+    hems = {language: CodeHem(language) for language in {f.language for f in files}}
+    samples: Dict[str, List[float]] = {stage: [] for stage in stages}
+    peaks: Dict[str, int] = {}
+
+    def stage_run(stage: str, body: Callable[[], None]) -> None:
+        if stage not in samples:
+            return
+        if trace_memory:
+            tracemalloc.start()
+        gc.collect()
+        body()
+        if trace_memory:
+            peaks[stage] = max(peaks.get(stage, 0), tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+    results: Dict[str, Any] = {}
+    queries: Dict[str, List[str]] = {}
+
+    for _ in range(repeat):
+        def parse():
+            for f in files:
+                code_bytes = f.code.encode('utf8')
+                _timed(lambda: get_parser(f.language).parse(code_bytes), samples['parse'])
+
+        def extract():
+            for f in files:
+                results[f.name] = _timed(lambda: hems[f.language].extract(f.code), samples['extract'])
+
+        stage_run('parse', parse)
+        if 'extract' in samples:
+            stage_run('extract', extract)
+        else:
+            for f in files:
+                results.setdefault(f.name, hems[f.language].extract(f.code))
+        for f in files:
+            queries[f.name] = _xpaths(results[f.name], max_queries)
+
+        def filter_stage():
+            for f in files:
+                for xpath in queries[f.name]:
+                    _timed(lambda: hems[f.language].filter(results[f.name], xpath), samples['filter'])
+
+        def get_text():
+            for f in files:
+                for xpath in queries[f.name]:
+                    _timed(lambda: hems[f.language].get_text_by_xpath(f.code, xpath), samples['get_text'])
+
+        def apply_patch():
+            for f in files:
+                targets = [x for x in queries[f.name] if '.' in x] or queries[f.name]
+                if not targets:
+                    continue
+                hem = hems[f.language]
+                text = hem.get_text_by_xpath(f.code, targets[0])
+                if text:
+                    _timed(lambda: hem.apply_patch(f.code, targets[0], text), samples['apply_patch'])
+
+        def workspace():
+            with tempfile.TemporaryDirectory(prefix='codehem-bench-') as root:
+                for index, f in enumerate(files):
+                    suffix = '.py' if f.language == 'python' else '.ts'
+                    with open(os.path.join(root, f'file_{index}{suffix}'), 'w', encoding='utf8') as fh:
+                        fh.write(f.code)
+                _timed(lambda: Workspace.open(root), samples['workspace'])
+
+        stage_run('filter', filter_stage)
+        stage_run('get_text', get_text)
+        stage_run('apply_patch', apply_patch)
+        stage_run('workspace', workspace)
+
+    stage_reports: Dict[str, Any] = {}
+    for stage in stages:
+        if stage == 'workspace':
+            stats = summarize(samples[stage])
+            if stats['total_s'] > 0:
+                stats['files_per_s'] = round(len(files) * len(samples[stage]) / stats['total_s'], 2)
+        else:
+            stats = summarize(samples[stage], len(samples[stage]) if stage in _PER_FILE_STAGES else None)
+        if stage in peaks:
+            stats['peak_alloc_kb'] = peaks[stage] // 1024
+        stage_reports[stage] = stats
+
+    from codehem import __version__
+    return {
+        'version': REPORT_VERSION,
+        'codehem_version': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'repeat': repeat,
+        'corpus': {
+            'files': len(files),
+            'lines': sum(f.code.count('\n') for f in files),
+            'bytes': sum(len(f.code.encode('utf8')) for f in files),
+        },
+        'stages': stage_reports,
+        'peak_rss_kb': _peak_rss_kb(),
+    }
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10,
+                    metric: str = 'p50_ms') -> Dict[str, Any]:
+    """
+    Compare two benchmark reports.
+
+    Args:
+        baseline: Earlier report
+        current: New report
+        threshold: Relative slowdown (0.10 = 10%) above which a stage is a regression
+        metric: Latency statistic compared per stage
+
+    Returns:
+        Dict with per-stage 'baseline', 'current' and relative 'change' of ``metric``
+        and the list of stages that regressed
+    """
+    stages: Dict[str, Any] = {}
+    regressions: List[str] = []
+    for stage, new_stats in current.get('stages', {}).items():
+        old_stats = baseline.get('stages', {}).get(stage)
+        if not old_stats or metric not in old_stats or metric not in new_stats:
+            continue
+        old, new = old_stats[metric], new_stats[metric]
+        change = (new - old) / old if old else 0.0
+        stages[stage] = {'baseline': old, 'current': new, 'change': round(change, 4)}
+        if change > threshold:
+            regressions.append(stage)
+    return {'metric': metric, 'threshold': threshold, 'stages': stages, 'regressions': regressions}
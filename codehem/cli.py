@@ -7,14 +7,22 @@ import json
 import logging
 import os
 import sys
-from typing import Any, Dict
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress
 
 from codehem import CodeHem
+from codehem.core.error_handling import BudgetExceededError
+from codehem.core.utils.budget import Budget
+from codehem.core.utils.instrumentation import span
+from codehem.core.utils.source_io import as_text
+from codehem.models import codec
 from codehem.languages import (
+    get_language_for_file,
     get_language_service_for_code,
     get_language_service_for_file,
 )
@@ -83,139 +91,235 @@ def _patch(
         console.print(Panel("Patch applied", style="green"))
 
 
-def main() -> None:
-    """Entry point for the ``codehem`` command."""
+def _to_dict(el: Any) -> Dict[str, Any]:
+    """Plain dict of an element (pydantic or not)."""
+    if hasattr(el, "model_dump"):
+        return el.model_dump()
+    if hasattr(el, "dict"):
+        return el.dict()
+    return dict(getattr(el, "__dict__", {}))
 
-    console = Console()
-    parser = argparse.ArgumentParser(description="CodeHem command-line interface")
-    parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
-    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
-    parser.add_argument("--quiet", action="store_true", help="Reduce logs to errors only")
-    sub = parser.add_subparsers(dest="command")
 
-    detect_p = sub.add_parser("detect", help="Detect language and show stats")
-    detect_p.add_argument("file", help="Source file path")
-    detect_p.add_argument("--raw-json", action="store_true", help="Output raw JSON")
+def _sanitize(obj: Any) -> Any:
+    """Make ``obj`` JSON serializable, dropping tree-sitter node references."""
+    if isinstance(obj, dict):
+        clean: Dict[str, Any] = {}
+        for k, v in obj.items():
+            if k == "node":
+                continue  # drop tree-sitter node references
+            clean[k] = _sanitize(v)
+        return clean
+    if isinstance(obj, list):
+        return [_sanitize(x) for x in obj]
+    if isinstance(obj, (str, int, float, bool)) or obj is None:
+        return obj
+    try:
+        json.dumps(obj)
+        return obj
+    except Exception:
+        return str(obj)
 
-    patch_p = sub.add_parser("patch", help="Apply patch to file")
-    patch_p.add_argument("target", help="Target file to modify")
-    patch_p.add_argument("--xpath", required=True, help="XPath to element")
-    patch_p.add_argument("--file", required=True, help="File containing new code")
-    patch_p.add_argument(
-        "--mode",
-        default="replace",
-        choices=["replace", "append", "prepend"],
-        help="Patch mode",
-    )
-    patch_p.add_argument("--dry-run", action="store_true", help="Preview diff only")
 
-    extract_p = sub.add_parser("extract", help="Extract code elements to JSON")
-    extract_p.add_argument("file", help="Source file or directory path")
-    extract_p.add_argument("--output", help="Output file (for aggregated results if --recursive)")
-    extract_p.add_argument("--raw-json", action="store_true", help="Output raw JSON (no progress UI)")
-    extract_p.add_argument("--summary", action="store_true", help="Only output counts (classes/functions/methods)")
-    extract_p.add_argument("--recursive", action="store_true", help="Scan directory recursively (requires path to be a directory)")
-    extract_p.add_argument(
-        "--ext",
-        action="append",
-        help="Limit to files with given extension(s); repeat or use comma-separated (e.g., --ext .py --ext .ts,.tsx)",
-    )
-    extract_p.add_argument(
-        "--ndjson",
-        action="store_true",
-        help="Emit one JSON object per line for each file (recursive mode)",
-    )
-    extract_p.add_argument(
-        "--out-dir",
-        help="Write per-file JSON outputs under this directory (recursive mode)",
-    )
+def _counts(elements_obj) -> Dict[str, int]:
+    """Count classes, functions and methods of an extraction result."""
+    # Compute basic counts (walks nested children for methods)
+    try:
+        classes = 0
+        functions = 0
+        methods = 0
 
-    args = parser.parse_args()
-    # Determine logging level
-    if getattr(args, "debug", False):
-        log_level = logging.DEBUG
-    elif getattr(args, "quiet", False):
-        log_level = logging.ERROR
-    elif getattr(args, "verbose", False):
-        log_level = logging.INFO
+        for e in elements_obj.elements:
+            et = getattr(e, "type", None)
+            ev = et.value if et else None
+            if ev == "class":
+                classes += 1
+                # count methods among children
+                try:
+                    for ch in getattr(e, "children", []) or []:
+                        ctype = getattr(ch, "type", None)
+                        if ctype and getattr(ctype, "value", None) == "method":
+                            methods += 1
+                except Exception:
+                    pass
+            elif ev == "function":
+                functions += 1
+            elif ev == "method":
+                methods += 1
+        return {"classes": classes, "functions": functions, "methods": methods}
+    except Exception:
+        return {"classes": 0, "functions": 0, "methods": 0}
+
+
+def _extract_file(
+    path: str, summary: bool = False, binary: bool = False, budget: Optional[Budget] = None
+) -> Dict[str, Any]:
+    """
+    Extract ``path`` into the record written by ``codehem extract``.
+
+    A file over ``budget`` yields ``{"path": ..., "skipped": reason}``.
+    """
+    try:
+        if budget is not None:
+            budget.check_file(path)
+        with span("io.read"):
+            content = CodeHem.load_file_bytes(path)
+        try:
+            # Route by extension; detect from content only for unknown extensions
+            language_code = get_language_for_file(path)
+            hem = CodeHem(language_code) if language_code else CodeHem.from_raw_code(as_text(content))
+        except Exception:
+            return {"path": path, "error": "unsupported_or_detection_failed"}
+        elements = hem.extract(content, budget=budget)
+    except BudgetExceededError as e:
+        return {"path": path, "skipped": str(e)}
+    with span("serialize"):
+        if summary:
+            return {"path": path, "summary": _counts(elements)}
+        elif binary:
+            return {"path": path, "binary": codec.dumps(elements)}
+        else:
+            raw_list = [_to_dict(e) for e in elements.elements]
+            return {"path": path, "elements": _sanitize(raw_list)}
+
+
+def _extract_file_safe(
+    path: str, summary: bool, binary: bool, timed: bool = False, budget: Optional[Budget] = None
+) -> Dict[str, Any]:
+    """
+    ``_extract_file`` for batch runs: failures become error records.
+
+    With ``timed`` the record carries its extraction time under ``_elapsed_s``.
+    """
+    start = time.perf_counter()
+    try:
+        result = _extract_file(path, summary, binary, budget)
+    except Exception as e:
+        result = {"path": path, "error": str(e) or e.__class__.__name__}
+    if timed:
+        result["_elapsed_s"] = time.perf_counter() - start
+    return result
+
+
+def _iter_source_files(root_dir: str, exts: Set[str]) -> Iterator[str]:
+    """Walk ``root_dir`` lazily, yielding files with one of ``exts`` (all files if empty)."""
+    for root, _, files in os.walk(root_dir):
+        for fname in files:
+            # Filter by extension if provided
+            if exts and os.path.splitext(fname)[1].lower() not in exts:
+                continue
+            yield os.path.join(root, fname)
+
+
+def _iter_extracted(
+    paths: Iterable[str],
+    jobs: int,
+    summary: bool,
+    binary: bool,
+    timed: bool = False,
+    budget: Optional[Budget] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield per-file results as soon as each file completes.
+
+    With ``jobs > 1`` files are extracted in a process pool that never has
+    more than ``2 * jobs`` files in flight, so memory stays flat and results
+    arrive in completion order.
+    """
+    if jobs <= 1:
+        for path in paths:
+            yield _extract_file_safe(path, summary, binary, timed, budget)
+        return
+    max_in_flight = 2 * jobs
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = set()
+        for path in paths:
+            pending.add(pool.submit(_extract_file_safe, path, summary, binary, timed, budget))
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in as_completed(pending):
+            yield future.result()
+
+
+def _bench(args: argparse.Namespace) -> None:
+    from codehem import bench
+
+    if args.compare:
+        with open(args.compare[0], encoding="utf8") as fh:
+            baseline = json.load(fh)
+        with open(args.compare[1], encoding="utf8") as fh:
+            current = json.load(fh)
+        comparison = bench.compare_reports(baseline, current, args.threshold)
+        print(json.dumps(comparison, indent=2))
+        sys.exit(1 if comparison["regressions"] else 0)
+
+    corpus_dirs = args.corpus
+    if corpus_dirs is None:
+        corpus_dirs = [d for d in (os.path.join("tests", "fixtures"),) if os.path.isdir(d)]
+    files = bench.load_corpus(corpus_dirs) + bench.synthetic_files(args.synthetic, args.synthetic_lines)
+    if not files:
+        print("No benchmark files found; pass --corpus or --synthetic", file=sys.stderr)
+        sys.exit(1)
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()] if args.stages else bench.STAGES
+    try:
+        report = bench.run_benchmarks(files, repeat=args.repeat, stages=stages, trace_memory=args.memory)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(2)
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf8") as fh:
+            report["comparison"] = bench.compare_reports(json.load(fh), report, args.threshold)
+        exit_code = 1 if report["comparison"]["regressions"] else 0
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf8") as fh:
+            fh.write(text + "\n")
     else:
-        log_level = logging.WARNING
-    logging.basicConfig(level=log_level)
+        print(text)
+    if exit_code:
+        sys.exit(exit_code)
+
 
+def _run_command(
+    args: argparse.Namespace,
+    parser: argparse.ArgumentParser,
+    console: Console,
+    file_times: Optional[List[Tuple[str, float]]] = None,
+) -> None:
+    """Run the parsed command; per-file times are appended to ``file_times`` when given."""
     if args.command == "detect":
         _detect(args.file, args.raw_json, console)
+    elif args.command == "serve":
+        from codehem.server import CodeHemServer
+
+        server = CodeHemServer(workspace_root=args.workspace)
+        if args.socket:
+            server.serve_unix_socket(args.socket)
+        else:
+            server.serve_stdio(sys.stdin, sys.stdout)
+    elif args.command == "bench":
+        _bench(args)
     elif args.command == "patch":
         _patch(args.target, args.xpath, args.file, args.mode, args.dry_run, console)
     elif args.command == "extract":
         if not os.path.exists(args.file):
             console.print(f"[bold red]Path not found:[/bold red] {args.file}")
             sys.exit(1)
-
-        def _to_dict(el: Any) -> Dict[str, Any]:
-            if hasattr(el, "model_dump"):
-                return el.model_dump()
-            if hasattr(el, "dict"):
-                return el.dict()
-            return dict(getattr(el, "__dict__", {}))
-
-        def _sanitize(obj: Any) -> Any:
-            if isinstance(obj, dict):
-                clean: Dict[str, Any] = {}
-                for k, v in obj.items():
-                    if k == "node":
-                        continue  # drop tree-sitter node references
-                    clean[k] = _sanitize(v)
-                return clean
-            if isinstance(obj, list):
-                return [_sanitize(x) for x in obj]
-            if isinstance(obj, (str, int, float, bool)) or obj is None:
-                return obj
-            try:
-                json.dumps(obj)
-                return obj
-            except Exception:
-                return str(obj)
-
-        def _counts(elements_obj) -> Dict[str, int]:
-            # Compute basic counts (walks nested children for methods)
-            try:
-                classes = 0
-                functions = 0
-                methods = 0
-
-                for e in elements_obj.elements:
-                    et = getattr(e, "type", None)
-                    ev = et.value if et else None
-                    if ev == "class":
-                        classes += 1
-                        # count methods among children
-                        try:
-                            for ch in getattr(e, "children", []) or []:
-                                ctype = getattr(ch, "type", None)
-                                if ctype and getattr(ctype, "value", None) == "method":
-                                    methods += 1
-                        except Exception:
-                            pass
-                    elif ev == "function":
-                        functions += 1
-                    elif ev == "method":
-                        methods += 1
-                return {"classes": classes, "functions": functions, "methods": methods}
-            except Exception:
-                return {"classes": 0, "functions": 0, "methods": 0}
-
-        def _extract_file(path: str) -> Dict[str, Any]:
-            content = CodeHem.load_file(path)
-            try:
-                hem = CodeHem.from_raw_code(content)
-            except Exception:
-                return {"path": path, "error": "unsupported_or_detection_failed"}
-            elements = hem.extract(content)
-            if args.summary:
-                return {"path": path, "summary": _counts(elements)}
-            else:
-                raw_list = [_to_dict(e) for e in elements.elements]
-                return {"path": path, "elements": _sanitize(raw_list)}
+        binary = args.format == "binary"
+        if binary and (args.summary or args.ndjson):
+            console.print("[bold red]--format binary cannot be combined with --summary or --ndjson[/bold red]")
+            sys.exit(1)
+        if binary and args.recursive and not args.out_dir:
+            console.print("[bold red]--format binary requires --out-dir in recursive mode[/bold red]")
+            sys.exit(1)
+        if binary and not args.recursive and not args.output and sys.stdout.isatty():
+            console.print("[bold red]--format binary needs --output or a redirected stdout, not a terminal[/bold red]")
+            sys.exit(1)
+        budget = None
+        if args.max_seconds is not None or args.max_bytes is not None:
+            budget = Budget(max_seconds=args.max_seconds, max_bytes=args.max_bytes)
 
         output_data: Dict[str, Any]
         if args.recursive and os.path.isdir(args.file):
@@ -232,48 +336,75 @@ def main() -> None:
                     exts.add(p)
 
             root_dir = os.path.abspath(args.file)
+            out_root = os.path.abspath(args.out_dir) if args.out_dir else None
+            if out_root:
+                os.makedirs(out_root, exist_ok=True)
+            ndjson_fh = None
+            if args.ndjson and not out_root:
+                ndjson_fh = open(args.output, "w", encoding="utf8") if args.output else sys.stdout
+            # Streaming modes only keep what the final output needs
+            keep_items = bool(args.output) if (out_root or ndjson_fh is not None) else True
             collected = []
-            for root, _, files in os.walk(args.file):
-                for fname in files:
-                    fpath = os.path.join(root, fname)
-                    # Filter by extension if provided
-                    if exts and os.path.splitext(fname)[1].lower() not in exts:
+            # Files over budget, reported instead of extracted
+            skipped = []
+            written = 0
+            try:
+                results = _iter_extracted(
+                    _iter_source_files(args.file, exts),
+                    args.jobs or os.cpu_count() or 1,
+                    args.summary,
+                    binary,
+                    file_times is not None,
+                    budget,
+                )
+                for result in results:
+                    elapsed = result.pop("_elapsed_s", None)
+                    if file_times is not None and elapsed is not None:
+                        file_times.append((result["path"], elapsed))
+                    # Skip files where detection failed
+                    if "error" in result:
                         continue
-                    try:
-                        result = _extract_file(fpath)
-                        # Skip files where detection failed
-                        if "error" in result:
-                            continue
-                        collected.append(result)
-                    except Exception:
+                    if "skipped" in result:
+                        skipped.append(result)
+                        if ndjson_fh is not None:
+                            ndjson_fh.write(json.dumps(result) + "\n")
+                            ndjson_fh.flush()
                         continue
+                    with span("io.write"):
+                        if out_root:
+                            rel = os.path.relpath(os.path.abspath(result["path"]), root_dir)
+                            if binary:
+                                out_path = os.path.join(out_root, rel + ".chb")
+                                os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                                with open(out_path, "wb") as f:
+                                    f.write(result.pop("binary"))
+                                result["output"] = out_path
+                            else:
+                                rel_json = rel + (".summary.json" if args.summary else ".json")
+                                out_path = os.path.join(out_root, rel_json)
+                                os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                                with open(out_path, "w", encoding="utf8") as f:
+                                    json.dump(result, f, indent=2)
+                        elif ndjson_fh is not None:
+                            ndjson_fh.write(json.dumps(result) + "\n")
+                            ndjson_fh.flush()
+                    written += 1
+                    if keep_items:
+                        collected.append(result)
+            finally:
+                if ndjson_fh is not None and ndjson_fh is not sys.stdout:
+                    ndjson_fh.close()
             # Handle output modes for recursive
-            if args.out_dir:
-                out_root = os.path.abspath(args.out_dir)
-                os.makedirs(out_root, exist_ok=True)
-                for item in collected:
-                    rel = os.path.relpath(item["path"], root_dir)
-                    rel_json = rel + (".summary.json" if args.summary else ".json")
-                    out_path = os.path.join(out_root, rel_json)
-                    os.makedirs(os.path.dirname(out_path), exist_ok=True)
-                    with open(out_path, "w", encoding="utf8") as f:
-                        json.dump(item, f, indent=2)
+            if out_root:
                 # When writing to out-dir, also print or save aggregate index if requested
                 if args.output:
                     with open(args.output, "w", encoding="utf8") as f:
                         json.dump({"files": collected}, f, indent=2)
                 output_data = {"files": collected}
-            elif args.ndjson:
-                # NDJSON to stdout or file
+            elif ndjson_fh is not None:
+                output_data = {"written": written, "format": "ndjson"}
                 if args.output:
-                    with open(args.output, "w", encoding="utf8") as f:
-                        for item in collected:
-                            f.write(json.dumps(item) + "\n")
-                    output_data = {"written": len(collected), "format": "ndjson", "path": args.output}
-                else:
-                    for item in collected:
-                        print(json.dumps(item))
-                    output_data = {"written": len(collected), "format": "ndjson"}
+                    output_data["path"] = args.output
             elif args.summary:
                 total = {"classes": 0, "functions": 0, "methods": 0}
                 for item in collected:
@@ -283,35 +414,191 @@ def main() -> None:
                 output_data = {"files": collected, "total": total}
             else:
                 output_data = {"files": collected}
+            if skipped:
+                output_data["skipped"] = skipped
         else:
             # Single file mode
+            start = time.perf_counter()
             if args.summary:
                 # No progress for summary
-                output_data = _extract_file(args.file)
-            elif args.raw_json or args.output:
-                output_data = _extract_file(args.file)
+                output_data = _extract_file(args.file, args.summary, binary, budget)
+            elif args.raw_json or args.output or binary:
+                output_data = _extract_file(args.file, args.summary, binary, budget)
             else:
                 # Progress UI for interactive single-file extraction
                 with Progress() as progress:
                     task = progress.add_task("[green]Extracting...", total=3)
                     progress.update(task, advance=1, description="[green]Creating instance...")
-                    output_data = _extract_file(args.file)
+                    output_data = _extract_file(args.file, args.summary, binary, budget)
                     progress.update(task, advance=2, description="[green]Done")
+            if file_times is not None:
+                file_times.append((args.file, time.perf_counter() - start))
 
         # Emit results
         # Emit final results if not already streamed via ndjson or out-dir
-        if not (args.recursive and (args.ndjson or args.out_dir)):
-            if args.output:
-                with open(args.output, "w", encoding="utf8") as f:
-                    json.dump(output_data, f, indent=2)
-            else:
-                if args.raw_json or args.summary or args.recursive:
-                    print(json.dumps(output_data, indent=2))
+        with span("io.write"):
+            if binary and not args.recursive:
+                if "binary" not in output_data:
+                    reason = output_data.get("error") or output_data.get("skipped")
+                    console.print(f"[bold red]Extraction failed:[/bold red] {reason}")
+                    sys.exit(1)
+                if args.output:
+                    with open(args.output, "wb") as f:
+                        f.write(output_data["binary"])
                 else:
-                    console.print_json(data=output_data)
+                    sys.stdout.buffer.write(output_data["binary"])
+                    sys.stdout.flush()
+            elif not (args.recursive and (args.ndjson or args.out_dir)):
+                if args.output:
+                    with open(args.output, "w", encoding="utf8") as f:
+                        json.dump(output_data, f, indent=2)
+                else:
+                    if args.raw_json or args.summary or args.recursive:
+                        print(json.dumps(output_data, indent=2))
+                    else:
+                        console.print_json(data=output_data)
     else:
         parser.print_help()
 
 
+def main() -> None:
+    """Entry point for the ``codehem`` command."""
+
+    console = Console()
+    parser = argparse.ArgumentParser(description="CodeHem command-line interface")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument("--quiet", action="store_true", help="Reduce logs to errors only")
+    sub = parser.add_subparsers(dest="command")
+
+    # Shared by detect, patch and extract
+    profile_opts = argparse.ArgumentParser(add_help=False)
+    profile_opts.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Run under cProfile; write pstats data to PATH and a JSON stage summary to <PATH stem>.summary.json",
+    )
+    profile_opts.add_argument(
+        "--profile-top",
+        type=int,
+        default=20,
+        help="Functions and slowest files listed in the profile summary (default: 20)",
+    )
+
+    detect_p = sub.add_parser("detect", help="Detect language and show stats", parents=[profile_opts])
+    detect_p.add_argument("file", help="Source file path")
+    detect_p.add_argument("--raw-json", action="store_true", help="Output raw JSON")
+
+    patch_p = sub.add_parser("patch", help="Apply patch to file", parents=[profile_opts])
+    patch_p.add_argument("target", help="Target file to modify")
+    patch_p.add_argument("--xpath", required=True, help="XPath to element")
+    patch_p.add_argument("--file", required=True, help="File containing new code")
+    patch_p.add_argument(
+        "--mode",
+        default="replace",
+        choices=["replace", "append", "prepend"],
+        help="Patch mode",
+    )
+    patch_p.add_argument("--dry-run", action="store_true", help="Preview diff only")
+
+    extract_p = sub.add_parser("extract", help="Extract code elements to JSON", parents=[profile_opts])
+    extract_p.add_argument("file", help="Source file or directory path")
+    extract_p.add_argument("--output", help="Output file (for aggregated results if --recursive)")
+    extract_p.add_argument("--raw-json", action="store_true", help="Output raw JSON (no progress UI)")
+    extract_p.add_argument("--summary", action="store_true", help="Only output counts (classes/functions/methods)")
+    extract_p.add_argument("--recursive", action="store_true", help="Scan directory recursively (requires path to be a directory)")
+    extract_p.add_argument(
+        "--ext",
+        action="append",
+        help="Limit to files with given extension(s); repeat or use comma-separated (e.g., --ext .py --ext .ts,.tsx)",
+    )
+    extract_p.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Emit one JSON object per line for each file (recursive mode)",
+    )
+    extract_p.add_argument(
+        "--out-dir",
+        help="Write per-file JSON outputs under this directory (recursive mode)",
+    )
+    extract_p.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Extract with N worker processes in recursive mode (0 = one per CPU); results stream in completion order",
+    )
+    extract_p.add_argument(
+        "--format",
+        default="json",
+        choices=["json", "binary"],
+        help="Result format; binary uses the compact codec (codehem.models.codec) and needs --output or a redirected stdout (--out-dir in recursive mode)",
+    )
+    extract_p.add_argument(
+        "--max-seconds",
+        type=float,
+        help="Time limit per file; slower files are reported as skipped instead of extracted",
+    )
+    extract_p.add_argument(
+        "--max-bytes",
+        type=int,
+        help="Size limit per file; larger files are reported as skipped without being read",
+    )
+
+    serve_p = sub.add_parser("serve", help="Serve JSON-RPC requests with warm caches")
+    serve_p.add_argument("--socket", help="Listen on this Unix socket path instead of stdio")
+    serve_p.add_argument("--workspace", help="Open a workspace rooted at this directory")
+
+    bench_p = sub.add_parser("bench", help="Benchmark pipeline stages and report latency as JSON")
+    bench_p.add_argument(
+        "--corpus",
+        action="append",
+        help="Directory of source files or fixtures to benchmark (repeatable; default: tests/fixtures)",
+    )
+    bench_p.add_argument("--synthetic", type=int, default=2, help="Number of synthetic large files to add")
+    bench_p.add_argument("--synthetic-lines", type=int, default=2000, help="Approximate lines per synthetic file")
+    bench_p.add_argument("--repeat", type=int, default=1, help="Passes over the corpus")
+    bench_p.add_argument("--stages", help="Comma-separated stages to run (default: all)")
+    bench_p.add_argument("--memory", action="store_true", help="Record per-stage peak allocations (slower)")
+    bench_p.add_argument("--output", help="Write the JSON report to this file")
+    bench_p.add_argument("--baseline", help="Compare the new report with this earlier report")
+    bench_p.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "CURRENT"),
+        help="Only compare two existing reports",
+    )
+    bench_p.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative p50 slowdown treated as a regression (default: 0.10)",
+    )
+
+    args = parser.parse_args()
+    # Determine logging level
+    if getattr(args, "debug", False):
+        log_level = logging.DEBUG
+    elif getattr(args, "quiet", False):
+        log_level = logging.ERROR
+    elif getattr(args, "verbose", False):
+        log_level = logging.INFO
+    else:
+        log_level = logging.WARNING
+    logging.basicConfig(level=log_level)
+
+    if getattr(args, "profile", None):
+        from codehem.profiling import run_profiled
+
+        file_times: List[Tuple[str, float]] = []
+        run_profiled(
+            lambda: _run_command(args, parser, console, file_times),
+            args.profile,
+            args.command,
+            top=args.profile_top,
+            file_times=file_times,
+        )
+    else:
+        _run_command(args, parser, console)
+
 if __name__ == "__main__":
     main()
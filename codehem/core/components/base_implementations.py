@@ -7,16 +7,26 @@ subclasses to provide concrete functionality.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+import threading
+from collections import OrderedDict
+from typing import Any, Collection, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 from abc import ABC, abstractmethod
 
-import rich
 
 from codehem.core.components.interfaces import (
     ICodeParser, ISyntaxTreeNavigator, IElementExtractor, IPostProcessor, IExtractionOrchestrator
 )
-from codehem.core.error_handling import handle_extraction_errors
+from codehem.core.error_handling import BudgetExceededError, handle_extraction_errors
+from codehem.core.utils.budget import check_deadline
+from codehem.core.utils.extraction_level import ExtractionLevel, current_level, extraction_level
+from codehem.core.utils.hashing import sha1_code
+from codehem.core.utils.source_io import SourceCode
+from codehem.core.utils.instrumentation import count, span
+from codehem.core.utils.merkle import build_merkle_tree
+from codehem.core.utils.node_retention import apply_node_retention
 from codehem.models.enums import CodeElementType
+from codehem.models.fast_element import fast_mode
+from codehem.models.source_buffer import SourceBuffer, use_source_buffer
 
 if TYPE_CHECKING:
     from codehem.models.code_element import CodeElement, CodeElementsResult
@@ -88,59 +98,59 @@ class BaseElementExtractor(IElementExtractor, ABC):
         """Get the language code this extractor is for."""
         return self._language_code
     
+    # Raw category -> (extraction method, lowest level extracting it), in extraction order
+    CATEGORIES: Dict[str, Tuple[str, ExtractionLevel]] = {
+        'imports': ('extract_imports', ExtractionLevel.OUTLINE),
+        'functions': ('extract_functions', ExtractionLevel.OUTLINE),
+        'classes': ('extract_classes', ExtractionLevel.OUTLINE),
+        'members': ('extract_methods', ExtractionLevel.MEMBERS),
+        'properties': ('extract_properties', ExtractionLevel.MEMBERS),
+        'static_properties': ('extract_static_properties', ExtractionLevel.MEMBERS),
+        'decorators': ('extract_decorators', ExtractionLevel.FULL),
+        'interfaces': ('extract_interfaces', ExtractionLevel.OUTLINE),
+        'enums': ('extract_enums', ExtractionLevel.OUTLINE),
+        'type_aliases': ('extract_type_aliases', ExtractionLevel.OUTLINE),
+        'namespaces': ('extract_namespaces', ExtractionLevel.OUTLINE),
+    }
+    # Categories whose entries only carry per-member analyses at the full level
+    DETAILED_CATEGORIES: Tuple[str, ...] = ('functions', 'members')
+
     @handle_extraction_errors
-    def extract_all(self, tree: Any, code_bytes: bytes) -> Dict[str, List[Dict]]:
+    def extract_all(self, tree: Any, code_bytes: bytes,
+                    reuse: Optional[Dict[str, List[Dict]]] = None,
+                    categories: Optional[Collection[str]] = None) -> Dict[str, List[Dict]]:
         """
         Extract all supported code elements from the provided syntax tree.
         
         Default implementation that combines results from individual extraction methods.
-        Subclasses may override for more efficient or specialized extraction.
+        Only the categories of the current extraction level are extracted
+        (see ``codehem.core.utils.extraction_level``).
         
         Args:
             tree: The syntax tree to extract from
             code_bytes: The original code as bytes
+            reuse: Categories already extracted for this tree at a sufficient
+                level; they are returned as is instead of being extracted again
+            categories: Raw categories to extract (all by default); see
+                ``codehem.core.utils.element_selection``
             
         Returns:
             Dictionary of element type to list of element data dictionaries
         """
-        logger.info(f'Starting raw extraction of all elements for {self.language_code}')
-        results = {'imports': self.extract_imports(tree, code_bytes)}
-        logger.debug(f"Raw extracted {len(results.get('imports', []))} import elements.")
-        
-        # Extract standalone functions
-        results['functions'] = self.extract_functions(tree, code_bytes)
-        logger.debug(f"Raw extracted {len(results.get('functions', []))} functions.")
-        
-        # Extract classes
-        results['classes'] = self.extract_classes(tree, code_bytes)
-        logger.debug(f"Raw extracted {len(results.get('classes', []))} classes.")
-        
-        # Extract methods
-        all_members = self.extract_methods(tree, code_bytes)
-        results['members'] = all_members
-        logger.debug(f'Raw extracted {len(all_members)} potential class members (methods/getters/setters).')
-        
-        # Extract properties
-        results['properties'] = self.extract_properties(tree, code_bytes)
-        logger.debug(f'Raw extracted {len(results.get("properties", []))} regular properties.')
-        
-        # Extract static properties
-        static_props = self.extract_static_properties(tree, code_bytes)
-        results['static_properties'] = static_props
-        logger.debug(f'Raw extracted {len(static_props)} static properties.')
-        
-        # Extract decorators
-        decorators = self.extract_decorators(tree, code_bytes)
-        results['decorators'] = decorators
-        logger.debug(f'Raw extracted {len(decorators)} decorators.')
-        
-        # Extract interfaces, enums, type aliases, namespaces if supported
-        for element_type in ['interfaces', 'enums', 'type_aliases', 'namespaces']:
-            extract_method = getattr(self, f'extract_{element_type}', None)
+        level = current_level()
+        logger.info(f'Starting raw extraction of {level.value} elements for {self.language_code}')
+        results: Dict[str, List[Dict]] = {}
+        for category, (method_name, min_level) in self.CATEGORIES.items():
+            if not level.includes(min_level) or (categories is not None and category not in categories):
+                continue
+            if reuse is not None and category in reuse:
+                results[category] = reuse[category]
+                continue
+            check_deadline(f'extract.{category}')
+            extract_method = getattr(self, method_name, None)
             if extract_method:
-                results[element_type] = extract_method(tree, code_bytes)
-                logger.debug(f"Raw extracted {len(results.get(element_type, []))} {element_type}.")
-        
+                results[category] = extract_method(tree, code_bytes)
+                logger.debug(f"Raw extracted {len(results[category])} {category}.")
         logger.info(f'Completed raw extraction for {self.language_code}. Collected types: {list(results.keys())}')
         return results
     
@@ -200,6 +210,32 @@ class BaseElementExtractor(IElementExtractor, ABC):
         """
         pass
 
+# Raw results of outline/members extractions by (extractor class, content
+# hash). Orchestrators are created per call, so the cache is shared at module
+# level. Each entry holds the parsed tree, the raw categories and the level
+# each category was extracted at, so a deeper request for the same code only
+# extracts what is missing. Full extractions consume the entry and are not
+# cached themselves.
+RAW_CACHE_SIZE = 16
+_raw_cache: 'OrderedDict[Tuple[type, str], Tuple[Any, bytes, Dict[str, List[Dict]], Dict[str, ExtractionLevel]]]' = OrderedDict()
+_raw_cache_lock = threading.Lock()
+
+
+def clear_raw_cache() -> None:
+    """Forget cached raw extraction results."""
+    with _raw_cache_lock:
+        _raw_cache.clear()
+
+
+def _copy_raw(value: Any) -> Any:
+    # Post-processors may annotate raw dicts; copy containers, share nodes and strings
+    if isinstance(value, dict):
+        return {key: _copy_raw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_raw(item) for item in value]
+    return value
+
+
 class BaseExtractionOrchestrator(IExtractionOrchestrator):
     """
     Base implementation of the IExtractionOrchestrator interface.
@@ -223,32 +259,99 @@ class BaseExtractionOrchestrator(IExtractionOrchestrator):
         self.extractor = extractor
         self.post_processor = post_processor
     
+    def _extract_raw(self, code: SourceCode, level: Union[ExtractionLevel, str] = ExtractionLevel.FULL,
+                     categories: Optional[Collection[str]] = None) -> Tuple[Any, bytes, Dict[str, List[Dict]]]:
+        """
+        Parse ``code`` and extract the raw categories of ``level`` (limited to
+        ``categories`` if given).
+        
+        Results below the full level are cached with the level of each
+        category: categories already extracted at a sufficient level (or that
+        do not depend on the level) are reused, so e.g. a full request after
+        an outline request reuses the tree and the top-level categories.
+        Returns a copy of the raw data that the caller may modify.
+        """
+        level = ExtractionLevel(level)
+        key = (type(self.extractor), sha1_code(code))
+        with _raw_cache_lock:
+            entry = _raw_cache.get(key)
+            if entry is not None:
+                _raw_cache.move_to_end(key)
+        if entry is None:
+            tree, code_bytes = self.parser.parse(code)
+            count('parse.bytes', len(code_bytes))
+            cached: Dict[str, List[Dict]] = {}
+            levels: Dict[str, ExtractionLevel] = {}
+        else:
+            tree, code_bytes, cached, levels = entry
+            count('extract.cache_hit')
+        detailed = getattr(self.extractor, 'DETAILED_CATEGORIES', ())
+        reuse = {category: items for category, items in cached.items()
+                 if category not in detailed or levels[category].includes(level)}
+        with extraction_level(level):
+            raw = self.extractor.extract_all(tree, code_bytes, reuse=reuse, categories=categories)
+        if level is ExtractionLevel.FULL:
+            # Nothing left to upgrade
+            if entry is None:
+                return tree, code_bytes, raw
+            with _raw_cache_lock:
+                _raw_cache.pop(key, None)
+            return tree, code_bytes, _copy_raw(raw)
+        cached = {**cached, **raw}
+        levels = {**levels, **{category: level for category in raw if category not in reuse}}
+        with _raw_cache_lock:
+            _raw_cache[key] = (tree, code_bytes, cached, levels)
+            _raw_cache.move_to_end(key)
+            while len(_raw_cache) > RAW_CACHE_SIZE:
+                _raw_cache.popitem(last=False)
+        return tree, code_bytes, _copy_raw(raw)
+    
     @handle_extraction_errors
-    def extract_all(self, code: str) -> 'CodeElementsResult':
+    def extract_all(self, code: SourceCode, lazy_content: bool = False, fast: bool = False,
+                    node_retention: str = 'none', level: str = 'full',
+                    categories: Optional[Collection[str]] = None) -> 'CodeElementsResult':
         """
         Extract all code elements from the provided code.
         
+        Post-processing runs on the slotted fast element model; the result is
+        converted to pydantic models at the end unless ``fast`` is set.
+        
         Args:
-            code: Source code as string
+            code: Source code as string or UTF-8 bytes (parsed as is)
+            lazy_content: Keep byte spans into a shared source buffer instead of
+                per-element content copies; content is decoded on first access.
+                Lazy elements are pydantic models, so this bypasses the fast model.
+            fast: Return the FastCodeElementsResult as is
+            node_retention: 'none', 'weak' or 'full'; see ``codehem.core.utils.node_retention``
+            level: 'outline', 'members' or 'full'; see ``codehem.core.utils.extraction_level``
+            categories: Raw categories to extract (all by default); see
+                ``codehem.core.utils.element_selection``
             
         Returns:
-            CodeElementsResult containing extracted elements
+            CodeElementsResult (or FastCodeElementsResult) containing extracted elements
         """
         from codehem.models.code_element import CodeElementsResult
         
         logger.info(f'ExtractionOrchestrator: Starting extraction for {self.language_code}')
         try:
-            # Parse the code
-            tree, code_bytes = self.parser.parse(code)
-            
-            # Extract raw elements
-            raw_elements = self.extractor.extract_all(tree, code_bytes)
+            # Parse the code and extract raw elements
+            tree, code_bytes, raw_elements = self._extract_raw(code, level, categories)
             
             # Post-process elements
-            result = self.post_processor.process_all(raw_elements)
+            use_fast_model = not lazy_content
+            with fast_mode(use_fast_model), use_source_buffer(SourceBuffer(code_bytes) if lazy_content else None):
+                result = self.post_processor.process_all(raw_elements)
+            build_merkle_tree(result)
+            apply_node_retention(result, node_retention)
+            if use_fast_model and not fast and hasattr(result, 'to_model'):
+                with span('to_model'):
+                    result = result.to_model()
+            count('elements', len(result.elements))
             
             logger.info(f'ExtractionOrchestrator: Completed extraction for {self.language_code}')
             return result
+        except BudgetExceededError:
+            raise
         except Exception as e:
             logger.error(f'Error during extract_all for {self.language_code}: {e}', exc_info=True)
             # Return empty result on error
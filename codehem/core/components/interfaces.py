@@ -9,6 +9,8 @@ enabling cleaner separation of concerns and better modularity.
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
+from codehem.core.utils.source_io import SourceCode
+
 if TYPE_CHECKING:
     from codehem.models.code_element import CodeElement, CodeElementsResult
 
@@ -21,12 +23,12 @@ class ICodeParser(ABC):
     """
     
     @abstractmethod
-    def parse(self, code: str) -> Tuple[Any, bytes]:
+    def parse(self, code: SourceCode) -> Tuple[Any, bytes]:
         """
         Parse source code into a syntax tree.
         
         Args:
-            code: Source code as string
+            code: Source code as string or UTF-8 bytes
             
         Returns:
             Tuple of (syntax_tree, code_bytes) where syntax_tree is the parsed tree
@@ -250,12 +252,12 @@ class IExtractionOrchestrator(ABC):
     """
     
     @abstractmethod
-    def extract_all(self, code: str) -> 'CodeElementsResult':
+    def extract_all(self, code: SourceCode) -> 'CodeElementsResult':
         """
         Extract all code elements from the provided code.
         
         Args:
-            code: Source code as string
+            code: Source code as string or UTF-8 bytes
             
         Returns:
             CodeElementsResult containing extracted elements
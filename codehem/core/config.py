@@ -20,7 +20,9 @@ class Configuration:
         self._config = {
             'extraction': {
                 'prefer_tree_sitter': True,
-                'fallback_to_regex': True,
+                # never | parse_error | error_regions (see codehem.core.extractors.regex_fallback)
+                'regex_fallback': 'error_regions',
+                'regex_fallback_timeout': 0.05,
                 'cache_results': False,
                 'cache_size': 100
             },
@@ -0,0 +1,140 @@
+"""
+Structural (element-level) diff between two extraction results.
+
+Elements are matched level by level on their type and name. Subtrees whose
+Merkle digests agree are skipped without comparing any text, siblings that
+changed order are found with a longest-increasing-subsequence pass, and an
+element removed in one place and added with an identical digest elsewhere is
+reported as moved. The whole diff runs in O(n log n) in the number of elements.
+"""
+import logging
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+from codehem.models.code_element import CodeElement, CodeElementsResult
+from codehem.models.diff import ElementChange, ElementChangeType
+from codehem.models.enums import CodeElementType
+
+logger = logging.getLogger(__name__)
+
+# Children that describe an element rather than being elements of their own;
+# changes to them surface as a modification of the owning element.
+_DETAIL_TYPES = {
+    CodeElementType.PARAMETER,
+    CodeElementType.RETURN_VALUE,
+    CodeElementType.DECORATOR,
+    CodeElementType.ANNOTATION,
+    CodeElementType.ATTRIBUTE,
+    CodeElementType.DOC_COMMENT,
+    CodeElementType.TYPE_HINT,
+    CodeElementType.DOCSTRING,
+    CodeElementType.META_ELEMENT,
+}
+
+_Key = Tuple[str, str, int]
+
+
+def _keyed(elements: List[CodeElement]) -> Dict[_Key, CodeElement]:
+    """Map structural elements to (type, name, occurrence) keys, preserving order."""
+    keyed: Dict[_Key, CodeElement] = {}
+    seen: Dict[Tuple[str, str], int] = defaultdict(int)
+    for element in elements:
+        if element.type in _DETAIL_TYPES:
+            continue
+        base = (element.type.value, element.name)
+        keyed[base + (seen[base],)] = element
+        seen[base] += 1
+    return keyed
+
+
+def _xpath(prefix: str, element: CodeElement) -> str:
+    return f'{prefix}.{element.name}[{element.type.value}]'
+
+
+def _stable_positions(sequence: List[int]) -> Set[int]:
+    """Indices of ``sequence`` forming a longest increasing subsequence."""
+    tails: List[int] = []
+    tail_indices: List[int] = []
+    previous = [-1] * len(sequence)
+    for i, value in enumerate(sequence):
+        pos = bisect_left(tails, value)
+        if pos == len(tails):
+            tails.append(value)
+            tail_indices.append(i)
+        else:
+            tails[pos] = value
+            tail_indices[pos] = i
+        previous[i] = tail_indices[pos - 1] if pos > 0 else -1
+    stable: Set[int] = set()
+    i = tail_indices[-1] if tail_indices else -1
+    while i != -1:
+        stable.add(i)
+        i = previous[i]
+    return stable
+
+
+def _diff_level(old_children: List[CodeElement], new_children: List[CodeElement], old_prefix: str, new_prefix: str,
+                changes: List[ElementChange], removed: list, added: list) -> None:
+    old_map = _keyed(old_children)
+    new_map = _keyed(new_children)
+    old_positions = {key: i for i, key in enumerate(old_map)}
+    matched = [key for key in new_map if key in old_map]
+    stable = _stable_positions([old_positions[key] for key in matched])
+
+    for pos, key in enumerate(matched):
+        old_el, new_el = old_map[key], new_map[key]
+        old_xpath, new_xpath = _xpath(old_prefix, old_el), _xpath(new_prefix, new_el)
+        if old_el.merkle_hash == new_el.merkle_hash:
+            if pos not in stable:
+                changes.append(ElementChange(change_type=ElementChangeType.MOVED, xpath=new_xpath, old_xpath=old_xpath,
+                                             element_type=new_el.type, old_range=old_el.range, new_range=new_el.range))
+            continue
+        changes.append(ElementChange(change_type=ElementChangeType.MODIFIED, xpath=new_xpath, old_xpath=old_xpath,
+                                     element_type=new_el.type, old_range=old_el.range, new_range=new_el.range))
+        _diff_level(old_el.children, new_el.children, old_xpath, new_xpath, changes, removed, added)
+
+    removed.extend((_xpath(old_prefix, el), el) for key, el in old_map.items() if key not in new_map)
+    added.extend((_xpath(new_prefix, el), el) for key, el in new_map.items() if key not in old_map)
+
+
+def diff_results(old: CodeElementsResult, new: CodeElementsResult) -> List[ElementChange]:
+    """
+    Compute element-level changes between two extraction results.
+
+    Args:
+        old: Extraction result of the original version
+        new: Extraction result of the updated version
+
+    Returns:
+        List of ElementChange objects (added, removed, moved or modified). A modified
+        container is listed together with the changes of its members.
+    """
+    if old.merkle_root == new.merkle_root:
+        return []
+    changes: List[ElementChange] = []
+    removed: list = []
+    added: list = []
+    _diff_level(old.elements, new.elements, 'FILE', 'FILE', changes, removed, added)
+
+    # An element removed in one place and added elsewhere with an identical subtree was moved
+    removed_by_digest = defaultdict(list)
+    paired: Set[int] = set()
+    for old_xpath, element in reversed(removed):
+        removed_by_digest[element.merkle_hash].append((old_xpath, element))
+    for new_xpath, element in added:
+        candidates = removed_by_digest.get(element.merkle_hash)
+        if candidates:
+            old_xpath, old_el = candidates.pop()
+            paired.add(id(old_el))
+            changes.append(ElementChange(change_type=ElementChangeType.MOVED, xpath=new_xpath, old_xpath=old_xpath,
+                                         element_type=element.type, old_range=old_el.range, new_range=element.range))
+        else:
+            changes.append(ElementChange(change_type=ElementChangeType.ADDED, xpath=new_xpath,
+                                         element_type=element.type, new_range=element.range))
+    for old_xpath, element in removed:
+        if id(element) not in paired:
+            changes.append(ElementChange(change_type=ElementChangeType.REMOVED, xpath=old_xpath, old_xpath=old_xpath,
+                                         element_type=element.type, old_range=element.range))
+    logger.debug(f'diff_results: {len(changes)} element changes')
+    return changes
@@ -2,14 +2,18 @@
 AST Handler for CodeHem providing a unified interface for tree-sitter operations.
 """
 import logging
+import threading
 import traceback
 from functools import lru_cache
 from typing import Tuple, List, Any, Optional, Dict, Callable
 
+from codehem.core.utils import budget
 from codehem.core.utils.hashing import sha1_code
+from codehem.core.utils.source_io import SourceCode, as_bytes
 
 
 from tree_sitter import Node, Query, QueryCursor
+from codehem.core.utils.instrumentation import instrumented
 
 logger = logging.getLogger(__name__)
 
@@ -25,27 +29,38 @@ class ASTHandler:
         
         Args:
             language_code: Language code (e.g., 'python', 'typescript')
-            parser: Tree-sitter parser for the language
+            parser: Tree-sitter parser for the language, used by the creating
+                thread; other threads parse with their own ``get_parser`` parser
             language: Tree-sitter language object
         """
         self.language_code = language_code
-        self.parser = parser
+        self._parser = parser
+        self._owner = threading.get_ident()
         self.language = language
 
+    @property
+    def parser(self):
+        if threading.get_ident() == self._owner:
+            return self._parser
+        from codehem.core.engine.languages import get_parser
+
+        return get_parser(self.language_code)
+
     @lru_cache(maxsize=128)
-    def _parse_cached(self, code_hash: str, code: str) -> Tuple[Node, bytes]:
+    def _parse_cached(self, code_hash: str, code: SourceCode) -> Tuple[Node, bytes]:
         """Internal cached parse implementation."""
-        code_bytes = code.encode("utf8")
-        tree = self.parser.parse(code_bytes)
+        code_bytes = as_bytes(code)
+        tree = budget.parse(self.parser, code_bytes)
         return (tree.root_node, code_bytes)
 
-    def parse(self, code: str) -> Tuple[Node, bytes]:
+    @instrumented('parse')
+    def parse(self, code: SourceCode) -> Tuple[Node, bytes]:
         """
         Parse source code into an AST. Results are cached using an LRU cache
         keyed by the SHA1 hash of ``code``.
 
         Args:
-            code: Source code as string
+            code: Source code as string or UTF-8 bytes
 
         Returns:
             Tuple of (root_node, code_bytes)
@@ -78,6 +93,7 @@ class ASTHandler:
         """
         return (node.start_point[0] + 1, node.end_point[0] + 1)
 
+    @instrumented('query')
     def execute_query(self, query_string: str, root: Node, code_bytes: bytes) -> List[Tuple[Node, str]]:
         """
         Execute a tree-sitter query and process the results.
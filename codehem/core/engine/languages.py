@@ -1,6 +1,8 @@
 """
 Central registry of supported programming languages and their parsers.
 """
+import threading
+
 import tree_sitter_python
 import tree_sitter_javascript
 import tree_sitter_typescript
@@ -13,11 +15,13 @@ TSX_LANGUAGE = Language(tree_sitter_typescript.language_tsx())
 LANGUAGES = {'python': PY_LANGUAGE, 'javascript': JS_LANGUAGE, 'typescript': TS_LANGUAGE, 'tsx': TSX_LANGUAGE}
 FILE_EXTENSIONS = {'.py': 'python', '.js': 'typescript', '.jsx': 'typescript', '.ts': 'typescript', '.tsx': 'typescript'}
 
-_PARSER_CACHE = {}
+# Parsers hold mutable parse state and must not be used by two threads at
+# once, so every thread gets its own
+_parsers = threading.local()
 
 def get_parser(language_code: str) -> Parser:
     """
-    Get a parser for the given language.
+    Get the calling thread's parser for the given language.
 
     Args:
         language_code: Language code (e.g., 'python', 'javascript')
@@ -30,10 +34,13 @@ def get_parser(language_code: str) -> Parser:
     """
     if language_code not in LANGUAGES:
         raise ValueError(f'Unknown language: {language_code}')
-    if language_code not in _PARSER_CACHE:
-        parser = Parser(LANGUAGES[language_code])
-        _PARSER_CACHE[language_code] = parser
-    return _PARSER_CACHE[language_code]
+    cache = getattr(_parsers, 'cache', None)
+    if cache is None:
+        cache = _parsers.cache = {}
+    parser = cache.get(language_code)
+    if parser is None:
+        parser = cache[language_code] = Parser(LANGUAGES[language_code])
+    return parser
 
 
 def get_language_for_file(file_path: str) -> str:
@@ -0,0 +1,157 @@
+"""
+XPath resolution directly on the syntax tree.
+
+``find_by_xpath``, ``get_element_hash`` and ``get_text_by_xpath`` only need
+one element, so instead of extracting and post-processing the whole file the
+resolver locates the name of each XPath step in the source, reads the
+definition owning it from the tree (name fields, decorators) and builds a
+skeleton ``CodeElementsResult`` holding just the candidate elements along the
+path. The usual filters (``ElementFilter``, the services' target lookup) run
+on the skeleton, so type matching and preferences stay the same.
+
+The resolver answers only when the tree gives an unambiguous picture: paths
+of one or two named steps (top-level element, class member) and a single
+top-level definition with the requested name. In every other case it returns
+None and callers fall back to full extraction.
+"""
+import logging
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Tuple
+
+from tree_sitter import Node
+
+from codehem.core.engine.languages import get_parser
+from codehem.core.utils.hashing import sha1_code
+from codehem.core.utils.instrumentation import count, instrumented
+from codehem.models.code_element import CodeElement, CodeElementsResult
+from codehem.models.enums import CodeElementType
+from codehem.models.range import CodeRange
+from codehem.models.xpath import CodeElementXPathNode
+
+logger = logging.getLogger(__name__)
+
+TREE_CACHE_SIZE = 8
+
+# (element type, node whose lines are the element's range)
+Candidate = Tuple[CodeElementType, Node]
+
+
+class XPathResolver(ABC):
+    """Resolves parsed XPaths against the syntax tree of one language."""
+
+    LANGUAGE_CODE: str = ''
+    # Identifier characters around a name occurrence
+    IDENTIFIER_CHARS = rb'\w'
+    # Member types the member lookup classifies completely; for other requested
+    # types (e.g. 'property', which also matches instance attributes) occurrences
+    # the resolver cannot classify make it defer
+    EXACT_MEMBER_TYPES = frozenset({CodeElementType.METHOD.value, CodeElementType.PROPERTY_GETTER.value,
+                                    CodeElementType.PROPERTY_SETTER.value, CodeElementType.STATIC_PROPERTY.value})
+
+    def __init__(self):
+        self._trees: 'OrderedDict[str, Tuple[Node, bytes]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(self, code: str) -> Tuple[Node, bytes]:
+        """Root node and bytes of ``code`` (the last few trees are kept)."""
+        key = sha1_code(code)
+        with self._lock:
+            cached = self._trees.get(key)
+            if cached is not None:
+                self._trees.move_to_end(key)
+                return cached
+        code_bytes = code.encode('utf8')
+        cached = (get_parser(self.LANGUAGE_CODE).parse(code_bytes).root_node, code_bytes)
+        with self._lock:
+            self._trees[key] = cached
+            if len(self._trees) > TREE_CACHE_SIZE:
+                self._trees.popitem(last=False)
+        return cached
+
+    @instrumented('xpath.resolve')
+    def resolve(self, code: str, xpath_nodes: List[CodeElementXPathNode]) -> Optional[CodeElementsResult]:
+        """
+        Skeleton result containing the candidate elements for ``xpath_nodes``.
+
+        Returns None when the path cannot be resolved reliably on the tree
+        (the caller should extract the whole file instead).
+        """
+        steps = [node for node in xpath_nodes if node.type != CodeElementType.FILE.value]
+        if not 1 <= len(steps) <= 2 or any(not step.name for step in steps):
+            return None
+        root, code_bytes = self.parse(code)
+        candidates = self.top_level_candidates(root, code_bytes, steps[0].name)
+        if candidates is None or len(candidates) != 1:
+            return None
+        element = self._element(candidates[0], steps[0].name, code_bytes)
+        if len(steps) == 2:
+            if element.type not in (CodeElementType.CLASS, CodeElementType.INTERFACE):
+                return None
+            members = self.member_candidates(candidates[0][1], code_bytes, steps[1].name, steps[1].type)
+            if members is None:
+                return None
+            element.children = [self._element(member, steps[1].name, code_bytes, element.name) for member in members]
+        count('xpath.resolved')
+        return CodeElementsResult(elements=[element])
+
+    @abstractmethod
+    def top_level_candidates(self, root: Node, code_bytes: bytes, name: str) -> Optional[List[Candidate]]:
+        """Definitions named ``name`` that extraction lists as top-level elements (None: unsure)."""
+
+    @abstractmethod
+    def member_candidates(self, container: Node, code_bytes: bytes, name: str,
+                          target_type: Optional[str]) -> Optional[List[Candidate]]:
+        """Members named ``name`` of ``container`` in source order (None: unsure)."""
+
+    def occurrences(self, node: Node, code_bytes: bytes, name: str) -> Iterator[Node]:
+        """Leaf nodes spelling ``name`` inside ``node``."""
+        chars = self.IDENTIFIER_CHARS
+        pattern = re.compile(rb'(?<![' + chars + rb'])' + re.escape(name.encode('utf8')) + rb'(?![' + chars + rb'])')
+        for match in pattern.finditer(code_bytes, node.start_byte, node.end_byte):
+            leaf = node.descendant_for_byte_range(match.start(), match.end())
+            if leaf is not None and leaf.start_byte == match.start() and leaf.end_byte == match.end():
+                yield leaf
+
+    @staticmethod
+    def is_name_of(leaf: Node, definition: Optional[Node], field: str = 'name') -> bool:
+        if definition is None:
+            return False
+        named = definition.child_by_field_name(field)
+        return named is not None and named.start_byte == leaf.start_byte and named.end_byte == leaf.end_byte
+
+    @staticmethod
+    def _element(candidate: Candidate, name: str, code_bytes: bytes,
+                 parent_name: Optional[str] = None) -> CodeElement:
+        element_type, node = candidate
+        start, end = node.start_point, node.end_point
+        return CodeElement(
+            type=element_type, name=name, parent_name=parent_name,
+            content=code_bytes[node.start_byte:node.end_byte].decode('utf8', errors='replace'),
+            range=CodeRange(start_line=start[0] + 1, start_column=start[1], end_line=end[0] + 1,
+                            end_column=end[1], start_byte=node.start_byte, end_byte=node.end_byte))
+
+
+_resolvers = {}
+_resolvers_lock = threading.Lock()
+
+
+def get_xpath_resolver(language_code: str) -> Optional[XPathResolver]:
+    """The resolver for ``language_code`` or None if the language has none."""
+    language_code = language_code.lower()
+    if language_code in _resolvers:
+        return _resolvers[language_code]
+    with _resolvers_lock:
+        if language_code in _resolvers:
+            return _resolvers[language_code]
+        resolver = None
+        if language_code == 'python':
+            from codehem.languages.lang_python.components.xpath_resolver import PythonXPathResolver
+            resolver = PythonXPathResolver()
+        elif language_code == 'typescript':
+            from codehem.languages.lang_typescript.components.xpath_resolver import TypeScriptXPathResolver
+            resolver = TypeScriptXPathResolver()
+        _resolvers[language_code] = resolver
+    return resolver
@@ -229,6 +229,23 @@ class ImportExtractorError(ExtractorError):
     def __init__(self, message: str, **kwargs):
         super().__init__("import", message, **kwargs)
 
+# ===== Budget Errors =====
+
+class BudgetExceededError(CodeHemError):
+    """Raised when a file exceeds its size or time budget (see ``codehem.core.utils.budget``).
+
+    Deliberately not an ``ExtractionError``: extraction error handlers turn
+    those into empty results, while an over-budget file must be reported.
+    """
+    def __init__(self, reason: str, detail: str):
+        super().__init__(f"{reason}: {detail}")
+        self.reason = reason
+        self.detail = detail
+
+    def __reduce__(self):
+        # Keep the error picklable so it survives process pools
+        return self.__class__, (self.reason, self.detail)
+
 # ===== Manipulation Errors =====
 
 class ManipulationError(CodeHemError):
@@ -293,6 +310,10 @@ class WriteConflictError(ManipulationError):
         self.expected_hash = expected_hash
         self.actual_hash = actual_hash
 
+    def __reduce__(self):
+        # Keep the error picklable so it survives process pools
+        return self.__class__, (self.expected_hash, self.actual_hash)
+
 # ===== Post-Processing Errors =====
 
 class PostProcessorError(CodeHemError):
@@ -411,6 +432,9 @@ def handle_extraction_errors(func: Callable) -> Callable:
                 return (0, 0)
             else:
                 return None
+        except BudgetExceededError:
+            # Expected outcome of a budget; callers report the file as skipped
+            raise
         except Exception as e:
             logger.exception(f"Unexpected error during {func.__name__}: {str(e)}")
             # Re-raise other exceptions
@@ -1,11 +1,15 @@
 import logging
 import os
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union, TYPE_CHECKING
 
+from codehem.core.utils.budget import check_deadline
+from codehem.core.utils.element_selection import ElementTypes, categories_for_types
 from codehem.core.utils.hashing import sha1_code
+from codehem.core.utils.instrumentation import instrumented, span
+from codehem.core.utils.merkle import build_merkle_tree
+from codehem.core.utils.node_retention import NodeRetention, apply_node_retention
 
-import rich
 
 from codehem.core.error_handling import handle_extraction_errors
 from codehem.core.registry import registry
@@ -281,13 +285,21 @@ class ExtractionService:
         """Extract any code element from the provided code."""
         return self._get_raw_extractor_results(code, element_type)
 
-    def _extract_file_raw(self, code: str) -> Dict[str, List[Dict]]:
+    @instrumented('extract.raw')
+    def _extract_file_raw(self, code: str, categories: Optional[FrozenSet[str]] = None) -> Dict[str, List[Dict]]:
         """
         Extract all supported code elements from the provided code.
         Now includes PROPERTY and DECORATOR types.
+        Only the raw ``categories`` are extracted if given (the others are empty).
         """
         logger.info(f'Starting raw extraction of all elements for {self.language_code}')
 
+        def wanted(category: str) -> bool:
+            if categories is not None and category not in categories:
+                return False
+            check_deadline(f'extract.{category}')
+            return True
+
         # Respect language-supported element types to avoid noisy warnings
         supported = set()
         try:
@@ -298,28 +310,28 @@ class ExtractionService:
         results: Dict[str, List[Dict]] = {}
 
         # Imports
-        if CodeElementType.IMPORT.value in supported:
+        if wanted('imports') and CodeElementType.IMPORT.value in supported:
             results['imports'] = self.extract_imports(code)
             logger.debug(f"Raw extracted {len(results.get('imports', []))} import elements.")
         else:
             results['imports'] = []
 
         # Functions
-        if CodeElementType.FUNCTION.value in supported:
+        if wanted('functions') and CodeElementType.FUNCTION.value in supported:
             results['functions'] = self.extract_functions(code)
             logger.debug(f"Raw extracted {len(results.get('functions', []))} functions.")
         else:
             results['functions'] = []
 
         # Classes
-        if CodeElementType.CLASS.value in supported:
+        if wanted('classes') and CodeElementType.CLASS.value in supported:
             results['classes'] = self.extract_classes(code)
             logger.debug(f"Raw extracted {len(results.get('classes', []))} classes.")
         else:
             results['classes'] = []
 
         # Members (methods/getters/setters)
-        if any(t in supported for t in [
+        if wanted('members') and any(t in supported for t in [
             CodeElementType.METHOD.value,
             CodeElementType.PROPERTY_GETTER.value,
             CodeElementType.PROPERTY_SETTER.value,
@@ -331,7 +343,7 @@ class ExtractionService:
             results['members'] = []
 
         # Regular properties (fields)
-        if CodeElementType.PROPERTY.value in supported:
+        if wanted('properties') and CodeElementType.PROPERTY.value in supported:
             props = self._get_raw_extractor_results(code, CodeElementType.PROPERTY.value)
             results['properties'] = props
             logger.debug(f'Raw extracted {len(props)} regular properties.')
@@ -339,7 +351,7 @@ class ExtractionService:
             results['properties'] = []
 
         # Static properties
-        if CodeElementType.STATIC_PROPERTY.value in supported:
+        if wanted('static_properties') and CodeElementType.STATIC_PROPERTY.value in supported:
             static_props = self._get_raw_extractor_results(code, CodeElementType.STATIC_PROPERTY.value)
             results['static_properties'] = static_props
             logger.debug(f'Raw extracted {len(static_props)} static properties.')
@@ -347,7 +359,7 @@ class ExtractionService:
             results['static_properties'] = []
 
         # Decorators
-        if CodeElementType.DECORATOR.value in supported:
+        if wanted('decorators') and CodeElementType.DECORATOR.value in supported:
             decorators = self._get_raw_extractor_results(code, CodeElementType.DECORATOR.value)
             results['decorators'] = decorators
             logger.debug(f'Raw extracted {len(decorators)} decorators.')
@@ -355,25 +367,25 @@ class ExtractionService:
             results['decorators'] = []
 
         # Interfaces / Enums / Type Aliases / Namespaces
-        if CodeElementType.INTERFACE.value in supported:
+        if wanted('interfaces') and CodeElementType.INTERFACE.value in supported:
             results['interfaces'] = self._get_raw_extractor_results(code, CodeElementType.INTERFACE.value)
             logger.debug(f"Raw extracted {len(results.get('interfaces', []))} interfaces.")
         else:
             results['interfaces'] = []
 
-        if CodeElementType.ENUM.value in supported:
+        if wanted('enums') and CodeElementType.ENUM.value in supported:
             results['enums'] = self._get_raw_extractor_results(code, CodeElementType.ENUM.value)
             logger.debug(f"Raw extracted {len(results.get('enums', []))} enums.")
         else:
             results['enums'] = []
 
-        if CodeElementType.TYPE_ALIAS.value in supported:
+        if wanted('type_aliases') and CodeElementType.TYPE_ALIAS.value in supported:
             results['type_aliases'] = self._get_raw_extractor_results(code, CodeElementType.TYPE_ALIAS.value)
             logger.debug(f"Raw extracted {len(results.get('type_aliases', []))} type aliases.")
         else:
             results['type_aliases'] = []
 
-        if CodeElementType.NAMESPACE.value in supported:
+        if wanted('namespaces') and CodeElementType.NAMESPACE.value in supported:
             results['namespaces'] = self._get_raw_extractor_results(code, CodeElementType.NAMESPACE.value)
             logger.debug(f"Raw extracted {len(results.get('namespaces', []))} namespaces.")
         else:
@@ -385,15 +397,18 @@ class ExtractionService:
     # *** CHANGE START ***
     # Updated type hint to use string literal
     @lru_cache(maxsize=128)
-    def _extract_all_cached(self, code_hash: str, code: str) -> 'CodeElementsResult':
+    def _extract_all_cached(self, code_hash: str, code: str, lazy_content: bool = False,
+                            node_retention: str = 'none',
+                            categories: Optional[FrozenSet[str]] = None) -> 'CodeElementsResult':
         """Internal helper wrapped with LRU cache."""
         from codehem.models.code_element import CodeElementsResult  # Local import
+        from codehem.models.source_buffer import SourceBuffer, use_source_buffer
         logger.info(
             f'ExtractionService: Starting full extraction and post-processing for {self.language_code}'
         )  # MODIFIED LOG LEVEL
         result = CodeElementsResult(elements=[])
         try:
-            raw_elements = self._extract_file_raw(code)
+            raw_elements = self._extract_file_raw(code, categories)
             if not self.post_processor:
                 logger.error(f'ExtractionService: No post-processor available for language {self.language_code}. Cannot structure results.')
                 return result
@@ -404,30 +419,33 @@ class ExtractionService:
             all_decorators_list = raw_elements.get('decorators', [])
             logger.debug(f"ExtractionService: Passing {len(all_decorators_list)} raw decorators to post-processor.") # ADDED LOG
 
-            imports = self.post_processor.process_imports(raw_elements.get('imports', []))
-            logger.debug(f"ExtractionService: Post-processor returned {len(imports)} import elements.") # ADDED LOG
-            result.elements.extend(imports)
-
-            functions = self.post_processor.process_functions(
-                raw_functions=raw_elements.get('functions', []),
-                all_decorators=all_decorators_list # Pass decorators
-            )
-            logger.debug(f"ExtractionService: Post-processor returned {len(functions)} function elements.") # ADDED LOG
-            result.elements.extend(functions)
-
-            # Pass all relevant raw data to process_classes
-            classes = self.post_processor.process_classes(
-                raw_classes=raw_elements.get('classes', []),
-                members=raw_elements.get('members', []), # Includes methods, getters, setters
-                static_props=raw_elements.get('static_properties', []),
-                properties=raw_elements.get('properties', []), # Pass regular properties
-                all_decorators=all_decorators_list # Pass decorators
-            )
-            logger.debug(f"ExtractionService: Post-processor returned {len(classes)} class/container elements.") # ADDED LOG
-            result.elements.extend(classes)
+            with span('process_all'), use_source_buffer(SourceBuffer(code.encode('utf8')) if lazy_content else None):
+                imports = self.post_processor.process_imports(raw_elements.get('imports', []))
+                logger.debug(f"ExtractionService: Post-processor returned {len(imports)} import elements.") # ADDED LOG
+                result.elements.extend(imports)
+
+                functions = self.post_processor.process_functions(
+                    raw_functions=raw_elements.get('functions', []),
+                    all_decorators=all_decorators_list # Pass decorators
+                )
+                logger.debug(f"ExtractionService: Post-processor returned {len(functions)} function elements.") # ADDED LOG
+                result.elements.extend(functions)
+
+                # Pass all relevant raw data to process_classes
+                classes = self.post_processor.process_classes(
+                    raw_classes=raw_elements.get('classes', []),
+                    members=raw_elements.get('members', []), # Includes methods, getters, setters
+                    static_props=raw_elements.get('static_properties', []),
+                    properties=raw_elements.get('properties', []), # Pass regular properties
+                    all_decorators=all_decorators_list # Pass decorators
+                )
+                logger.debug(f"ExtractionService: Post-processor returned {len(classes)} class/container elements.") # ADDED LOG
+                result.elements.extend(classes)
 
             # Sort final top-level elements by start line
             result.elements.sort(key=lambda el: el.range.start_line if el.range else float('inf'))
+            build_merkle_tree(result)
+            apply_node_retention(result, node_retention)
             logger.info(f'ExtractionService: Completed full extraction for {self.language_code}. Top-level element count: {len(result.elements)}') # MODIFIED LOG LEVEL
 
         except Exception as e:
@@ -451,32 +469,69 @@ class ExtractionService:
 
         return result
 
-    def extract_all(self, code: str) -> 'CodeElementsResult':
-        """Public wrapper using the LRU cache."""
+    def extract_all(self, code: str, lazy_content: bool = False, node_retention: str = 'none',
+                    types: ElementTypes = None) -> 'CodeElementsResult':
+        """
+        Public wrapper using the LRU cache; see ``CodeHem.extract`` for the options.
+
+        Cached results drop tree-sitter nodes by default so the cache does not pin syntax trees.
+        """
         code_hash = sha1_code(code)
-        return self._extract_all_cached(code_hash, code)
+        return self._extract_all_cached(code_hash, code, lazy_content, NodeRetention(node_retention).value,
+                                        categories_for_types(types))
 
     def find_by_xpath(self, code: str, xpath: str) -> Optional[Tuple[int, int]]:
         """Return the line range of the element at ``xpath`` or ``None``."""
-        logger.debug("Finding range by XPath: '%s' using extract_all and filter.", xpath)
+        logger.debug("Finding range by XPath: '%s'.", xpath)
         code_hash = sha1_code(code)
         return self._find_by_xpath_cached(code_hash, xpath, code)
 
+    def get_element_hash(self, code: str, xpath: str, algorithm: str = 'sha256') -> Optional[str]:
+        """
+        Return the hash of the fragment selected by ``xpath``.
+
+        Uses the cached extraction result and the hash memoized on the element, so
+        repeated lookups for the same source do not re-extract or re-hash.
+        """
+        element = self._resolve_xpath(code, xpath) or self.extract_all(code).filter(xpath)
+        if element is None:
+            return None
+        return element.fragment_hash(code, algorithm)
+
+    def _resolve_xpath(self, code: str, xpath: str) -> Optional['CodeElement']:
+        """
+        Element at ``xpath`` located directly on the syntax tree.
+
+        None if the path cannot be resolved that way (see
+        ``codehem.core.engine.xpath_resolver``); callers then filter the full
+        extraction result.
+        """
+        from codehem.core.engine.xpath_parser import XPathParser
+        from codehem.core.engine.xpath_resolver import get_xpath_resolver
+        resolver = get_xpath_resolver(self.language_code)
+        if resolver is None:
+            return None
+        try:
+            skeleton = resolver.resolve(code, XPathParser.parse(xpath))
+        except Exception as e:
+            logger.debug("XPath resolver failed for '%s': %s", xpath, e)
+            return None
+        return skeleton.filter(xpath) if skeleton is not None else None
+
     @lru_cache(maxsize=128)
     def _find_by_xpath_cached(self, code_hash: str, xpath: str, code: str) -> Optional[Tuple[int, int]]:
         """Internal helper for ``find_by_xpath`` with caching."""
         try:
-            elements_result: 'CodeElementsResult' = self.extract_all(code)
+            # Single-element lookups resolve on the tree; extract only if that is not possible
+            target_element: Optional['CodeElement'] = self._resolve_xpath(code, xpath)
+            if target_element is None:
+                elements_result: 'CodeElementsResult' = self.extract_all(code)
 
-            if not elements_result or not elements_result.elements:
-                logger.warning("extract_all returned no elements for find_by_xpath('%s').", xpath)
-                return None
+                if not elements_result or not elements_result.elements:
+                    logger.warning("extract_all returned no elements for find_by_xpath('%s').", xpath)
+                    return None
 
-            # *** CHANGE START ***
-            # Import locally if needed for filtering logic, or use string hint
-            # from codehem.models.code_element import CodeElement # Example if needed locally
-            target_element: Optional['CodeElement'] = elements_result.filter(xpath)
-            # *** CHANGE END ***
+                target_element = elements_result.filter(xpath)
 
             if target_element and target_element.range:
                 start_line = target_element.range.start_line
@@ -1,9 +1,10 @@
 # Content of codehem\core\extractors\extraction_base.py
 import logging
 import re
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 from codehem.core.engine.ast_handler import ASTHandler
 from codehem.core.engine.languages import LANGUAGES, get_parser
+from codehem.core.extractors import regex_fallback
 from codehem.models.element_type_descriptor import ElementTypeLanguageDescriptor
 from codehem.models.enums import CodeElementType
 from abc import ABC, abstractmethod
@@ -330,6 +331,7 @@ class BaseExtractor(ABC):
 
 class TemplateExtractor(BaseExtractor):
     """Base template extractor implementing the pattern extraction flow."""
+    REGEX_FLAGS = re.MULTILINE | re.DOTALL
 
     @abstractmethod
     def _process_tree_sitter_results(self, query_results, code_bytes, ast_handler, context) -> List[Dict]:
@@ -364,12 +366,13 @@ class TemplateExtractor(BaseExtractor):
         # else: logger.debug(...)
 
         should_fallback = self._should_fallback_to_regex(tree_sitter_attempted, tree_sitter_error, elements, current_handler)
-        if should_fallback and current_handler.regexp_pattern:
+        regions = self._regex_regions(code, tree_sitter_attempted, tree_sitter_error) if should_fallback and current_handler.regexp_pattern else None
+        if regions:
              regex_attempted = True
              try:
                   self._before_regex(current_handler)
-                  regex_elements = self._parse_code_with_regex(code, current_handler, context)
-                  if not elements or tree_sitter_error: elements = regex_elements
+                  regex_elements = self._parse_code_with_regex(code, current_handler, context, regions)
+                  elements = regex_elements if not elements or tree_sitter_error else regex_fallback.merge(elements, regex_elements)
              except Exception as e:
                   self._handle_regex_exception(e, current_handler)
                   if not elements or tree_sitter_error: elements = []
@@ -395,10 +398,17 @@ class TemplateExtractor(BaseExtractor):
         err_type = type(e).__name__
         logger.error(f'Error during TreeSitter extraction for {self.language_code}/{getattr(handler.element_type,"value","?")}: {err_type}: {e}', exc_info=False) # Less verbose exc_info
         if isinstance(e, QueryError): logger.error(f"Failed Query: {repr(handler.tree_sitter_query)}")
-    def _should_fallback_to_regex(self, ts_attempted: bool, ts_error: bool, elements: List[Dict], handler: ElementTypeLanguageDescriptor) -> bool: return not ts_attempted or ts_error or (ts_attempted and not elements)
+    def _should_fallback_to_regex(self, ts_attempted: bool, ts_error: bool, elements: List[Dict], handler: ElementTypeLanguageDescriptor) -> bool: return regex_fallback.fallback_policy() != regex_fallback.RegexFallback.NEVER
+    def _regex_regions(self, code: str, ts_attempted: bool, ts_error: bool) -> Optional[List[Tuple[int, int]]]:
+        """Spans to scan with the regex fallback under the configured policy (None: no fallback)."""
+        root = None
+        if ts_attempted and not ts_error:
+            ast_handler = self._get_ast_handler()
+            root = ast_handler.parse(code)[0] if ast_handler else None
+        return regex_fallback.plan(ts_attempted, ts_error, root, code)
     def _before_regex(self, handler: ElementTypeLanguageDescriptor): logger.debug(f'Using Regex fallback for {self.language_code}/{getattr(handler.element_type,"value","?")}.') # Pattern: {repr(handler.regexp_pattern)} # Too verbose
-    def _parse_code_with_regex(self, code: str, handler: ElementTypeLanguageDescriptor, context: Dict[str, Any]) -> List[Dict]:
-        matches = re.finditer(handler.regexp_pattern, code, re.MULTILINE | re.DOTALL); return self._process_regex_results(matches, code, context)
+    def _parse_code_with_regex(self, code: str, handler: ElementTypeLanguageDescriptor, context: Dict[str, Any], regions: Optional[List[Tuple[int, int]]] = None) -> List[Dict]:
+        matches = regex_fallback.finditer(handler.regexp_pattern, code, self.REGEX_FLAGS, regions); return self._process_regex_results(matches, code, context)
     def _handle_regex_exception(self, e: Exception, handler: ElementTypeLanguageDescriptor):
         err_type = type(e).__name__
         logger.error(f'Error during Regex extraction for {self.language_code}/{getattr(handler.element_type,"value","?")}: {err_type}: {e}', exc_info=False)
@@ -0,0 +1,133 @@
+"""
+Policy for the regex fallback of tree-sitter based extractors.
+
+Extractors can fall back to the ``regexp_pattern`` of their descriptor when
+tree-sitter cannot be used. The ``extraction.regex_fallback`` setting of
+``codehem.core.config.config`` controls when that happens:
+
+    never          tree-sitter results only
+    parse_error    only when tree-sitter failed (parse or query error); the
+                   whole file is scanned
+    error_regions  as ``parse_error``, and additionally when the tree has
+                   syntax errors: only the lines covered by ERROR/missing
+                   nodes are scanned (default)
+
+Tree-sitter finding no elements is not a reason to fall back. Patterns are
+compiled once, and scans stop at the ``extraction.regex_fallback_timeout``
+deadline (seconds), which is checked between matches.
+"""
+import logging
+import re
+import time
+from enum import Enum
+from functools import lru_cache
+from typing import Iterator, List, Match, Optional, Pattern, Sequence, Tuple
+
+from tree_sitter import Node
+
+from codehem.core.config import config
+from codehem.core.utils.line_index import get_line_index
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 0.05
+
+
+class RegexFallback(str, Enum):
+    """When extractors fall back to regex patterns"""
+    NEVER = 'never'
+    PARSE_ERROR = 'parse_error'
+    ERROR_REGIONS = 'error_regions'
+
+
+def fallback_policy() -> RegexFallback:
+    """The configured policy (``error_regions`` if the setting is invalid)."""
+    value = config.get('extraction', 'regex_fallback', RegexFallback.ERROR_REGIONS)
+    try:
+        return RegexFallback(value)
+    except ValueError:
+        logger.warning(f'Unknown regex_fallback policy {value!r}; using error_regions.')
+        return RegexFallback.ERROR_REGIONS
+
+
+@lru_cache(maxsize=256)
+def compiled(pattern: str, flags: int = 0) -> Pattern:
+    """``re.compile`` cached across extractor calls."""
+    return re.compile(pattern, flags)
+
+
+def error_regions(root: Node, code: str) -> List[Tuple[int, int]]:
+    """
+    Character spans (whole lines) of the ERROR and missing nodes under ``root``.
+
+    Only subtrees reporting ``has_error`` are visited; overlapping spans are merged.
+    """
+    rows: List[Tuple[int, int]] = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.type == 'ERROR' or node.is_missing:
+            rows.append((node.start_point[0], node.end_point[0]))
+            continue
+        stack.extend(child for child in node.children if child.has_error)
+    if not rows:
+        return []
+    index = get_line_index(code)
+    spans: List[Tuple[int, int]] = []
+    for start_row, end_row in sorted(rows):
+        start, end = index.line_start(start_row + 1), index.line_end(end_row + 1)
+        if spans and start <= spans[-1][1] + 1:
+            spans[-1] = (spans[-1][0], max(spans[-1][1], end))
+        else:
+            spans.append((start, end))
+    return spans
+
+
+def plan(ts_attempted: bool, ts_error: bool, root: Optional[Node], code: str) -> Optional[List[Tuple[int, int]]]:
+    """
+    Decide whether to run the regex fallback.
+
+    Args:
+        ts_attempted: Tree-sitter extraction was tried
+        ts_error: Tree-sitter extraction raised
+        root: Parsed tree (None if unavailable)
+        code: Source code
+
+    Returns:
+        None for no fallback, otherwise the character spans to scan
+        (one span covering the whole file for a full scan)
+    """
+    policy = fallback_policy()
+    if policy == RegexFallback.NEVER:
+        return None
+    if not ts_attempted or ts_error:
+        return [(0, len(code))]
+    if policy == RegexFallback.ERROR_REGIONS and root is not None and root.has_error:
+        return error_regions(root, code) or None
+    return None
+
+
+def finditer(pattern: str, code: str, flags: int = 0,
+             regions: Optional[Sequence[Tuple[int, int]]] = None) -> Iterator[Match]:
+    """
+    Matches of ``pattern`` within ``regions`` of ``code`` (the whole code by default).
+
+    Match offsets refer to ``code``. Iteration stops once the configured
+    timeout has elapsed.
+    """
+    regex = compiled(pattern, flags)
+    timeout = config.get('extraction', 'regex_fallback_timeout', DEFAULT_TIMEOUT)
+    deadline = time.perf_counter() + timeout if timeout else None
+    for start, end in regions or [(0, len(code))]:
+        for match in regex.finditer(code, start, end):
+            yield match
+            if deadline is not None and time.perf_counter() > deadline:
+                logger.warning(f'Regex fallback stopped after {timeout}s (pattern {pattern[:60]!r}...).')
+                return
+
+
+def merge(elements: List[dict], regex_elements: List[dict]) -> List[dict]:
+    """Tree-sitter ``elements`` plus regex results not already found at the same line."""
+    seen = {(e.get('name'), e.get('range', {}).get('start', {}).get('line')) for e in elements}
+    return elements + [e for e in regex_elements
+                       if (e.get('name'), e.get('range', {}).get('start', {}).get('line')) not in seen]
@@ -31,7 +31,7 @@ class TemplateClassExtractor(TemplateExtractor):
         for class_name, class_def in class_nodes.items():
             content = ast_handler.get_node_text(class_def, code_bytes)
             decorators = ExtractorHelpers.extract_decorators(ast_handler, class_def, code_bytes)
-            class_info = {'type': 'class', 'name': class_name, 'content': content, 'range': {'start': {'line': class_def.start_point[0] + 1, 'column': class_def.start_point[1]}, 'end': {'line': class_def.end_point[0] + 1, 'column': class_def.end_point[1]}}, 'decorators': decorators, 'members': {'methods': [], 'properties': [], 'static_properties': []}}
+            class_info = {'type': 'class', 'name': class_name, 'content': content, 'range': {'start': {'line': class_def.start_point[0] + 1, 'column': class_def.start_point[1], 'byte': class_def.start_byte}, 'end': {'line': class_def.end_point[0] + 1, 'column': class_def.end_point[1], 'byte': class_def.end_byte}}, 'decorators': decorators, 'members': {'methods': [], 'properties': [], 'static_properties': []}}
             classes.append(class_info)
         return classes
 
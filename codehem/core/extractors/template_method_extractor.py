@@ -2,9 +2,9 @@ import logging
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
-import rich
 from tree_sitter import Node
 
+from codehem.core.extractors import regex_fallback
 from codehem.core.extractors.extraction_base import ExtractorHelpers, TemplateExtractor
 from codehem.core.registry import extractor
 from codehem.models.element_type_descriptor import ElementTypeLanguageDescriptor
@@ -144,8 +144,8 @@ class TemplateMethodExtractor(TemplateExtractor):
         try:
             info['content'] = ast_handler.get_node_text(node_for_range_and_content, code_bytes)
             info['range'] = {
-                'start': {'line': node_for_range_and_content.start_point[0] + 1, 'column': node_for_range_and_content.start_point[1]},
-                'end': {'line': node_for_range_and_content.end_point[0] + 1, 'column': node_for_range_and_content.end_point[1]}
+                'start': {'line': node_for_range_and_content.start_point[0] + 1, 'column': node_for_range_and_content.start_point[1], 'byte': node_for_range_and_content.start_byte},
+                'end': {'line': node_for_range_and_content.end_point[0] + 1, 'column': node_for_range_and_content.end_point[1], 'byte': node_for_range_and_content.end_byte}
             }
             # Also store the start line of the actual definition (excluding decorators)
             info['definition_start_line'] = definition_node.start_point[0] + 1
@@ -304,13 +304,17 @@ class TemplateMethodExtractor(TemplateExtractor):
 
         # Regex fallback phase
         should_fallback = self._should_fallback_to_regex(tree_sitter_attempted, tree_sitter_error, elements, current_handler)
-        if should_fallback and current_handler.regexp_pattern:
+        regions = self._regex_regions(code, tree_sitter_attempted, tree_sitter_error) if should_fallback and current_handler.regexp_pattern else None
+        should_fallback = bool(regions)
+        if regions:
             try:
                 self._before_regex(current_handler)
-                elements = self._parse_code_with_regex(code, current_handler, context)
+                regex_elements = self._parse_code_with_regex(code, current_handler, context, regions)
+                elements = regex_elements if not elements or tree_sitter_error else regex_fallback.merge(elements, regex_elements)
             except Exception as e:
                 self._handle_regex_exception(e, current_handler)
-                elements = []
+                if not elements or tree_sitter_error:
+                    elements = []
 
         self._after_extraction(elements, tree_sitter_attempted, tree_sitter_error, should_fallback, current_handler)
 
@@ -338,16 +342,13 @@ class TemplateMethodExtractor(TemplateExtractor):
         handler_type_name = handler.element_type.value if handler.element_type else 'unknown_handler'
         logger.error(f'Error during TreeSitter extraction for {self.language_code} ({handler_type_name}): {e}', exc_info=False)
 
-    def _should_fallback_to_regex(self, tree_sitter_attempted: bool, tree_sitter_error: bool, elements: List[Dict], handler: ElementTypeLanguageDescriptor) -> bool:
-        # Fallback if TreeSitter was not attempted or errored
-        return not tree_sitter_attempted or tree_sitter_error
-
     def _before_regex(self, handler: ElementTypeLanguageDescriptor):
         handler_type_name = handler.element_type.value if handler.element_type else 'unknown_handler'
         logger.debug(f"Using Regex fallback for {self.language_code} (handler: {handler_type_name}).")
 
-    def _parse_code_with_regex(self, code: str, handler: ElementTypeLanguageDescriptor, context: Dict[str, Any]) -> List[Dict]:
-        matches = re.finditer(handler.regexp_pattern, code, re.MULTILINE | re.DOTALL)
+    def _parse_code_with_regex(self, code: str, handler: ElementTypeLanguageDescriptor, context: Dict[str, Any],
+                               regions: Optional[List[Tuple[int, int]]] = None) -> List[Dict]:
+        matches = regex_fallback.finditer(handler.regexp_pattern, code, self.REGEX_FLAGS, regions)
         return self._process_regex_results(matches, code, context)
 
     def _handle_regex_exception(self, e: Exception, handler: ElementTypeLanguageDescriptor):
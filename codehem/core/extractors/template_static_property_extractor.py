@@ -13,6 +13,7 @@ logger = logging.getLogger(__name__)
 class TemplateStaticPropertyExtractor(TemplateExtractor):
     """Template implementation for static class property extraction."""
     ELEMENT_TYPE = CodeElementType.STATIC_PROPERTY
+    REGEX_FLAGS = re.MULTILINE
 
     def _get_parent_class_name(self, node: Node, ast_handler: Any, code_bytes: bytes) -> Optional[str]:
         """Finds the name of the containing class definition."""
@@ -152,8 +153,8 @@ class TemplateStaticPropertyExtractor(TemplateExtractor):
             return []
 
         try:
-            # Find all matches in the relevant code scope (might need context adjustment in real use)
-             for match in re.finditer(pattern, code, re.MULTILINE):
+            # Matches come from the regex fallback scan (see regex_fallback)
+             for match in matches:
                 try:
                      # Regex groups depend on the defined pattern in STATIC_PROPERTY_TEMPLATE
                      prop_name = match.group(1)
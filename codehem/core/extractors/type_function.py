@@ -1,9 +1,10 @@
 """
 Function extractor that uses language-specific handlers.
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import re
 import logging
+from codehem.core.extractors import regex_fallback
 from codehem.core.extractors.base import BaseExtractor
 from codehem.core.extractors.extraction_base import ExtractorHelpers
 from codehem.models.enums import CodeElementType
@@ -24,22 +25,28 @@ class FunctionExtractor(BaseExtractor):
 
     def _extract_with_patterns(self, code: str, handler: ElementTypeLanguageDescriptor, context: Dict[str, Any]) -> List[Dict]:
         """Extract using TreeSitter first, fall back to regex if needed."""
+        functions: Optional[List[Dict]] = []
         if handler.tree_sitter_query:
             functions = self._extract_with_tree_sitter(code, handler, context)
-            if functions:
-                return functions
-        if handler.regexp_pattern:
-            return self._extract_with_regex(code, handler, context)
-        return []
+        if not handler.regexp_pattern:
+            return functions or []
+        # _extract_with_tree_sitter returns None when tree-sitter failed
+        ts_error = functions is None
+        ast_handler = self._get_ast_handler() if handler.tree_sitter_query and not ts_error else None
+        root = ast_handler.parse(code)[0] if ast_handler else None
+        regions = regex_fallback.plan(bool(handler.tree_sitter_query), ts_error, root, code)
+        if not regions:
+            return functions or []
+        return regex_fallback.merge(functions or [], self._extract_with_regex(code, handler, context, regions))
 
     def _extract_with_tree_sitter(
         self, code: str, handler: ElementTypeLanguageDescriptor, context: Dict[str, Any]
-    ) -> List[Dict]:
-        """Extract functions using TreeSitter.
+    ) -> Optional[List[Dict]]:
+        """Extract functions using TreeSitter (None if tree-sitter failed).
         [MODIFIED V2: Correctly capture full range including decorators and body]"""
         ast_handler = self._get_ast_handler()
         if not ast_handler:
-            return []
+            return None
         try:
             root, code_bytes = ast_handler.parse(code)
             # Use the function definition query provided by the handler
@@ -132,10 +139,12 @@ class FunctionExtractor(BaseExtractor):
                                 "start": {
                                     "line": start_point[0] + 1,
                                     "column": start_point[1],
+                                    "byte": node_for_range.start_byte,
                                 },
                                 "end": {
                                     "line": end_point[0] + 1,
                                     "column": end_point[1],
+                                    "byte": node_for_range.end_byte,
                                 },
                             },
                             "parameters": parameters,
@@ -153,7 +162,7 @@ class FunctionExtractor(BaseExtractor):
                 f"TreeSitter extraction error in FunctionExtractor: {str(e)}",
                 exc_info=True,
             )
-            return []
+            return None
 
     def _extract_parameters(self, function_node, code_bytes, ast_handler) -> List[Dict]:
         """
@@ -254,11 +263,12 @@ class FunctionExtractor(BaseExtractor):
                         return_values.append(match.group(1).strip())
         return {'return_type': return_type, 'return_values': return_values}
 
-    def _extract_with_regex(self, code: str, handler: ElementTypeLanguageDescriptor, context: Dict[str, Any]) -> List[Dict]:
-        """Extract functions using regex."""
+    def _extract_with_regex(self, code: str, handler: ElementTypeLanguageDescriptor, context: Dict[str, Any],
+                            regions: Optional[List[Tuple[int, int]]] = None) -> List[Dict]:
+        """Extract functions using regex, optionally only within ``regions`` (character spans)."""
         try:
             pattern = handler.regexp_pattern
-            matches = re.finditer(pattern, code, re.DOTALL)
+            matches = regex_fallback.finditer(pattern, code, re.DOTALL, regions)
             functions = []
             for match in matches:
                 name = match.group(1)
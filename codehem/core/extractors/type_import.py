@@ -3,9 +3,10 @@ Import extractor that uses language-specific handlers.
 """
 import sys # Added missing import
 from tree_sitter import QueryError # Added missing import
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import re
 import logging
+from codehem.core.extractors import regex_fallback
 from codehem.core.extractors.base import BaseExtractor
 from codehem.models.enums import CodeElementType
 from codehem.models.element_type_descriptor import ElementTypeLanguageDescriptor
@@ -42,10 +43,14 @@ class ImportExtractor(BaseExtractor):
                  tree_sitter_error = True
                  imports = [] # Ensure imports is empty on error
 
-        if not imports and handler.regexp_pattern and (not tree_sitter_attempted or tree_sitter_error):
-            # Only fallback if TS wasn't attempted, failed, or returned nothing
+        regions = None
+        if handler.regexp_pattern:
+            ast_handler = self._get_ast_handler() if tree_sitter_attempted and not tree_sitter_error else None
+            root = ast_handler.parse(code)[0] if ast_handler else None
+            regions = regex_fallback.plan(tree_sitter_attempted, tree_sitter_error, root, code)
+        if regions:
             logger.debug(f"Using Regex fallback for imports in {self.language_code}.")
-            imports = self._extract_with_regex(code, handler, context)
+            imports = regex_fallback.merge(imports, self._extract_with_regex(code, handler, context, regions))
 
         # Consolidate individual imports into one 'imports' block AFTER extraction
         if imports:
@@ -142,14 +147,15 @@ class ImportExtractor(BaseExtractor):
         logger.debug(f"ImportExtractor: Finished TreeSitter processing, found {len(imports)} individual imports.")
         return imports
 
-    def _extract_with_regex(self, code: str, handler: ElementTypeLanguageDescriptor, context: Dict[str, Any]) -> List[Dict]:
-        """Extract imports using regex."""
+    def _extract_with_regex(self, code: str, handler: ElementTypeLanguageDescriptor, context: Dict[str, Any],
+                            regions: Optional[List[Tuple[int, int]]] = None) -> List[Dict]:
+        """Extract imports using regex, optionally only within ``regions`` (character spans)."""
         pattern = handler.regexp_pattern
         if not pattern:
              logger.warning("Import regex pattern is missing.")
              return []
         try:
-            matches = re.finditer(pattern, code, re.MULTILINE)
+            matches = regex_fallback.finditer(pattern, code, re.MULTILINE, regions)
         except re.error as e:
             logger.error(f"Invalid regex pattern for imports: {pattern}. Error: {e}")
             return []
@@ -1,7 +1,7 @@
 # Content of codehem\core\language_service.py
 import logging
+import threading
 from abc import ABC, abstractmethod
-from functools import cached_property
 from typing import Dict, List, Optional, Tuple, Type, Union, TYPE_CHECKING
 from codehem.core.extractors.base import BaseExtractor
 from codehem.core.formatting.formatter import BaseFormatter
@@ -10,6 +10,7 @@ from codehem.models.enums import CodeElementType
 from codehem.models.xpath import CodeElementXPathNode
 from codehem.models.element_type_descriptor import ElementTypeLanguageDescriptor
 from codehem.core.registry import registry
+from codehem.core.utils.concurrency import locked_cached_property
 if TYPE_CHECKING:
     from codehem.core.extraction_service import ExtractionService
     from codehem.models.code_element import CodeElementsResult
@@ -23,6 +24,8 @@ class LanguageService(ABC):
     """
     LANGUAGE_CODE: str
     _instances: Dict[str, 'LanguageService'] = {}
+    # Guards _instances and one-time initialization of the singletons
+    _instances_lock = threading.RLock()
 
     def __new__(cls, *args, **kwargs):
         language_code = getattr(cls, 'LANGUAGE_CODE', None)
@@ -32,12 +35,13 @@ class LanguageService(ABC):
                  raise ValueError(f'{cls.__name__} must define LANGUAGE_CODE or receive it during instantiation.')
 
         lang_code_lower = language_code.lower()
-        if lang_code_lower not in cls._instances:
-            logger.debug(f'[__new__] Creating new singleton instance for {lang_code_lower}')
-            cls._instances[lang_code_lower] = super().__new__(cls)
-        else:
-            logger.debug(f'[__new__] Reusing existing instance for {lang_code_lower}')
-        return cls._instances[lang_code_lower]
+        with cls._instances_lock:
+            if lang_code_lower not in cls._instances:
+                logger.debug(f'[__new__] Creating new singleton instance for {lang_code_lower}')
+                cls._instances[lang_code_lower] = super().__new__(cls)
+            else:
+                logger.debug(f'[__new__] Reusing existing instance for {lang_code_lower}')
+            return cls._instances[lang_code_lower]
 
     def __init__(self, formatter_class: Optional[Type[BaseFormatter]]=None, **kwargs):
         """
@@ -49,22 +53,24 @@ class LanguageService(ABC):
             formatter_class: Optional formatter class for this language. If None, uses BaseFormatter.
             **kwargs: Catches potential arguments.
         """
-        if hasattr(self, '_initialized') and self._initialized:
-            # logger.debug(f"LanguageService for '{self.language_code}' already initialized. Skipping.") # Reduce noise
-            return
-        self._initialized = True
+        with LanguageService._instances_lock:
+            if hasattr(self, '_initialized') and self._initialized:
+                # logger.debug(f"LanguageService for '{self.language_code}' already initialized. Skipping.") # Reduce noise
+                return
 
-        current_language_code = self.language_code
-        logger.info(f"Initializing LanguageService for '{current_language_code}'...")
+            current_language_code = self.language_code
+            logger.info(f"Initializing LanguageService for '{current_language_code}'...")
 
-        self.formatter = formatter_class() if formatter_class else BaseFormatter()
-        logger.debug(f'Using formatter: {self.formatter.__class__.__name__}')
-        self._extraction_service_instance: Optional['ExtractionService'] = None
-        logger.debug('LanguageService initialization deferred. Components will be created lazily.')
+            self.formatter = formatter_class() if formatter_class else BaseFormatter()
+            logger.debug(f'Using formatter: {self.formatter.__class__.__name__}')
+            self._extraction_service_instance: Optional['ExtractionService'] = None
+            logger.debug('LanguageService initialization deferred. Components will be created lazily.')
+            # Set last: other threads skip initialization once they see it
+            self._initialized = True
 
     # Lazy-initialized component containers
 
-    @cached_property
+    @locked_cached_property
     def element_type_descriptors(self) -> Dict[str, ElementTypeLanguageDescriptor]:
         """Initialize and cache descriptor instances for this language."""
         current_language_code = self.language_code
@@ -106,7 +112,7 @@ class LanguageService(ABC):
             descriptors[element_type_key] = descriptor_instance
         return descriptors
 
-    @cached_property
+    @locked_cached_property
     def extractors(self) -> Dict[str, BaseExtractor]:
         """Instantiate extractor objects lazily."""
         current_language_code = self.language_code
@@ -147,7 +153,7 @@ class LanguageService(ABC):
                     )
         return extractors
 
-    @cached_property
+    @locked_cached_property
     def manipulators(self) -> Dict[str, ManipulatorBase]:
         """Instantiate manipulator objects lazily."""
         current_language_code = self.language_code
@@ -180,11 +186,13 @@ class LanguageService(ABC):
         """Gets or creates the ExtractionService instance for this language."""
         from codehem.core.extraction_service import ExtractionService
         if self._extraction_service_instance is None:
-            try:
-                self._extraction_service_instance = ExtractionService(self.language_code)
-            except Exception as e:
-                logger.error(f'Failed to create ExtractionService instance for {self.language_code} on demand: {e}', exc_info=True)
-                raise
+            with LanguageService._instances_lock:
+                if self._extraction_service_instance is None:
+                    try:
+                        self._extraction_service_instance = ExtractionService(self.language_code)
+                    except Exception as e:
+                        logger.error(f'Failed to create ExtractionService instance for {self.language_code} on demand: {e}', exc_info=True)
+                        raise
         return self._extraction_service_instance
 
     def _get_supported_element_types_enum(self) -> List[CodeElementType]:
@@ -304,6 +312,24 @@ class LanguageService(ABC):
         """Optional hook for language-specific post-extraction adjustments."""
         return current_result
 
+    def _resolve_target_element(self, code: str, xpath_nodes: List['CodeElementXPathNode']) -> Optional['CodeElement']:
+        """
+        Target element located directly on the syntax tree, without extracting the file.
+
+        Returns None if the language has no XPath resolver or the path cannot be
+        resolved on the tree; callers then extract and search the full result.
+        """
+        from codehem.core.engine.xpath_resolver import get_xpath_resolver
+        resolver = get_xpath_resolver(self.language_code)
+        if resolver is None:
+            return None
+        try:
+            skeleton = resolver.resolve(code, xpath_nodes)
+        except Exception as e:
+            logger.debug(f'LanguageService ({self.language_code}): XPath resolver failed, falling back to extraction: {e}')
+            return None
+        return self._find_target_element(skeleton, xpath_nodes) if skeleton else None
+
     @abstractmethod
     def get_text_by_xpath_internal(self, code: str, xpath_nodes: List['CodeElementXPathNode']) -> Optional[str]:
         """
@@ -0,0 +1,118 @@
+"""
+Registration manifest for lazy component loading.
+
+``import codehem`` does not import the language packages. The registry reads
+``codehem/languages/_manifest.py`` (language -> file extensions and the
+modules registering its service, detector, extractors, manipulators and
+descriptors) and imports a language's modules on first use.
+
+Regenerate the manifest after adding or moving registered components:
+
+    python -m codehem.core.manifest            # write codehem/languages/_manifest.py
+    python -m codehem.core.manifest --check    # exit 1 if it is out of date
+"""
+import argparse
+import os
+import pprint
+import sys
+from typing import Any, Dict, List
+
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'languages',
+                             '_manifest.py')
+MANIFEST_VERSION = 1
+
+_HEADER = '''"""
+Registration manifest generated by ``python -m codehem.core.manifest``. Do not edit.
+
+Maps each built-in language to the modules that register its components, so
+the registry can import a language only when it is first used.
+"""
+'''
+
+
+def _path(obj: Any) -> str:
+    cls = obj if isinstance(obj, type) else type(obj)
+    return f'{cls.__module__}:{cls.__qualname__}'
+
+
+def _module_order(modules: List[str], package: str) -> List[str]:
+    # Package first (its __init__ registers most components), then the rest
+    return sorted(set(modules), key=lambda name: (name != package, name))
+
+
+def build_manifest() -> Dict[str, Any]:
+    """Discover every built-in module and record which modules register what."""
+    from codehem.core.registry import registry
+
+    registry.discover_modules()
+    languages: Dict[str, Any] = {}
+    for language_code, service_cls in registry.language_services.items():
+        package = service_cls.__module__.rsplit('.', 1)[0]
+        if not package.startswith('codehem.'):
+            continue  # plugins are loaded through their entry point
+        service = registry.get_language_service(language_code)
+        detector = registry.language_detectors.get(language_code)
+        extractors = {key: _path(cls) for key, cls in sorted(registry.all_extractors.items())
+                      if cls.LANGUAGE_CODE.lower() == language_code}
+        manipulators = {key: _path(cls) for key, cls in sorted(registry.all_manipulators.items())
+                        if cls.LANGUAGE_CODE.lower() == language_code}
+        descriptors = {key: _path(obj) for key, obj in sorted(registry.all_descriptors.get(language_code, {}).items())}
+        modules = [package, service_cls.__module__]
+        modules += [path.split(':')[0] for path in (*extractors.values(), *manipulators.values(),
+                                                    *descriptors.values())]
+        if detector is not None:
+            modules.append(type(detector).__module__)
+        if language_code in registry.config_modules:
+            modules.append(registry.config_modules[language_code])
+        languages[language_code] = {
+            'extensions': list(service.file_extensions) if service else [],
+            'service': _path(service_cls),
+            'detector': _path(detector) if detector is not None else None,
+            'extractors': extractors,
+            'manipulators': manipulators,
+            'descriptors': descriptors,
+            'modules': _module_order(modules, package),
+        }
+    # Language-independent components (e.g. the '__all__' template extractors)
+    core_modules = sorted({cls.__module__ for cls in registry.all_extractors.values()
+                           if cls.LANGUAGE_CODE.lower() not in registry.language_services}
+                          | {cls.__module__ for cls in registry.all_manipulators.values()
+                             if cls.LANGUAGE_CODE.lower() not in registry.language_services})
+    return {'version': MANIFEST_VERSION, 'core_modules': core_modules, 'languages': languages}
+
+
+def render_manifest(manifest: Dict[str, Any]) -> str:
+    return _HEADER + 'MANIFEST = ' + pprint.pformat(manifest, indent=1, width=110, sort_dicts=False) + '\n'
+
+
+def read_manifest(path: str = MANIFEST_PATH) -> Dict[str, Any]:
+    """The MANIFEST stored in ``path`` ({} if the file does not exist)."""
+    namespace: Dict[str, Any] = {}
+    try:
+        with open(path, encoding='utf8') as fh:
+            exec(compile(fh.read(), path, 'exec'), namespace)
+    except FileNotFoundError:
+        return {}
+    return namespace.get('MANIFEST', {})
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Generate the CodeHem registration manifest')
+    parser.add_argument('--check', action='store_true', help='Exit 1 if the manifest is out of date')
+    parser.add_argument('--output', default=MANIFEST_PATH, help='Manifest path')
+    args = parser.parse_args(argv)
+    built = build_manifest()
+    if args.check:
+        # Language order follows discovery order, so compare contents, not text
+        if read_manifest(args.output) != built:
+            print(f'{args.output} is out of date; run python -m codehem.core.manifest', file=sys.stderr)
+            return 1
+        return 0
+    with open(args.output, 'w', encoding='utf8') as fh:
+        fh.write(render_manifest(built))
+    print(f'Wrote {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
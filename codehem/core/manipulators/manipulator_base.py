@@ -6,6 +6,7 @@ import re
 from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple
 from codehem.core.formatting.formatter import BaseFormatter
+from codehem.core.utils.line_index import get_line_index
 from codehem.models.enums import CodeElementType
 logger = logging.getLogger(__name__)
 
@@ -161,15 +162,8 @@ class ManipulatorBase(ABC):
         if start_line <= 0 or end_line < start_line:
             logger.error(f'Invalid line range: start={start_line}, end={end_line}')
             return original_code
-        lines = original_code.splitlines()
-        start_index = start_line - 1
-        end_index = end_line
-        if start_index >= len(lines):
-            logger.warning(f'Start line {start_line} beyond end of code ({len(lines)} lines).')
+        index = get_line_index(original_code)
+        if start_line > index.line_count:
+            logger.warning(f'Start line {start_line} beyond end of code ({index.line_count} lines).')
             return original_code
-        end_index = min(end_index, len(lines))
-        result = []
-        result.extend(lines[:start_index])
-        result.extend(new_content.splitlines())
-        result.extend(lines[end_index:])
-        return '\n'.join(result)
\ No newline at end of file
+        return index.replace_lines(start_line, end_line, new_content)
\ No newline at end of file
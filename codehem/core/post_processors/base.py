@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from codehem.core.components.interfaces import IPostProcessor
 from codehem.models.enums import CodeElementType
+from codehem.core.utils.budget import check_deadline
+from codehem.core.utils.instrumentation import instrumented
 
 if TYPE_CHECKING:
     from codehem.models.code_element import CodeElement, CodeElementsResult
@@ -87,6 +89,7 @@ class LanguagePostProcessor(IPostProcessor, ABC):
         """
         pass
     
+    @instrumented('process_all')
     def process_all(self, raw_elements: Dict[str, List[Dict]]) -> 'CodeElementsResult':
         """
         Process all raw element data into a CodeElementsResult.
@@ -100,10 +103,10 @@ class LanguagePostProcessor(IPostProcessor, ABC):
         Returns:
             CodeElementsResult containing processed elements
         """
-        from codehem.models.code_element import CodeElementsResult
+        from codehem.models.fast_element import new_result
         
         logger.info(f'Starting post-processing of all elements for {self.language_code}')
-        result = CodeElementsResult()
+        result = new_result()
         
         # Extract decorators to use for contextual enrichment
         all_decorators = raw_elements.get('decorators', [])
@@ -112,6 +115,7 @@ class LanguagePostProcessor(IPostProcessor, ABC):
         imports = self.process_imports(raw_elements.get('imports', []))
         result.elements.extend(imports)
         logger.debug(f'Post-processed {len(imports)} import elements')
+        check_deadline('process_imports')
         
         # Process functions
         functions = self.process_functions(
@@ -120,6 +124,7 @@ class LanguagePostProcessor(IPostProcessor, ABC):
         )
         result.elements.extend(functions)
         logger.debug(f'Post-processed {len(functions)} function elements')
+        check_deadline('process_functions')
         
         # Process classes and their members
         classes = self.process_classes(
@@ -131,6 +136,7 @@ class LanguagePostProcessor(IPostProcessor, ABC):
         )
         result.elements.extend(classes)
         logger.debug(f'Post-processed {len(classes)} class elements')
+        check_deadline('process_classes')
         
         # Process additional language-specific elements
         for element_type in ['interfaces', 'enums', 'type_aliases', 'namespaces']:
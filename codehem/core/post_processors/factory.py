@@ -71,6 +71,10 @@ class PostProcessorFactory:
         if normalized_code == "javascript":
             normalized_code = "typescript"
             logger.debug("Using TypeScript post-processor for JavaScript")
+
+        # Language packages register their post-processors when loaded
+        from codehem.core.registry import registry
+        registry.load_language(normalized_code)
         
         processor_class_path = cls._registry.get(normalized_code)
         if not processor_class_path:
@@ -111,6 +115,8 @@ class PostProcessorFactory:
         Returns:
             List of language codes for which post-processors are registered
         """
+        from codehem.core.registry import registry
+        registry.initialize_components()
         return list(cls._registry.keys())
 
 
@@ -4,6 +4,7 @@ import importlib.metadata as importlib_metadata
 import logging
 import os
 import sys # Added sys import for checking module existence
+import threading
 import traceback
 from typing import Any, List, Optional, Type, Dict, TYPE_CHECKING # Added Dict, TYPE_CHECKING
 
@@ -22,6 +23,7 @@ logger = logging.getLogger(__name__)
 class Registry:
     """Central registry for CodeHem components."""
     _instance = None
+    _instance_lock = threading.Lock()
 
     def __init__(self):
         # Prevent re-initialization
@@ -31,8 +33,9 @@ class Registry:
         self._initialize()
 
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(Registry, cls).__new__(cls)
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(Registry, cls).__new__(cls)
         return cls._instance
 
     def _initialize(self):
@@ -45,8 +48,19 @@ class Registry:
         self.all_manipulators: Dict[str, Type[ManipulatorBase]] = {} # Type hint added
         self.language_configs: Dict[str, Dict] = {}
         self.discovered_modules: set[str] = set() # Type hint added
+        # Lazy loading: languages whose modules were imported, the manifest
+        # (None until read) and entry-point plugins (None until read)
+        self.loaded_languages: set[str] = set()
+        self.config_modules: Dict[str, str] = {}
+        self._core_loaded = False
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._plugins: Optional[Dict[str, str]] = None
         # Cache for LanguageService instances
         self.language_service_instances: Dict[str, 'LanguageService'] = {} # Type hint added, uses string literal
+        # Guards loading languages and creating services; reentrant because
+        # language modules look the registry up while they are imported
+        self._lock = threading.RLock()
+        self._loading: set[str] = set()
         logger.debug('Registry _initialize completed.')
 
     def register_language_detector(self, cls):
@@ -162,10 +176,12 @@ class Registry:
 
     def get_language_config(self, language_code: str) -> Optional[Dict]:
         """Retrieves the stored configuration dictionary for a language."""
+        self.load_language(language_code)
         return self.language_configs.get(language_code.lower())
 
     def get_language_detector(self, language_code: str) -> Optional[Any]:
         """Gets a language detector instance."""
+        self.load_language(language_code)
         return self.language_detectors.get(language_code.lower())
 
     # *** CHANGE START ***
@@ -178,10 +194,17 @@ class Registry:
             return None
         lang_code_lower = language_code.lower()
 
-        if lang_code_lower in self.language_service_instances:
+        instance = self.language_service_instances.get(lang_code_lower)
+        if instance is not None:
             logger.debug(f"Returning existing LanguageService instance for '{lang_code_lower}'.")
-            return self.language_service_instances[lang_code_lower]
+            return instance
+        with self._lock:
+            return self._create_language_service(lang_code_lower)
 
+    def _create_language_service(self, lang_code_lower: str) -> Optional['LanguageService']:
+        if lang_code_lower in self.language_service_instances:
+            return self.language_service_instances[lang_code_lower]
+        self.load_language(lang_code_lower)
         language_service_cls = self.language_services.get(lang_code_lower)
         if not language_service_cls:
             logger.error(f"No registered LanguageService class found for '{lang_code_lower}'.")
@@ -215,8 +238,113 @@ class Registry:
              return None
 
     def get_supported_languages(self) -> List[str]:
-        """Returns a list of supported language codes based on registered services."""
-        return list(self.language_services.keys())
+        """
+        Returns a list of supported language codes: built-in languages from the
+        manifest, entry-point plugins and any other registered services. Nothing
+        is imported to answer this unless the manifest is missing.
+        """
+        languages = list(self.manifest.get('languages', {}))
+        if not languages:
+            self.initialize_components()
+        for language_code in list(self.language_services) + list(self._plugin_modules()):
+            if language_code not in languages:
+                languages.append(language_code)
+        return languages
+
+    # ----- lazy loading -----
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        """The prebuilt registration manifest (``codehem.languages._manifest``), or {} if unavailable."""
+        if self._manifest is None:
+            try:
+                from codehem.languages._manifest import MANIFEST
+                self._manifest = MANIFEST
+            except ImportError:
+                logger.warning('Registration manifest not found; falling back to module discovery.')
+                self._manifest = {}
+        return self._manifest
+
+    def _import_component_module(self, module_name: str) -> None:
+        """Import a module for its registration side effects."""
+        if module_name in self.discovered_modules:
+            return
+        module = importlib.import_module(module_name)
+        self.discovered_modules.add(module_name)
+        if not hasattr(module, '__path__'):
+            # Packages re-export their config module's LANGUAGE_CONFIG; discovery skips them too
+            self._register_module_config(module_name, module)
+
+    def _register_module_config(self, module_name: str, module: Any) -> None:
+        """Register the module's LANGUAGE_CONFIG, if it defines one."""
+        if hasattr(module, 'LANGUAGE_CONFIG') and isinstance(module.LANGUAGE_CONFIG, dict):
+            config = module.LANGUAGE_CONFIG
+            if 'language_code' in config:
+                self.register_language_config(config['language_code'], config)
+                self.config_modules[config['language_code'].lower()] = module_name
+            else:
+                logger.warning(f"Found LANGUAGE_CONFIG in {module_name} but it lacks 'language_code' key.")
+
+    def _plugin_modules(self) -> Dict[str, str]:
+        """Language code -> module of the ``codehem.languages`` entry points (read once, not imported)."""
+        if self._plugins is None:
+            self._plugins = {}
+            try:
+                eps = importlib_metadata.entry_points(group='codehem.languages')
+            except Exception as exc:
+                logger.error("Failed to read entry points: %s", exc)
+                return self._plugins
+            for ep in eps:
+                self._plugins.setdefault(ep.name.lower(), ep.value.split(':')[0])
+        return self._plugins
+
+    def load_language(self, language_code: str) -> bool:
+        """
+        Import the modules registering ``language_code``'s components, once.
+
+        Built-in languages are loaded from the manifest, plugins from their
+        entry point. Without a manifest everything is discovered at once.
+
+        Returns:
+            True if the language is known (loaded now or before)
+        """
+        lang_code_lower = language_code.lower()
+        if lang_code_lower in self.loaded_languages:
+            return True
+        with self._lock:
+            # Reentrant lookups while the language's modules import see it as known
+            if lang_code_lower in self.loaded_languages or lang_code_lower in self._loading:
+                return True
+            return self._load_language(lang_code_lower)
+
+    def _load_language(self, lang_code_lower: str) -> bool:
+        languages = self.manifest.get('languages', {})
+        if not languages:
+            self.initialize_components()
+            return lang_code_lower in self.language_services
+        entry = languages.get(lang_code_lower)
+        plugin_module = None if entry is not None else self._plugin_modules().get(lang_code_lower)
+        if entry is None and plugin_module is None:
+            return lang_code_lower in self.language_services
+        # Other threads only see the language as loaded once its modules are imported
+        self._loading.add(lang_code_lower)
+        try:
+            if not self._core_loaded:
+                self._core_loaded = True
+                for module_name in self.manifest.get('core_modules', []):
+                    self._import_component_module(module_name)
+            if entry is not None:
+                for module_name in entry['modules']:
+                    self._import_component_module(module_name)
+            else:
+                self._load_plugin(plugin_module)
+        except Exception as e:
+            logger.error(f"Failed to load components for language '{lang_code_lower}': {e}", exc_info=True)
+        finally:
+            self._loading.discard(lang_code_lower)
+            self.loaded_languages.add(lang_code_lower)
+        logger.debug(f"Loaded components for language '{lang_code_lower}'.")
+        return True
 
     def discover_modules(self, package_name='codehem', recursive=True):
         """Discovers and imports modules in the package to trigger registration."""
@@ -262,12 +390,7 @@ class Registry:
                              logger.debug(f"Successfully imported: {module_name}")
 
                              # Check for LANGUAGE_CONFIG and register it
-                             if hasattr(imported_module, 'LANGUAGE_CONFIG') and isinstance(imported_module.LANGUAGE_CONFIG, dict):
-                                 config = imported_module.LANGUAGE_CONFIG
-                                 if 'language_code' in config:
-                                     self.register_language_config(config['language_code'], config)
-                                 else:
-                                     logger.warning(f"Found LANGUAGE_CONFIG in {module_name} but it lacks 'language_code' key.")
+                             self._register_module_config(module_name, imported_module)
 
                          except ModuleNotFoundError as mnfe:
                               logger.warning(f'Cannot import module {module_name}. Reason: {mnfe}. Check dependencies or structure.')
@@ -280,36 +403,50 @@ class Registry:
                         subpackage_name = f'{package_name}.{item}'
                         self.discover_modules(subpackage_name, recursive=recursive)
 
-    def _load_entry_point_plugins(self, group: str = 'codehem.languages') -> None:
-        """Load language modules declared as entry points."""
+    def _load_plugin(self, module_name: str) -> None:
+        """Import a plugin package declared as an entry point and its submodules."""
+        if module_name in self.discovered_modules:
+            return
         try:
-            eps = importlib_metadata.entry_points(group=group)
+            logger.debug("Loading plugin module '%s'", module_name)
+            importlib.import_module(module_name)
+            self.discovered_modules.add(module_name)
+            # Discover submodules in the plugin package
+            self.discover_modules(module_name)
         except Exception as exc:
-            logger.error("Failed to read entry points: %s", exc)
-            return
+            logger.error("Failed to load plugin module %s: %s", module_name, exc)
 
-        for ep in eps:
-            module_name = ep.value.split(':')[0]
-            if module_name in self.discovered_modules:
-                continue
-            try:
-                logger.debug("Loading plugin module '%s' from entry point '%s'", module_name, ep.name)
-                importlib.import_module(module_name)
-                self.discovered_modules.add(module_name)
-                # Discover submodules in the plugin package
-                self.discover_modules(module_name)
-            except Exception as exc:
-                logger.error("Failed to load plugin module %s: %s", module_name, exc)
+    def _load_entry_point_plugins(self) -> None:
+        """Load language modules declared as entry points."""
+        for language_code, module_name in self._plugin_modules().items():
+            self.loaded_languages.add(language_code)
+            self._load_plugin(module_name)
 
     def initialize_components(self):
-        """Discovers and initializes all components. Called once."""
+        """
+        Loads every built-in language and plugin at once. Called once.
+
+        ``import codehem`` no longer does this; languages are loaded on first
+        use through ``load_language``. Without a manifest all modules under
+        ``codehem`` are discovered instead.
+        """
+        with self._lock:
+            self._initialize_components()
+
+    def _initialize_components(self):
         if self._initialized:
             logger.debug('Components already initialized.')
             return
+        self._initialized = True
         logger.info('Starting CodeHem component initialization...')
-        self.discover_modules()  # Discover built-in modules
+        languages = self.manifest.get('languages', {})
+        if languages:
+            for language_code in languages:
+                self.load_language(language_code)
+        else:
+            self.discover_modules()  # Discover built-in modules
+            self.loaded_languages.update(self.language_services)
         self._load_entry_point_plugins()  # Load plugin packages via entry points
-        self._initialized = True
         # Log summary after initialization
         logger.info('--- Registry Content After Discovery ---')
         logger.info('Language Detectors: %s', list(self.language_detectors.keys()))
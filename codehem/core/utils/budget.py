@@ -0,0 +1,117 @@
+"""
+Per-file size and time budgets.
+
+A single pathological file (a minified bundle, generated code, a deeply
+nested literal) must not stall a batch. A ``Budget`` limits the bytes of a
+file and the seconds spent on it; ``enforce`` checks the size up front and
+opens a deadline that parsing and the extraction phases check
+cooperatively:
+
+    with enforce(Budget(max_seconds=2.0, max_bytes=1_000_000), len(code_bytes)):
+        ...
+
+``parse`` feeds tree-sitter through a read callback in ``PARSE_CHUNK_SIZE``
+chunks and stops supplying input once the deadline has passed, so a parse
+overruns by at most one chunk. Extraction calls ``check_deadline`` between
+categories and post-processing phases. Both raise ``BudgetExceededError``,
+which batch callers (``codehem extract --recursive``, ``Workspace``,
+``extract_many``) report as a skipped file. The deadline lives in a
+ContextVar, so it applies to the current thread or task only.
+"""
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Union
+
+from codehem.core.error_handling import BudgetExceededError
+from codehem.core.utils.source_io import SourceCode
+
+PARSE_CHUNK_SIZE = 64 * 1024
+
+TIMEOUT = 'timeout'
+TOO_LARGE = 'too_large'
+
+_deadline: ContextVar[Optional[float]] = ContextVar('codehem_deadline', default=None)
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Limits for one file; None disables a limit."""
+    max_seconds: Optional[float] = None
+    max_bytes: Optional[int] = None
+
+    def check_size(self, size: int) -> None:
+        """Raise ``BudgetExceededError`` if ``size`` bytes exceed ``max_bytes``."""
+        if self.max_bytes is not None and size > self.max_bytes:
+            raise BudgetExceededError(TOO_LARGE, f'{size} bytes exceed the limit of {self.max_bytes}')
+
+    def check_code(self, code: SourceCode) -> None:
+        """``check_size`` for the UTF-8 size of ``code``, encoding text only when its length is inconclusive."""
+        if self.max_bytes is None:
+            return
+        if isinstance(code, bytes):
+            self.check_size(len(code))
+            return
+        # A character takes 1 to 4 bytes in UTF-8
+        if len(code) > self.max_bytes:
+            raise BudgetExceededError(TOO_LARGE, f'at least {len(code)} bytes exceed the limit of {self.max_bytes}')
+        if 4 * len(code) > self.max_bytes:
+            self.check_size(len(code.encode('utf8')))
+
+    def check_file(self, path: Union[str, 'os.PathLike[str]']) -> None:
+        """``check_size`` for the file at ``path``, before it is read (a missing file is left to the read)."""
+        if self.max_bytes is None:
+            return
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
+            return
+        self.check_size(size)
+
+
+@contextmanager
+def enforce(budget: Optional[Budget], size: Optional[int] = None) -> Iterator[None]:
+    """
+    Check ``size`` (if given) against ``budget`` and apply its deadline
+    inside the block (nested deadlines keep the earliest).
+    """
+    if budget is None:
+        yield
+        return
+    if size is not None:
+        budget.check_size(size)
+    if budget.max_seconds is None:
+        yield
+        return
+    deadline = time.perf_counter() + budget.max_seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(deadline, current))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def check_deadline(phase: str) -> None:
+    """Raise ``BudgetExceededError`` if the current deadline has passed."""
+    deadline = _deadline.get()
+    if deadline is not None and time.perf_counter() > deadline:
+        raise BudgetExceededError(TIMEOUT, f'time limit exceeded during {phase}')
+
+
+def parse(parser: Any, code_bytes: bytes) -> Any:
+    """``parser.parse(code_bytes)`` that gives up at the current deadline."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return parser.parse(code_bytes)
+
+    def read(byte_offset: int, point: Any) -> bytes:
+        if time.perf_counter() > deadline:
+            return b''  # End of input: the parser finishes with what it has
+        return code_bytes[byte_offset:byte_offset + PARSE_CHUNK_SIZE]
+
+    tree = parser.parse(read)
+    check_deadline('parse')
+    return tree
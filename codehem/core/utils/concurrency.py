@@ -0,0 +1,37 @@
+"""
+Helpers for state shared between threads.
+
+CodeHem keeps process-wide singletons (the registry, language services) and
+caches that threads extracting in parallel share. Without the GIL (free-
+threaded CPython builds) every check-then-create on them must be locked;
+with the GIL it avoids building the same service or component map twice.
+Tree-sitter parsers are not shared at all: ``get_parser`` returns one per
+thread.
+"""
+import threading
+from functools import cached_property
+from typing import Any
+
+_MISSING = object()
+
+
+class locked_cached_property(cached_property):
+    """
+    ``functools.cached_property`` that computes the value once per instance
+    even when threads race for it (the standard one stopped locking in 3.12).
+    """
+
+    def __init__(self, func):
+        super().__init__(func)
+        self.lock = threading.RLock()
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        value = instance.__dict__.get(self.attrname, _MISSING)
+        if value is _MISSING:
+            with self.lock:
+                value = instance.__dict__.get(self.attrname, _MISSING)
+                if value is _MISSING:
+                    value = super().__get__(instance, owner)
+        return value
@@ -0,0 +1,52 @@
+"""
+Element type selection for ``CodeHem.extract(code, types=...)``.
+
+Extraction works on raw categories (``imports``, ``functions``, ``members``,
+...), each produced by one extractor. A selection of element types maps to
+the categories that have to be extracted; member types also need their
+containers (classes and interfaces), since members are attached to them,
+and decorated types need the decorators that attach to their elements.
+"""
+from typing import FrozenSet, Iterable, Optional, Union
+
+from codehem.models.enums import CodeElementType
+
+# Raw category -> element types it produces
+CATEGORY_TYPES = {
+    'imports': {CodeElementType.IMPORT},
+    'functions': {CodeElementType.FUNCTION},
+    'classes': {CodeElementType.CLASS},
+    'members': {CodeElementType.METHOD, CodeElementType.PROPERTY_GETTER, CodeElementType.PROPERTY_SETTER},
+    'properties': {CodeElementType.PROPERTY},
+    'static_properties': {CodeElementType.STATIC_PROPERTY},
+    'decorators': {CodeElementType.DECORATOR},
+    'interfaces': {CodeElementType.INTERFACE},
+    'enums': {CodeElementType.ENUM},
+    'type_aliases': {CodeElementType.TYPE_ALIAS},
+    'namespaces': {CodeElementType.NAMESPACE},
+}
+MEMBER_CATEGORIES = frozenset({'members', 'properties', 'static_properties'})
+CONTAINER_CATEGORIES = frozenset({'classes', 'interfaces'})
+DECORATED_CATEGORIES = frozenset({'functions', 'classes', 'members'})
+
+ElementTypes = Optional[Iterable[Union[CodeElementType, str]]]
+
+
+def categories_for_types(types: ElementTypes) -> Optional[FrozenSet[str]]:
+    """
+    Raw categories needed to extract ``types``.
+
+    Returns None (every category) when ``types`` is None. Raises ValueError
+    for unknown element types.
+    """
+    if types is None:
+        return None
+    if isinstance(types, (str, CodeElementType)):
+        types = [types]
+    wanted = {CodeElementType(t) for t in types}
+    categories = {category for category, produced in CATEGORY_TYPES.items() if produced & wanted}
+    if categories & MEMBER_CATEGORIES:
+        categories |= CONTAINER_CATEGORIES
+    if categories & DECORATED_CATEGORIES:
+        categories.add('decorators')
+    return frozenset(categories)
@@ -0,0 +1,59 @@
+"""
+Extraction levels for ``CodeHem.extract(code, level=...)``.
+
+Levels:
+    outline: imports and top-level definitions (classes, functions,
+        interfaces, enums, type aliases, namespaces) with names and ranges
+    members: outline plus class members (methods, getters/setters, static
+        properties, fields) with names, kinds and ranges
+    full: everything, including parameters, return info, decorators and
+        instance attributes (default)
+
+The level of the running extraction is held in a context variable so the
+element extractors can skip per-member analyses without changing their
+signatures.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Iterator, Union
+
+
+class ExtractionLevel(str, Enum):
+    """How much detail extraction computes"""
+    OUTLINE = 'outline'
+    MEMBERS = 'members'
+    FULL = 'full'
+
+    @property
+    def rank(self) -> int:
+        return _RANKS[self]
+
+    def includes(self, other: 'ExtractionLevel') -> bool:
+        """True if this level computes everything ``other`` does."""
+        return self.rank >= other.rank
+
+
+_RANKS = {ExtractionLevel.OUTLINE: 0, ExtractionLevel.MEMBERS: 1, ExtractionLevel.FULL: 2}
+
+_level: ContextVar[ExtractionLevel] = ContextVar('codehem_extraction_level', default=ExtractionLevel.FULL)
+
+
+def current_level() -> ExtractionLevel:
+    """Level of the extraction running in this context."""
+    return _level.get()
+
+
+def wants_details() -> bool:
+    """True if per-member analyses (parameters, return info, decorators) should run."""
+    return _level.get() is ExtractionLevel.FULL
+
+
+@contextmanager
+def extraction_level(level: Union[ExtractionLevel, str]) -> Iterator[None]:
+    """Run extractors at ``level`` inside the block."""
+    token = _level.set(ExtractionLevel(level))
+    try:
+        yield
+    finally:
+        _level.reset(token)
@@ -1,11 +1,30 @@
+
 import hashlib
 
+from codehem.core.utils.source_io import SourceCode, as_bytes
+
+HASH_ALGORITHMS = ("sha256", "blake2b")
 
-def sha1_code(code: str) -> str:
-    """Return the SHA1 hash of the given code string."""
-    return hashlib.sha1(code.encode("utf8")).hexdigest()
+
+def sha1_code(code: SourceCode) -> str:
+    """Return the SHA1 hash of the given code (a string or its UTF-8 bytes)."""
+    return hashlib.sha1(as_bytes(code)).hexdigest()
 
 
 def sha256_code(code: str) -> str:
     """Return the SHA256 hash of the given code string."""
     return hashlib.sha256(code.encode("utf8")).hexdigest()
+
+
+def blake2b_code(code: str) -> str:
+    """Return the BLAKE2b hash of the given code string."""
+    return hashlib.blake2b(code.encode("utf8")).hexdigest()
+
+
+def hash_code(code: str, algorithm: str = "sha256") -> str:
+    """Return the hash of the given code string using ``algorithm`` ('sha256' or 'blake2b')."""
+    if algorithm == "sha256":
+        return sha256_code(code)
+    if algorithm == "blake2b":
+        return blake2b_code(code)
+    raise ValueError(f"Unsupported hash algorithm: {algorithm}")
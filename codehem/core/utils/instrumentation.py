@@ -0,0 +1,211 @@
+"""
+Lightweight per-stage timing instrumentation.
+
+Hot paths (parsing, query execution, raw extraction, post-processing, model
+building, patching) are wrapped in named spans. Spans nest: each one records
+its total duration and its self time (total minus time spent in child
+spans), so ``extract`` can be broken down into ``parse``, ``query``,
+``extract.*``, ``process_*`` and ``to_model``. Counters record sizes such as
+parsed bytes and produced elements.
+
+Instrumentation is disabled by default. While disabled, ``instrumented``
+functions cost one global flag check and ``span``/``count`` return
+immediately. Enable it with ``enable()`` (or ``CodeHem.enable_metrics()``)
+and read the aggregated numbers with ``snapshot()`` (``CodeHem.metrics()``).
+
+Sinks receive every finished span and counter update, e.g. for exporting to
+a monitoring system::
+
+    class StatsdSink(MetricsSink):
+        def on_span(self, name, path, duration, self_duration):
+            statsd.timing(f'codehem.{name}', duration * 1000)
+
+    add_sink(StatsdSink())
+"""
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+_enabled = False
+_lock = threading.Lock()
+# name -> [count, total, self, min, max] in seconds
+_spans: Dict[str, List[float]] = {}
+_counters: Dict[str, float] = {}
+_sinks: List['MetricsSink'] = []
+# Stack of open spans of the current thread/task: tuple of _Frame
+_stack: ContextVar[Tuple['_Frame', ...]] = ContextVar('codehem_span_stack', default=())
+
+
+class MetricsSink:
+    """Receives instrumentation events; override the hooks you need."""
+
+    def on_span(self, name: str, path: Tuple[str, ...], duration: float, self_duration: float) -> None:
+        """Called when a span ends. ``path`` lists the enclosing span names, outermost first."""
+
+    def on_counter(self, name: str, value: float) -> None:
+        """Called when a counter is incremented by ``value``."""
+
+
+class LoggingSink(MetricsSink):
+    """Logs every span at DEBUG level."""
+
+    def __init__(self, log: logging.Logger = logger):
+        self.log = log
+
+    def on_span(self, name: str, path: Tuple[str, ...], duration: float, self_duration: float) -> None:
+        self.log.debug('span %s %.3fms (self %.3fms)', '/'.join(path + (name,)), duration * 1000,
+                       self_duration * 1000)
+
+
+class _Frame:
+    __slots__ = ('name', 'children')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.children = 0.0
+
+
+def enable(enabled: bool = True) -> None:
+    """Turn instrumentation on (or off with ``enable(False)``)."""
+    global _enabled
+    _enabled = enabled
+
+
+def disable() -> None:
+    """Turn instrumentation off. Collected metrics are kept until ``reset()``."""
+    enable(False)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def add_sink(sink: MetricsSink) -> None:
+    with _lock:
+        _sinks.append(sink)
+
+
+def remove_sink(sink: MetricsSink) -> None:
+    with _lock:
+        if sink in _sinks:
+            _sinks.remove(sink)
+
+
+def _record(name: str, path: Tuple[str, ...], duration: float, self_duration: float) -> None:
+    with _lock:
+        stats = _spans.get(name)
+        if stats is None:
+            _spans[name] = [1, duration, self_duration, duration, duration]
+        else:
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] += self_duration
+            if duration < stats[3]:
+                stats[3] = duration
+            if duration > stats[4]:
+                stats[4] = duration
+        sinks = tuple(_sinks)
+    for sink in sinks:
+        try:
+            sink.on_span(name, path, duration, self_duration)
+        except Exception as e:
+            logger.warning(f'Metrics sink {sink!r} failed: {e}')
+
+
+@contextmanager
+def _timed_span(name: str) -> Iterator[None]:
+    stack = _stack.get()
+    frame = _Frame(name)
+    token = _stack.set(stack + (frame,))
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        _stack.reset(token)
+        if stack:
+            stack[-1].children += duration
+        _record(name, tuple(f.name for f in stack), duration, duration - frame.children)
+
+
+@contextmanager
+def _noop() -> Iterator[None]:
+    yield
+
+
+def span(name: str):
+    """Context manager timing the enclosed block as span ``name`` (no-op while disabled)."""
+    return _timed_span(name) if _enabled else _noop()
+
+
+def instrumented(name: str) -> Callable[[F], F]:
+    """Decorator timing every call of the function as span ``name``."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _timed_span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def count(name: str, value: float = 1) -> None:
+    """Increment counter ``name`` by ``value`` (no-op while disabled)."""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+        sinks = tuple(_sinks)
+    for sink in sinks:
+        try:
+            sink.on_counter(name, value)
+        except Exception as e:
+            logger.warning(f'Metrics sink {sink!r} failed: {e}')
+
+
+def snapshot(reset_after: bool = False) -> Dict[str, Any]:
+    """
+    Aggregated metrics collected so far.
+
+    Returns:
+        {'enabled': bool,
+         'spans': {name: {'count', 'total_ms', 'self_ms', 'mean_ms', 'min_ms', 'max_ms'}},
+         'counters': {name: value}}
+    """
+    with _lock:
+        spans = {
+            name: {
+                'count': int(n),
+                'total_ms': round(total * 1000, 4),
+                'self_ms': round(own * 1000, 4),
+                'mean_ms': round(total / n * 1000, 4),
+                'min_ms': round(low * 1000, 4),
+                'max_ms': round(high * 1000, 4),
+            }
+            for name, (n, total, own, low, high) in sorted(_spans.items())
+        }
+        counters = dict(sorted(_counters.items()))
+        if reset_after:
+            _spans.clear()
+            _counters.clear()
+    return {'enabled': _enabled, 'spans': spans, 'counters': counters}
+
+
+def reset() -> None:
+    """Discard collected metrics."""
+    with _lock:
+        _spans.clear()
+        _counters.clear()
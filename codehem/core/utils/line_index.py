@@ -0,0 +1,170 @@
+"""
+Line index for fast line/offset conversions on source text.
+
+A ``LineIndex`` records the offset at which every line starts, so that
+mapping a line range to a text slice (or an offset back to a line) is a
+``bisect`` lookup instead of a full ``splitlines()`` pass. Lines are split
+on ``\\n`` only, which matches the row numbering used by tree-sitter.
+"""
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from codehem.core.utils.hashing import sha1_code
+
+
+class LineIndex:
+    """Precomputed line-start offsets for a single source string."""
+
+    __slots__ = ('text', 'line_starts', '_byte_starts')
+
+    def __init__(self, text: str):
+        self.text = text
+        starts = [0]
+        find = text.find
+        pos = find('\n')
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = find('\n', pos + 1)
+        self.line_starts: List[int] = starts
+        self._byte_starts: Optional[List[int]] = None
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines, counted the same way as ``str.splitlines()``."""
+        if not self.text:
+            return 0
+        if self.text.endswith('\n'):
+            return len(self.line_starts) - 1
+        return len(self.line_starts)
+
+    def line_start(self, line: int) -> int:
+        """Offset of the first character of a 1-based line."""
+        if line <= 1:
+            return 0
+        if line > len(self.line_starts):
+            return len(self.text)
+        return self.line_starts[line - 1]
+
+    def line_end(self, line: int) -> int:
+        """Offset just past the last character of a 1-based line, excluding its terminator."""
+        if line < len(self.line_starts):
+            end = self.line_starts[line] - 1
+            if end > 0 and self.text[end - 1] == '\r':
+                end -= 1
+            return end
+        return len(self.text)
+
+    def line_of_offset(self, offset: int) -> int:
+        """1-based line containing the given character offset."""
+        return bisect_right(self.line_starts, offset)
+
+    def span(self, start_line: int, end_line: int) -> Tuple[int, int]:
+        """Character span covering lines ``start_line``..``end_line`` (inclusive, 1-based)."""
+        end_line = min(end_line, max(self.line_count, 1))
+        return self.line_start(start_line), self.line_end(end_line)
+
+    def slice_lines(self, start_line: int, end_line: int) -> str:
+        """Text of lines ``start_line``..``end_line`` without the final line terminator."""
+        start, end = self.span(start_line, end_line)
+        return self.text[start:end]
+
+    def newline(self) -> str:
+        """Line terminator used by the text (``\\r\\n`` or ``\\n``)."""
+        if len(self.line_starts) > 1:
+            first_break = self.line_starts[1] - 1
+            if first_break > 0 and self.text[first_break - 1] == '\r':
+                return '\r\n'
+        return '\n'
+
+    def replace_lines(self, start_line: int, end_line: int, new_content: str) -> str:
+        """
+        Replace lines ``start_line``..``end_line`` with ``new_content``.
+
+        Text outside the replaced lines is preserved verbatim. An empty
+        ``new_content`` removes the lines together with their terminator.
+
+        Args:
+            start_line: First line to replace (1-based)
+            end_line: Last line to replace (inclusive)
+            new_content: Replacement text
+
+        Returns:
+            The updated source text
+        """
+        text = self.text
+        end_line = min(end_line, self.line_count)
+        head = text[:self.line_start(start_line)]
+        if end_line < len(self.line_starts):
+            tail_start = self.line_starts[end_line]
+        else:
+            tail_start = len(text)
+        tail = text[tail_start:]
+        new_lines = new_content.splitlines()
+        if not new_lines:
+            return head + tail
+        terminator = text[self.line_end(end_line):tail_start]
+        return head + self.newline().join(new_lines) + terminator + tail
+
+    def char_offset(self, byte_offset: int) -> int:
+        """Convert a UTF-8 byte offset (as reported by tree-sitter) to a character offset."""
+        if self._byte_starts is None:
+            if self.text.isascii():
+                self._byte_starts = self.line_starts
+            else:
+                text = self.text
+                starts = self.line_starts
+                byte_starts = [0]
+                for idx in range(1, len(starts)):
+                    byte_starts.append(byte_starts[-1] + len(text[starts[idx - 1]:starts[idx]].encode('utf8')))
+                self._byte_starts = byte_starts
+        if self._byte_starts is self.line_starts:
+            return byte_offset
+        line_idx = bisect_right(self._byte_starts, byte_offset) - 1
+        line_start = self.line_starts[line_idx]
+        line_stop = self.line_starts[line_idx + 1] if line_idx + 1 < len(self.line_starts) else len(self.text)
+        prefix = self.text[line_start:line_stop].encode('utf8')[:byte_offset - self._byte_starts[line_idx]]
+        return line_start + len(prefix.decode('utf8', errors='ignore'))
+
+    def slice_bytes(self, start_byte: int, end_byte: int) -> str:
+        """Text between two UTF-8 byte offsets."""
+        return self.text[self.char_offset(start_byte):self.char_offset(end_byte)]
+
+
+# Indexes keep their text alive, so the cache is bounded by entries and by characters
+LINE_INDEX_CACHE_SIZE = 8
+LINE_INDEX_CACHE_CHARS = 4_000_000
+
+# SHA1 of the text -> its index
+_line_indexes: 'OrderedDict[str, LineIndex]' = OrderedDict()
+_line_indexes_chars = 0
+_line_indexes_lock = threading.Lock()
+
+
+def get_line_index(text: str) -> LineIndex:
+    """Return a cached ``LineIndex`` for the given source text."""
+    global _line_indexes_chars
+    with _line_indexes_lock:
+        # Callers usually pass the same string object again; skip hashing it
+        for key, index in _line_indexes.items():
+            if index.text is text:
+                _line_indexes.move_to_end(key)
+                return index
+    key = sha1_code(text)
+    with _line_indexes_lock:
+        index = _line_indexes.get(key)
+        if index is not None:
+            _line_indexes.move_to_end(key)
+            return index
+    index = LineIndex(text)
+    if len(text) > LINE_INDEX_CACHE_CHARS:
+        return index
+    with _line_indexes_lock:
+        if key not in _line_indexes:
+            _line_indexes[key] = index
+            _line_indexes_chars += len(text)
+            while len(_line_indexes) > LINE_INDEX_CACHE_SIZE or _line_indexes_chars > LINE_INDEX_CACHE_CHARS:
+                _, evicted = _line_indexes.popitem(last=False)
+                _line_indexes_chars -= len(evicted.text)
+    return index
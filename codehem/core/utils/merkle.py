@@ -0,0 +1,49 @@
+"""
+Merkle hashing over extracted element trees.
+
+Every element gets a digest covering its type, name, content and the digests
+of its children; the file-level root covers all top-level elements. Two
+subtrees with equal digests are identical, so comparisons (diffs, cache
+invalidation, incremental reindexing) can skip them without looking inside.
+"""
+import hashlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from codehem.models.code_element import CodeElement, CodeElementsResult
+
+DIGEST_SIZE = 16
+
+
+def element_digest(element: 'CodeElement') -> str:
+    """Compute (and store on the element) the Merkle digest of an element subtree."""
+    hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    hasher.update(element.type.value.encode('utf8'))
+    hasher.update(b'\0')
+    hasher.update(element.name.encode('utf8'))
+    hasher.update(b'\0')
+    hasher.update(element.content_bytes())
+    for child in element.children:
+        hasher.update(b'\1')
+        hasher.update(bytes.fromhex(element_digest(child)))
+    digest = hasher.hexdigest()
+    element._merkle_hash = digest
+    return digest
+
+
+def build_merkle_tree(result: 'CodeElementsResult') -> str:
+    """
+    Compute Merkle digests for every element of an extraction result.
+
+    Args:
+        result: The extraction result to hash
+
+    Returns:
+        The file-level root digest (also stored on the result)
+    """
+    hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    for element in result.elements:
+        hasher.update(bytes.fromhex(element_digest(element)))
+    root = hasher.hexdigest()
+    result._merkle_root = root
+    return root
@@ -0,0 +1,137 @@
+"""
+Retention policy for tree-sitter nodes referenced from extraction results.
+
+Extractors attach live ``tree_sitter.Node`` objects to ranges and raw data
+(``CodeRange.node``, ``'node'``/``'range_node'`` entries kept in
+``additional_data``). A node keeps its whole syntax tree and source bytes
+alive, so a cached result would pin every tree it was built from.
+
+Policies:
+    none: drop node references (default; safe to cache and serialize)
+    weak: replace nodes with ``NodeRef`` handles that resolve back to the node
+        while its tree is still held by the bounded live-tree cache
+    full: keep the live nodes
+"""
+import threading
+from collections import OrderedDict
+from enum import Enum
+from itertools import count
+from typing import Any, Callable, Dict, Optional, Union
+
+from tree_sitter import Node
+
+LIVE_TREE_LIMIT = 64
+
+_live_trees: 'OrderedDict[int, Node]' = OrderedDict()
+_tree_keys = count(1)
+_live_trees_lock = threading.Lock()
+
+
+class NodeRetention(str, Enum):
+    """How extraction results keep tree-sitter nodes"""
+    NONE = 'none'
+    WEAK = 'weak'
+    FULL = 'full'
+
+
+def register_tree(root: Node) -> int:
+    """Keep ``root`` resolvable for ``NodeRef`` handles; evicts the oldest tree beyond the limit."""
+    with _live_trees_lock:
+        key = next(_tree_keys)
+        _live_trees[key] = root
+        while len(_live_trees) > LIVE_TREE_LIMIT:
+            _live_trees.popitem(last=False)
+    return key
+
+
+class NodeRef:
+    """Handle to a tree-sitter node that does not keep its tree alive."""
+
+    __slots__ = ('tree_key', 'type', 'start_byte', 'end_byte')
+
+    def __init__(self, tree_key: int, node: Node):
+        self.tree_key = tree_key
+        self.type = node.type
+        self.start_byte = node.start_byte
+        self.end_byte = node.end_byte
+
+    def __repr__(self) -> str:
+        return f'NodeRef({self.type}, {self.start_byte}:{self.end_byte})'
+
+    @property
+    def alive(self) -> bool:
+        """True while the node's tree is still in the live-tree cache."""
+        return self.tree_key in _live_trees
+
+    def resolve(self) -> Optional[Node]:
+        """Return the live node, or None once its tree was evicted."""
+        root = _live_trees.get(self.tree_key)
+        if root is None:
+            return None
+        node = root.descendant_for_byte_range(self.start_byte, self.end_byte)
+        while node is not None and node.start_byte == self.start_byte and node.end_byte == self.end_byte:
+            if node.type == self.type:
+                return node
+            node = node.parent
+        return None
+
+
+def _weak_converter() -> Callable[[Node], NodeRef]:
+    """Build a node -> NodeRef converter registering each distinct tree once."""
+    tree_keys: Dict[Node, int] = {}
+
+    def convert(node: Node) -> NodeRef:
+        root = node
+        while root.parent is not None:
+            root = root.parent
+        tree_key = tree_keys.get(root)
+        if tree_key is None:
+            tree_key = tree_keys[root] = register_tree(root)
+        return NodeRef(tree_key, node)
+    return convert
+
+
+def _retain(value: Any, convert: Optional[Callable[[Node], NodeRef]]) -> Any:
+    """Copy of ``value`` with nodes dropped (no converter) or converted to NodeRefs."""
+    if isinstance(value, dict):
+        kept = {}
+        for key, item in value.items():
+            if isinstance(item, Node):
+                if convert is not None:
+                    kept[key] = convert(item)
+            else:
+                kept[key] = _retain(item, convert)
+        return kept
+    if isinstance(value, list):
+        return [_retain(item, convert) for item in value]
+    return value
+
+
+def apply_node_retention(result: Any, policy: Union[str, NodeRetention] = NodeRetention.NONE) -> Any:
+    """
+    Apply a node retention policy to an extraction result in place.
+
+    Args:
+        result: CodeElementsResult (or its fast counterpart)
+        policy: 'none', 'weak' or 'full'
+
+    Returns:
+        The same result object
+
+    Raises:
+        ValueError: If ``policy`` is not a known retention policy
+    """
+    policy = NodeRetention(policy)
+    if policy is NodeRetention.FULL:
+        return result
+    convert = _weak_converter() if policy is NodeRetention.WEAK else None
+    stack = list(result.elements)
+    while stack:
+        element = stack.pop()
+        code_range = element.range
+        if code_range is not None and isinstance(code_range.node, Node):
+            code_range.node = convert(code_range.node) if convert is not None else None
+        if element.additional_data:
+            element.additional_data = _retain(element.additional_data, convert)
+        stack.extend(element.children)
+    return result
@@ -0,0 +1,57 @@
+"""
+Bytes-first source handling.
+
+Tree-sitter parses UTF-8 bytes and extraction decodes node text from those
+bytes, so a file never needs to exist as one ``str`` on the extraction path:
+
+    code = CodeHem.load_file_bytes(path)   # one binary read, UTF-8 bytes
+    hem.extract(code)                      # parsed as is, no re-encoding
+
+``read_source`` reads a file with a single binary read and detects its
+encoding once; input that is not UTF-8 is transcoded to UTF-8 then, so
+every byte offset downstream stays a UTF-8 offset. ``as_bytes`` and
+``as_text`` let APIs accept either form and convert only when needed.
+"""
+import locale
+from typing import Tuple, Union
+
+# Source code as text or as UTF-8 bytes
+SourceCode = Union[str, bytes]
+
+UTF8 = 'utf-8'
+
+
+def as_bytes(code: SourceCode) -> bytes:
+    """UTF-8 bytes of ``code`` (bytes are returned as is, without a copy)."""
+    return code if isinstance(code, bytes) else code.encode('utf8')
+
+
+def as_text(code: SourceCode) -> str:
+    """``code`` as text (UTF-8 bytes are decoded)."""
+    return code.decode('utf8', errors='replace') if isinstance(code, bytes) else code
+
+
+def detect_encoding(data: bytes) -> str:
+    """UTF-8 if ``data`` is valid UTF-8, else the locale's preferred encoding."""
+    if data.isascii():
+        return UTF8
+    try:
+        data.decode('utf8')
+    except UnicodeDecodeError:
+        return locale.getpreferredencoding(False)
+    return UTF8
+
+
+def read_source(file_path: str) -> Tuple[bytes, str]:
+    """
+    Read ``file_path`` with one binary read.
+
+    Returns:
+        Tuple of (UTF-8 bytes, detected encoding of the file)
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    encoding = detect_encoding(data)
+    if encoding != UTF8:
+        data = data.decode(encoding, errors='replace').encode('utf8')
+    return data, encoding
@@ -3,27 +3,46 @@ import time
 from contextlib import contextmanager
 from pathlib import Path
 from collections import defaultdict
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from codehem.main import CodeHem
-from codehem.core.error_handling import WriteConflictError
+from codehem.core.error_handling import BudgetExceededError, WriteConflictError
+from codehem.core.utils.budget import Budget
+from codehem.models.element_table import ElementTable
+
+# Seconds between attempts to take a file's lock
+LOCK_POLL_INTERVAL = 0.05
 
 
 class Workspace:
     """Simple workspace index and patch orchestrator."""
 
-    def __init__(self, root: str):
+    def __init__(self, root: str, budget: Optional[Budget] = None):
         self.root = Path(root)
+        # Per-file limits; files over budget are listed in ``skipped``
+        self.budget = budget
+        # Relative path -> why the file is not indexed
+        self.skipped: Dict[str, str] = {}
         self.index: Dict[Tuple[str, str], List[Tuple[str, str]]] = defaultdict(list)
+        # Merkle root of every indexed file (relative path -> digest)
+        self.file_hashes: Dict[str, str] = {}
+        self._file_keys: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+        # Element table of every indexed file (relative path -> table); full
+        # results are not kept, they would hold every file's content
+        self.tables: Dict[str, ElementTable] = {}
 
     @classmethod
-    def open(cls, root: str) -> "Workspace":
-        ws = cls(root)
+    def open(cls, root: str, budget: Optional[Budget] = None) -> "Workspace":
+        ws = cls(root, budget)
         ws._build_index()
         return ws
 
     def _build_index(self) -> None:
         self.index.clear()
+        self.file_hashes.clear()
+        self._file_keys.clear()
+        self.tables.clear()
+        self.skipped.clear()
         for path in self.root.rglob("*"):
             if not path.is_file():
                 continue
@@ -31,22 +50,90 @@ class Workspace:
                 hem = CodeHem.from_file_path(str(path))
             except ValueError:
                 continue
-            code = hem.load_file(str(path))
-            result = hem.extract(code)
-            self._index_file(path, hem, result)
+            result = self._extract(path, hem)
+            if result is not None:
+                self._index_file(path, hem, result)
+
+    def _extract(self, path: Path, hem: CodeHem):
+        """Extract ``path`` within the budget; None (and a ``skipped`` entry) if it is over budget."""
+        current_file = str(path.relative_to(self.root))
+        try:
+            if self.budget is not None:
+                self.budget.check_file(path)
+            result = hem.extract(hem.load_file_bytes(str(path)), budget=self.budget)
+        except BudgetExceededError as e:
+            self.skipped[current_file] = str(e)
+            return None
+        self.skipped.pop(current_file, None)
+        return result
+
+    def refresh(self, file_path: str) -> bool:
+        """
+        Re-extract ``file_path`` and update its index entries if it changed.
+
+        Files whose Merkle root is unchanged keep their entries untouched.
+        A file now over budget is removed from the index and listed in
+        ``skipped``; a deleted file is removed from the index.
+
+        Returns:
+            True if the index was updated, False if the file was unchanged
+        """
+        path = self.root / file_path
+        if not path.exists():
+            self._remove_file(str(path.relative_to(self.root)))
+            return True
+        hem = CodeHem.from_file_path(str(path))
+        elements = self._extract(path, hem)
+        if elements is None:
+            return self._forget_file(str(path.relative_to(self.root)))
+        return self._index_file(path, hem, elements)
+
+    def _remove_file(self, current_file: str) -> None:
+        """Forget a deleted file, including any ``skipped`` entry."""
+        self.skipped.pop(current_file, None)
+        self._forget_file(current_file)
 
-    def _index_file(self, path: Path, hem: CodeHem, elements) -> None:
+    def _forget_file(self, current_file: str) -> bool:
+        self.tables.pop(current_file, None)
+        if self.file_hashes.pop(current_file, None) is None:
+            return False
+        self._drop_file(current_file)
+        return True
+
+    def _drop_file(self, current_file: str) -> None:
+        for key in self._file_keys.pop(current_file, ()):
+            entries = [entry for entry in self.index.get(key, []) if entry[0] != current_file]
+            if entries:
+                self.index[key] = entries
+            else:
+                self.index.pop(key, None)
+
+    def _index_file(self, path: Path, hem: CodeHem, elements) -> bool:
         current_file = str(path.relative_to(self.root))
+        root_hash = elements.merkle_root
+        # Keep the newest table even when unchanged; line positions may have moved
+        self.tables[current_file] = ElementTable.from_result(elements, current_file)
+        if self.file_hashes.get(current_file) == root_hash:
+            return False
+        if current_file in self.file_hashes:
+            self._drop_file(current_file)
+        self.file_hashes[current_file] = root_hash
 
         def visit(element):
             key = (element.name, element.type.value)
             xpath = hem.short_xpath(elements, element)
             self.index[key].append((current_file, xpath))
+            self._file_keys[current_file].add(key)
             for child in getattr(element, "children", []):
                 visit(child)
 
         for el in elements.elements:
             visit(el)
+        return True
+
+    def element_table(self) -> ElementTable:
+        """Columnar table of every element in the workspace (see ``ElementTable``)."""
+        return ElementTable.from_tables(self.tables[path] for path in sorted(self.tables))
 
     def find(self, name: str, kind: str) -> Optional[Tuple[str, str]]:
         matches = self.index.get((name, kind))
@@ -54,23 +141,36 @@ class Workspace:
             return None
         return matches[0]
 
+    @staticmethod
+    def _lock_path(path: Path) -> Path:
+        return path.with_suffix(path.suffix + ".lock")
+
+    @staticmethod
+    def _try_lock(lock_path: Path) -> bool:
+        """Create ``lock_path`` exclusively; False if another writer holds it."""
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        return True
+
+    @staticmethod
+    def _unlock(lock_path: Path) -> None:
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
     @contextmanager
     def _file_lock(self, path: Path):
-        lock_path = path.with_suffix(path.suffix + ".lock")
-        while True:
-            try:
-                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-                os.close(fd)
-                break
-            except FileExistsError:
-                time.sleep(0.05)
+        lock_path = self._lock_path(path)
+        while not self._try_lock(lock_path):
+            time.sleep(LOCK_POLL_INTERVAL)
         try:
             yield
         finally:
-            try:
-                os.remove(lock_path)
-            except OSError:
-                pass
+            self._unlock(lock_path)
 
     def apply_patch(
         self,
@@ -103,8 +203,9 @@ class Workspace:
                 raise
             with open(abs_path, "w", encoding="utf8") as fh:
                 fh.write(result["code"])
-        # Rebuild index for this file
-        result_code = result["code"] if isinstance(result, dict) else result
-        elements = hem.extract(result_code)
-        self._index_file(abs_path, hem, elements)
+            # Rebuild index for this file inside the lock, so an older version
+            # never overwrites a newer one
+            result_code = result["code"] if isinstance(result, dict) else result
+            elements = hem.extract(result_code)
+            self._index_file(abs_path, hem, elements)
         return result
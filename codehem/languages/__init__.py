@@ -1,71 +1,155 @@
 """
 Language detection and service management.
+
+Files are routed by extension through a map built from the registration
+manifest, so resolving a ``.py`` file imports only the Python language.
+Content detection is the fallback: detectors score a bounded prefix sample
+of the code and results are memoized by content hash.
 """
-from typing import List, Optional, Any
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any
+import os
 import re
 import logging
+import threading
 from codehem.core.registry import registry
 from codehem.core.language_service import LanguageService
+from codehem.core.utils.hashing import sha1_code
 
 logger = logging.getLogger(__name__)
 
+# Detectors see at most this many characters (cut at a line boundary)
+DETECTION_SAMPLE_SIZE = 8192
+DETECTION_CACHE_SIZE = 512
+
+_PYTHON_FALLBACK_DEF = re.compile('def\\s+\\w+\\s*\\(')
+_PYTHON_FALLBACK_BLOCK = re.compile(':\\s*\\n')
+_TS_FALLBACK_FUNCTION = re.compile('function\\s+\\w+\\s*\\(')
+_TS_FALLBACK_ANNOTATION = re.compile(':\\s*\\w+')
+
+_extension_map: Optional[Dict[str, str]] = None
+_detection_cache: 'OrderedDict[str, Optional[str]]' = OrderedDict()
+_detection_lock = threading.Lock()
+
+
 def get_language_service(language_code: str) -> Optional[LanguageService]:
     """Return the language service registered for ``language_code``."""
     return registry.get_language_service(language_code.lower())
 
-def get_language_service_for_file(file_path: str) -> Optional[LanguageService]:
-    """Get language service for the specified file based on its extension."""
-    import os
+
+def _extensions() -> Dict[str, str]:
+    """Extension -> language code from the manifest; the first language listing an extension wins."""
+    global _extension_map
+    if _extension_map is None:
+        mapping: Dict[str, str] = {}
+        for language_code, entry in registry.manifest.get('languages', {}).items():
+            for ext in entry.get('extensions', []):
+                mapping.setdefault(ext.lower(), language_code)
+        _extension_map = mapping
+    return _extension_map
+
+
+def get_language_for_file(file_path: str) -> Optional[str]:
+    """Language code for ``file_path`` based on its extension, or None."""
     _, ext = os.path.splitext(file_path)
     if not ext:
         return None
-    
-    # Try to get language service based on file extension
+    ext = ext.lower()
+    language_code = _extensions().get(ext)
+    if language_code is not None:
+        return language_code
+    # Plugins and languages missing from the manifest
     for language_code in registry.get_supported_languages():
         service = get_language_service(language_code)
-        if service and ext.lower() in service.file_extensions:
-            return service
-    
+        if service and ext in service.file_extensions:
+            return service.language_code
     return None
 
-def get_language_service_for_code(code: str) -> Optional[LanguageService]:
-    """
-    Attempt to detect language from code content.
-    This is a heuristic approach and not 100% reliable.
-    """
-    if not code.strip():
-        return None
-    
-    results = []
-    # Use all available detectors
+
+def get_language_service_for_file(file_path: str) -> Optional[LanguageService]:
+    """Get language service for the specified file based on its extension."""
+    language_code = get_language_for_file(file_path)
+    return get_language_service(language_code) if language_code else None
+
+
+def _sample(code: str) -> str:
+    if len(code) <= DETECTION_SAMPLE_SIZE:
+        return code
+    cut = code.rfind('\n', 0, DETECTION_SAMPLE_SIZE)
+    return code[:cut + 1] if cut > 0 else code[:DETECTION_SAMPLE_SIZE]
+
+
+def _detect(code: str) -> Optional[str]:
+    sample = _sample(code)
+    best: Optional[str] = None
+    best_confidence = 0.0
     for language_code in registry.get_supported_languages():
         detector = registry.get_language_detector(language_code)
-        if detector:
-            confidence = detector.detect_confidence(code)
-            logger.debug(f"Language detection confidence for {language_code}: {confidence}")
-            if confidence > 0:
-                results.append((language_code, confidence))
-    
-    if not results:
+        if not detector:
+            continue
+        confidence = detector.detect_confidence(sample)
+        logger.debug(f"Language detection confidence for {language_code}: {confidence}")
+        if confidence > best_confidence:
+            best, best_confidence = language_code, confidence
+            if confidence >= 1.0:
+                break  # Nothing can score higher; earlier languages win ties
+    if best is not None:
+        logger.debug(f"Best language match: {best} with confidence {best_confidence}")
+        # Use the language with the highest confidence if it's above a threshold
+        if best_confidence > 0.5:
+            return best
+    else:
         logger.debug("No language detected")
         return None
-    
-    # Sort by confidence score
-    results.sort(key=lambda x: x[1], reverse=True)
-    logger.debug(f"Best language match: {results[0][0]} with confidence {results[0][1]}")
-    
-    # Use the language with the highest confidence if it's above a threshold
-    if results[0][1] > 0.5:
-        return get_language_service(results[0][0])
-    
+
     # Fallback to basic pattern matching
-    if re.search('def\\s+\\w+\\s*\\(', code) and re.search(':\\s*\\n', code):
-        return get_language_service('python')
-    elif re.search('function\\s+\\w+\\s*\\(', code) or re.search(':\\s*\\w+', code):
-        return get_language_service('typescript')
-    
+    if _PYTHON_FALLBACK_DEF.search(sample) and _PYTHON_FALLBACK_BLOCK.search(sample):
+        return 'python'
+    elif _TS_FALLBACK_FUNCTION.search(sample) or _TS_FALLBACK_ANNOTATION.search(sample):
+        return 'typescript'
     return None
 
+
+def detect_language(code: str) -> Optional[str]:
+    """
+    Detect the language of ``code`` from its content.
+
+    This is a heuristic approach and not 100% reliable. Only the first
+    ``DETECTION_SAMPLE_SIZE`` characters are inspected and results are
+    memoized by content hash.
+    """
+    if not code.strip():
+        return None
+    key = sha1_code(code)
+    with _detection_lock:
+        if key in _detection_cache:
+            _detection_cache.move_to_end(key)
+            return _detection_cache[key]
+    language_code = _detect(code)
+    with _detection_lock:
+        _detection_cache[key] = language_code
+        if len(_detection_cache) > DETECTION_CACHE_SIZE:
+            _detection_cache.popitem(last=False)
+    return language_code
+
+
+def clear_detection_cache() -> None:
+    """Forget memoized detection results and the extension map (e.g. after registering a language)."""
+    global _extension_map
+    with _detection_lock:
+        _detection_cache.clear()
+        _extension_map = None
+
+
+def get_language_service_for_code(code: str) -> Optional[LanguageService]:
+    """
+    Attempt to detect language from code content.
+    This is a heuristic approach and not 100% reliable.
+    """
+    language_code = detect_language(code)
+    return get_language_service(language_code) if language_code else None
+
+
 def get_supported_languages() -> List[str]:
     """Get a list of all supported language codes."""
     return registry.get_supported_languages()
@@ -0,0 +1,120 @@
+"""
+Registration manifest generated by ``python -m codehem.core.manifest``. Do not edit.
+
+Maps each built-in language to the modules that register its components, so
+the registry can import a language only when it is first used.
+"""
+MANIFEST = {'version': 1,
+ 'core_modules': ['codehem.core.extractors.template_class_extractor',
+                  'codehem.core.extractors.template_method_extractor',
+                  'codehem.core.extractors.template_property_extractor',
+                  'codehem.core.extractors.template_static_property_extractor',
+                  'codehem.core.extractors.type_function',
+                  'codehem.core.extractors.type_import'],
+ 'languages': {'typescript': {'extensions': ['.ts', '.tsx', '.js', '.jsx'],
+                              'service': 'codehem.languages.lang_typescript.service:TypeScriptLanguageService',
+                              'detector': 'codehem.languages.lang_typescript.detector:TypeScriptLanguageDetector',
+                              'extractors': {'typescript/class': 'codehem.languages.lang_typescript.extractors.typescript_class_extractor:TypeScriptClassExtractor',
+                                             'typescript/decorator': 'codehem.languages.lang_typescript.extractors.typescript_decorator_extractor:TypeScriptDecoratorExtractor',
+                                             'typescript/enum': 'codehem.languages.lang_typescript.extractors.typescript_enum_extractor:TypeScriptEnumExtractor',
+                                             'typescript/function': 'codehem.languages.lang_typescript.extractors.typescript_function_extractor:TypeScriptFunctionExtractor',
+                                             'typescript/import': 'codehem.languages.lang_typescript.extractors.typescript_import_extractor:TypeScriptImportExtractor',
+                                             'typescript/interface': 'codehem.languages.lang_typescript.extractors.typescript_interface_extractor:TypeScriptInterfaceExtractor',
+                                             'typescript/method': 'codehem.languages.lang_typescript.extractors.typescript_method_extractor:TypeScriptMethodExtractor',
+                                             'typescript/namespace': 'codehem.languages.lang_typescript.extractors.typescript_namespace_extractor:TypeScriptNamespaceExtractor',
+                                             'typescript/property': 'codehem.languages.lang_typescript.extractors.typescript_property_extractor:TypeScriptPropertyExtractor',
+                                             'typescript/static_property': 'codehem.languages.lang_typescript.extractors.typescript_static_property_extractor:TypeScriptStaticPropertyExtractor',
+                                             'typescript/type_alias': 'codehem.languages.lang_typescript.extractors.typescript_type_alias_extractor:TypeScriptTypeAliasExtractor'},
+                              'manipulators': {},
+                              'descriptors': {'class': 'codehem.languages.lang_typescript.type_class:TypeScriptClassHandlerElementType',
+                                              'decorator': 'codehem.languages.lang_typescript.type_decorator:TypeScriptDecoratorHandlerElementType',
+                                              'enum': 'codehem.languages.lang_typescript.type_enum:TypeScriptEnumHandlerElementType',
+                                              'function': 'codehem.languages.lang_typescript.type_function:TypeScriptFunctionHandlerElementType',
+                                              'import': 'codehem.languages.lang_typescript.type_import:TypeScriptImportHandlerElementType',
+                                              'interface': 'codehem.languages.lang_typescript.type_interface:TypeScriptInterfaceHandlerElementType',
+                                              'method': 'codehem.languages.lang_typescript.type_method:TypeScriptMethodHandlerElementType',
+                                              'namespace': 'codehem.languages.lang_typescript.type_namespace:TypeScriptNamespaceHandlerElementType',
+                                              'property': 'codehem.languages.lang_typescript.type_property:TypeScriptPropertyHandlerElementType',
+                                              'property_getter': 'codehem.languages.lang_typescript.type_property_getter:TypeScriptPropertyGetterHandlerElementType',
+                                              'property_setter': 'codehem.languages.lang_typescript.type_property_setter:TypeScriptPropertySetterHandlerElementType',
+                                              'static_property': 'codehem.languages.lang_typescript.type_static_property:TypeScriptStaticPropertyHandlerElementType',
+                                              'type_alias': 'codehem.languages.lang_typescript.type_alias:TypeScriptTypeAliasHandlerElementType'},
+                              'modules': ['codehem.languages.lang_typescript',
+                                          'codehem.languages.lang_typescript.config',
+                                          'codehem.languages.lang_typescript.detector',
+                                          'codehem.languages.lang_typescript.extractors.typescript_class_extractor',
+                                          'codehem.languages.lang_typescript.extractors.typescript_decorator_extractor',
+                                          'codehem.languages.lang_typescript.extractors.typescript_enum_extractor',
+                                          'codehem.languages.lang_typescript.extractors.typescript_function_extractor',
+                                          'codehem.languages.lang_typescript.extractors.typescript_import_extractor',
+                                          'codehem.languages.lang_typescript.extractors.typescript_interface_extractor',
+                                          'codehem.languages.lang_typescript.extractors.typescript_method_extractor',
+                                          'codehem.languages.lang_typescript.extractors.typescript_namespace_extractor',
+                                          'codehem.languages.lang_typescript.extractors.typescript_property_extractor',
+                                          'codehem.languages.lang_typescript.extractors.typescript_static_property_extractor',
+                                          'codehem.languages.lang_typescript.extractors.typescript_type_alias_extractor',
+                                          'codehem.languages.lang_typescript.service',
+                                          'codehem.languages.lang_typescript.type_alias',
+                                          'codehem.languages.lang_typescript.type_class',
+                                          'codehem.languages.lang_typescript.type_decorator',
+                                          'codehem.languages.lang_typescript.type_enum',
+                                          'codehem.languages.lang_typescript.type_function',
+                                          'codehem.languages.lang_typescript.type_import',
+                                          'codehem.languages.lang_typescript.type_interface',
+                                          'codehem.languages.lang_typescript.type_method',
+                                          'codehem.languages.lang_typescript.type_namespace',
+                                          'codehem.languages.lang_typescript.type_property',
+                                          'codehem.languages.lang_typescript.type_property_getter',
+                                          'codehem.languages.lang_typescript.type_property_setter',
+                                          'codehem.languages.lang_typescript.type_static_property']},
+               'python': {'extensions': ['.py'],
+                          'service': 'codehem.languages.lang_python.service:PythonLanguageService',
+                          'detector': 'codehem.languages.lang_python.detector:PythonLanguageDetector',
+                          'extractors': {'python/decorator': 'codehem.languages.lang_python.extractors.python_decorator_extractor:PythonDecoratorExtractor',
+                                         'python/property': 'codehem.languages.lang_python.extractors.python_property_extractor:PythonPropertyExtractor',
+                                         'python/property_getter': 'codehem.languages.lang_python.extractors.python_property_getter_extractor:PythonPropertyGetterExtractor',
+                                         'python/property_setter': 'codehem.languages.lang_python.extractors.python_property_setter_extractor:PythonPropertySetterExtractor'},
+                          'manipulators': {'python_class': 'codehem.languages.lang_python.manipulator.class_handler:PythonClassManipulator',
+                                           'python_function': 'codehem.languages.lang_python.manipulator.function_handler:PythonFunctionManipulator',
+                                           'python_import': 'codehem.languages.lang_python.manipulator.import_handler:PythonImportManipulator',
+                                           'python_method': 'codehem.languages.lang_python.manipulator.method_handler:PythonMethodManipulator',
+                                           'python_property': 'codehem.languages.lang_python.manipulator.property_handler:PythonPropertyManipulator'},
+                          'descriptors': {'class': 'codehem.languages.lang_python.type_class:PythonClassHandlerElementType',
+                                          'decorator': 'codehem.languages.lang_python.type_decorator:PythonDecoratorHandlerElementType',
+                                          'function': 'codehem.languages.lang_python.type_function:PythonFunctionHandlerElementType',
+                                          'import': 'codehem.languages.lang_python.type_import:PythonImportHandlerElementType',
+                                          'method': 'codehem.languages.lang_python.type_method:PythonMethodHandlerElementType',
+                                          'property_getter': 'codehem.languages.lang_python.type_property_getter:PythonPropertyGetterHandlerElementType',
+                                          'property_setter': 'codehem.languages.lang_python.type_property_setter:PythonPropertySetterHandlerElementType',
+                                          'static_property': 'codehem.languages.lang_python.type_static_property:PythonStaticPropertyHandlerElementType'},
+                          'modules': ['codehem.languages.lang_python',
+                                      'codehem.languages.lang_python.config',
+                                      'codehem.languages.lang_python.detector',
+                                      'codehem.languages.lang_python.extractors.python_decorator_extractor',
+                                      'codehem.languages.lang_python.extractors.python_property_extractor',
+                                      'codehem.languages.lang_python.extractors.python_property_getter_extractor',
+                                      'codehem.languages.lang_python.extractors.python_property_setter_extractor',
+                                      'codehem.languages.lang_python.manipulator.class_handler',
+                                      'codehem.languages.lang_python.manipulator.function_handler',
+                                      'codehem.languages.lang_python.manipulator.import_handler',
+                                      'codehem.languages.lang_python.manipulator.method_handler',
+                                      'codehem.languages.lang_python.manipulator.property_handler',
+                                      'codehem.languages.lang_python.service',
+                                      'codehem.languages.lang_python.type_class',
+                                      'codehem.languages.lang_python.type_decorator',
+                                      'codehem.languages.lang_python.type_function',
+                                      'codehem.languages.lang_python.type_import',
+                                      'codehem.languages.lang_python.type_method',
+                                      'codehem.languages.lang_python.type_property_getter',
+                                      'codehem.languages.lang_python.type_property_setter',
+                                      'codehem.languages.lang_python.type_static_property']},
+               'javascript': {'extensions': ['.ts', '.tsx', '.js', '.jsx'],
+                              'service': 'codehem.languages.lang_javascript.service:JavaScriptLanguageService',
+                              'detector': 'codehem.languages.lang_javascript.detector:JavaScriptLanguageDetector',
+                              'extractors': {},
+                              'manipulators': {},
+                              'descriptors': {},
+                              'modules': ['codehem.languages.lang_javascript',
+                                          'codehem.languages.lang_javascript.config',
+                                          'codehem.languages.lang_javascript.detector',
+                                          'codehem.languages.lang_javascript.service']}}}
@@ -3,6 +3,9 @@ from typing import List
 from codehem.core.detector import BaseLanguageDetector
 from codehem.core.registry import language_detector
 
+_PATTERNS = tuple(re.compile(p) for p in (r"function\b", r"=>", r"\bexport\b", r"\b(var|let|const)\b"))
+
+
 @language_detector
 class JavaScriptLanguageDetector(BaseLanguageDetector):
     """Simple heuristic detector for JavaScript code."""
@@ -18,6 +21,5 @@ class JavaScriptLanguageDetector(BaseLanguageDetector):
     def detect_confidence(self, code: str) -> float:
         if not code.strip():
             return 0.0
-        patterns = [r"function\b", r"=>", r"\bexport\b", r"\b(var|let|const)\b"]
-        matches = sum(bool(re.search(p, code)) for p in patterns)
-        return min(1.0, matches / len(patterns))
+        matches = sum(bool(p.search(code)) for p in _PATTERNS)
+        return min(1.0, matches / len(_PATTERNS))
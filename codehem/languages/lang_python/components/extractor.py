@@ -11,6 +11,8 @@ from codehem.core.components.base_implementations import BaseElementExtractor
 from codehem.models.enums import CodeElementType
 from codehem.models.code_element import CodeElement, CodeElementsResult
 from codehem.models.range import CodeRange
+from codehem.core.utils.extraction_level import ExtractionLevel, wants_details
+from codehem.core.utils.instrumentation import instrumented
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,10 @@ class PythonElementExtractor(BaseElementExtractor):
     Extracts code elements from Python syntax trees.
     """
     
+    # Properties include instance attributes and type analysis, so they are full-level only
+    CATEGORIES = {**BaseElementExtractor.CATEGORIES,
+                  'properties': ('extract_properties', ExtractionLevel.FULL)}
+
     def __init__(self, navigator):
         """
         Initialize the Python element extractor.
@@ -30,6 +36,7 @@ class PythonElementExtractor(BaseElementExtractor):
         """
         super().__init__('python', navigator)
     
+    @instrumented('extract.functions')
     def extract_functions(self, tree: Node, code_bytes: bytes) -> List[Dict]:
         """
         Extract functions from a Python syntax tree.
@@ -44,6 +51,7 @@ class PythonElementExtractor(BaseElementExtractor):
         logger.debug('Extracting Python functions')
         
         functions = []
+        details = wants_details()
         query_string = '(function_definition name: (identifier) @function_name) @function_def'
         
         try:
@@ -64,12 +72,12 @@ class PythonElementExtractor(BaseElementExtractor):
                     function_name = self.navigator.get_node_text(name_node, code_bytes)
                     function_content = self.navigator.get_node_text(node, code_bytes)
                     
-                    # Get parameters
-                    parameters_node = self.navigator.find_child_by_field_name(node, 'parameters')
-                    parameters = self._extract_parameters(parameters_node, code_bytes) if parameters_node else []
-                    
-                    # Get return info
-                    return_info = self._extract_return_info(node, code_bytes)
+                    # Get parameters and return info (full level only)
+                    parameters, return_info = [], {}
+                    if details:
+                        parameters_node = self.navigator.find_child_by_field_name(node, 'parameters')
+                        parameters = self._extract_parameters(parameters_node, code_bytes) if parameters_node else []
+                        return_info = self._extract_return_info(node, code_bytes)
                     
                     # Get range
                     start_line, end_line = self.navigator.get_node_range(node)
@@ -96,6 +104,7 @@ class PythonElementExtractor(BaseElementExtractor):
         
         return functions
     
+    @instrumented('extract.classes')
     def extract_classes(self, tree: Node, code_bytes: bytes) -> List[Dict]:
         """
         Extract classes from a Python syntax tree.
@@ -159,6 +168,7 @@ class PythonElementExtractor(BaseElementExtractor):
         
         return classes
     
+    @instrumented('extract.methods')
     def extract_methods(self, tree: Node, code_bytes: bytes, 
                       class_name: Optional[str]=None) -> List[Dict]:
         """
@@ -175,6 +185,7 @@ class PythonElementExtractor(BaseElementExtractor):
         logger.debug(f'Extracting Python methods' + (f' for class {class_name}' if class_name else ''))
         
         methods = []
+        details = wants_details()
         
         # Build query based on whether we're filtering by class
         if class_name:
@@ -228,12 +239,12 @@ class PythonElementExtractor(BaseElementExtractor):
                     if class_name and parent_name != class_name:
                         continue
                     
-                    # Get parameters
-                    parameters_node = self.navigator.find_child_by_field_name(node, 'parameters')
-                    parameters = self._extract_parameters(parameters_node, code_bytes, is_method=True) if parameters_node else []
-                    
-                    # Get return info
-                    return_info = self._extract_return_info(node, code_bytes)
+                    # Get parameters and return info (full level only)
+                    parameters, return_info = [], {}
+                    if details:
+                        parameters_node = self.navigator.find_child_by_field_name(node, 'parameters')
+                        parameters = self._extract_parameters(parameters_node, code_bytes, is_method=True) if parameters_node else []
+                        return_info = self._extract_return_info(node, code_bytes)
                     
                     # Check if this is a property decorator and collect all
                     # decorators attached to the method (the post-processor reads
@@ -247,11 +258,12 @@ class PythonElementExtractor(BaseElementExtractor):
                             if child.type == 'decorator':
                                 decorator_text = self.navigator.get_node_text(child, code_bytes)
                                 # Decorator name = text after '@', stripped of any call args.
-                                decorator_name = decorator_text.lstrip('@').split('(')[0].strip()
-                                decorators.append({
-                                    'name': decorator_name,
-                                    'content': decorator_text.strip(),
-                                })
+                                if details:
+                                    decorator_name = decorator_text.lstrip('@').split('(')[0].strip()
+                                    decorators.append({
+                                        'name': decorator_name,
+                                        'content': decorator_text.strip(),
+                                    })
                                 if decorator_text.strip() == '@property':
                                     is_property = True
                                 elif '.setter' in decorator_text:
@@ -293,6 +305,7 @@ class PythonElementExtractor(BaseElementExtractor):
         
         return methods
     
+    @instrumented('extract.properties')
     def extract_properties(self, tree: Node, code_bytes: bytes) -> List[Dict]:
         """
         Extract properties from a Python syntax tree.
@@ -550,6 +563,7 @@ class PythonElementExtractor(BaseElementExtractor):
         logger.debug(f'Extracted {len(instance_props)} Python instance attributes')
         return instance_props
     
+    @instrumented('extract.static_properties')
     def extract_static_properties(self, tree: Node, code_bytes: bytes) -> List[Dict]:
         """
         Extract static properties from a Python syntax tree.
@@ -722,6 +736,7 @@ class PythonElementExtractor(BaseElementExtractor):
         
         return static_props
     
+    @instrumented('extract.imports')
     def extract_imports(self, tree: Node, code_bytes: bytes) -> List[Dict]:
         """
         Extract imports from a Python syntax tree.
@@ -874,6 +889,7 @@ class PythonElementExtractor(BaseElementExtractor):
         
         return imports
     
+    @instrumented('extract.decorators')
     def extract_decorators(self, tree: Node, code_bytes: bytes) -> List[Dict]:
         """
         Extract decorators from a Python syntax tree.
@@ -13,6 +13,7 @@ from tree_sitter import Query, Node, QueryError, QueryCursor
 from codehem.core.components.base_implementations import BaseSyntaxTreeNavigator
 from codehem.models.enums import CodeElementType
 from codehem.core.engine.languages import PY_LANGUAGE
+from codehem.core.utils.instrumentation import instrumented
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +101,7 @@ class PythonSyntaxTreeNavigator(BaseSyntaxTreeNavigator):
             logger.error(f"Error when finding element: {e}", exc_info=True)
             return (0, 0)
     
+    @instrumented('query')
     def execute_query(self, tree: Node, code_bytes: bytes, query_string: str) -> List[Tuple[Node, str]]:
         """
         Execute a tree-sitter query on the Python syntax tree.
@@ -11,6 +11,9 @@ from tree_sitter import Parser, Language
 
 from codehem.core.components.base_implementations import BaseCodeParser
 from codehem.core.engine.languages import get_parser, PY_LANGUAGE
+from codehem.core.utils import budget
+from codehem.core.utils.instrumentation import instrumented
+from codehem.core.utils.source_io import SourceCode, as_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -24,21 +27,26 @@ class PythonCodeParser(BaseCodeParser):
     def __init__(self):
         """Initialize the Python code parser."""
         super().__init__('python')
-        self._parser = get_parser('python')
         self._language = PY_LANGUAGE
+
+    @property
+    def _parser(self) -> Parser:
+        """The calling thread's parser (orchestrators may be shared between threads)."""
+        return get_parser('python')
     
-    def parse(self, code: str) -> Tuple[Any, bytes]:
+    @instrumented('parse')
+    def parse(self, code: SourceCode) -> Tuple[Any, bytes]:
         """
         Parse Python code into a syntax tree.
         
         Args:
-            code: Python source code as string
+            code: Python source code as string or UTF-8 bytes
             
         Returns:
             Tuple of (syntax_tree, code_bytes) where syntax_tree is the parsed tree
             and code_bytes is the source code as bytes
         """
         logger.debug('Parsing Python code with tree-sitter')
-        code_bytes = code.encode('utf8')
-        tree = self._parser.parse(code_bytes)
+        code_bytes = as_bytes(code)
+        tree = budget.parse(self._parser, code_bytes)
         return (tree.root_node, code_bytes)
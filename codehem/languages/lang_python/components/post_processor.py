@@ -13,7 +13,9 @@ from codehem.core.post_processors.base import LanguagePostProcessor
 from codehem.models.enums import CodeElementType
 from codehem.models.code_element import CodeElement, CodeElementsResult
 from codehem.models.range import CodeRange
+from codehem.models.fast_element import element_from_dict, new_element, new_range, new_result
 from pydantic import ValidationError
+from codehem.core.utils.instrumentation import instrumented
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +33,7 @@ class PythonPostProcessor(LanguagePostProcessor):
         """Initialize the Python post-processor."""
         super().__init__('python')
     
+    @instrumented('process_imports')
     def process_imports(self, raw_imports: List[Dict]) -> List[CodeElement]:
         """
         Process raw import data into CodeElement objects.
@@ -89,7 +92,7 @@ class PythonPostProcessor(LanguagePostProcessor):
         if (isinstance(start_line, int) and isinstance(end_line, int) and 
             start_line > 0 and end_line >= start_line):
             try:
-                combined_range = CodeRange(
+                combined_range = new_range(
                     start_line=start_line,
                     start_column=start_col,
                     end_line=end_line,
@@ -118,7 +121,7 @@ class PythonPostProcessor(LanguagePostProcessor):
         
         try:
             # Create the combined CodeElement
-            combined_element = CodeElement(
+            combined_element = new_element(
                 type=CodeElementType.IMPORT,
                 name="imports",  # Standardized name for the combined block
                 content=combined_content,
@@ -136,6 +139,7 @@ class PythonPostProcessor(LanguagePostProcessor):
             )
             return []  # Return empty list on failure
     
+    @instrumented('process_functions')
     def process_functions(self, raw_functions: List[Dict], 
                         all_decorators: Optional[List[Dict]]=None) -> List[CodeElement]:
         """
@@ -167,7 +171,7 @@ class PythonPostProcessor(LanguagePostProcessor):
             
             try:
                 # Create CodeElement from raw data
-                func_element = CodeElement.from_dict(function_data)
+                func_element = element_from_dict(function_data)
                 func_element.parent_name = None
                 
                 # Process decorators directly associated with the function
@@ -200,6 +204,7 @@ class PythonPostProcessor(LanguagePostProcessor):
         
         return processed_functions
     
+    @instrumented('process_classes')
     def process_classes(self, raw_classes: List[Dict], members: List[Dict], 
                       static_props: List[Dict], properties: Optional[List[Dict]]=None,
                       all_decorators: Optional[List[Dict]]=None) -> List[CodeElement]:
@@ -243,7 +248,7 @@ class PythonPostProcessor(LanguagePostProcessor):
             
             try:
                 # Create CodeElement from raw data
-                class_element = CodeElement.from_dict(class_data)
+                class_element = element_from_dict(class_data)
                 class_element.parent_name = None
                 
                 # Process decorators directly associated with the class
@@ -347,7 +352,7 @@ class PythonPostProcessor(LanguagePostProcessor):
 
         try:
             # Create CodeElement from raw data
-            element = CodeElement.from_dict(prop_data)
+            element = element_from_dict(prop_data)
             element.parent_name = parent_name
             return element
         except (ValidationError, Exception) as e:
@@ -385,7 +390,7 @@ class PythonPostProcessor(LanguagePostProcessor):
                 continue
                 
             try:
-                param_element = CodeElement(
+                param_element = new_element(
                     type=CodeElementType.PARAMETER,
                     name=name,
                     content=name,  # Content is just the name for parameters
@@ -434,7 +439,7 @@ class PythonPostProcessor(LanguagePostProcessor):
         )
         
         try:
-            return_element = CodeElement(
+            return_element = new_element(
                 type=CodeElementType.RETURN_VALUE,
                 name=f"{element.name}_return",  # Standardized name
                 content=return_type or "",  # Content is the type hint string
@@ -481,7 +486,7 @@ class PythonPostProcessor(LanguagePostProcessor):
             method_data["type"] = element_type_enum.value
             
             # Create CodeElement from raw data
-            element = CodeElement.from_dict(method_data)
+            element = element_from_dict(method_data)
             element.parent_name = parent_name
             
             # Classify based on decorators
@@ -549,7 +554,7 @@ class PythonPostProcessor(LanguagePostProcessor):
         
         try:
             # Create CodeElement from raw data
-            element = CodeElement.from_dict(prop_data)
+            element = element_from_dict(prop_data)
             element.parent_name = parent_name
             element.value_type = prop_data.get("value_type")  # Keep potential type hint
             
@@ -636,7 +641,7 @@ class PythonPostProcessor(LanguagePostProcessor):
                 
                 if (isinstance(start_line, int) and isinstance(end_line, int) and 
                     start_line > 0 and end_line >= start_line):
-                    decorator_range = CodeRange(
+                    decorator_range = new_range(
                         start_line=start_line,
                         start_column=start_col if isinstance(start_col, int) else 0,
                         end_line=end_line,
@@ -649,7 +654,7 @@ class PythonPostProcessor(LanguagePostProcessor):
         
         try:
             # Create CodeElement for the decorator
-            decorator_element = CodeElement(
+            decorator_element = new_element(
                 type=CodeElementType.DECORATOR,
                 name=name,
                 content=content,
@@ -0,0 +1,102 @@
+"""
+Python implementation of the syntax-tree XPath resolver.
+"""
+from typing import List, Optional, Tuple
+
+from tree_sitter import Node
+
+from codehem.core.engine.xpath_resolver import Candidate, XPathResolver
+from codehem.models.enums import CodeElementType
+
+
+class PythonXPathResolver(XPathResolver):
+    """
+    Resolves Python XPaths on the tree.
+
+    Mirrors how extraction lists elements: every class is top-level (nested
+    classes too), functions are top-level unless they sit directly in a class
+    body, class ranges exclude decorators while function and method ranges
+    include them, and methods are getters/setters by their ``@property`` /
+    ``@<name>.setter`` decorators.
+    """
+
+    LANGUAGE_CODE = 'python'
+
+    @staticmethod
+    def _outer(definition: Node) -> Tuple[Node, Node]:
+        """(definition including decorators, node containing it)."""
+        parent = definition.parent
+        if parent is not None and parent.type == 'decorated_definition':
+            return parent, parent.parent
+        return definition, parent
+
+    @staticmethod
+    def _is_class_body(node: Optional[Node]) -> bool:
+        return node is not None and node.type == 'block' and node.parent is not None \
+            and node.parent.type == 'class_definition'
+
+    def top_level_candidates(self, root: Node, code_bytes: bytes, name: str) -> Optional[List[Candidate]]:
+        candidates: List[Candidate] = []
+        for leaf in self.occurrences(root, code_bytes, name):
+            definition = leaf.parent
+            if not self.is_name_of(leaf, definition):
+                continue
+            if definition.type == 'class_definition':
+                candidates.append((CodeElementType.CLASS, definition))
+            elif definition.type == 'function_definition':
+                outer, container = self._outer(definition)
+                if not self._is_class_body(container):
+                    candidates.append((CodeElementType.FUNCTION, outer))
+        return candidates
+
+    def member_candidates(self, container: Node, code_bytes: bytes, name: str,
+                          target_type: Optional[str]) -> Optional[List[Candidate]]:
+        body = container.child_by_field_name('body')
+        if body is None:
+            return None
+        candidates: List[Candidate] = []
+        unsure = False
+        for leaf in self.occurrences(body, code_bytes, name):
+            parent = leaf.parent
+            if parent.type == 'function_definition' and self.is_name_of(leaf, parent):
+                # Functions nested in methods are listed as members of the class too
+                if self._enclosing_class(parent) == container:
+                    outer, _ = self._outer(parent)
+                    candidates.append((self._member_type(outer, name, code_bytes), outer))
+                continue
+            if parent.type == 'assignment' and self.is_name_of(leaf, parent, 'left'):
+                statement = parent.parent
+                if statement is not None and statement.type == 'expression_statement' \
+                        and statement.parent is not None and statement.parent.start_byte == body.start_byte:
+                    candidates.append((CodeElementType.STATIC_PROPERTY, statement))
+                    continue
+            # Attributes (self.<name>), decorators, nested definitions, ...
+            unsure = True
+        if unsure and target_type not in self.EXACT_MEMBER_TYPES:
+            return None
+        kinds = [element_type for element_type, _ in candidates]
+        if len(set(kinds)) != len(kinds):
+            return None  # Redefinitions; extraction keeps one of them
+        return candidates
+
+    @staticmethod
+    def _enclosing_class(node: Node) -> Optional[Node]:
+        node = node.parent
+        while node is not None and node.type != 'class_definition':
+            node = node.parent
+        return node
+
+    @staticmethod
+    def _member_type(outer: Node, name: str, code_bytes: bytes) -> CodeElementType:
+        if outer.type != 'decorated_definition':
+            return CodeElementType.METHOD
+        element_type = CodeElementType.METHOD
+        for child in outer.children:
+            if child.type != 'decorator':
+                continue
+            decorator = code_bytes[child.start_byte:child.end_byte].decode('utf8', errors='replace').lstrip('@').strip()
+            if decorator == f'{name}.setter':
+                return CodeElementType.PROPERTY_SETTER
+            if decorator == 'property':
+                element_type = CodeElementType.PROPERTY_GETTER
+        return element_type
@@ -4,6 +4,45 @@ from typing import List
 from codehem.core.detector import BaseLanguageDetector
 from codehem.core.registry import language_detector
 
+# Strong indicators (high scores)
+_STRONG_PATTERNS = tuple(re.compile(p, re.DOTALL) for p in (
+    "def\\s+\\w+\\s*\\(",  # Function definition
+    "class\\s+\\w+\\s*:",  # Class definition
+    "def\\s+\\w+\\s*\\([^)]*\\)\\s*:",  # Complete function signature with colon
+))
+
+# Medium indicators (medium scores)
+_MEDIUM_PATTERNS = tuple(re.compile(p, re.DOTALL) for p in (
+    "import\\s+\\w+",  # Import statement
+    "from\\s+\\w+\\s+import",  # From import
+    ":\\s*\\n",  # Block indicator
+    "__\\w+__",  # Dunder methods/attributes
+    "@\\w+",  # Decorators
+    "pass\\b",  # Pass statement - very Python-specific
+))
+
+# Weak indicators (low scores)
+_WEAK_PATTERNS = tuple(re.compile(p, re.DOTALL) for p in (
+    "#.*?\\n",  # Comments
+    '""".*?"""',  # Docstrings (multiline)
+    "'''.*?'''",  # Docstrings (multiline, alt)
+    "\\bif\\s+.+?:",  # If statements
+    "\\bfor\\s+.+?:",  # For loops
+    "\\bwhile\\s+.+?:",  # While loops
+))
+
+# Anti-patterns (negative scores)
+_ANTI_PATTERNS = tuple(re.compile(p) for p in (
+    "{\\s*\\n",  # JS/TS block start
+    "function\\s+\\w+\\s*\\(",  # JS function
+    "var\\s+\\w+\\s*=",  # JS variable
+    "let\\s+\\w+\\s*=",  # JS variable
+    "const\\s+\\w+\\s*=",  # JS variable
+))
+
+_MINIMAL_FUNCTION = re.compile("def\\s+\\w+\\s*\\([^)]*\\)\\s*:\\s*pass")
+_MAX_SCORE = len(_STRONG_PATTERNS) * 20 + len(_MEDIUM_PATTERNS) * 10 + len(_WEAK_PATTERNS) * 5
+
 
 @language_detector
 class PythonLanguageDetector(BaseLanguageDetector):
@@ -22,72 +61,28 @@ class PythonLanguageDetector(BaseLanguageDetector):
         if not code.strip():
             return 0.0
 
-        # Strong indicators (high scores)
-        strong_patterns = [
-            "def\\s+\\w+\\s*\\(",  # Function definition
-            "class\\s+\\w+\\s*:",  # Class definition
-            "def\\s+\\w+\\s*\\([^)]*\\)\\s*:",  # Complete function signature with colon
-        ]
-
-        # Medium indicators (medium scores)
-        medium_patterns = [
-            "import\\s+\\w+",  # Import statement
-            "from\\s+\\w+\\s+import",  # From import
-            ":\\s*\\n",  # Block indicator
-            "__\\w+__",  # Dunder methods/attributes
-            "@\\w+",  # Decorators
-            "pass\\b",  # Pass statement - very Python-specific
-        ]
-
-        # Weak indicators (low scores)
-        weak_patterns = [
-            "#.*?\\n",  # Comments
-            '""".*?"""',  # Docstrings (multiline)
-            "'''.*?'''",  # Docstrings (multiline, alt)
-            "\\bif\\s+.+?:",  # If statements
-            "\\bfor\\s+.+?:",  # For loops
-            "\\bwhile\\s+.+?:",  # While loops
-        ]
-
-        # Anti-patterns (negative scores)
-        anti_patterns = [
-            "{\\s*\\n",  # JS/TS block start
-            "function\\s+\\w+\\s*\\(",  # JS function
-            "var\\s+\\w+\\s*=",  # JS variable
-            "let\\s+\\w+\\s*=",  # JS variable
-            "const\\s+\\w+\\s*=",  # JS variable
-        ]
-
         score = 0
-        max_score = (
-            len(strong_patterns) * 20
-            + len(medium_patterns) * 10
-            + len(weak_patterns) * 5
-        )
-
-        # Calculate score
-        for pattern in strong_patterns:
-            if re.search(pattern, code, re.DOTALL):
+        for pattern in _STRONG_PATTERNS:
+            if pattern.search(code):
                 score += 20
 
-        for pattern in medium_patterns:
-            if re.search(pattern, code, re.DOTALL):
+        for pattern in _MEDIUM_PATTERNS:
+            if pattern.search(code):
                 score += 10
 
-        for pattern in weak_patterns:
-            if re.search(pattern, code, re.DOTALL):
+        for pattern in _WEAK_PATTERNS:
+            if pattern.search(code):
                 score += 5
 
-        for pattern in anti_patterns:
-            if re.search(pattern, code):
+        for pattern in _ANTI_PATTERNS:
+            if pattern.search(code):
                 score -= 15
 
         # For minimal function definitions with pass (like 'def foo(): pass')
-        if re.search("def\\s+\\w+\\s*\\([^)]*\\)\\s*:\\s*pass", code):
+        if _MINIMAL_FUNCTION.search(code):
             score += 40  # Very strong boost for definitive minimal Python construct
 
-        # Normalize score between 0 and 1, with a floor of 0.3 for minimal code
-        normalized_score = max(0.0, min(1.0, score / max_score))
+        normalized_score = max(0.0, min(1.0, score / _MAX_SCORE))
 
         # For very small snippets that match Python patterns, set a minimum confidence
         if len(code.strip()) < 50 and score > 0:
@@ -15,6 +15,7 @@ class PythonDecoratorExtractor(TemplateExtractor):
     """ Extracts Python decorators. """
     LANGUAGE_CODE = 'python'
     ELEMENT_TYPE = CodeElementType.DECORATOR
+    REGEX_FLAGS = re.MULTILINE
 
     def _process_tree_sitter_results(self, query_results: List[Tuple[Node, str]], code_bytes: bytes, ast_handler: ASTHandler, context: Dict[str, Any]) -> List[Dict]:
         decorators = []
@@ -91,7 +92,7 @@ class PythonDecoratorExtractor(TemplateExtractor):
         pattern = self.descriptor.regexp_pattern # Use formatted pattern from descriptor
 
         try:
-            for match in re.finditer(pattern, code, re.MULTILINE):
+            for match in matches:
                  try:
                      full_match = match.group(0)
                      # Group 1 should be QUALIFIED_NAME_PATTERN
@@ -83,7 +83,7 @@ class PythonPropertyGetterExtractor(TemplateExtractor):
         pattern = self.descriptor.regexp_pattern
         try:
             class_name_context = context.get('class_name') # Get class context if available
-            for match in re.finditer(pattern, code, re.MULTILINE | re.DOTALL):
+            for match in matches:
                 try:
                     # Extract info based on PROPERTY_GETTER_TEMPLATE regex groups
                     prop_name = match.group(1) # Captured identifier
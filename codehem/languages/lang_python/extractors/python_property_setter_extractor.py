@@ -74,7 +74,7 @@ class PythonPropertySetterExtractor(TemplateExtractor):
             # Regex needs to capture property name from decorator AND method name
             # The current template regex might need adjustment for this capture.
             # Assuming group(1) is method name, need logic to find decorator name.
-            for match in re.finditer(pattern, code, re.MULTILINE | re.DOTALL):
+            for match in matches:
                 try:
                     method_name = match.group(1) # Method name
                     full_content = match.group(0) # Full matched text
@@ -7,6 +7,7 @@ from pydantic import ValidationError  # Added ValidationError
 
 # Updated import path for the base class
 from ..post_processor_base import BaseExtractionPostProcessor
+from codehem.core.utils.instrumentation import instrumented
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,7 @@ class PythonExtractionPostProcessor(BaseExtractionPostProcessor):
     Transforms raw extraction dicts into structured CodeElement objects.
     """
 
+    @instrumented('process_imports')
     def process_imports(self, raw_imports: List[Dict]) -> List[CodeElement]:
         """Processes raw import data into a single combined CodeElement"""
         if not raw_imports:
@@ -120,6 +122,7 @@ class PythonExtractionPostProcessor(BaseExtractionPostProcessor):
             )
             return []  # Return empty list on failure
 
+    @instrumented('process_functions')
     def process_functions(self, raw_functions: List[Dict], all_decorators: List[Dict] = None) -> List[CodeElement]:
         """ Processes raw standalone function data. Accepts all_decorators but doesn't use it yet. """
         processed_functions = []
@@ -146,6 +149,7 @@ class PythonExtractionPostProcessor(BaseExtractionPostProcessor):
                 logger.error(f"Failed to process function '{func_name}': {e}. Data: {function_data}", exc_info=True)
         return processed_functions
 
+    @instrumented('process_classes')
     def process_classes(self, raw_classes: List[Dict], members: List[Dict], static_props: List[Dict], properties: List[Dict] = None, all_decorators: List[Dict] = None) -> List[CodeElement]:
         """
         Processes raw Python class data, associating members and static properties.
@@ -13,6 +13,7 @@ from codehem.models.enums import CodeElementType
 from codehem.models.xpath import CodeElementXPathNode
 from codehem.core.language_service_extended import ExtendedLanguageService
 from codehem.core.registry import language_service
+from codehem.core.utils.line_index import get_line_index
 from codehem.core.engine.xpath_parser import XPathParser
 from codehem.languages.lang_python.components.orchestrator import PythonExtractionOrchestrator
 from codehem.languages.lang_python.components.post_processor import PythonPostProcessor
@@ -233,17 +234,17 @@ class PythonLanguageService(ExtendedLanguageService):
             logger.warning(f"Attempting to extract part from element without valid range: {(element.name if element else 'None')}, Range: {getattr(element, 'range', 'N/A')}")
             return None
 
-        code_lines = code.splitlines()
+        line_index = get_line_index(code)
         element_start_idx = element.range.start_line - 1 # 0-based index
         element_end_idx = element.range.end_line       # Exclusive index for slicing
 
         # Ensure indices are within bounds
-        if element_start_idx < 0 or element_start_idx >= len(code_lines) or element_end_idx > len(code_lines):
-             logger.error(f"Invalid line indices calculated for element '{element.name}': start={element_start_idx}, end={element_end_idx}, total_lines={len(code_lines)}")
+        if element_start_idx < 0 or element_start_idx >= line_index.line_count or element_end_idx > line_index.line_count:
+             logger.error(f"Invalid line indices calculated for element '{element.name}': start={element_start_idx}, end={element_end_idx}, total_lines={line_index.line_count}")
              return None
 
-        # Get the lines belonging to the element based on its range
-        element_lines = code_lines[element_start_idx:element_end_idx]
+        # Get the lines belonging to the element based on its range (sliced via the line index)
+        element_lines = line_index.slice_lines(element.range.start_line, element.range.end_line).splitlines()
         if not element_lines:
              logger.warning(f"No lines found for element '{element.name}' in range {element.range.start_line}-{element.range.end_line}")
              return "" # Return empty string if range yielded no lines
@@ -355,20 +356,22 @@ class PythonLanguageService(ExtendedLanguageService):
         if not xpath_nodes:
             return None
 
-        # Perform extraction to get the element tree using the higher level
-        # ExtractionService to ensure consistent results with other API calls
-        from codehem.core.extraction_service import ExtractionService
-        try:
-            extraction_service = ExtractionService(self.LANGUAGE_CODE)
-            elements_result = extraction_service.extract_all(code)
-        except Exception as e:
-            logger.error(f"Error during orchestrator extraction within get_text_by_xpath_internal: {e}", exc_info=True)
-            return None # Cannot proceed if extraction fails
-
-        logger.debug(f'get_text_by_xpath_internal: Extraction completed, {len(elements_result.elements)} top-level elements.')
-
-        # Find the specific target element based on the parsed XPath
-        target_element = self._find_target_element(elements_result, xpath_nodes)
+        target_element = self._resolve_target_element(code, xpath_nodes)
+        if target_element is None:
+            # Perform extraction to get the element tree using the higher level
+            # ExtractionService to ensure consistent results with other API calls
+            from codehem.core.extraction_service import ExtractionService
+            try:
+                extraction_service = ExtractionService(self.LANGUAGE_CODE)
+                elements_result = extraction_service.extract_all(code)
+            except Exception as e:
+                logger.error(f"Error during orchestrator extraction within get_text_by_xpath_internal: {e}", exc_info=True)
+                return None # Cannot proceed if extraction fails
+
+            logger.debug(f'get_text_by_xpath_internal: Extraction completed, {len(elements_result.elements)} top-level elements.')
+
+            # Find the specific target element based on the parsed XPath
+            target_element = self._find_target_element(elements_result, xpath_nodes)
 
         if not target_element:
             logger.warning(f'get_text_by_xpath_internal: Element not found for XPath: {XPathParser.to_string(xpath_nodes)}')
@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Optional, Tuple
 from codehem.core.components.interfaces import IElementExtractor, ISyntaxTreeNavigator
 from codehem.core.components.base_implementations import BaseElementExtractor
 from codehem.models.enums import CodeElementType
+from codehem.core.utils.extraction_level import wants_details
+from codehem.core.utils.instrumentation import instrumented
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
         """
         super().__init__('typescript', navigator)
     
+    @instrumented('extract.functions')
     def extract_functions(self, tree: Any, code_bytes: bytes) -> List[Dict]:
         """
         Extract function declarations and expressions from TypeScript code.
@@ -69,6 +72,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
         try:
             result = self.navigator.execute_query(tree, code_bytes, query_str)
             functions = []
+            details = wants_details()
             
             for match in result:
                 func_data = {}
@@ -90,7 +94,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
                             'end': {'line': func_range[1], 'column': 0}
                         },
                         'content': self.navigator.get_node_text(func_node, code_bytes).decode('utf-8'),
-                        'parameters': self._extract_parameters(params_node, code_bytes, False)
+                        'parameters': self._extract_parameters(params_node, code_bytes, False) if details else []
                     }
                     
                 # Handle exported function declarations
@@ -110,7 +114,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
                             'end': {'line': func_range[1], 'column': 0}
                         },
                         'content': self.navigator.get_node_text(func_node, code_bytes).decode('utf-8'),
-                        'parameters': self._extract_parameters(params_node, code_bytes, False),
+                        'parameters': self._extract_parameters(params_node, code_bytes, False) if details else [],
                         'additional_data': {'is_exported': True}
                     }
                 
@@ -131,7 +135,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
                             'end': {'line': func_range[1], 'column': 0}
                         },
                         'content': self.navigator.get_node_text(func_node, code_bytes).decode('utf-8'),
-                        'parameters': self._extract_parameters(params_node, code_bytes, False),
+                        'parameters': self._extract_parameters(params_node, code_bytes, False) if details else [],
                         'additional_data': {'is_arrow_function': True}
                     }
                 
@@ -145,6 +149,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
             logger.error(f"Error extracting TypeScript functions: {e}", exc_info=True)
             return []
     
+    @instrumented('extract.classes')
     def extract_classes(self, tree: Any, code_bytes: bytes) -> List[Dict]:
         """
         Extract class declarations from TypeScript code.
@@ -223,6 +228,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
             logger.error(f"Error extracting TypeScript classes: {e}", exc_info=True)
             return []
     
+    @instrumented('extract.methods')
     def extract_methods(self, tree: Any, code_bytes: bytes, class_name: Optional[str] = None) -> List[Dict]:
         """
         Extract methods from TypeScript classes.
@@ -248,6 +254,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
         try:
             result = self.navigator.execute_query(tree, code_bytes, query_str)
             methods = []
+            details = wants_details()
             
             # Extract class name from the first match that has it
             current_class_name = None
@@ -285,7 +292,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
                             'end': {'line': method_range[1], 'column': 0}
                         },
                         'content': self.navigator.get_node_text(method_node, code_bytes).decode('utf-8'),
-                        'parameters': self._extract_parameters(params_node, code_bytes, True) if params_node else []
+                        'parameters': self._extract_parameters(params_node, code_bytes, True) if params_node and details else []
                     }
                     
                     methods.append(method_data)
@@ -297,6 +304,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
             logger.error(f"Error extracting TypeScript methods: {e}", exc_info=True)
             return []
     
+    @instrumented('extract.properties')
     def extract_properties(self, tree: Any, code_bytes: bytes) -> List[Dict]:
         """
         Extract properties (class fields) from TypeScript classes.
@@ -384,6 +392,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
             logger.error(f"Error extracting TypeScript properties: {e}", exc_info=True)
             return []
     
+    @instrumented('extract.static_properties')
     def extract_static_properties(self, tree: Any, code_bytes: bytes) -> List[Dict]:
         """
         Extract static properties from TypeScript classes.
@@ -458,6 +467,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
             logger.error(f"Error extracting TypeScript static properties: {e}", exc_info=True)
             return []
     
+    @instrumented('extract.imports')
     def extract_imports(self, tree: Any, code_bytes: bytes) -> List[Dict]:
         """
         Extract import statements from TypeScript code.
@@ -557,6 +567,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
             logger.error(f"Error extracting TypeScript imports: {e}", exc_info=True)
             return []
     
+    @instrumented('extract.interfaces')
     def extract_interfaces(self, tree: Any, code_bytes: bytes) -> List[Dict]:
         """
         Extract interface declarations from TypeScript code.
@@ -635,6 +646,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
             logger.error(f"Error extracting TypeScript interfaces: {e}", exc_info=True)
             return []
 
+    @instrumented('extract.decorators')
     def extract_decorators(self, tree: Any, code_bytes: bytes) -> List[Dict]:
         """
         Extract decorators from TypeScript code.
@@ -708,6 +720,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
             logger.error(f"Error extracting TypeScript decorators: {e}", exc_info=True)
             return []
     
+    @instrumented('extract.enums')
     def extract_enums(self, tree: Any, code_bytes: bytes) -> List[Dict]:
         """
         Extract enum declarations from TypeScript code.
@@ -786,6 +799,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
             logger.error(f"Error extracting TypeScript enums: {e}", exc_info=True)
             return []
     
+    @instrumented('extract.type_aliases')
     def extract_type_aliases(self, tree: Any, code_bytes: bytes) -> List[Dict]:
         """
         Extract type alias declarations from TypeScript code.
@@ -866,6 +880,7 @@ class TypeScriptElementExtractor(BaseElementExtractor):
             logger.error(f"Error extracting TypeScript type aliases: {e}", exc_info=True)
             return []
     
+    @instrumented('extract.namespaces')
     def extract_namespaces(self, tree: Any, code_bytes: bytes) -> List[Dict]:
         """
         Extract namespace declarations from TypeScript code.
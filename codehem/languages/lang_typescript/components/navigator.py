@@ -13,6 +13,7 @@ from tree_sitter import Query, QueryCursor
 from codehem.core.components.interfaces import ISyntaxTreeNavigator
 from codehem.core.components.base_implementations import BaseSyntaxTreeNavigator
 from codehem.core.engine.languages import LANGUAGES
+from codehem.core.utils.instrumentation import instrumented
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +105,7 @@ class TypeScriptSyntaxTreeNavigator(BaseSyntaxTreeNavigator):
             logger.error(f"find_element: Error finding TypeScript element: {e}", exc_info=True)
             return 0, 0
     
+    @instrumented('query')
     def execute_query(self, tree: Any, code_bytes: bytes, query_string: str) -> List[Dict[str, Any]]:
         """
         Execute a tree-sitter query on the TypeScript syntax tree.
@@ -6,12 +6,17 @@ coordinating the extraction of code elements from TypeScript/JavaScript files.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Collection, Dict, List, Optional, Tuple
 
 from codehem.core.components.interfaces import IExtractionOrchestrator, IPostProcessor
 from codehem.core.components.base_implementations import BaseExtractionOrchestrator
 from codehem.core.error_handling import handle_extraction_errors
+from codehem.core.utils.instrumentation import count, span
+from codehem.core.utils.merkle import build_merkle_tree
+from codehem.core.utils.node_retention import apply_node_retention
 from codehem.models.code_element import CodeElementsResult
+from codehem.models.fast_element import fast_mode
+from codehem.models.source_buffer import SourceBuffer, use_source_buffer
 
 from .parser import TypeScriptCodeParser
 from .navigator import TypeScriptSyntaxTreeNavigator
@@ -45,26 +50,39 @@ class TypeScriptExtractionOrchestrator(BaseExtractionOrchestrator):
         super().__init__('typescript', parser, extractor, post_processor)
     
     @handle_extraction_errors
-    def extract_all(self, code: str) -> CodeElementsResult:
+    def extract_all(self, code: str, lazy_content: bool = False, fast: bool = False,
+                    node_retention: str = 'none', level: str = 'full',
+                    categories: Optional[Collection[str]] = None) -> CodeElementsResult:
         """
         Perform complete extraction of all code elements from TypeScript code.
         
         Args:
             code: The TypeScript code to extract elements from
+            lazy_content: Keep byte spans into a shared source buffer instead of
+                per-element content copies
+            fast: Return the slotted FastCodeElementsResult instead of pydantic models
+            node_retention: 'none', 'weak' or 'full' tree-sitter node retention
+            level: 'outline', 'members' or 'full' extraction level
+            categories: Raw categories to extract (all by default)
             
         Returns:
             A CodeElementsResult containing all extracted CodeElement objects
         """
         logger.debug("Extracting all TypeScript code elements")
         
-        # Parse the code
-        tree, code_bytes = self.parser.parse(code)
-        
-        # Extract raw data for all elements
-        raw_data = self.extractor.extract_all(tree, code_bytes)
+        # Parse the code and extract raw data for the requested level
+        tree, code_bytes, raw_data = self._extract_raw(code, level, categories)
         
         # Process raw data into CodeElement objects
-        elements = self.post_processor.process_all(raw_data)
+        use_fast_model = not lazy_content
+        with fast_mode(use_fast_model), use_source_buffer(SourceBuffer(code_bytes) if lazy_content else None):
+            elements = self.post_processor.process_all(raw_data)
+        build_merkle_tree(elements)
+        apply_node_retention(elements, node_retention)
+        if use_fast_model and not fast and hasattr(elements, 'to_model'):
+            with span('to_model'):
+                elements = elements.to_model()
+        count('elements', len(elements.elements))
         
         logger.debug(f"Extracted {len(elements.elements)} TypeScript code elements")
         return elements
@@ -10,7 +10,11 @@ from typing import Any, Tuple
 
 from codehem.core.components.interfaces import ICodeParser
 from codehem.core.components.base_implementations import BaseCodeParser
+from codehem.core.error_handling import BudgetExceededError
 from codehem.core.engine.languages import get_parser, LANGUAGES
+from codehem.core.utils import budget
+from codehem.core.utils.instrumentation import instrumented
+from codehem.core.utils.source_io import SourceCode, as_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -25,17 +29,20 @@ class TypeScriptCodeParser(BaseCodeParser):
     def __init__(self):
         """Initialize the TypeScript code parser."""
         super().__init__('typescript')
-        self.parser = get_parser('typescript')
         self.language = LANGUAGES['typescript']
-        # Set the language for the parser - use language property
-        self.parser.language = self.language
+
+    @property
+    def parser(self):
+        """The calling thread's parser (orchestrators may be shared between threads)."""
+        return get_parser('typescript')
     
-    def parse(self, code: str) -> Tuple[Any, bytes]:
+    @instrumented('parse')
+    def parse(self, code: SourceCode) -> Tuple[Any, bytes]:
         """
         Parse TypeScript code into a syntax tree.
         
         Args:
-            code: The TypeScript/JavaScript code to parse
+            code: The TypeScript/JavaScript code to parse (string or UTF-8 bytes)
             
         Returns:
             A tuple containing the parsed syntax tree and the code as bytes
@@ -43,10 +50,12 @@ class TypeScriptCodeParser(BaseCodeParser):
         logger.debug("Parsing TypeScript code")
         
         try:
-            code_bytes = code.encode('utf-8')
-            tree = self.parser.parse(code_bytes)
+            code_bytes = as_bytes(code)
+            tree = budget.parse(self.parser, code_bytes)
             logger.debug("Successfully parsed TypeScript code")
             return tree, code_bytes
+        except BudgetExceededError:
+            raise
         except Exception as e:
             logger.error(f"Error parsing TypeScript code: {e}", exc_info=True)
             raise
@@ -13,7 +13,10 @@ from codehem.core.post_processors.base import LanguagePostProcessor
 from codehem.models.code_element import CodeElement, CodeElementsResult
 from codehem.models.enums import CodeElementType
 from codehem.models.range import CodeRange
+from codehem.models.fast_element import element_from_dict, new_element, new_range, new_result
 from pydantic import ValidationError
+from codehem.core.utils.budget import check_deadline
+from codehem.core.utils.instrumentation import instrumented
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
         """Initialize the TypeScript post-processor."""
         super().__init__('typescript')
     
+    @instrumented('process_imports')
     def process_imports(self, raw_imports: List[Dict]) -> List[CodeElement]:
         """
         Process raw import data into CodeElement objects.
@@ -90,7 +94,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
         if (isinstance(start_line, int) and isinstance(end_line, int) and 
             start_line > 0 and end_line >= start_line):
             try:
-                combined_range = CodeRange(
+                combined_range = new_range(
                     start_line=start_line,
                     start_column=start_col,
                     end_line=end_line,
@@ -119,7 +123,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
         
         try:
             # Create the combined CodeElement
-            combined_element = CodeElement(
+            combined_element = new_element(
                 type=CodeElementType.IMPORT,
                 name="imports",  # Standardized name for the combined block
                 content=combined_content,
@@ -137,6 +141,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             )
             return []  # Return empty list on failure
     
+    @instrumented('process_functions')
     def process_functions(self, raw_functions: List[Dict], 
                         all_decorators: Optional[List[Dict]]=None) -> List[CodeElement]:
         """
@@ -171,7 +176,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             
             try:
                 # Create CodeElement from raw data
-                func_element = CodeElement.from_dict(function_data)
+                func_element = element_from_dict(function_data)
                 func_element.parent_name = None
                 
                 # Process decorators from the global decorator list
@@ -209,6 +214,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
         
         return processed_functions
     
+    @instrumented('process_classes')
     def process_classes(self, raw_classes: List[Dict], members: List[Dict], 
                       static_props: List[Dict], properties: Optional[List[Dict]]=None,
                       all_decorators: Optional[List[Dict]]=None) -> List[CodeElement]:
@@ -255,7 +261,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             
             try:
                 # Create CodeElement from raw data
-                class_element = CodeElement.from_dict(class_data)
+                class_element = element_from_dict(class_data)
                 class_element.parent_name = None
                 
                 # Store TypeScript-specific information
@@ -386,7 +392,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             
             try:
                 # Create CodeElement from raw data
-                interface_element = CodeElement.from_dict(interface_data)
+                interface_element = element_from_dict(interface_data)
                 interface_element.parent_name = None
                 
                 # Store TypeScript-specific information for interfaces
@@ -461,7 +467,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             
             try:
                 # Create CodeElement from raw data
-                type_alias_element = CodeElement.from_dict(type_alias_data)
+                type_alias_element = element_from_dict(type_alias_data)
                 type_alias_element.parent_name = None
                 
                 # Store TypeScript-specific information
@@ -514,7 +520,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             
             try:
                 # Create CodeElement from raw data
-                enum_element = CodeElement.from_dict(enum_data)
+                enum_element = element_from_dict(enum_data)
                 enum_element.parent_name = None
                 
                 # Store TypeScript-specific information (const enum, etc.)
@@ -539,7 +545,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
                         continue
                     
                     try:
-                        member_element = CodeElement(
+                        member_element = new_element(
                             type=CodeElementType.ENUM_MEMBER,
                             name=member_name,
                             content=member_data.get('content', ''),
@@ -599,7 +605,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             
             try:
                 # Create CodeElement from raw data
-                namespace_element = CodeElement.from_dict(namespace_data)
+                namespace_element = element_from_dict(namespace_data)
                 namespace_element.parent_name = None
                 
                 # Add decorators from the global decorator list
@@ -646,6 +652,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
         
         return processed_namespaces
     
+    @instrumented('process_all')
     def process_all(self, raw_elements: Dict[str, List[Dict]]) -> CodeElementsResult:
         """
         Process all raw extracted elements into a structured CodeElementsResult.
@@ -666,6 +673,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
         # Process imports
         imports = self.process_imports(raw_elements.get('imports', []))
         all_elements.extend(imports)
+        check_deadline('process_imports')
         
         # Process functions
         functions = self.process_functions(
@@ -673,6 +681,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             all_decorators
         )
         all_elements.extend(functions)
+        check_deadline('process_functions')
         
         # Process classes with their members, static properties, and properties
         classes = self.process_classes(
@@ -683,6 +692,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             all_decorators
         )
         all_elements.extend(classes)
+        check_deadline('process_classes')
         
         # Process interfaces
         interfaces = self.process_interfaces(
@@ -690,6 +700,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             all_decorators
         )
         all_elements.extend(interfaces)
+        check_deadline('process_interfaces')
         
         # Process type aliases
         type_aliases = self.process_type_aliases(
@@ -697,6 +708,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             all_decorators
         )
         all_elements.extend(type_aliases)
+        check_deadline('process_type_aliases')
         
         # Process enums
         enums = self.process_enums(
@@ -704,6 +716,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             all_decorators
         )
         all_elements.extend(enums)
+        check_deadline('process_enums')
         
         # Process namespaces
         namespaces = self.process_namespaces(
@@ -716,12 +729,12 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
         
         try:
             # Create the final CodeElementsResult
-            result = CodeElementsResult(elements=all_elements)
+            result = new_result(elements=all_elements)
             return result
         except (ValidationError, Exception) as e:
             logger.error(f"process_all: Failed to create CodeElementsResult: {e}", exc_info=True)
             # Return an empty result if creation fails
-            return CodeElementsResult(elements=[])
+            return new_result(elements=[])
     
     def _process_parameters(self, element: CodeElement, params_data: List[Dict]) -> List[CodeElement]:
         """
@@ -777,7 +790,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
                 
                 content = "".join(content_parts)
                 
-                param_element = CodeElement(
+                param_element = new_element(
                     type=CodeElementType.PARAMETER,
                     name=name,
                     content=content,
@@ -829,7 +842,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             # Format the return type appropriately for TypeScript
             content = f": {return_type}" if return_type else ""
             
-            return_element = CodeElement(
+            return_element = new_element(
                 type=CodeElementType.RETURN_VALUE,
                 name=f"{element.name}_return",  # Standardized name
                 content=content,
@@ -877,7 +890,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             method_data["type"] = element_type_enum.value
             
             # Create CodeElement from raw data
-            element = CodeElement.from_dict(method_data)
+            element = element_from_dict(method_data)
             element.parent_name = parent_name
             
             # Add TypeScript-specific information
@@ -943,7 +956,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
         
         try:
             # Create CodeElement from raw data
-            element = CodeElement.from_dict(prop_data)
+            element = element_from_dict(prop_data)
             element.parent_name = parent_name
             element.value_type = prop_data.get("value_type")  # Keep potential type hint
             
@@ -999,7 +1012,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
         
         try:
             # Create CodeElement from raw data
-            element = CodeElement.from_dict(prop_data)
+            element = element_from_dict(prop_data)
             element.parent_name = parent_name
             element.value_type = prop_data.get("value_type")  # Keep potential type hint
             
@@ -1050,7 +1063,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             method_data["type"] = CodeElementType.METHOD.value
             
             # Create CodeElement from raw data
-            element = CodeElement.from_dict(method_data)
+            element = element_from_dict(method_data)
             element.parent_name = parent_name
             
             # Add TypeScript-specific information
@@ -1097,7 +1110,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
             prop_data["type"] = CodeElementType.PROPERTY.value
             
             # Create CodeElement from raw data
-            element = CodeElement.from_dict(prop_data)
+            element = element_from_dict(prop_data)
             element.parent_name = parent_name
             element.value_type = prop_data.get("value_type")  # Keep potential type hint
             
@@ -1155,7 +1168,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
                 
                 if (isinstance(start_line, int) and isinstance(end_line, int) and 
                     start_line > 0 and end_line >= start_line):
-                    decorator_range = CodeRange(
+                    decorator_range = new_range(
                         start_line=start_line,
                         start_column=start_col if isinstance(start_col, int) else 0,
                         end_line=end_line,
@@ -1168,7 +1181,7 @@ class TypeScriptPostProcessor(LanguagePostProcessor):
         
         try:
             # Create CodeElement for the decorator
-            decorator_element = CodeElement(
+            decorator_element = new_element(
                 type=CodeElementType.DECORATOR,
                 name=name,
                 content=content,
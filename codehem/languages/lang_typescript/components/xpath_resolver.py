@@ -0,0 +1,76 @@
+"""
+TypeScript implementation of the syntax-tree XPath resolver.
+"""
+from typing import List, Optional
+
+from tree_sitter import Node
+
+from codehem.core.engine.xpath_resolver import Candidate, XPathResolver
+from codehem.models.enums import CodeElementType
+
+
+class TypeScriptXPathResolver(XPathResolver):
+    """
+    Resolves TypeScript XPaths on the tree.
+
+    Only module-level class and function declarations (optionally exported)
+    and the methods, accessors and fields of their class bodies are resolved;
+    ranges exclude ``export`` and decorators, as in extraction. Static fields
+    are listed both as property and static property. Anything else with the
+    requested name (nested or local definitions, arrow functions, interfaces)
+    makes the resolver defer to extraction.
+    """
+
+    LANGUAGE_CODE = 'typescript'
+    IDENTIFIER_CHARS = rb'\w$'
+
+    TOP_LEVEL_TYPES = {'class_declaration': CodeElementType.CLASS,
+                       'function_declaration': CodeElementType.FUNCTION}
+    MEMBER_TYPES = frozenset({'method_definition', 'public_field_definition', 'method_signature',
+                              'property_signature', 'abstract_method_signature'})
+
+    def top_level_candidates(self, root: Node, code_bytes: bytes, name: str) -> Optional[List[Candidate]]:
+        candidates: List[Candidate] = []
+        for leaf in self.occurrences(root, code_bytes, name):
+            definition = leaf.parent
+            if not self.is_name_of(leaf, definition) or definition.type in self.MEMBER_TYPES:
+                continue  # References and class/interface members
+            element_type = self.TOP_LEVEL_TYPES.get(definition.type)
+            container = definition.parent
+            if container is not None and container.type == 'export_statement':
+                container = container.parent
+            if element_type is None or container is None or container.type != 'program':
+                return None
+            candidates.append((element_type, definition))
+        return candidates
+
+    def member_candidates(self, container: Node, code_bytes: bytes, name: str,
+                          target_type: Optional[str]) -> Optional[List[Candidate]]:
+        body = container.child_by_field_name('body')
+        if body is None:
+            return None
+        candidates: List[Candidate] = []
+        for leaf in self.occurrences(body, code_bytes, name):
+            member = leaf.parent
+            if not self.is_name_of(leaf, member):
+                continue
+            if member.parent is None or member.parent.start_byte != body.start_byte:
+                return None  # Local definitions inside members
+            if member.type == 'method_definition':
+                keywords = {child.type for child in member.children if not child.is_named}
+                if 'get' in keywords:
+                    candidates.append((CodeElementType.PROPERTY_GETTER, member))
+                elif 'set' in keywords:
+                    candidates.append((CodeElementType.PROPERTY_SETTER, member))
+                else:
+                    candidates.append((CodeElementType.METHOD, member))
+            elif member.type == 'public_field_definition':
+                candidates.append((CodeElementType.PROPERTY, member))
+                if any(child.type == 'static' for child in member.children):
+                    candidates.append((CodeElementType.STATIC_PROPERTY, member))
+            else:
+                return None
+        kinds = [element_type for element_type, _ in candidates]
+        if len(set(kinds)) != len(kinds):
+            return None  # Overloads and redefinitions
+        return candidates
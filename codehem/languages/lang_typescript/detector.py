@@ -6,6 +6,41 @@ from codehem.core.registry import language_detector
 
 logger = logging.getLogger(__name__)
 
+# Strong indicators for TS/JS
+_STRONG_PATTERNS = tuple(re.compile(p) for p in (
+    r'\b(interface|type)\s+[A-Z]', # TS interfaces/types usually start upper
+    r'\b(import|export)\s+.*\s+from\s+["\']', # ES6 modules
+    r'@(Component|Injectable|NgModule|Directive|Pipe)\b', # Common Angular decorators
+    r'\b(class|constructor)\b',
+    r'\b(public|private|protected|readonly)\s+', # TS access modifiers/readonly
+    r'\b(let|const)\s+\w+', # Modern JS variable declarations
+    r'=>', # Arrow functions
+    r'function\s*\(', # Function keyword
+))
+# Weaker indicators (could appear in other languages but common in JS/TS)
+_WEAK_PATTERNS = tuple(re.compile(p) for p in (
+    r'{\s*\n', # Braces formatting
+    r'}\s*;?', # Braces formatting
+    r'\.\s*(then|catch|subscribe|map|filter|forEach)\s*\(', # Common method chaining
+    r'document\.getElementById', # Browser JS
+    r'console\.log', # Common logging
+    r'angular\.module', # AngularJS module definition
+    r'\$scope|\$http|\$q', # Common AngularJS identifiers
+))
+# Anti-patterns (more likely in other languages like Python)
+_ANTI_PATTERNS = tuple(re.compile(p) for p in (
+    r'^\s*def\s+\w+\(.*\):', # Python function definition
+    r'^\s*class\s+\w+\(.*\):', # Python class definition with inheritance
+    r'@property', # Python property decorator
+    r'#include', # C/C++
+    r'using\s+System', # C#
+    r'package\s+\w+', # Java/Go
+    r'func\s+\w+\(', # Go
+))
+
+_MAX_SCORE = len(_STRONG_PATTERNS) * 15.0 + len(_WEAK_PATTERNS) * 5.0
+
+
 @language_detector
 class TypeScriptLanguageDetector(BaseLanguageDetector):
     """TypeScript/JavaScript language detector."""
@@ -24,58 +59,26 @@ class TypeScriptLanguageDetector(BaseLanguageDetector):
         if not code.strip():
             return 0.0
 
-        # Strong indicators for TS/JS
-        ts_strong_patterns = [
-            r'\b(interface|type)\s+[A-Z]', # TS interfaces/types usually start upper
-            r'\b(import|export)\s+.*\s+from\s+["\']', # ES6 modules
-            r'@(Component|Injectable|NgModule|Directive|Pipe)\b', # Common Angular decorators
-            r'\b(class|constructor)\b',
-            r'\b(public|private|protected|readonly)\s+', # TS access modifiers/readonly
-            r'\b(let|const)\s+\w+', # Modern JS variable declarations
-            r'=>', # Arrow functions
-            r'function\s*\(', # Function keyword
-        ]
-        # Weaker indicators (could appear in other languages but common in JS/TS)
-        ts_weak_patterns = [
-            r'{\s*\n', # Braces formatting
-            r'}\s*;?', # Braces formatting
-            r'\.\s*(then|catch|subscribe|map|filter|forEach)\s*\(', # Common method chaining
-            r'document\.getElementById', # Browser JS
-            r'console\.log', # Common logging
-            r'angular\.module', # AngularJS module definition
-            r'\$scope|\$http|\$q', # Common AngularJS identifiers
-        ]
-        # Anti-patterns (more likely in other languages like Python)
-        anti_patterns = [
-            r'^\s*def\s+\w+\(.*\):', # Python function definition
-            r'^\s*class\s+\w+\(.*\):', # Python class definition with inheritance
-            r'@property', # Python property decorator
-            r'#include', # C/C++
-            r'using\s+System', # C#
-            r'package\s+\w+', # Java/Go
-            r'func\s+\w+\(', # Go
-        ]
-
         score = 0.0
-        max_score = len(ts_strong_patterns) * 15.0 + len(ts_weak_patterns) * 5.0
+        max_score = _MAX_SCORE
 
         num_lines = code.count('\n')
 
         # Check strong patterns
-        for pattern in ts_strong_patterns:
-            if re.search(pattern, code):
+        for pattern in _STRONG_PATTERNS:
+            if pattern.search(code):
                 score += 15
                 # logger.debug(f"TS Strong Match: {pattern}")
 
         # Check weak patterns
-        for pattern in ts_weak_patterns:
-            if re.search(pattern, code):
+        for pattern in _WEAK_PATTERNS:
+            if pattern.search(code):
                 score += 5
                 # logger.debug(f"TS Weak Match: {pattern}")
 
         # Check anti-patterns
-        for pattern in anti_patterns:
-            if re.search(pattern, code):
+        for pattern in _ANTI_PATTERNS:
+            if pattern.search(code):
                 score -= 20 # Penalize heavily for strong indicators of other languages
                 # logger.debug(f"TS Anti-Match: {pattern}")
 
@@ -15,6 +15,7 @@ class TypeScriptStaticPropertyExtractor(TemplateExtractor):
     """ Extracts TypeScript/JavaScript static properties (static class fields). """
     LANGUAGE_CODE = 'typescript'
     ELEMENT_TYPE = CodeElementType.STATIC_PROPERTY
+    REGEX_FLAGS = re.MULTILINE
 
     def _get_parent_class_name(self, node: Node, ast_handler: ASTHandler, code_bytes: bytes) -> Optional[str]:
         """ Finds the name of the containing class definition """
@@ -176,15 +177,11 @@ class TypeScriptStaticPropertyExtractor(TemplateExtractor):
     def _process_regex_results(self, matches: Any, code: str, context: Dict[str, Any]) -> List[Dict]:
         """ Regex fallback for static properties. """
         logger.warning("Regex fallback used for TypeScriptStaticPropertyExtractor.")
-        # This regex is basic and might miss cases or have false positives
-        pattern = self.descriptor.regexp_pattern if self.descriptor else None
-        if not pattern:
-            pattern = r"(?:^|\n)\s*static\s+(?:readonly\s+)?([a-zA-Z_$][a-zA-Z0-9_$]*)(?:\s*:\s*[\w.<>|&\[\]\s]+)?\s*=\s*(.+?)(?:;|$)"
-
+        # The descriptor pattern is basic and might miss cases or have false positives
         properties = []
         class_name_context = context.get('class_name') if context else None
         try:
-            for match in re.finditer(pattern, code, re.MULTILINE):
+            for match in matches:
                  prop_name = match.group(1)
                  prop_value = match.group(2).strip()
                  content = match.group(0)
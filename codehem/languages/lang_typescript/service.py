@@ -5,6 +5,7 @@ from codehem.models.enums import CodeElementType
 from codehem.models.xpath import CodeElementXPathNode
 from codehem.core.language_service import LanguageService
 from codehem.core.registry import language_service, registry
+from codehem.core.utils.line_index import get_line_index
 from codehem.core.engine.xpath_parser import XPathParser
 from codehem.models.code_element import CodeElement, CodeElementsResult
 from .components.orchestrator import TypeScriptExtractionOrchestrator
@@ -228,15 +229,15 @@ class TypeScriptLanguageService(LanguageService):
             logger.warning(f"Attempting to extract part from element without valid range: {(element.name if element else 'None')}, Range: {getattr(element, 'range', 'N/A')}")
             return None
 
-        code_lines = code.splitlines()
+        line_index = get_line_index(code)
         element_start_idx = element.range.start_line - 1
         element_end_idx = element.range.end_line
 
-        if element_start_idx < 0 or element_start_idx >= len(code_lines) or element_end_idx > len(code_lines):
-            logger.error(f"Invalid line indices for element '{element.name}': start={element_start_idx}, end={element_end_idx}, total_lines={len(code_lines)}")
+        if element_start_idx < 0 or element_start_idx >= line_index.line_count or element_end_idx > line_index.line_count:
+            logger.error(f"Invalid line indices for element '{element.name}': start={element_start_idx}, end={element_end_idx}, total_lines={line_index.line_count}")
             return None
 
-        element_lines = code_lines[element_start_idx:element_end_idx]
+        element_lines = line_index.slice_lines(element.range.start_line, element.range.end_line).splitlines()
         if not element_lines:
             logger.warning(f"No lines found for element '{element.name}' in range {element.range.start_line}-{element.range.end_line}")
             return ''
@@ -345,7 +346,6 @@ class TypeScriptLanguageService(LanguageService):
 
     def extract(self, code: str) -> 'CodeElementsResult':
         """Extract code elements using the TypeScript orchestrator instead of template extractors."""
-        print(f'=== TypeScript service extract method called ===')
         logger.debug(f'TypeScript service: Starting extraction using component-based orchestrator')
         try:
             # Create orchestrator with post-processor
@@ -354,7 +354,6 @@ class TypeScriptLanguageService(LanguageService):
             
             # Use orchestrator to extract elements
             result = orchestrator.extract_all(code)
-            print(f'=== TypeScript orchestrator found {len(result.elements)} elements ===')
             logger.debug(f'TypeScript service: Completed extraction. Found {len(result.elements)} top-level elements.')
             return result
         except Exception as e:
@@ -368,20 +367,22 @@ class TypeScriptLanguageService(LanguageService):
         if not xpath_nodes:
             return None
 
-        try:
-            # Use the service's own extraction method which should use the post-processor
-            elements_result: 'CodeElementsResult' = self.extract(code)
-            if not elements_result or not elements_result.elements:
-                 logger.warning("get_text_by_xpath_internal: Extraction returned no elements.")
-                 return None
-        except Exception as e:
-            logger.error(f'Error during extraction within get_text_by_xpath_internal: {e}', exc_info=True)
-            return None
+        target_element = self._resolve_target_element(code, xpath_nodes)
+        if target_element is None:
+            try:
+                # Use the service's own extraction method which should use the post-processor
+                elements_result: 'CodeElementsResult' = self.extract(code)
+                if not elements_result or not elements_result.elements:
+                     logger.warning("get_text_by_xpath_internal: Extraction returned no elements.")
+                     return None
+            except Exception as e:
+                logger.error(f'Error during extraction within get_text_by_xpath_internal: {e}', exc_info=True)
+                return None
 
-        logger.debug(f'get_text_by_xpath_internal: Extraction completed, {len(elements_result.elements)} top-level elements.')
+            logger.debug(f'get_text_by_xpath_internal: Extraction completed, {len(elements_result.elements)} top-level elements.')
 
-        # Use the filtering logic to find the target element
-        target_element = self._find_target_element(elements_result, xpath_nodes)
+            # Use the filtering logic to find the target element
+            target_element = self._find_target_element(elements_result, xpath_nodes)
 
         if not target_element:
             logger.warning(f'get_text_by_xpath_internal: Element not found for XPath: {XPathParser.to_string(xpath_nodes)}')
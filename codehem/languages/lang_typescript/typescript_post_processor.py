@@ -4,6 +4,7 @@ from codehem.models.code_element import CodeElement, CodeRange
 from codehem.models.enums import CodeElementType
 from pydantic import ValidationError
 from codehem.core.post_processors.base import LanguagePostProcessor
+from codehem.core.utils.instrumentation import instrumented
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,7 @@ class TypeScriptExtractionPostProcessor(LanguagePostProcessor):
         super().__init__("typescript")
 
     # --- process_imports (unchanged from previous thought process, assuming it's mostly correct) ---
+    @instrumented('process_imports')
     def process_imports(self, raw_imports: List[Dict]) -> List[CodeElement]:
         """Processes raw import data into CodeElement objects."""
         processed_imports = []
@@ -109,6 +111,7 @@ class TypeScriptExtractionPostProcessor(LanguagePostProcessor):
             return individual_elements
 
     # --- process_functions (unchanged from previous thought process) ---
+    @instrumented('process_functions')
     def process_functions(self, raw_functions: List[Dict], all_decorators: List[Dict]=None) -> List[CodeElement]:
         """Processes raw function data into CodeElement objects. Accepts all_decorators list."""
         processed_functions = []
@@ -160,6 +163,7 @@ class TypeScriptExtractionPostProcessor(LanguagePostProcessor):
         return processed_functions
 
     # --- process_classes (modified as per patch) ---
+    @instrumented('process_classes')
     def process_classes(self, raw_classes: List[Dict], members: List[Dict], static_props: List[Dict], properties: List[Dict]=None, all_decorators: List[Dict]=None) -> List[CodeElement]:
         """Processes raw class/interface data, associating members, static properties, and regular properties.
         Accepts all_decorators list."""
@@ -1,4 +1,5 @@
 import os
+import locale
 import logging
 from typing import List, Optional, Tuple
 
@@ -6,6 +7,14 @@ from .core.engine.xpath_parser import XPathParser
 from .core.extraction_service import ExtractionService
 from .core.manipulation_service import ManipulationService
 from .core.post_processors.factory import PostProcessorFactory
+from .core.utils import instrumentation
+from .core.utils.instrumentation import instrumented
+from .core.utils.node_retention import NodeRetention
+from .core.utils.element_selection import ElementTypes, categories_for_types
+from .core.utils.extraction_level import ExtractionLevel
+from .core.utils.budget import Budget, enforce
+from .core.utils.source_io import UTF8, SourceCode, as_text, read_source
+from .core.error_handling import BudgetExceededError
 from .languages import (
     get_language_service,
     get_language_service_for_code,
@@ -13,6 +22,7 @@ from .languages import (
     get_supported_languages,
 )
 from .models.code_element import CodeElement, CodeElementsResult
+from .models.diff import ElementChange
 from .models.enums import CodeElementType
 from .models.xpath import CodeElementXPathNode
 from .builder import build_class, build_function, build_method
@@ -26,16 +36,23 @@ class CodeHem:
     Provides language-agnostic interface for code manipulation.
     """
 
-    def __init__(self, language_code: str):
+    def __init__(self, language_code: str, hash_algorithm: str = "sha256"):
         """
         Initialize CodeHem for a specific language.
 
         Args:
             language_code: Language code (e.g., 'python', 'typescript')
+            hash_algorithm: Algorithm for element hashes and patch conflict
+                checks ('sha256' or the faster 'blake2b')
 
         Raises:
-            ValueError: If the language is not supported
+            ValueError: If the language or hash algorithm is not supported
         """
+        from codehem.core.utils.hashing import HASH_ALGORITHMS
+
+        if hash_algorithm not in HASH_ALGORITHMS:
+            raise ValueError(f"Unsupported hash algorithm: {hash_algorithm}")
+        self.hash_algorithm = hash_algorithm
         self.language_service = get_language_service(language_code)
         if not self.language_service:
             raise ValueError(f"Unsupported language: {language_code}")
@@ -116,11 +133,68 @@ class CodeHem:
         return PostProcessorFactory.get_supported_languages()
 
     @staticmethod
-    def open_workspace(repo_root: str) -> "Workspace":
-        """Open a workspace rooted at ``repo_root`` and build its index."""
+    def enable_metrics(enabled: bool = True) -> None:
+        """Turn per-stage timing instrumentation on or off (off by default)."""
+        instrumentation.enable(enabled)
+
+    @staticmethod
+    def metrics(reset: bool = False) -> dict:
+        """
+        Return the timings and counters collected while metrics were enabled.
+
+        Args:
+            reset: Clear the collected metrics after reading them
+
+        Returns:
+            Dict with per-span ``count``/``total_ms``/``self_ms``/``mean_ms``/``min_ms``/``max_ms``
+            under ``spans`` and counter values under ``counters``
+        """
+        return instrumentation.snapshot(reset_after=reset)
+
+    @staticmethod
+    def open_workspace(repo_root: str, budget: Optional[Budget] = None) -> "Workspace":
+        """
+        Open a workspace rooted at ``repo_root`` and build its index.
+
+        Files exceeding ``budget`` are not indexed; they are listed in the
+        workspace's ``skipped`` mapping with the reason.
+        """
         from codehem.core.workspace import Workspace
 
-        return Workspace.open(repo_root)
+        return Workspace.open(repo_root, budget)
+
+    @staticmethod
+    def extract_many(
+        items,
+        workers: Optional[int] = None,
+        ordered: bool = True,
+        executor: str = "process",
+        chunk_size: int = 8,
+        timeout: Optional[float] = None,
+        **options,
+    ):
+        """
+        Extract many files with a worker pool, yielding one outcome per item.
+
+        Args:
+            items: Paths, or ``(name, code)`` / ``(name, code, language)``
+                tuples for in-memory sources
+            workers: Pool size (default: CPU count); 1 runs in the calling thread
+            ordered: Yield in input order (default) or as files complete
+            executor: ``"process"`` (default) or ``"thread"``
+            chunk_size: Items dispatched to a worker at a time
+            timeout: Per-file time limit in seconds; overruns yield a
+                ``"timeout"`` error
+            **options: Passed to ``extract`` (``fast``, ``level``, ``types``, ...)
+
+        Returns:
+            Generator of ``codehem.batch.ExtractOutcome`` (``path``,
+            ``language``, ``result`` or ``error``, ``elapsed``)
+        """
+        from .batch import extract_many
+
+        return extract_many(items, workers=workers, ordered=ordered, executor=executor,
+                            chunk_size=chunk_size, timeout=timeout, **options)
 
     @staticmethod
     def load_file(file_path: str) -> str:
@@ -139,20 +213,51 @@ class CodeHem:
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except IOError as e:
+            logger.error(f"IOError reading file {file_path}: {e}")
+            raise
         try:
             # Try UTF-8 first
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
+            return data.decode("utf-8")
         except UnicodeDecodeError:
             logger.warning(
                 f"Could not decode {file_path} as UTF-8, trying default encoding."
             )
             # Fallback to default encoding if UTF-8 fails
-            with open(file_path, "r") as f:
-                return f.read()
+            return data.decode(locale.getpreferredencoding(False))
+
+    @staticmethod
+    def load_file_bytes(file_path: str) -> bytes:
+        """
+        Load a file as UTF-8 bytes for the bytes-first extraction path.
+
+        The file is read with a single binary read; files that are not
+        UTF-8 are decoded with the default encoding and re-encoded once.
+        Pass the result to ``extract``, which parses it without re-encoding.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Content of the file as UTF-8 bytes
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            IOError: If the file cannot be read
+        """
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+        try:
+            data, encoding = read_source(file_path)
         except IOError as e:
             logger.error(f"IOError reading file {file_path}: {e}")
             raise
+        if encoding != UTF8:
+            logger.warning(f"Could not decode {file_path} as UTF-8, decoded it as {encoding}.")
+        return data
 
     def detect_element_type(self, code: str) -> str:
         """
@@ -288,16 +393,76 @@ class CodeHem:
             )
             return None
 
-    def extract(self, code: str) -> CodeElementsResult:
+    @instrumented('extract')
+    def extract(
+        self,
+        code: SourceCode,
+        lazy_content: bool = False,
+        fast: bool = False,
+        node_retention: str = "none",
+        level: str = "full",
+        types: ElementTypes = None,
+        budget: Optional[Budget] = None,
+    ) -> CodeElementsResult:
         """
         Extract code elements from the source code.
 
         Args:
-            code: Source code as string
+            code: Source code as string, or as UTF-8 bytes (see
+                ``load_file_bytes``), which Python and TypeScript parse as is
+                and only decode node by node
+            lazy_content: If True, elements keep byte spans into one shared
+                source buffer and decode ``content`` on first access. This
+                only saves the per-element text copies, which are a small
+                part of a result: retained results are about 10% smaller
+                for ``str`` input and about 20% smaller for ``bytes`` input,
+                where the caller's bytes are the buffer
+            fast: If True, return the slotted ``FastCodeElementsResult`` built by
+                the post-processors without converting it to pydantic models;
+                call ``to_model()`` on it when a pydantic result is needed
+            node_retention: How results keep tree-sitter nodes: ``"none"`` drops
+                them so results don't pin syntax trees, ``"weak"`` keeps
+                ``NodeRef`` handles resolvable while the tree is cached and
+                ``"full"`` keeps the live nodes
+            level: How much detail to extract: ``"outline"`` (imports and
+                top-level definitions), ``"members"`` (plus class members,
+                without parameters, return info or decorators) or ``"full"``.
+                Raw results are cached per level, so a later deeper request
+                for the same code only extracts what is missing. Languages
+                without a component orchestrator always extract everything.
+            types: Element types to extract (e.g. ``{"import"}`` or
+                ``{CodeElementType.CLASS, CodeElementType.METHOD}``); only
+                the extractors and queries for them run. Classes and
+                interfaces are included when member types are selected, so
+                the members have a parent. Default: every type.
+            budget: Size and time limits for this file
+                (``codehem.core.utils.budget.Budget``). Parsing and the
+                extraction phases stop once the time limit has passed.
 
         Returns:
             CodeElementsResult containing extracted elements
+
+        Raises:
+            BudgetExceededError: If the code exceeds ``budget``
         """
+        node_retention = NodeRetention(node_retention)
+        level = ExtractionLevel(level)
+        categories = categories_for_types(types)
+        if budget is not None:
+            budget.check_code(code)
+        with enforce(budget):
+            return self._extract(code, lazy_content, fast, node_retention, level, types, categories)
+
+    def _extract(
+        self,
+        code: SourceCode,
+        lazy_content: bool,
+        fast: bool,
+        node_retention: NodeRetention,
+        level: ExtractionLevel,
+        types: ElementTypes,
+        categories: Optional[frozenset],
+    ) -> CodeElementsResult:
         # Special handling to use component-based orchestrators where available
         if self.language_service and self.language_service.language_code in ['typescript', 'javascript', 'python']:
             lang = self.language_service.language_code
@@ -316,9 +481,18 @@ class CodeHem:
                     post_processor = PythonPostProcessor()
                     orchestrator = PythonExtractionOrchestrator(post_processor)
 
-                result = orchestrator.extract_all(code)
+                result = orchestrator.extract_all(
+                    code,
+                    lazy_content=lazy_content,
+                    fast=fast,
+                    node_retention=node_retention,
+                    level=level,
+                    categories=categories,
+                )
                 logger.debug(f'CodeHem: {lang.capitalize()} orchestrator found {len(result.elements)} elements')
                 return result
+            except BudgetExceededError:
+                raise
             except Exception as e:
                 logger.error(f'CodeHem: Error with {lang.capitalize()} orchestrator, falling back to extraction service: {e}', exc_info=True)
                 # Fall back to regular extraction service
@@ -326,7 +500,9 @@ class CodeHem:
         # Default behavior for other languages
         if not self.extraction:
             raise RuntimeError("Extraction service not initialized.")
-        return self.extraction.extract_all(code)
+        return self.extraction.extract_all(
+            as_text(code), lazy_content=lazy_content, node_retention=node_retention, types=types
+        )
 
     @staticmethod
     def _ensure_file_prefix_static(xpath: str) -> str:
@@ -405,11 +581,12 @@ class CodeHem:
             return None
         start_line, end_line = line_range
 
-        lines = code.splitlines()
-        # Adjust validation if start_line can be > end_line temporarily? No, find_by_xpath should return valid range.
+        from codehem.core.utils.line_index import get_line_index
+
+        index = get_line_index(code)
         if (
-            start_line > len(lines)
-            or end_line > len(lines)
+            start_line > index.line_count
+            or end_line > index.line_count
             or start_line <= 0
             or end_line < start_line
         ):
@@ -417,29 +594,23 @@ class CodeHem:
                 f'Invalid line range returned by find_by_xpath for "{xpath}": ({start_line}, {end_line})'
             )
             return None
-
-        def extract_text(start, end, code_lines):
-            # Ensure indices are within bounds for slicing
-            start_idx = max(0, start - 1)
-            end_idx = min(len(code_lines), end)
-            if start_idx >= end_idx:
-                logger.warning(
-                    f"Adjusted invalid line range for extraction: start_idx={start_idx}, end_idx={end_idx}"
-                )
-                return None
-            return "\n".join(code_lines[start_idx:end_idx])
-
-        return extract_text(start_line, end_line, lines)
+        return index.slice_lines(start_line, end_line)
 
     def get_element_hash(self, code: str, xpath: str) -> Optional[str]:
-        """Return SHA256 hash of the code fragment specified by XPath."""
-        text = self.get_text_by_xpath(code, xpath)
-        if text is None:
-            return None
-        from codehem.core.utils.hashing import sha256_code
+        """
+        Return the hash of the code fragment specified by XPath.
 
-        return sha256_code(text)
+        The hash is memoized on the element of the cached extraction result, so
+        calling this before ``apply_patch`` does not cost an extra extraction.
+        """
+        if not self.extraction:
+            raise RuntimeError("Extraction service not initialized.")
+        processed_xpath = self._ensure_file_prefix(xpath)
+        return self.extraction.get_element_hash(
+            code, processed_xpath, self.hash_algorithm
+        )
 
+    @instrumented('apply_patch')
     def apply_patch(
         self,
         original_code: str,
@@ -457,11 +628,14 @@ class CodeHem:
 
             raise ElementNotFoundError("xpath", xpath)
         start_line, end_line = location
-        lines = original_code.splitlines()
-        old_fragment = "\n".join(lines[start_line - 1 : end_line])
-        from codehem.core.utils.hashing import sha256_code
+        from codehem.core.utils.line_index import get_line_index
+
+        index = get_line_index(original_code)
+        old_fragment = index.slice_lines(start_line, end_line)
+        from codehem.core.utils.hashing import hash_code
 
-        current_hash = sha256_code(old_fragment)
+        # The same lines get_element_hash hashes; no second xpath lookup
+        current_hash = hash_code(old_fragment, self.hash_algorithm)
         if original_hash is not None and original_hash != current_hash:
             from codehem.core.error_handling import WriteConflictError
 
@@ -472,29 +646,16 @@ class CodeHem:
         if mode == "replace":
             new_fragment_lines = new_code.splitlines()
         elif mode == "append":
-            new_fragment_lines = (
-                lines[start_line - 1 : end_line] + new_code.splitlines()
-            )
+            new_fragment_lines = [old_fragment] + new_code.splitlines()
         elif mode == "prepend":
-            new_fragment_lines = (
-                new_code.splitlines() + lines[start_line - 1 : end_line]
-            )
+            new_fragment_lines = new_code.splitlines() + [old_fragment]
         else:
             from codehem.core.error_handling import InvalidManipulationError
 
             raise InvalidManipulationError("apply_patch", f"Unknown mode: {mode}")
-        patched_lines = lines[: start_line - 1] + new_fragment_lines + lines[end_line:]
-        patched_code = "\n".join(patched_lines)
-        from difflib import unified_diff
-
-        diff_lines = list(
-            unified_diff(
-                original_code.splitlines(True),
-                patched_code.splitlines(True),
-                fromfile="original",
-                tofile="patched",
-            )
-        )
+        new_fragment = "\n".join(new_fragment_lines)
+        patched_code = index.replace_lines(start_line, end_line, new_fragment)
+        diff_lines = self._fragment_diff(index, start_line, end_line, new_fragment)
         if dry_run:
             return "".join(diff_lines)
 
@@ -512,13 +673,72 @@ class CodeHem:
             "status": "ok",
             "lines_added": lines_added,
             "lines_removed": lines_removed,
-            "new_hash": sha256_code("\n".join(new_fragment_lines)),
+            "new_hash": hash_code(new_fragment, self.hash_algorithm),
             "code": patched_code,
         }
         if return_format == "text":
             return patched_code
         return result
 
+    @staticmethod
+    def _fragment_diff(index, start_line: int, end_line: int, new_fragment: str, context: int = 3) -> List[str]:
+        """
+        Build a unified diff for a line-range replacement without diffing the whole file.
+
+        Only the replaced lines plus ``context`` lines on each side are compared;
+        hunk headers are shifted back to file line numbers afterwards.
+        """
+        import re
+        from difflib import unified_diff
+
+        end_line = min(end_line, index.line_count)
+        window_start = max(1, start_line - context)
+        window_end = min(index.line_count, end_line + context)
+        text = index.text
+        window_stop = index.line_start(window_end + 1) if window_end < index.line_count else len(text)
+        after_start = index.line_start(end_line + 1) if end_line < index.line_count else len(text)
+        before = text[index.line_start(window_start):index.line_start(start_line)]
+        after = text[after_start:window_stop]
+        old_window = text[index.line_start(window_start):window_stop]
+        terminator = text[index.line_end(end_line):after_start]
+        if new_fragment.splitlines():
+            new_window = before + index.newline().join(new_fragment.splitlines()) + terminator + after
+        else:
+            new_window = before + after
+        offset = window_start - 1
+
+        def shift(match):
+            old_start, old_len, new_start, new_len = match.groups()
+            return f"@@ -{int(old_start) + offset}{old_len or ''} +{int(new_start) + offset}{new_len or ''} @@"
+
+        hunk_header = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@")
+        diff_lines = []
+        for line in unified_diff(
+            old_window.splitlines(True),
+            new_window.splitlines(True),
+            fromfile="original",
+            tofile="patched",
+        ):
+            if line.startswith("@@"):
+                line = hunk_header.sub(shift, line)
+            diff_lines.append(line)
+        return diff_lines
+
+    def diff_elements(self, old_code: str, new_code: str) -> List[ElementChange]:
+        """
+        Compute element-level changes between two versions of a file.
+
+        Args:
+            old_code: Original source code
+            new_code: Updated source code
+
+        Returns:
+            List of ElementChange objects (added, removed, moved, modified) keyed by XPath
+        """
+        from codehem.core.element_diff import diff_results
+
+        return diff_results(self.extract(old_code), self.extract(new_code))
+
     def new_function(
         self,
         original_code: str,
@@ -2,3 +2,5 @@ from .code_element import CodeElement, CodeElementsResult
 from .enums import CodeElementType
 from .range import CodeRange
 from .xpath import CodeElementXPathNode
+from .diff import ElementChange, ElementChangeType
+from .element_table import ElementTable
@@ -3,13 +3,14 @@ Models for code elements.
 Provides data structures for representing code elements and their relationships.
 """
 import logging  # Added logging
-from typing import Any, Dict, List, Optional, TYPE_CHECKING  # Added Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING  # Added Tuple, TYPE_CHECKING
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_serializer
 
 # Import enums and range directly (no circular dependencies here)
 from .enums import CodeElementType
 from .range import CodeRange
+from .source_buffer import SourceBuffer, current_source_buffer
 
 # Use TYPE_CHECKING to avoid circular imports at runtime
 if TYPE_CHECKING:
@@ -17,73 +18,98 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__) # Added logger
 
-class CodeElement(BaseModel):
-    """Unified model for all code elements"""
-    type: CodeElementType
-    name: str
-    content: str
-    range: Optional[CodeRange] = None
-    parent_name: Optional[str] = None
-    value_type: Optional[str] = None
-    additional_data: Dict[str, Any] = Field(default_factory=dict)
-    children: List['CodeElement'] = Field(default_factory=list)
 
-    @staticmethod
-    def from_dict(raw_element: dict) -> 'CodeElement':
-        element_type_str = raw_element.get('type', 'unknown')
-        name = raw_element.get('name', '')
-        # Removed print statement, use logging if needed
-        # print(f'[from_dict] name={name}, type={element_type_str}') 
-        logger.debug(f'CodeElement.from_dict: Creating element name={name}, type_str={element_type_str}')
-        content = raw_element.get('content', '')
-        
-        # Attempt to convert string to enum, default to UNKNOWN
-        try:
-             element_type = CodeElementType(element_type_str.lower())
-        except ValueError:
-             logger.warning(f"Unknown element type string '{element_type_str}' encountered for element '{name}'. Defaulting to UNKNOWN.")
-             element_type = CodeElementType.UNKNOWN
-        
-        range_data = raw_element.get('range')
-        code_range = None
-        if isinstance(range_data, dict): # Check if range_data is a dict before accessing
-            try:
-                start_line = range_data.get('start', {}).get('line', 0)
-                end_line = range_data.get('end', {}).get('line', 0)
-                # Ensure lines are at least 1 if they are 0 (often means not set properly)
-                start_line = 1 if start_line == 0 else start_line 
-                end_line = 1 if end_line == 0 else end_line
-
-                code_range = CodeRange(
-                     start_line=start_line, 
-                     start_column=range_data.get('start', {}).get('column', 0), 
-                     end_line=end_line, 
-                     end_column=range_data.get('end', {}).get('column', 0),
-                     # Pass node if available - check type?
-                     node=range_data.get('node') 
-                )
-            except Exception as e:
-                 logger.error(f"Error creating CodeRange for element '{name}': {e}. Range data: {range_data}", exc_info=True)
-                 code_range = None # Ensure range is None if creation fails
-        elif range_data is not None:
-             logger.warning(f"Invalid range data format for element '{name}': {type(range_data)}. Expected dict.")
+def parse_raw_element(raw_element: dict) -> Tuple[CodeElementType, str, str]:
+    """Read type, name and content from a raw extraction dict (shared by element models)."""
+    element_type_str = raw_element.get('type', 'unknown')
+    name = raw_element.get('name', '')
+    logger.debug(f'CodeElement.from_dict: Creating element name={name}, type_str={element_type_str}')
+    content = raw_element.get('content', '')
+
+    # Attempt to convert string to enum, default to UNKNOWN
+    try:
+         element_type = CodeElementType(element_type_str.lower())
+    except ValueError:
+         logger.warning(f"Unknown element type string '{element_type_str}' encountered for element '{name}'. Defaulting to UNKNOWN.")
+         element_type = CodeElementType.UNKNOWN
+    return element_type, name, content
+
+
+def parse_raw_range(raw_element: dict, name: str) -> Optional[Dict[str, Any]]:
+    """Build CodeRange keyword arguments from the 'range' entry of a raw extraction dict."""
+    range_data = raw_element.get('range')
+    if not isinstance(range_data, dict): # Check if range_data is a dict before accessing
+        if range_data is not None:
+            logger.warning(f"Invalid range data format for element '{name}': {type(range_data)}. Expected dict.")
+        return None
+    start = range_data.get('start', {})
+    end = range_data.get('end', {})
+    start_line = start.get('line', 0)
+    end_line = end.get('line', 0)
+    # Ensure lines are at least 1 if they are 0 (often means not set properly)
+    start_line = 1 if start_line == 0 else start_line
+    end_line = 1 if end_line == 0 else end_line
+
+    start_byte = start.get('byte')
+    end_byte = end.get('byte')
+    if start_byte is None:
+        # Take byte offsets from the source node when it spans the same lines
+        span_node = raw_element.get('range_node') or raw_element.get('node')
+        if span_node is not None and getattr(span_node, 'start_point', None) is not None \
+                and span_node.start_point[0] + 1 == start_line and span_node.end_point[0] + 1 == end_line:
+            start_byte, end_byte = span_node.start_byte, span_node.end_byte
+
+    return dict(
+        start_line=start_line,
+        start_column=start.get('column', 0),
+        end_line=end_line,
+        end_column=end.get('column', 0),
+        start_byte=start_byte,
+        end_byte=end_byte,
+        # Pass node if available - check type?
+        node=range_data.get('node'),
+    )
+
+
+class ElementKindMixin:
+    """Hashes, type predicates and child accessors shared by the element models."""
+    __slots__ = ()
+
+    def fragment_hash(self, code: str, algorithm: str = 'sha256') -> Optional[str]:
+        """
+        Hash of the source lines covered by this element, memoized per algorithm.
 
-        # Handle potential 'class_name' vs 'parent_name' inconsistency if needed
-        parent_name = raw_element.get('parent_name', raw_element.get('class_name'))
+        The fragment is the same one ``CodeHem.apply_patch`` replaces, so the value can
+        be passed back as ``original_hash``. ``code`` must be the source the element
+        was extracted from.
 
-        element = CodeElement(
-            type=element_type,
-            name=name,
-            content=content,
-            range=code_range,
-            parent_name=parent_name,
-            value_type=raw_element.get('value_type'),
-            additional_data=raw_element.get('additional_data', {}), # Ensure default is dict
-            children=[] # Initialize children, they will be added by post-processor
-        )
-        return element
+        Args:
+            code: Source code the element belongs to
+            algorithm: 'sha256' (default) or 'blake2b'
+
+        Returns:
+            Hex digest, or None if the element has no range
+        """
+        cached = self._fragment_hashes.get(algorithm)
+        if cached is not None:
+            return cached
+        if not self.range:
+            return None
+        from codehem.core.utils.hashing import hash_code
+        from codehem.core.utils.line_index import get_line_index
+        fragment = get_line_index(code).slice_lines(self.range.start_line, self.range.end_line)
+        digest = hash_code(fragment, algorithm)
+        self._fragment_hashes[algorithm] = digest
+        return digest
+
+    @property
+    def merkle_hash(self) -> str:
+        """Merkle digest of this element and its children (see ``core.utils.merkle``)."""
+        if self._merkle_hash is None:
+            from codehem.core.utils.merkle import element_digest
+            element_digest(self)
+        return self._merkle_hash
 
-    # Properties remain the same
     @property
     def is_method(self) -> bool:
         return self.type == CodeElementType.METHOD
@@ -153,9 +179,129 @@ class CodeElement(BaseModel):
         meta_types = [CodeElementType.DECORATOR, CodeElementType.ANNOTATION, CodeElementType.ATTRIBUTE, CodeElementType.DOC_COMMENT, CodeElementType.TYPE_HINT, CodeElementType.DOCSTRING, CodeElementType.META_ELEMENT]
         return self.type in meta_types
 
-class CodeElementsResult(BaseModel):
-    """Collection of extracted code elements"""
-    elements: List[CodeElement] = Field(default_factory=list)
+
+class CodeElement(BaseModel, ElementKindMixin):
+    """Unified model for all code elements"""
+    type: CodeElementType
+    name: str
+    content: str
+    range: Optional[CodeRange] = None
+    parent_name: Optional[str] = None
+    value_type: Optional[str] = None
+    additional_data: Dict[str, Any] = Field(default_factory=dict)
+    children: List['CodeElement'] = Field(default_factory=list)
+    _fragment_hashes: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _merkle_hash: Optional[str] = PrivateAttr(default=None)
+    # Lazy-content mode: byte span into a shared source buffer instead of a content copy
+    _source: Optional[SourceBuffer] = PrivateAttr(default=None)
+    _span: Optional[Tuple[int, int]] = PrivateAttr(default=None)
+
+    def __getattr__(self, item: str) -> Any:
+        if item == 'content':
+            private = self.__pydantic_private__ or {}
+            source = private.get('_source')
+            if source is not None:
+                return self._materialize_content(source, private['_span'])
+        return super().__getattr__(item)
+
+    def _materialize_content(self, source: SourceBuffer, span: Tuple[int, int]) -> str:
+        """Decode content from the shared buffer and store it as a regular field value."""
+        content = source.decode(*span)
+        self.__dict__['content'] = content
+        self.__pydantic_fields_set__.add('content')
+        # Now an ordinary element: equal to the same element extracted eagerly
+        self._source = None
+        self._span = None
+        return content
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CodeElement):
+            for element in (self, other):
+                if element._source is not None:
+                    element._materialize_content(element._source, element._span)
+        return super().__eq__(other)
+
+    @model_serializer(mode='wrap')
+    def _serialize_with_content(self, handler):
+        if 'content' not in self.__dict__ and self._source is not None:
+            self._materialize_content(self._source, self._span)
+        data = handler(self)
+        if isinstance(data, dict) and tuple(data) != _FIELD_ORDER:
+            # Materialized content was stored last; dump fields in declaration order
+            ordered = {name: data[name] for name in _FIELD_ORDER if name in data}
+            ordered.update(data)
+            data = ordered
+        return data
+
+    @property
+    def is_content_materialized(self) -> bool:
+        """False while the content of a lazy element has not been decoded yet."""
+        return 'content' in self.__dict__
+
+    def content_bytes(self):
+        """UTF-8 content as a bytes-like object, without decoding lazy content."""
+        if 'content' not in self.__dict__ and self._source is not None:
+            return self._source.view(*self._span)
+        return (self.content or '').encode('utf8')
+
+    @staticmethod
+    def from_dict(raw_element: dict) -> 'CodeElement':
+        element_type, name, content = parse_raw_element(raw_element)
+        range_kwargs = parse_raw_range(raw_element, name)
+        code_range = None
+        if range_kwargs is not None:
+            try:
+                code_range = CodeRange(**range_kwargs)
+            except Exception as e:
+                 logger.error(f"Error creating CodeRange for element '{name}': {e}. Range data: {raw_element.get('range')}", exc_info=True)
+                 code_range = None # Ensure range is None if creation fails
+
+        # Handle potential 'class_name' vs 'parent_name' inconsistency if needed
+        parent_name = raw_element.get('parent_name', raw_element.get('class_name'))
+
+        source = current_source_buffer()
+        if source is not None and code_range is not None and code_range.start_byte is not None \
+                and isinstance(content, str) and source.spans_text(code_range.start_byte, code_range.end_byte, content):
+            # Lazy-content mode: keep only the span, content is decoded on first access
+            element = CodeElement.model_construct(
+                type=element_type,
+                name=name,
+                range=code_range,
+                parent_name=parent_name,
+                value_type=raw_element.get('value_type'),
+                additional_data=raw_element.get('additional_data') or {},
+                children=[]
+            )
+            element._source = source
+            element._span = (code_range.start_byte, code_range.end_byte)
+            return element
+
+        element = CodeElement(
+            type=element_type,
+            name=name,
+            content=content,
+            range=code_range,
+            parent_name=parent_name,
+            value_type=raw_element.get('value_type'),
+            additional_data=raw_element.get('additional_data', {}), # Ensure default is dict
+            children=[] # Initialize children, they will be added by post-processor
+        )
+        return element
+
+_FIELD_ORDER = tuple(CodeElement.model_fields)
+
+
+class ElementsResultMixin:
+    """Accessors shared by the extraction result models."""
+    __slots__ = ()
+
+    @property
+    def merkle_root(self) -> str:
+        """File-level Merkle digest; equal roots mean structurally identical results."""
+        if self._merkle_root is None:
+            from codehem.core.utils.merkle import build_merkle_tree
+            build_merkle_tree(self)
+        return self._merkle_root
 
     @property
     def classes(self) -> List[CodeElement]:
@@ -189,6 +335,12 @@ class CodeElementsResult(BaseModel):
         from .element_filter import ElementFilter
         return ElementFilter.filter(self, xpath)
 
+
+class CodeElementsResult(BaseModel, ElementsResultMixin):
+    """Collection of extracted code elements"""
+    elements: List[CodeElement] = Field(default_factory=list)
+    _merkle_root: Optional[str] = PrivateAttr(default=None)
+
 # Ensure the model rebuilds to include the new method
 CodeElement.model_rebuild()
 CodeElementsResult.model_rebuild()
\ No newline at end of file
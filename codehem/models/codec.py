@@ -0,0 +1,236 @@
+"""
+Compact binary codec for extraction results.
+
+``dumps`` writes a ``CodeElementsResult`` (or its fast counterpart) as one
+versioned blob and ``loads`` reads it back. Elements are flattened in
+pre-order into fixed-width ``array`` columns; every string (names, content,
+types, JSON-encoded ``additional_data``) lives once in a shared string table
+that is encoded and decoded as a single UTF-8 blob.
+
+Layout (all integers in the byte order named by the header)::
+
+    header   magic b'CHEM', u16 version, u8 byte order, u8 reserved,
+             u32 element count, u32 string count, i32 merkle root string id
+    strings  i64[string count] character lengths, u64 blob size, UTF-8 blob
+    columns  i32[count] for each of _INT_COLUMNS, then i64[count] for each of
+             _LONG_COLUMNS
+
+tree-sitter nodes are never serialized; missing optional values are stored
+as -1.
+"""
+import json
+import struct
+import sys
+from array import array
+from typing import Any, Dict, List, Optional
+
+from tree_sitter import Node
+
+from .enums import CodeElementType
+from .fast_element import FastCodeElement, FastCodeElementsResult, FastCodeRange
+
+MAGIC = b'CHEM'
+VERSION = 1
+_HEADER = struct.Struct('<4sHBxIIi')
+_BLOB_SIZE = struct.Struct('<Q')
+_LITTLE, _BIG = 0, 1
+
+_INT_COLUMNS = ('type', 'name', 'content', 'parent_name', 'value_type', 'additional_data', 'children',
+                'start_line', 'end_line', 'start_column', 'end_column')
+_LONG_COLUMNS = ('start_byte', 'end_byte')
+_NONE = -1
+
+
+class CodecError(ValueError):
+    """Raised when a blob is not a valid encoded extraction result."""
+
+
+def _json_default(value: Any) -> Any:
+    # tree-sitter nodes and NodeRef handles are dropped; anything else falls back to its string form
+    from codehem.core.utils.node_retention import NodeRef
+    if isinstance(value, (Node, NodeRef)):
+        return None
+    return str(value)
+
+
+class _StringTable:
+    __slots__ = ('strings', 'ids')
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self.ids: Dict[str, int] = {}
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return _NONE
+        sid = self.ids.get(value)
+        if sid is None:
+            sid = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return sid
+
+
+def dumps(result: Any) -> bytes:
+    """
+    Encode an extraction result.
+
+    Args:
+        result: CodeElementsResult or FastCodeElementsResult
+
+    Returns:
+        The encoded bytes
+    """
+    table = _StringTable()
+    add = table.add
+    columns = {name: array('i') for name in _INT_COLUMNS}
+    longs = {name: array('q') for name in _LONG_COLUMNS}
+    (type_col, name_col, content_col, parent_col, value_type_col, data_col, children_col,
+     start_line_col, end_line_col, start_column_col, end_column_col) = (columns[name] for name in _INT_COLUMNS)
+    start_byte_col, end_byte_col = longs['start_byte'], longs['end_byte']
+
+    stack = list(reversed(result.elements))
+    while stack:
+        element = stack.pop()
+        type_col.append(add(element.type.value))
+        name_col.append(add(element.name))
+        content_col.append(add(element.content))
+        parent_col.append(add(element.parent_name))
+        value_type_col.append(add(element.value_type))
+        data = element.additional_data
+        data_col.append(add(json.dumps(data, default=_json_default)) if data else _NONE)
+        children_col.append(len(element.children))
+        code_range = element.range
+        if code_range is None:
+            start_line_col.append(_NONE)
+            end_line_col.append(_NONE)
+            start_column_col.append(_NONE)
+            end_column_col.append(_NONE)
+            start_byte_col.append(_NONE)
+            end_byte_col.append(_NONE)
+        else:
+            start_line_col.append(code_range.start_line)
+            end_line_col.append(code_range.end_line)
+            start_column_col.append(_NONE if code_range.start_column is None else code_range.start_column)
+            end_column_col.append(_NONE if code_range.end_column is None else code_range.end_column)
+            start_byte_col.append(_NONE if code_range.start_byte is None else code_range.start_byte)
+            end_byte_col.append(_NONE if code_range.end_byte is None else code_range.end_byte)
+        stack.extend(reversed(element.children))
+
+    root_sid = add(result._merkle_root)
+    strings = table.strings
+    lengths = array('q', map(len, strings))
+    blob = ''.join(strings).encode('utf8', errors='surrogatepass')
+    parts = [
+        _HEADER.pack(MAGIC, VERSION, _LITTLE if sys.byteorder == 'little' else _BIG,
+                     len(type_col), len(strings), root_sid),
+        lengths.tobytes(),
+        _BLOB_SIZE.pack(len(blob)),
+        blob,
+    ]
+    parts.extend(columns[name].tobytes() for name in _INT_COLUMNS)
+    parts.extend(longs[name].tobytes() for name in _LONG_COLUMNS)
+    return b''.join(parts)
+
+
+def _read_array(typecode: str, data: memoryview, offset: int, count: int, swap: bool):
+    column = array(typecode)
+    end = offset + count * column.itemsize
+    if end > len(data):
+        raise CodecError('Truncated CodeHem result blob')
+    column.frombytes(data[offset:end])
+    if swap:
+        column.byteswap()
+    return column, end
+
+
+def loads(data: bytes, fast: bool = False) -> Any:
+    """
+    Decode bytes produced by ``dumps``.
+
+    Args:
+        data: Encoded result
+        fast: Return a FastCodeElementsResult instead of pydantic models
+
+    Returns:
+        CodeElementsResult (or FastCodeElementsResult)
+
+    Raises:
+        CodecError: If the data is not a valid blob of a supported version
+    """
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        raise CodecError('Truncated CodeHem result blob')
+    magic, version, byte_order, count, string_count, root_sid = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise CodecError('Not a CodeHem result blob')
+    if version != VERSION:
+        raise CodecError(f'Unsupported CodeHem result blob version {version} (expected {VERSION})')
+    swap = (byte_order == _LITTLE) != (sys.byteorder == 'little')
+
+    lengths, offset = _read_array('q', view, _HEADER.size, string_count, swap)
+    if offset + _BLOB_SIZE.size > len(view):
+        raise CodecError('Truncated CodeHem result blob')
+    (blob_size,) = _BLOB_SIZE.unpack_from(view, offset)
+    offset += _BLOB_SIZE.size
+    text = bytes(view[offset:offset + blob_size]).decode('utf8', errors='surrogatepass')
+    offset += blob_size
+    strings: List[str] = []
+    position = 0
+    for length in lengths:
+        strings.append(text[position:position + length])
+        position += length
+
+    columns = []
+    for _ in _INT_COLUMNS:
+        column, offset = _read_array('i', view, offset, count, swap)
+        columns.append(column)
+    for _ in _LONG_COLUMNS:
+        column, offset = _read_array('q', view, offset, count, swap)
+        columns.append(column)
+
+    types: Dict[int, CodeElementType] = {}
+    top: List[FastCodeElement] = []
+    # [children list to fill, children still expected] of the parents being filled
+    open_parents: List[list] = []
+    for (type_sid, name_sid, content_sid, parent_sid, value_type_sid, data_sid, child_count,
+         start_line, end_line, start_column, end_column, start_byte, end_byte) in zip(*columns):
+        element_type = types.get(type_sid)
+        if element_type is None:
+            element_type = types[type_sid] = CodeElementType(strings[type_sid])
+        if data_sid == _NONE:
+            additional_data = {}
+        else:
+            # Decoded per element so results never share mutable dicts
+            additional_data = json.loads(strings[data_sid])
+        element = FastCodeElement(
+            type=element_type,
+            name=strings[name_sid],
+            content=strings[content_sid],
+            range=None if start_line == _NONE else FastCodeRange(
+                start_line=start_line,
+                end_line=end_line,
+                start_column=None if start_column == _NONE else start_column,
+                end_column=None if end_column == _NONE else end_column,
+                start_byte=None if start_byte == _NONE else start_byte,
+                end_byte=None if end_byte == _NONE else end_byte,
+            ),
+            parent_name=None if parent_sid == _NONE else strings[parent_sid],
+            value_type=None if value_type_sid == _NONE else strings[value_type_sid],
+            additional_data=additional_data,
+        )
+        if open_parents:
+            entry = open_parents[-1]
+            entry[0].append(element)
+            entry[1] -= 1
+            if entry[1] == 0:
+                open_parents.pop()
+        else:
+            top.append(element)
+        if child_count:
+            open_parents.append([element.children, child_count])
+    if open_parents:
+        raise CodecError('Corrupt CodeHem result blob (unbalanced element tree)')
+
+    result = FastCodeElementsResult(elements=top)
+    result._merkle_root = None if root_sid == _NONE else strings[root_sid]
+    return result if fast else result.to_model()
@@ -0,0 +1,33 @@
+"""
+Models for structural (element-level) diffs between two versions of a file.
+"""
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel
+
+from .enums import CodeElementType
+from .range import CodeRange
+
+
+class ElementChangeType(str, Enum):
+    """Kinds of element-level changes"""
+    ADDED = 'added'
+    REMOVED = 'removed'
+    MOVED = 'moved'
+    MODIFIED = 'modified'
+
+
+class ElementChange(BaseModel):
+    """A single element-level change, keyed by XPath"""
+    change_type: ElementChangeType
+    xpath: str
+    element_type: CodeElementType
+    old_xpath: Optional[str] = None
+    old_range: Optional[CodeRange] = None
+    new_range: Optional[CodeRange] = None
+
+    def __str__(self) -> str:
+        if self.change_type == ElementChangeType.MOVED and self.old_xpath and self.old_xpath != self.xpath:
+            return f'{self.change_type.value}: {self.old_xpath} -> {self.xpath}'
+        return f'{self.change_type.value}: {self.xpath}'
@@ -0,0 +1,321 @@
+"""
+Columnar view over extraction results.
+
+``ElementTable`` flattens one or many ``CodeElementsResult`` trees into
+parallel ``array`` columns (type codes, interned name ids, parent row
+indices, line and byte spans, file ids) so that analytics across many files
+are simple scans over machine integers instead of walks over nested element
+objects. When NumPy is installed the columns are exposed as zero-copy NumPy
+views and ``select``/``group_count``/``aggregate`` run vectorized; without it
+the same helpers fall back to plain loops over the arrays.
+"""
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+
+from .enums import CodeElementType
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# Stable code for every element type (its position in the enum)
+ELEMENT_TYPES: List[CodeElementType] = list(CodeElementType)
+TYPE_CODES: Dict[CodeElementType, int] = {t: i for i, t in enumerate(ELEMENT_TYPES)}
+NO_PARENT = -1
+NO_BYTE = -1
+
+COLUMNS = ('type_code', 'name_id', 'parent', 'start_line', 'end_line', 'start_byte', 'end_byte', 'file_id')
+_DERIVED = ('lines',)
+
+TypeSpec = Union[str, CodeElementType, Iterable[Union[str, CodeElementType]]]
+
+
+def type_code(element_type: Union[str, CodeElementType]) -> int:
+    """Return the column code of an element type."""
+    return TYPE_CODES[CodeElementType(element_type)]
+
+
+def _as_set(value: Any) -> set:
+    if isinstance(value, (str, CodeElementType)) or not isinstance(value, Iterable):
+        return {value}
+    return set(value)
+
+
+class ElementTable:
+    """Array-backed, one-row-per-element table of extraction results."""
+
+    __slots__ = COLUMNS + ('names', 'files', '_name_ids', '_file_ids')
+
+    def __init__(self):
+        self.type_code = array('B')
+        self.name_id = array('i')
+        self.parent = array('i')
+        self.start_line = array('i')
+        self.end_line = array('i')
+        self.start_byte = array('q')
+        self.end_byte = array('q')
+        self.file_id = array('i')
+        self.names: List[str] = []
+        self.files: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        self._file_ids: Dict[str, int] = {}
+
+    @classmethod
+    def from_result(cls, result, file_path: str = '') -> 'ElementTable':
+        """Build a table from a single extraction result."""
+        table = cls()
+        table.add_result(result, file_path)
+        return table
+
+    @classmethod
+    def from_results(cls, results: Mapping[str, Any]) -> 'ElementTable':
+        """Build a table from a mapping of file path -> extraction result."""
+        table = cls()
+        for file_path, result in results.items():
+            table.add_result(result, file_path)
+        return table
+
+    @classmethod
+    def from_tables(cls, tables: Iterable['ElementTable']) -> 'ElementTable':
+        """Build a table by concatenating other tables (e.g. one per file)."""
+        table = cls()
+        for other in tables:
+            table.add_table(other)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.type_code)
+
+    def _intern(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        return name_id
+
+    def _file_id(self, file_path: str) -> int:
+        file_id = self._file_ids.get(file_path)
+        if file_id is None:
+            file_id = self._file_ids[file_path] = len(self.files)
+            self.files.append(file_path)
+        return file_id
+
+    def add_result(self, result, file_path: str = '') -> None:
+        """Append every element of ``result`` (depth first, parents before children)."""
+        file_id = self._file_id(file_path)
+        stack = [(element, NO_PARENT) for element in reversed(result.elements)]
+        while stack:
+            element, parent = stack.pop()
+            row = len(self.type_code)
+            code_range = element.range
+            self.type_code.append(TYPE_CODES.get(element.type, TYPE_CODES[CodeElementType.UNKNOWN]))
+            self.name_id.append(self._intern(element.name))
+            self.parent.append(parent)
+            self.file_id.append(file_id)
+            if code_range is not None:
+                self.start_line.append(code_range.start_line)
+                self.end_line.append(code_range.end_line)
+                start_byte, end_byte = code_range.start_byte, code_range.end_byte
+            else:
+                self.start_line.append(0)
+                self.end_line.append(0)
+                start_byte = end_byte = None
+            self.start_byte.append(NO_BYTE if start_byte is None else start_byte)
+            self.end_byte.append(NO_BYTE if end_byte is None else end_byte)
+            stack.extend((child, row) for child in reversed(element.children))
+
+    def add_table(self, other: 'ElementTable') -> None:
+        """Append the rows of ``other``, re-interning its names and files."""
+        offset = len(self)
+        name_ids = [self._intern(name) for name in other.names]
+        file_ids = [self._file_id(file_path) for file_path in other.files]
+        self.type_code.extend(other.type_code)
+        self.name_id.extend(array('i', (name_ids[i] for i in other.name_id)))
+        self.parent.extend(array('i', (p if p == NO_PARENT else p + offset for p in other.parent)))
+        self.file_id.extend(array('i', (file_ids[i] for i in other.file_id)))
+        for name in ('start_line', 'end_line', 'start_byte', 'end_byte'):
+            getattr(self, name).extend(getattr(other, name))
+
+    def column(self, name: str) -> array:
+        """Return a column (or the derived ``lines`` column) as an ``array``."""
+        if name == 'lines':
+            return array('i', (end - start + 1 for start, end in zip(self.start_line, self.end_line)))
+        if name not in COLUMNS:
+            raise ValueError(f"Unknown column '{name}', expected one of {COLUMNS + _DERIVED}")
+        return getattr(self, name)
+
+    def numpy(self) -> Dict[str, Any]:
+        """
+        Zero-copy NumPy views of all columns.
+
+        The views share memory with the arrays and are invalidated by
+        ``add_result``.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError('ElementTable.numpy() requires NumPy')
+        return {name: np.frombuffer(getattr(self, name), dtype=getattr(self, name).typecode) for name in COLUMNS}
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Decode one row into a plain dict."""
+        start_byte, end_byte = self.start_byte[index], self.end_byte[index]
+        return {
+            'type': ELEMENT_TYPES[self.type_code[index]],
+            'name': self.names[self.name_id[index]],
+            'parent': None if self.parent[index] == NO_PARENT else self.parent[index],
+            'file': self.files[self.file_id[index]],
+            'start_line': self.start_line[index],
+            'end_line': self.end_line[index],
+            'start_byte': None if start_byte == NO_BYTE else start_byte,
+            'end_byte': None if end_byte == NO_BYTE else end_byte,
+        }
+
+    def _predicates(self, type, name, file, parent_type):
+        """Translate select() arguments into (column, allowed codes) pairs."""
+        predicates = []
+        if type is not None:
+            predicates.append(('type_code', {type_code(t) for t in _as_set(type)}))
+        if name is not None:
+            predicates.append(('name_id', {self._name_ids.get(n, -1) for n in _as_set(name)}))
+        if file is not None:
+            predicates.append(('file_id', {self._file_ids.get(f, -1) for f in _as_set(file)}))
+        if parent_type is not None:
+            predicates.append(('parent_type', {type_code(t) for t in _as_set(parent_type)}))
+        return predicates
+
+    def select(self, type: Optional[TypeSpec] = None, name: Any = None, file: Any = None,
+               parent_type: Optional[TypeSpec] = None, min_lines: Optional[int] = None,
+               max_lines: Optional[int] = None, rows: Optional[Iterable[int]] = None) -> array:
+        """
+        Return the row indices matching all given conditions.
+
+        Args:
+            type: Element type(s) to keep
+            name: Element name(s) to keep
+            file: File path(s) to keep
+            parent_type: Keep rows whose parent has one of these types
+            min_lines: Keep rows spanning at least this many lines
+            max_lines: Keep rows spanning at most this many lines
+            rows: Restrict the selection to these row indices
+
+        Returns:
+            ``array('i')`` of matching row indices, in table order
+        """
+        predicates = self._predicates(type, name, file, parent_type)
+        if np is not None:
+            return self._select_numpy(predicates, min_lines, max_lines, rows)
+        candidates = range(len(self)) if rows is None else sorted(set(rows))
+        type_codes, parents = self.type_code, self.parent
+        selected = array('i')
+        for i in candidates:
+            lines = self.end_line[i] - self.start_line[i] + 1
+            if min_lines is not None and lines < min_lines:
+                continue
+            if max_lines is not None and lines > max_lines:
+                continue
+            for column, allowed in predicates:
+                if column == 'parent_type':
+                    value = type_codes[parents[i]] if parents[i] != NO_PARENT else -1
+                else:
+                    value = getattr(self, column)[i]
+                if value not in allowed:
+                    break
+            else:
+                selected.append(i)
+        return selected
+
+    def _select_numpy(self, predicates, min_lines, max_lines, rows) -> array:
+        cols = self.numpy()
+        mask = np.ones(len(self), dtype=bool)
+        if min_lines is not None or max_lines is not None:
+            lines = cols['end_line'] - cols['start_line'] + 1
+            if min_lines is not None:
+                mask &= lines >= min_lines
+            if max_lines is not None:
+                mask &= lines <= max_lines
+        for column, allowed in predicates:
+            if column == 'parent_type':
+                parents = cols['parent']
+                values = np.where(parents != NO_PARENT, cols['type_code'][np.maximum(parents, 0)], -1)
+            else:
+                values = cols[column]
+            mask &= np.isin(values, list(allowed))
+        if rows is not None:
+            restrict = np.zeros(len(self), dtype=bool)
+            restrict[np.asarray(list(rows), dtype=np.intp)] = True
+            mask &= restrict
+        return array('i', np.flatnonzero(mask).astype(np.int32).tobytes())
+
+    def _key_decoder(self, by: str):
+        if by == 'type':
+            return 'type_code', lambda code: ELEMENT_TYPES[code].value
+        if by == 'name':
+            return 'name_id', self.names.__getitem__
+        if by == 'file':
+            return 'file_id', self.files.__getitem__
+        if by == 'parent':
+            return 'parent', lambda row: row
+        raise ValueError(f"Cannot group by '{by}', expected 'type', 'name', 'file' or 'parent'")
+
+    def group_count(self, by: str, rows: Optional[Iterable[int]] = None) -> Dict[Any, int]:
+        """
+        Count rows per group.
+
+        Args:
+            by: 'type', 'name', 'file' or 'parent' (parent row index; top-level rows
+                are grouped under -1)
+            rows: Only count these row indices
+
+        Returns:
+            Mapping of group key -> number of rows
+        """
+        return self.aggregate('lines', by, 'count', rows)
+
+    def aggregate(self, column: str, by: str, func: str = 'sum',
+                  rows: Optional[Iterable[int]] = None) -> Dict[Any, Union[int, float]]:
+        """
+        Aggregate a column per group.
+
+        Args:
+            column: Column to aggregate (any of COLUMNS or 'lines')
+            by: 'type', 'name', 'file' or 'parent'
+            func: 'count', 'sum', 'min', 'max' or 'mean'
+            rows: Only aggregate these row indices
+
+        Returns:
+            Mapping of group key -> aggregated value
+        """
+        if func not in ('count', 'sum', 'min', 'max', 'mean'):
+            raise ValueError(f"Unknown aggregate '{func}'")
+        key_column, decode = self._key_decoder(by)
+        if np is not None:
+            return self._aggregate_numpy(column, key_column, decode, func, rows)
+        keys, values = getattr(self, key_column), self.column(column)
+        groups: Dict[int, List[int]] = {}
+        for i in (range(len(self)) if rows is None else rows):
+            groups.setdefault(keys[i], []).append(values[i])
+        reducers = {'count': len, 'sum': sum, 'min': min, 'max': max, 'mean': lambda v: sum(v) / len(v)}
+        return {decode(key): reducers[func](groups[key]) for key in sorted(groups)}
+
+    def _aggregate_numpy(self, column, key_column, decode, func, rows) -> Dict[Any, Union[int, float]]:
+        cols = self.numpy()
+        keys = cols[key_column]
+        values = cols['end_line'] - cols['start_line'] + 1 if column == 'lines' else np.asarray(self.column(column))
+        if rows is not None:
+            index = np.asarray(list(rows), dtype=np.intp)
+            keys, values = keys[index], values[index]
+        if len(keys) == 0:
+            return {}
+        unique, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        if func == 'count':
+            out = counts
+        elif func in ('sum', 'mean'):
+            out = np.bincount(inverse, weights=values, minlength=len(unique))
+            out = out / counts if func == 'mean' else out.astype(np.int64)
+        else:
+            out = np.full(len(unique), values.max() if func == 'min' else values.min(), dtype=np.int64)
+            (np.minimum if func == 'min' else np.maximum).at(out, inverse, values)
+        return {decode(int(key)): value.item() for key, value in zip(unique, out)}
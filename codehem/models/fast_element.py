@@ -0,0 +1,185 @@
+"""
+Lightweight slotted element model for the extraction fast path.
+
+Post-processors build elements through the factory functions below. While
+fast mode is active (see ``fast_mode``) they produce ``__slots__``
+dataclasses that skip pydantic validation; otherwise they build the regular
+pydantic models. Fast results convert to pydantic on demand with
+``to_model()``, which installs the field values directly (even
+``model_construct`` is too slow here) since the data was already normalized
+while it was built.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from .code_element import (
+    CodeElement,
+    CodeElementsResult,
+    ElementKindMixin,
+    ElementsResultMixin,
+    parse_raw_element,
+    parse_raw_range,
+)
+from .enums import CodeElementType
+from .range import CodeRange
+
+_RANGE_FIELDS = frozenset(CodeRange.model_fields)
+_ELEMENT_FIELDS = frozenset(CodeElement.model_fields)
+
+
+def _install(model_cls, values: dict, fields_set: frozenset, private: Optional[dict] = None) -> Any:
+    """Create a pydantic instance from already-validated field values."""
+    instance = model_cls.__new__(model_cls)
+    object.__setattr__(instance, '__dict__', values)
+    object.__setattr__(instance, '__pydantic_fields_set__', set(fields_set))
+    object.__setattr__(instance, '__pydantic_extra__', None)
+    object.__setattr__(instance, '__pydantic_private__', private)
+    return instance
+
+
+@dataclass(slots=True)
+class FastCodeRange:
+    """Slotted counterpart of ``CodeRange``"""
+    start_line: int
+    end_line: int
+    start_column: Optional[int] = None
+    end_column: Optional[int] = None
+    start_byte: Optional[int] = None
+    end_byte: Optional[int] = None
+    node: Any = None
+
+    def to_model(self) -> CodeRange:
+        return _install(CodeRange, {
+            'start_line': self.start_line,
+            'end_line': self.end_line,
+            'start_column': self.start_column,
+            'end_column': self.end_column,
+            'start_byte': self.start_byte,
+            'end_byte': self.end_byte,
+            'node': self.node,
+        }, _RANGE_FIELDS)
+
+
+@dataclass(slots=True, eq=False)
+class FastCodeElement(ElementKindMixin):
+    """Slotted counterpart of ``CodeElement``"""
+    type: CodeElementType
+    name: str
+    content: str
+    range: Optional[FastCodeRange] = None
+    parent_name: Optional[str] = None
+    value_type: Optional[str] = None
+    additional_data: Dict[str, Any] = field(default_factory=dict)
+    children: List['FastCodeElement'] = field(default_factory=list)
+    _fragment_hashes: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _merkle_hash: Optional[str] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        # The few checks pydantic validation would otherwise have caught
+        if not isinstance(self.type, CodeElementType):
+            self.type = CodeElementType(self.type)
+        if not isinstance(self.name, str):
+            raise ValueError(f'Element name must be a string, got {type(self.name).__name__}')
+        if self.content is None:
+            raise ValueError(f"Element '{self.name}' has no content")
+        if self.additional_data is None:
+            self.additional_data = {}
+
+    @staticmethod
+    def from_dict(raw_element: dict) -> 'FastCodeElement':
+        element_type, name, content = parse_raw_element(raw_element)
+        range_kwargs = parse_raw_range(raw_element, name)
+        return FastCodeElement(
+            type=element_type,
+            name=name,
+            content=content,
+            range=FastCodeRange(**range_kwargs) if range_kwargs is not None else None,
+            parent_name=raw_element.get('parent_name', raw_element.get('class_name')),
+            value_type=raw_element.get('value_type'),
+            additional_data=raw_element.get('additional_data', {}),
+        )
+
+    @property
+    def is_content_materialized(self) -> bool:
+        return True
+
+    def content_bytes(self) -> bytes:
+        return (self.content or '').encode('utf8')
+
+    def to_model(self) -> CodeElement:
+        """Convert this element (and its children) to a pydantic ``CodeElement``."""
+        return _install(CodeElement, {
+            'type': self.type,
+            'name': self.name,
+            'content': self.content,
+            'range': self.range.to_model() if self.range is not None else None,
+            'parent_name': self.parent_name,
+            'value_type': self.value_type,
+            'additional_data': self.additional_data,
+            'children': [child.to_model() for child in self.children],
+        }, _ELEMENT_FIELDS, {
+            '_fragment_hashes': dict(self._fragment_hashes),
+            '_merkle_hash': self._merkle_hash,
+            '_source': None,
+            '_span': None,
+        })
+
+
+@dataclass(slots=True)
+class FastCodeElementsResult(ElementsResultMixin):
+    """Slotted counterpart of ``CodeElementsResult``"""
+    elements: List[FastCodeElement] = field(default_factory=list)
+    _merkle_root: Optional[str] = field(default=None, init=False, repr=False)
+
+    def to_model(self) -> CodeElementsResult:
+        """Convert to a pydantic ``CodeElementsResult``."""
+        return _install(CodeElementsResult, {'elements': [element.to_model() for element in self.elements]},
+                        frozenset(('elements',)), {'_merkle_root': self._merkle_root})
+
+
+_fast_mode: ContextVar[bool] = ContextVar('codehem_fast_mode', default=False)
+
+
+def is_fast_mode() -> bool:
+    """True while elements are being built with the slotted fast model."""
+    return _fast_mode.get()
+
+
+@contextmanager
+def fast_mode(enabled: bool = True) -> Iterator[None]:
+    """Build elements with the slotted fast model inside the block."""
+    token = _fast_mode.set(enabled)
+    try:
+        yield
+    finally:
+        _fast_mode.reset(token)
+
+
+def new_element(**kwargs) -> Any:
+    """Create a CodeElement, or a FastCodeElement in fast mode."""
+    if _fast_mode.get():
+        return FastCodeElement(**kwargs)
+    return CodeElement(**kwargs)
+
+
+def new_range(**kwargs) -> Any:
+    """Create a CodeRange, or a FastCodeRange in fast mode."""
+    if _fast_mode.get():
+        return FastCodeRange(**kwargs)
+    return CodeRange(**kwargs)
+
+
+def new_result(elements: Optional[list] = None) -> Any:
+    """Create a CodeElementsResult, or a FastCodeElementsResult in fast mode."""
+    if _fast_mode.get():
+        return FastCodeElementsResult(elements=list(elements or []))
+    return CodeElementsResult(elements=list(elements or []))
+
+
+def element_from_dict(raw_element: dict) -> Any:
+    """Build an element from a raw extraction dict, honouring fast mode."""
+    if _fast_mode.get():
+        return FastCodeElement.from_dict(raw_element)
+    return CodeElement.from_dict(raw_element)
@@ -4,10 +4,12 @@ from pydantic import BaseModel
 
 
 class CodeRange(BaseModel):
-    """Represents a range in source code (line numbers)"""
+    """Represents a range in source code (line numbers and, when known, UTF-8 byte offsets)"""
     start_line: int
     end_line: int
     start_column: Optional[int] = None
     end_column: Optional[int] = None
+    start_byte: Optional[int] = None
+    end_byte: Optional[int] = None
     node: Any = None
     model_config = {'arbitrary_types_allowed': True}
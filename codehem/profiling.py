@@ -0,0 +1,137 @@
+"""
+``--profile`` support for CLI commands.
+
+``run_profiled`` runs a command under cProfile with instrumentation spans
+enabled and writes two files:
+
+    <path>               pstats data (``python -m pstats <path>``, snakeviz, ...)
+    <stem>.summary.json  wall time, per-stage breakdown, counters, the top N
+                         functions by cumulative and by self time and the N
+                         slowest files
+
+Stage breakdown uses span self times, so stages add up to (at most) the wall
+time: parse, queries, extraction, post_processing, model_building,
+serialization, io, patch and other (everything not covered by a span).
+With ``extract --jobs N`` (N > 1) only the parent process is profiled; the
+per-file times still come from the workers.
+"""
+import cProfile
+import json
+import os
+import pstats
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from codehem.core.utils import instrumentation
+
+# Breakdown category of a span name; entries ending in '.' or '_' match as prefixes
+_STAGE_OF_SPAN = (
+    ('parse', 'parse'),
+    ('query', 'queries'),
+    ('extract', 'extraction'),
+    ('extract.', 'extraction'),
+    ('process_', 'post_processing'),
+    ('to_model', 'model_building'),
+    ('serialize', 'serialization'),
+    ('io.', 'io'),
+    ('apply_patch', 'patch'),
+)
+STAGES = ('parse', 'queries', 'extraction', 'post_processing', 'model_building', 'serialization', 'io',
+          'patch', 'other')
+
+
+def summary_path(profile_path: str) -> str:
+    """Path of the JSON summary written next to ``profile_path``."""
+    return os.path.splitext(profile_path)[0] + '.summary.json'
+
+
+def _stage(span_name: str) -> Optional[str]:
+    for prefix, stage in _STAGE_OF_SPAN:
+        if span_name == prefix or (prefix.endswith(('.', '_')) and span_name.startswith(prefix)):
+            return stage
+    return None
+
+
+def stage_breakdown(spans: Dict[str, Dict[str, Any]], wall_s: float) -> Dict[str, float]:
+    """Milliseconds per stage from instrumentation span self times."""
+    breakdown = {stage: 0.0 for stage in STAGES}
+    for name, stats in spans.items():
+        stage = _stage(name)
+        if stage is not None:
+            breakdown[stage] += stats['self_ms']
+    covered = sum(breakdown.values())
+    breakdown['other'] = max(wall_s * 1000 - covered, 0.0)
+    return {stage: round(ms, 3) for stage, ms in breakdown.items()}
+
+
+def top_functions(profiler: cProfile.Profile, limit: int, sort: str = 'cumulative') -> List[Dict[str, Any]]:
+    """The ``limit`` functions with the highest ``'cumulative'`` or ``'self'`` time."""
+    stats = pstats.Stats(profiler).stats  # type: ignore[attr-defined]
+    column = 3 if sort == 'cumulative' else 2
+    rows = sorted(stats.items(), key=lambda item: item[1][column], reverse=True)[:limit]
+    return [
+        {
+            'function': f'{os.path.basename(filename)}:{line}({name})' if line else name,
+            'calls': calls,
+            'primitive_calls': primitive,
+            'self_s': round(tottime, 6),
+            'cumulative_s': round(cumtime, 6),
+        }
+        for (filename, line, name), (primitive, calls, tottime, cumtime, _) in rows
+    ]
+
+
+def run_profiled(func: Callable[[], Any], profile_path: str, command: str, top: int = 20,
+                 file_times: Optional[List[Tuple[str, float]]] = None) -> Any:
+    """
+    Run ``func`` under cProfile and write the pstats file and JSON summary.
+
+    Args:
+        func: The command to run
+        profile_path: Where to write the pstats data
+        command: Command name recorded in the summary
+        top: Number of functions and files listed in the summary
+        file_times: List the command appends ``(path, seconds)`` to for each
+            processed file; the slowest ones are reported
+
+    The files are written even when the command fails or calls ``sys.exit``.
+    """
+    was_enabled = instrumentation.is_enabled()
+    instrumentation.reset()
+    instrumentation.enable()
+    profiler = cProfile.Profile()
+    exit_code: Any = 0
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        return func()
+    except SystemExit as e:
+        exit_code = e.code
+        raise
+    except BaseException as e:
+        exit_code = e.__class__.__name__
+        raise
+    finally:
+        profiler.disable()
+        wall_s = time.perf_counter() - start
+        metrics = instrumentation.snapshot(reset_after=True)
+        instrumentation.enable(was_enabled)
+        profiler.dump_stats(profile_path)
+        slowest = sorted(file_times or [], key=lambda item: item[1], reverse=True)[:top]
+        summary = {
+            'command': command,
+            'argv': sys.argv[1:],
+            'exit_code': exit_code,
+            'wall_s': round(wall_s, 6),
+            'profile': os.path.abspath(profile_path),
+            'stages_ms': stage_breakdown(metrics['spans'], wall_s),
+            'spans': metrics['spans'],
+            'counters': metrics['counters'],
+            'top_functions': top_functions(profiler, top),
+            'top_self': top_functions(profiler, top, sort='self'),
+            'files': len(file_times) if file_times is not None else None,
+            'slowest_files': [{'path': path, 'ms': round(seconds * 1000, 3)} for path, seconds in slowest],
+        }
+        with open(summary_path(profile_path), 'w', encoding='utf8') as fh:
+            json.dump(summary, fh, indent=2, default=str)
@@ -0,0 +1,338 @@
+"""
+Long-lived JSON-RPC server for CodeHem (``codehem serve``).
+
+A one-shot CLI call pays interpreter start-up, component registration and
+cold parse/extraction caches for a few milliseconds of actual work. The
+server keeps one ``CodeHem`` per language, their caches, recent extraction
+results and an optional ``Workspace`` alive across requests.
+
+Protocol: JSON-RPC 2.0, one JSON document per line, over stdio or a Unix
+domain socket. Methods:
+
+    detect(code | path)                        language and element counts
+    extract(code | path, language?, summary?)  extracted elements
+    query(code | path, xpath)                  element at xpath (or null)
+    get_text(code | path, xpath)               source text at xpath
+    patch(code | path, xpath, new_code, mode?, original_hash?, dry_run?)
+    workspace.open(root) / workspace.find(name, kind) / workspace.refresh(path)
+    ping() / shutdown()
+
+``path`` is resolved against the open workspace root when relative.
+"""
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, IO, Optional, Tuple
+
+from codehem.core.error_handling import CodeHemError, WriteConflictError
+from codehem.core.utils.hashing import sha1_code
+from codehem.core.workspace import Workspace
+from codehem.languages import get_language_service_for_code, get_language_service_for_file
+from codehem.main import CodeHem
+
+logger = logging.getLogger(__name__)
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+WRITE_CONFLICT = -32001
+
+
+class RpcError(Exception):
+    """Error reported to the client as a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+def _element_to_dict(element) -> Dict[str, Any]:
+    return element.model_dump(exclude={'range': {'node'}})
+
+
+def _remove_stale_socket(path: str) -> None:
+    """
+    Remove a socket left behind at ``path`` by a server that is gone.
+
+    Raises:
+        FileExistsError: If ``path`` is not a socket or a server is listening on it
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f'Cannot listen on {path}: the path exists and is not a socket')
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except OSError:
+            os.remove(path)
+            return
+    raise FileExistsError(f'Cannot listen on {path}: another server is listening on it')
+
+
+class CodeHemServer:
+    """Dispatches JSON-RPC requests against warm CodeHem instances."""
+
+    def __init__(self, workspace_root: Optional[str] = None, cache_size: int = 128):
+        self.workspace: Optional[Workspace] = Workspace.open(workspace_root) if workspace_root else None
+        self.cache_size = cache_size
+        self.running = True
+        self._hems: Dict[str, CodeHem] = {}
+        self._results: 'OrderedDict[Tuple[str, str], Any]' = OrderedDict()
+        # Requests from concurrent socket clients are served one at a time
+        self._lock = threading.RLock()
+        self._methods: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            'detect': self.detect,
+            'extract': self.extract,
+            'query': self.query,
+            'get_text': self.get_text,
+            'patch': self.patch,
+            'workspace.open': self.workspace_open,
+            'workspace.find': self.workspace_find,
+            'workspace.refresh': self.workspace_refresh,
+            'ping': lambda params: 'pong',
+            'shutdown': self.shutdown,
+        }
+
+    # ----- helpers -----
+
+    def _hem(self, language: str) -> CodeHem:
+        hem = self._hems.get(language)
+        if hem is None:
+            hem = self._hems[language] = CodeHem(language)
+        return hem
+
+    def _resolve_path(self, path: str) -> str:
+        if self.workspace is not None and not os.path.isabs(path):
+            return str(self.workspace.root / path)
+        return path
+
+    def _source(self, params: Dict[str, Any]) -> Tuple[CodeHem, str, Optional[str]]:
+        """Return (CodeHem, code, resolved path) for the ``code``/``path``/``language`` params."""
+        path = params.get('path')
+        code = params.get('code')
+        if path is not None:
+            path = self._resolve_path(path)
+            if code is None:
+                if not os.path.isfile(path):
+                    raise RpcError(INVALID_PARAMS, f'File not found: {path}')
+                code = CodeHem.load_file(path)
+        if code is None:
+            raise RpcError(INVALID_PARAMS, "Either 'code' or 'path' is required")
+        language = params.get('language')
+        if not language:
+            service = get_language_service_for_file(path) if path is not None else None
+            service = service or get_language_service_for_code(code)
+            if service is None:
+                raise RpcError(INVALID_PARAMS, 'Could not detect the language')
+            language = service.language_code
+        try:
+            hem = self._hem(language)
+        except ValueError as e:
+            raise RpcError(INVALID_PARAMS, str(e))
+        return hem, code, path
+
+    def _extract(self, hem: CodeHem, code: str):
+        key = (hem.language_service.language_code, sha1_code(code))
+        result = self._results.get(key)
+        if result is None:
+            result = hem.extract(code)
+            self._results[key] = result
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        else:
+            self._results.move_to_end(key)
+        return result
+
+    @staticmethod
+    def _required(params: Dict[str, Any], name: str) -> Any:
+        if params.get(name) is None:
+            raise RpcError(INVALID_PARAMS, f"Missing parameter '{name}'")
+        return params[name]
+
+    def _require_workspace(self) -> Workspace:
+        if self.workspace is None:
+            raise RpcError(INVALID_PARAMS, "No workspace open; call 'workspace.open' first")
+        return self.workspace
+
+    # ----- methods -----
+
+    def detect(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        hem, code, _ = self._source(params)
+        result = self._extract(hem, code)
+        return {
+            'language': hem.language_service.language_code,
+            'classes': len(result.classes),
+            'functions': len(result.functions),
+            'methods': len(result.methods),
+        }
+
+    def extract(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        hem, code, path = self._source(params)
+        result = self._extract(hem, code)
+        response = {'language': hem.language_service.language_code, 'merkle_root': result.merkle_root}
+        if path is not None:
+            response['path'] = path
+        if params.get('summary'):
+            response['summary'] = {
+                'classes': len(result.classes),
+                'functions': len(result.functions),
+                'methods': len(result.methods),
+            }
+        else:
+            response['elements'] = [_element_to_dict(element) for element in result.elements]
+        return response
+
+    def query(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        hem, code, _ = self._source(params)
+        element = hem.filter(self._extract(hem, code), self._required(params, 'xpath'))
+        return _element_to_dict(element) if element is not None else None
+
+    def get_text(self, params: Dict[str, Any]) -> Optional[str]:
+        hem, code, _ = self._source(params)
+        return hem.get_text_by_xpath(code, self._required(params, 'xpath'))
+
+    def patch(self, params: Dict[str, Any]) -> Any:
+        hem, code, path = self._source(params)
+        xpath = self._required(params, 'xpath')
+        new_code = self._required(params, 'new_code')
+        mode = params.get('mode', 'replace')
+        original_hash = params.get('original_hash')
+        dry_run = bool(params.get('dry_run'))
+        write = path is not None and 'code' not in params and not dry_run
+        if write and self.workspace is not None:
+            root = os.path.abspath(self.workspace.root)
+            if os.path.commonpath([root, os.path.abspath(path)]) == root:
+                return self.workspace.apply_patch(os.path.relpath(os.path.abspath(path), root), xpath, new_code,
+                                                  mode=mode, original_hash=original_hash)
+        result = hem.apply_patch(code, xpath, new_code, mode=mode, original_hash=original_hash, dry_run=dry_run)
+        if write:
+            with open(path, 'w', encoding='utf8') as fh:
+                fh.write(result['code'] if isinstance(result, dict) else result)
+        return result
+
+    def workspace_open(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        root = self._required(params, 'root')
+        if not os.path.isdir(root):
+            raise RpcError(INVALID_PARAMS, f'Not a directory: {root}')
+        self.workspace = Workspace.open(root)
+        return {'root': str(self.workspace.root), 'files': len(self.workspace.file_hashes)}
+
+    def workspace_find(self, params: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        found = self._require_workspace().find(self._required(params, 'name'), self._required(params, 'kind'))
+        return {'file': found[0], 'xpath': found[1]} if found else None
+
+    def workspace_refresh(self, params: Dict[str, Any]) -> Dict[str, bool]:
+        return {'changed': self._require_workspace().refresh(self._required(params, 'path'))}
+
+    def shutdown(self, params: Dict[str, Any]) -> bool:
+        self.running = False
+        return True
+
+    # ----- dispatch -----
+
+    def handle(self, request: Any) -> Optional[Dict[str, Any]]:
+        """Handle one decoded JSON-RPC request; returns None for notifications."""
+        if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+            return self._error(None, INVALID_REQUEST, 'Invalid request')
+        response = self._dispatch(request)
+        # Notifications (no id) get no response
+        return response if 'id' in request else None
+
+    def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        request_id = request.get('id')
+        params = request.get('params') or {}
+        method = self._methods.get(request['method'])
+        try:
+            if method is None:
+                raise RpcError(METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, 'params must be an object')
+            with self._lock:
+                result = method(params)
+        except RpcError as e:
+            return self._error(request_id, e.code, e.message, e.data)
+        except WriteConflictError as e:
+            return self._error(request_id, WRITE_CONFLICT, e.message,
+                               {'expected_hash': e.expected_hash, 'actual_hash': e.actual_hash})
+        except CodeHemError as e:
+            return self._error(request_id, SERVER_ERROR, e.message, {'type': e.__class__.__name__})
+        except Exception as e:
+            logger.exception(f"codehem serve: '{request['method']}' failed")
+            return self._error(request_id, SERVER_ERROR, str(e), {'type': e.__class__.__name__})
+        return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+
+    @staticmethod
+    def _error(request_id: Any, code: int, message: str, data: Any = None) -> Dict[str, Any]:
+        error = {'code': code, 'message': message}
+        if data is not None:
+            error['data'] = data
+        return {'jsonrpc': '2.0', 'id': request_id, 'error': error}
+
+    def handle_line(self, line: str) -> Optional[str]:
+        """Handle one line of input (a request or a batch); returns the response line, if any."""
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError as e:
+            return json.dumps(self._error(None, PARSE_ERROR, f'Parse error: {e}'))
+        if isinstance(payload, list):
+            responses = [response for response in map(self.handle, payload) if response is not None]
+            return json.dumps(responses, default=str) if responses else None
+        response = self.handle(payload)
+        return json.dumps(response, default=str) if response is not None else None
+
+    # ----- transports -----
+
+    def serve_stdio(self, infile: IO[str], outfile: IO[str]) -> None:
+        """Serve line-delimited requests from ``infile`` until EOF or ``shutdown``."""
+        for line in infile:
+            if not line.strip():
+                continue
+            response = self.handle_line(line)
+            if response is not None:
+                outfile.write(response + '\n')
+                outfile.flush()
+            if not self.running:
+                break
+
+    def serve_unix_socket(self, path: str) -> None:
+        """Serve line-delimited requests on a Unix domain socket until ``shutdown``."""
+        if not hasattr(socket, 'AF_UNIX'):
+            raise RuntimeError('Unix domain sockets are not available on this platform')
+        server_ref = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for raw in self.rfile:
+                    line = raw.decode('utf8')
+                    if not line.strip():
+                        continue
+                    response = server_ref.handle_line(line)
+                    if response is not None:
+                        self.wfile.write((response + '\n').encode('utf8'))
+                        self.wfile.flush()
+                    if not server_ref.running:
+                        # shutdown() blocks until serve_forever returns, so call it off this thread
+                        threading.Thread(target=self.server.shutdown, daemon=True).start()
+                        break
+
+        _remove_stale_socket(path)
+        with socketserver.ThreadingUnixStreamServer(path, Handler) as server:
+            server.daemon_threads = True
+            logger.info(f'codehem serve: listening on {path}')
+            try:
+                server.serve_forever()
+            finally:
+                if os.path.exists(path):
+                    os.remove(path)
@@ -4,7 +4,7 @@ Tests for language detection functionality.
 import unittest
 
 from codehem import CodeHem
-from codehem.languages import get_language_service_for_code
+from codehem.languages import DETECTION_SAMPLE_SIZE, detect_language, get_language_for_file, get_language_service_for_code
 from ..helpers.code_examples import TestHelper
 
 class LanguageDetectionTests(unittest.TestCase):
@@ -41,4 +41,18 @@ class LanguageDetectionTests(unittest.TestCase):
         empty_code = ''
         whitespace_code = '   \n  \t  '
         self.assertIsNone(get_language_service_for_code(empty_code))
-        self.assertIsNone(get_language_service_for_code(whitespace_code))
\ No newline at end of file
+        self.assertIsNone(get_language_service_for_code(whitespace_code))
+
+    def test_extension_routing(self):
+        """Test that files are routed by extension before content."""
+        self.assertEqual("python", get_language_for_file("pkg/module.PY"))
+        self.assertEqual("typescript", get_language_for_file("src/app.tsx"))
+        self.assertEqual("typescript", get_language_for_file("src/app.js"))
+        self.assertIsNone(get_language_for_file("README"))
+        self.assertIsNone(get_language_for_file("notes.txt"))
+
+    def test_detection_uses_bounded_sample(self):
+        """Test that only the start of large inputs is inspected."""
+        code = 'def foo():\n    pass\n' * 20 + '\n'.join(['const x = () => { return 1; };'] * (DETECTION_SAMPLE_SIZE // 10))
+        self.assertEqual("python", detect_language(code))
+        self.assertEqual("python", detect_language(code))
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+
+from codehem.core import manifest
+from codehem.core.registry import registry
+
+
+def _fresh(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split()
+
+
+def test_import_does_not_load_languages():
+    out = _fresh(
+        "import sys, codehem\n"
+        "from codehem.core.registry import registry\n"
+        "print(any(m.startswith('codehem.languages.lang_') for m in sys.modules), 'rich' in sys.modules)\n"
+        "print(','.join(registry.get_supported_languages()))\n"
+        "codehem.CodeHem('python')\n"
+        "print(sorted(registry.loaded_languages) == ['python'], 'codehem.languages.lang_typescript' in sys.modules)\n"
+    )
+    assert out == ["False", "False", "typescript,python,javascript", "True", "False"]
+
+
+def test_manifest_matches_discovery():
+    built = manifest.build_manifest()
+    assert manifest.read_manifest() == built
+    assert set(built["languages"]) <= set(registry.get_supported_languages())
+    assert built["languages"]["python"]["extensions"] == [".py"]
@@ -0,0 +1,68 @@
+from codehem import CodeHem
+from codehem.core.utils.line_index import LineIndex, get_line_index
+
+
+SAMPLE = "import os\n\nclass A:\n    def m(self):\n        return 1\n\ndef f():\n    return 'ż'\n"
+
+
+def test_slice_lines_matches_splitlines():
+    index = LineIndex(SAMPLE)
+    lines = SAMPLE.splitlines()
+    assert index.line_count == len(lines)
+    for start in range(1, len(lines) + 1):
+        for end in range(start, len(lines) + 1):
+            assert index.slice_lines(start, end) == "\n".join(lines[start - 1:end])
+
+
+def test_line_of_offset_and_crlf():
+    index = LineIndex("a\r\nbb\r\nccc")
+    assert index.line_of_offset(0) == 1
+    assert index.line_of_offset(3) == 2
+    assert index.line_of_offset(8) == 3
+    assert index.slice_lines(1, 2) == "a\r\nbb"
+    assert index.newline() == "\r\n"
+
+
+def test_replace_lines_preserves_surrounding_text():
+    index = LineIndex(SAMPLE)
+    patched = index.replace_lines(7, 8, "def g():\n    return 2")
+    assert patched == SAMPLE.replace("def f():\n    return 'ż'", "def g():\n    return 2")
+    assert index.replace_lines(1, 2, "") == SAMPLE.split("\n", 2)[2]
+
+
+def test_char_offset_for_non_ascii_source():
+    index = get_line_index(SAMPLE)
+    encoded = SAMPLE.encode("utf8")
+    start = encoded.index(b"'")
+    end = len(encoded) - 1
+    assert index.slice_bytes(start, end) == "'ż'"
+    assert get_line_index(SAMPLE) is index
+
+
+def test_extracted_ranges_carry_byte_offsets():
+    hem = CodeHem("python")
+    code = "class A:\n    def m(self):\n        return 1\n\ndef f():\n    return 2\n"
+    result = hem.extract(code)
+    func = hem.filter(result, "f")
+    assert func.range.start_byte is not None
+    assert code.encode("utf8")[func.range.start_byte:func.range.end_byte].decode() == func.content
+
+
+def test_apply_patch_keeps_trailing_newline():
+    hem = CodeHem("python")
+    code = "def foo():\n    return 1\n\ndef bar():\n    return 2\n"
+    patched = hem.apply_patch(code, "foo", "def foo():\n    return 3", return_format="text")
+    assert patched == "def foo():\n    return 3\n\ndef bar():\n    return 2\n"
+
+
+def test_line_index_cache_is_bounded():
+    from codehem.core.utils import line_index
+
+    texts = [f"x = {i}\n" * 3 for i in range(line_index.LINE_INDEX_CACHE_SIZE + 4)]
+    indexes = [get_line_index(text) for text in texts]
+    assert len(line_index._line_indexes) <= line_index.LINE_INDEX_CACHE_SIZE
+    assert get_line_index(texts[-1]) is indexes[-1]
+    assert get_line_index("".join(list(texts[-1]))) is indexes[-1]  # Equal text, other object
+    assert get_line_index(texts[0]) is not indexes[0]  # Evicted
+    big = "x\n" * (line_index.LINE_INDEX_CACHE_CHARS // 2 + 1)
+    assert get_line_index(big) is not get_line_index(big)
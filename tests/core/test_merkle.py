@@ -0,0 +1,34 @@
+from codehem import CodeHem
+
+
+BASE = """\
+class A:
+    def m(self):
+        return 1
+
+    def n(self):
+        return 2
+
+def f():
+    return 3
+"""
+
+
+def test_merkle_root_is_stable_and_structural():
+    hem = CodeHem("python")
+    first = hem.extract(BASE)
+    second = hem.extract(BASE)
+    assert first.merkle_root == second.merkle_root
+    changed = hem.extract(BASE.replace("return 2", "return 20"))
+    assert changed.merkle_root != first.merkle_root
+
+
+def test_unchanged_subtrees_keep_their_digest():
+    hem = CodeHem("python")
+    old = hem.extract(BASE)
+    new = hem.extract(BASE.replace("return 2", "return 20"))
+    old_cls, new_cls = hem.filter(old, "A"), hem.filter(new, "A")
+    assert old_cls.merkle_hash != new_cls.merkle_hash
+    assert hem.filter(old, "A.m").merkle_hash == hem.filter(new, "A.m").merkle_hash
+    assert hem.filter(old, "A.n").merkle_hash != hem.filter(new, "A.n").merkle_hash
+    assert hem.filter(old, "f").merkle_hash == hem.filter(new, "f").merkle_hash
@@ -0,0 +1,43 @@
+import pytest
+
+from codehem.core.config import config
+from codehem.core.engine.languages import get_parser
+from codehem.core.extractors import regex_fallback
+from codehem.core.extractors.regex_fallback import RegexFallback
+
+
+CLEAN = "def f():\n    return 1\n"
+BROKEN = "def f():\n    return 1\n\nclass Broken(:\n    x = 1\n"
+
+
+@pytest.fixture
+def policy():
+    original = config.get('extraction', 'regex_fallback')
+
+    def set_policy(value):
+        config.set('extraction', 'regex_fallback', value)
+
+    yield set_policy
+    config.set('extraction', 'regex_fallback', original)
+
+
+def _root(code):
+    return get_parser('python').parse(code.encode('utf8')).root_node
+
+
+def test_no_fallback_when_tree_sitter_found_nothing(policy):
+    # An error-free tree without matches is not a reason to scan the file
+    assert regex_fallback.plan(True, False, _root(CLEAN), CLEAN) is None
+    assert regex_fallback.plan(True, True, None, CLEAN) == [(0, len(CLEAN))]
+    assert regex_fallback.plan(False, False, None, CLEAN) == [(0, len(CLEAN))]
+    policy('never')
+    assert regex_fallback.plan(True, True, None, CLEAN) is None
+
+
+def test_error_regions_limit_the_scan(policy):
+    regions = regex_fallback.plan(True, False, _root(BROKEN), BROKEN)
+    assert [BROKEN[start:end] for start, end in regions] == ["class Broken(:"]
+    matches = list(regex_fallback.finditer(r'(?:class|def)\s+(\w+)', BROKEN, 0, regions))
+    assert [(m.group(1), m.start()) for m in matches] == [("Broken", BROKEN.index("class"))]
+    policy(RegexFallback.PARSE_ERROR.value)
+    assert regex_fallback.plan(True, False, _root(BROKEN), BROKEN) is None
@@ -0,0 +1,89 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from codehem import CodeHem
+from codehem.aio import AsyncCodeHem, AsyncWorkspace
+from codehem.core.error_handling import WriteConflictError
+from codehem.core.utils import instrumentation
+
+CODE = "class Greeter:\n    def greet(self):\n        return 'hi'\n\ndef main():\n    return 0\n"
+
+
+def test_async_calls_match_sync():
+    hem = CodeHem('python')
+
+    async def run():
+        ahem = AsyncCodeHem('python')
+        result = await ahem.extract(CODE, types=['class', 'method'])
+        text = await ahem.get_text_by_xpath(CODE, 'Greeter.greet')
+        patched = await ahem.apply_patch(CODE, 'main', 'def main():\n    return 1')
+        return result, text, patched
+
+    result, text, patched = asyncio.run(run())
+    assert [element.name for element in result.elements] == ['Greeter']
+    assert text == hem.get_text_by_xpath(CODE, 'Greeter.greet')
+    assert patched == hem.apply_patch(CODE, 'main', 'def main():\n    return 1')
+
+
+def test_identical_concurrent_requests_are_coalesced():
+    code = CODE + "\n# coalesce\n"
+
+    async def run():
+        ahem = AsyncCodeHem('python')
+        same = await asyncio.gather(*(ahem.extract(code, types=['function']) for _ in range(5)))
+        other = await asyncio.gather(ahem.extract(code), ahem.extract(code + '\n'))
+        return same, other
+
+    instrumentation.reset()
+    CodeHem.enable_metrics()
+    try:
+        same, other = asyncio.run(run())
+    finally:
+        CodeHem.enable_metrics(False)
+    snapshot = CodeHem.metrics(reset=True)
+    assert all(result is same[0] for result in same)
+    assert other[0] is not other[1]
+    assert snapshot['counters']['aio.coalesced'] == 4
+
+
+def test_process_executor_and_errors():
+    async def run(executor):
+        ahem = AsyncCodeHem('python', executor=executor)
+        result = await ahem.extract(CODE)
+        with pytest.raises(WriteConflictError):
+            await ahem.apply_patch(CODE, 'main', 'def main():\n    pass', original_hash='stale')
+        return result
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        result = asyncio.run(run(executor))
+    assert sorted(element.name for element in result.elements) == ['Greeter', 'main']
+
+
+def test_async_workspace(tmp_path):
+    (tmp_path / 'pkg').mkdir()
+    sample = tmp_path / 'pkg' / 'sample.py'
+    sample.write_text(CODE)
+    (tmp_path / 'util.ts').write_text('export function helper(x: number): number {\n  return x;\n}\n')
+    (tmp_path / 'notes.txt').write_text('not code')
+
+    async def run():
+        ws = await AsyncWorkspace.open(str(tmp_path), concurrency=2)
+        found = await ws.find('helper', 'function'), await ws.find('greet', 'method')
+        await asyncio.gather(
+            ws.apply_patch('pkg/sample.py', 'main[function]', 'def main():\n    return 1'),
+            ws.apply_patch('pkg/sample.py', 'Greeter.greet[method]', "    def greet(self):\n        return 'hello'"),
+        )
+        conflict = await ws.apply_patch('pkg/sample.py', 'main[function]', 'def main():\n    pass',
+                                        original_hash='stale', on_conflict=lambda e: 'conflict')
+        return ws, found, conflict
+
+    ws, found, conflict = asyncio.run(run())
+    assert found == (('util.ts', 'FILE.helper[function]'), ('pkg/sample.py', 'FILE.Greeter[class].greet[method]'))
+    assert conflict == 'conflict'
+    assert "return 'hello'" in sample.read_text() and 'return 1' in sample.read_text()
+    assert not list(tmp_path.rglob('*.lock'))
+    assert ws._locks == {}
+    sync_ws = CodeHem.open_workspace(str(tmp_path))
+    assert dict(ws.workspace.index) == dict(sync_ws.index)
@@ -0,0 +1,47 @@
+import json
+import sys
+
+import pytest
+
+from codehem import bench, cli
+
+
+def _corpus(tmp_path):
+    fixtures = tmp_path / "fixtures" / "python"
+    fixtures.mkdir(parents=True)
+    (fixtures / "simple.txt").write_text("## element_type: class\n## name: A\nclass A:\n    def m(self):\n        return 1\n")
+    (tmp_path / "fixtures" / "f.ts").write_text("export function f(a: number): number {\n    return a;\n}\n")
+    return str(tmp_path / "fixtures")
+
+
+def test_load_corpus_and_report(tmp_path):
+    files = bench.load_corpus([_corpus(tmp_path)])
+    assert sorted((f.name, f.language) for f in files) == [("f.ts", "typescript"), ("python/simple.txt", "python")]
+    assert not any(f.code.startswith("##") for f in files)
+    report = bench.run_benchmarks(files + bench.synthetic_files(1, 60), repeat=2)
+    assert set(report["stages"]) == set(bench.STAGES)
+    extract = report["stages"]["extract"]
+    assert extract["count"] == 6 and extract["files_per_s"] > 0
+    assert extract["p50_ms"] <= extract["p90_ms"] <= extract["max_ms"]
+    assert report["stages"]["filter"]["count"] > 0
+    assert report["corpus"]["files"] == 3
+    with pytest.raises(ValueError):
+        bench.run_benchmarks(files, stages=["nope"])
+
+
+def test_compare_reports_flags_regressions(tmp_path, monkeypatch, capsys):
+    old = {"stages": {"parse": {"p50_ms": 1.0}, "extract": {"p50_ms": 10.0}}}
+    new = {"stages": {"parse": {"p50_ms": 1.05}, "extract": {"p50_ms": 12.0}, "workspace": {"p50_ms": 5.0}}}
+    comparison = bench.compare_reports(old, new, threshold=0.1)
+    assert comparison["regressions"] == ["extract"]
+    assert comparison["stages"]["extract"]["change"] == 0.2
+    assert "workspace" not in comparison["stages"]
+
+    (tmp_path / "old.json").write_text(json.dumps(old))
+    (tmp_path / "new.json").write_text(json.dumps(new))
+    monkeypatch.setattr(sys, "argv", ["codehem", "bench", "--compare", str(tmp_path / "old.json"),
+                                      str(tmp_path / "new.json")])
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+    assert exc.value.code == 1
+    assert json.loads(capsys.readouterr().out)["regressions"] == ["extract"]
@@ -0,0 +1,101 @@
+import time
+
+import pytest
+
+from codehem import CodeHem
+from codehem.core.error_handling import BudgetExceededError
+from codehem.core.utils.budget import Budget, check_deadline, enforce
+
+PY_CODE = "\n".join(
+    f"class Service{i}:\n    def run(self, x: int = {i}) -> int:\n        return x\n\ndef helper{i}(a, b):\n    return a + b\n"
+    for i in range(400)
+)
+TS_CODE = "\n".join(
+    f"export class Widget{i} {{\n  render(x: number): number {{ return x; }}\n}}\n" for i in range(400)
+)
+
+
+def test_within_budget_matches_unbounded():
+    hem = CodeHem('python')
+    bounded = hem.extract(PY_CODE + "\n# bounded\n", budget=Budget(max_seconds=60, max_bytes=10_000_000))
+    unbounded = hem.extract(PY_CODE + "\n# unbounded\n")
+    assert [e.name for e in bounded.elements] == [e.name for e in unbounded.elements]
+
+
+def test_size_limit_rejects_before_extracting():
+    with pytest.raises(BudgetExceededError) as info:
+        CodeHem('python').extract(PY_CODE, budget=Budget(max_bytes=1000))
+    assert info.value.reason == 'too_large'
+
+
+def test_text_size_is_measured_in_utf8_bytes():
+    text = 'ż' * 10  # 20 bytes
+    for max_bytes in (5, 15):
+        with pytest.raises(BudgetExceededError):
+            Budget(max_bytes=max_bytes).check_code(text)
+    for max_bytes in (20, 40):
+        Budget(max_bytes=max_bytes).check_code(text)
+    with pytest.raises(BudgetExceededError):
+        Budget(max_bytes=15).check_code(text.encode('utf8'))
+
+
+def test_file_size_is_checked_before_reading(tmp_path):
+    path = tmp_path / 'big.py'
+    path.write_text(PY_CODE)
+    with pytest.raises(BudgetExceededError):
+        Budget(max_bytes=1000).check_file(path)
+    Budget(max_bytes=len(PY_CODE)).check_file(str(path))
+    Budget(max_bytes=1000).check_file(tmp_path / 'missing.py')  # Left to the read
+
+
+@pytest.mark.parametrize('language, code', [('python', PY_CODE), ('typescript', TS_CODE)])
+def test_time_limit_cancels_extraction(language, code):
+    hem = CodeHem(language)
+    start = time.perf_counter()
+    with pytest.raises(BudgetExceededError) as info:
+        hem.extract(code + "\n// timed\n" if language == 'typescript' else code + "\n# timed\n",
+                    budget=Budget(max_seconds=0.001))
+    assert info.value.reason == 'timeout'
+    assert time.perf_counter() - start < 5
+
+
+def test_parse_timeouts_are_not_logged_as_errors(caplog):
+    with pytest.raises(BudgetExceededError):
+        CodeHem('typescript').extract(TS_CODE + "\n// parse\n", budget=Budget(max_seconds=0))
+    assert not [record for record in caplog.records if record.levelname == 'ERROR']
+
+
+def test_nested_deadlines_keep_the_earliest():
+    with enforce(Budget(max_seconds=0.001), 0):
+        with enforce(Budget(max_seconds=60), 0):
+            time.sleep(0.01)
+            with pytest.raises(BudgetExceededError):
+                check_deadline('test')
+    check_deadline('test')  # No deadline outside the blocks
+
+
+def test_workspace_reports_skipped_files(tmp_path):
+    (tmp_path / 'small.py').write_text("def small():\n    return 1\n")
+    big = tmp_path / 'big.py'
+    big.write_text(PY_CODE)
+    ws = CodeHem.open_workspace(str(tmp_path), budget=Budget(max_bytes=1000))
+    assert ws.find('small', 'function') == ('small.py', 'FILE.small[function]')
+    assert ws.find('helper1', 'function') is None
+    assert ws.skipped['big.py'].startswith('too_large')
+
+    big.write_text("def helper1():\n    return 1\n")
+    assert ws.refresh('big.py') is True
+    assert ws.find('helper1', 'function') == ('big.py', 'FILE.helper1[function]')
+    assert ws.skipped == {}
+
+    big.write_text(PY_CODE)
+    assert ws.refresh('big.py') is True
+    assert ws.find('helper1', 'function') is None and 'big.py' in ws.skipped
+
+
+def test_extract_many_reports_budget_reasons():
+    items = [('big.py', PY_CODE), ('small.py', "def small():\n    return 1\n")]
+    outcomes = CodeHem.extract_many(items, workers=2, executor='thread', budget=Budget(max_bytes=1000))
+    assert [outcome.error for outcome in outcomes] == ['too_large', None]
+    outcomes = list(CodeHem.extract_many(items[:1], workers=2, executor='thread', timeout=0.001))
+    assert outcomes[0].error == 'timeout'
@@ -0,0 +1,35 @@
+import locale
+
+from codehem import CodeHem
+from codehem.core.utils.source_io import read_source
+
+PY_CODE = "class Greeter:\n    def greet(self):\n        return 'cześć'\n\ndef main():\n    return 0\n"
+TS_CODE = "export class Widget {\n  render(): string { return 'żółw'; }\n}\n"
+
+
+def test_bytes_extract_matches_text():
+    for language, code in (('python', PY_CODE), ('typescript', TS_CODE)):
+        hem = CodeHem(language)
+        from_text = hem.extract(code + "\n")
+        from_bytes = hem.extract((code + "\n\n").encode('utf8'))
+        assert from_bytes.model_dump() == hem.extract(code + "\n\n").model_dump()
+        assert [e.name for e in from_bytes.elements] == [e.name for e in from_text.elements]
+        lazy = hem.extract(code.encode('utf8'), lazy_content=True)
+        assert [e.content for e in lazy.elements] == [e.content for e in from_text.elements]
+
+
+def test_load_file_bytes(tmp_path):
+    path = tmp_path / 'sample.py'
+    path.write_text(PY_CODE, encoding='utf8')
+    assert CodeHem.load_file_bytes(str(path)) == PY_CODE.encode('utf8')
+    assert CodeHem.load_file(str(path)) == PY_CODE
+
+
+def test_non_utf8_files_are_transcoded_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(locale, 'getpreferredencoding', lambda do_setlocale=True: 'latin-1')
+    path = tmp_path / 'legacy.py'
+    path.write_bytes("def café():\n    return 1\n".encode('latin-1'))
+    data, encoding = read_source(str(path))
+    assert encoding == 'latin-1' and data == "def café():\n    return 1\n".encode('utf8')
+    assert CodeHem.load_file(str(path)) == data.decode('utf8')
+    assert [e.name for e in CodeHem('python').extract(CodeHem.load_file_bytes(str(path))).elements] == ['café']
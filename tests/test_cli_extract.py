@@ -0,0 +1,79 @@
+import json
+import sys
+
+import pytest
+
+from codehem import cli
+
+
+def _make_repo(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "a.py").write_text("def a():\n    return 1\n")
+    (repo / "pkg" / "b.py").write_text("class B:\n    def m(self):\n        return 2\n")
+    (repo / "notes.txt").write_text("not code\n")
+    return repo
+
+
+def _run(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["codehem", *argv])
+    cli.main()
+
+
+def test_recursive_ndjson_with_jobs_streams_every_file(tmp_path, monkeypatch, capsys):
+    repo = _make_repo(tmp_path)
+    _run(monkeypatch, "extract", str(repo), "--recursive", "--ndjson", "--ext", ".py", "--jobs", "2")
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.startswith("{")]
+    assert sorted(r["path"].replace(str(repo), "") for r in records) == ["/a.py", "/pkg/b.py"]
+    assert all(r["elements"] for r in records)
+
+
+def test_recursive_out_dir_matches_sequential_run(tmp_path, monkeypatch):
+    repo = _make_repo(tmp_path)
+    _run(monkeypatch, "extract", str(repo), "--recursive", "--ext", "py", "--out-dir", str(tmp_path / "seq"))
+    _run(monkeypatch, "extract", str(repo), "--recursive", "--ext", "py", "--out-dir", str(tmp_path / "par"),
+         "--jobs", "2")
+    for rel in ("a.py.json", "pkg/b.py.json"):
+        assert (tmp_path / "seq" / rel).read_text() == (tmp_path / "par" / rel).read_text()
+
+
+def test_profile_writes_pstats_and_summary(tmp_path, monkeypatch, capsys):
+    import pstats
+
+    repo = _make_repo(tmp_path)
+    prof = tmp_path / "run.prof"
+    _run(monkeypatch, "extract", str(repo), "--recursive", "--ext", ".py", "--ndjson",
+         "--profile", str(prof), "--profile-top", "1")
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.startswith("{")]
+    assert all("_elapsed_s" not in r for r in records)
+    assert pstats.Stats(str(prof)).total_calls > 0
+    summary = json.loads((tmp_path / "run.summary.json").read_text())
+    assert summary["command"] == "extract" and summary["exit_code"] == 0
+    assert summary["files"] == 2 and len(summary["slowest_files"]) == 1
+    assert summary["stages_ms"]["parse"] > 0 and summary["stages_ms"]["queries"] > 0
+    assert summary["stages_ms"]["serialization"] > 0
+    assert len(summary["top_functions"]) == 1
+
+
+def test_recursive_reports_files_over_budget_as_skipped(tmp_path, monkeypatch, capsys):
+    repo = _make_repo(tmp_path)
+    (repo / "big.py").write_text("x = 1\n" * 100)
+    _run(monkeypatch, "extract", str(repo), "--recursive", "--ext", ".py", "--max-bytes", "200")
+    output = json.loads(capsys.readouterr().out)
+    assert sorted(r["path"].replace(str(repo), "") for r in output["files"]) == ["/a.py", "/pkg/b.py"]
+    assert [r["path"].replace(str(repo), "") for r in output["skipped"]] == ["/big.py"]
+    assert output["skipped"][0]["skipped"].startswith("too_large")
+
+
+def test_binary_format_refuses_to_write_to_a_terminal(tmp_path, monkeypatch, capsys):
+    source = tmp_path / "a.py"
+    source.write_text("def a():\n    return 1\n")
+    monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+    with pytest.raises(SystemExit) as exc:
+        _run(monkeypatch, "extract", str(source), "--format", "binary")
+    assert exc.value.code == 1
+    assert "redirected stdout" in capsys.readouterr().out
+
+    out = tmp_path / "a.bin"
+    _run(monkeypatch, "extract", str(source), "--format", "binary", "--output", str(out))
+    assert out.read_bytes()
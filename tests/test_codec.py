@@ -0,0 +1,69 @@
+import pytest
+
+from codehem import CodeHem
+from codehem.models import codec
+from codehem.models.fast_element import FastCodeElementsResult
+
+
+PY_CODE = '''
+import os
+
+class Greeter:
+    """Says hello – in ünïcode."""
+    greeting: str = "żółw"
+
+    @property
+    def value(self) -> str:
+        return self.greeting
+
+    def greet(self, name: str) -> str:
+        return f"{self.greeting}, {name}"
+
+def helper(x: int = 1) -> int:
+    return x
+'''
+
+TS_CODE = '''
+import { x } from "./x";
+
+export class Service {
+    run(input: string): string {
+        return input;
+    }
+}
+'''
+
+
+def _dump(result):
+    return [el.model_dump(exclude={'range': {'node'}}) for el in result.elements]
+
+
+def test_round_trip_matches_extraction():
+    for language, code in (('python', PY_CODE), ('typescript', TS_CODE)):
+        result = CodeHem(language).extract(code)
+        blob = codec.dumps(result)
+        assert blob[:4] == codec.MAGIC
+        loaded = codec.loads(blob)
+        assert _dump(loaded) == _dump(result)
+        assert loaded.merkle_root == result.merkle_root
+        assert loaded.filter('Greeter.greet' if language == 'python' else 'Service.run') is not None
+
+
+def test_fast_loads_and_fast_results():
+    hem = CodeHem('python')
+    fast = hem.extract(PY_CODE, fast=True)
+    blob = codec.dumps(fast)
+    assert blob == codec.dumps(hem.extract(PY_CODE))
+    loaded = codec.loads(blob, fast=True)
+    assert isinstance(loaded, FastCodeElementsResult)
+    assert _dump(loaded.to_model()) == _dump(fast.to_model())
+
+
+def test_rejects_invalid_blobs():
+    blob = codec.dumps(CodeHem('python').extract(PY_CODE))
+    with pytest.raises(codec.CodecError):
+        codec.loads(b'JSON' + blob[4:])
+    with pytest.raises(codec.CodecError):
+        codec.loads(blob[:4] + (codec.VERSION + 1).to_bytes(2, 'little') + blob[6:])
+    with pytest.raises(codec.CodecError):
+        codec.loads(blob[:-3])
@@ -0,0 +1,69 @@
+from codehem import CodeHem
+from codehem.models import ElementChangeType
+
+
+OLD = """\
+class A:
+    def m(self):
+        return 1
+
+    def n(self):
+        return 2
+
+class B:
+    def z(self):
+        return 0
+
+def f():
+    return 3
+
+def g():
+    return 4
+"""
+
+NEW = """\
+class A:
+    def m(self):
+        return 1
+
+    def k(self):
+        return 5
+
+class B:
+    def z(self):
+        return 9
+
+def g():
+    return 4
+
+def f():
+    return 3
+"""
+
+
+def _changes(old, new):
+    hem = CodeHem('python')
+    return {(c.change_type, c.xpath) for c in hem.diff_elements(old, new)}
+
+
+def test_diff_identical_files_is_empty():
+    assert CodeHem('python').diff_elements(OLD, OLD) == []
+
+
+def test_diff_reports_typed_changes_by_xpath():
+    changes = _changes(OLD, NEW)
+    assert (ElementChangeType.ADDED, 'FILE.A[class].k[method]') in changes
+    assert (ElementChangeType.REMOVED, 'FILE.A[class].n[method]') in changes
+    assert (ElementChangeType.MODIFIED, 'FILE.B[class].z[method]') in changes
+    assert (ElementChangeType.MOVED, 'FILE.g[function]') in changes
+    assert not any(xpath == 'FILE.A[class].m[method]' for _, xpath in changes)
+
+
+def test_diff_detects_member_moved_between_classes():
+    old = "class A:\n    def m(self):\n        return 1\n\nclass B:\n    pass\n"
+    new = "class A:\n    pass\n\nclass B:\n    def m(self):\n        return 1\n"
+    changes = CodeHem('python').diff_elements(old, new)
+    moved = [c for c in changes if c.change_type == ElementChangeType.MOVED]
+    assert len(moved) == 1
+    assert moved[0].old_xpath == 'FILE.A[class].m[method]'
+    assert moved[0].xpath == 'FILE.B[class].m[method]'
@@ -0,0 +1,85 @@
+import pytest
+
+from codehem import CodeHem
+from codehem.core.extraction_service import ExtractionService
+from codehem.core.utils import instrumentation
+from codehem.core.utils.element_selection import categories_for_types
+from codehem.models.enums import CodeElementType
+
+
+CODE = """\
+import os
+
+class Greeter:
+    def hello(self) -> str:
+        return "hi"
+
+def main():
+    return 0
+"""
+
+
+def _extract_spans(hem, code, **kwargs):
+    instrumentation.reset()
+    CodeHem.enable_metrics()
+    try:
+        result = hem.extract(code, **kwargs)
+    finally:
+        CodeHem.enable_metrics(False)
+    spans = CodeHem.metrics(reset=True)['spans']
+    return result, sorted(name for name in spans if name.startswith('extract.'))
+
+
+def test_categories_for_types():
+    assert categories_for_types(None) is None
+    assert categories_for_types('import') == {'imports'}
+    assert categories_for_types([CodeElementType.METHOD]) == {'members', 'classes', 'interfaces', 'decorators'}
+    assert categories_for_types('function') == {'functions', 'decorators'}
+    with pytest.raises(ValueError):
+        categories_for_types({'nope'})
+
+
+def test_only_selected_extractors_run():
+    hem = CodeHem('python')
+    result, spans = _extract_spans(hem, CODE, types={'import'})
+    assert [e.type for e in result.elements] == [CodeElementType.IMPORT]
+    assert spans == ['extract.imports']
+
+    result, spans = _extract_spans(hem, CODE, types={'method'})
+    assert [e.name for e in result.elements] == ['Greeter']
+    assert [c.name for c in result.elements[0].children] == ['hello']
+    assert spans == ['extract.classes', 'extract.decorators', 'extract.methods']
+
+
+def test_extraction_service_types():
+    service = ExtractionService('python')
+    result = service.extract_all(CODE, types={'function'})
+    assert [(e.type, e.name) for e in result.elements] == [(CodeElementType.FUNCTION, 'main')]
+    assert len(service.extract_all(CODE).elements) == 3
+
+
+DECORATED = """\
+import functools
+
+@functools.total_ordering
+class Greeter:
+    @staticmethod
+    def hello() -> str:
+        return "hi"
+
+@functools.lru_cache
+def main(x: int) -> int:
+    return x
+"""
+
+
+@pytest.mark.parametrize('level', ['full', 'outline'])
+def test_selected_elements_match_full_extraction(level):
+    hem = CodeHem('python')
+    full = hem.extract(DECORATED, level=level)
+    assert hem.extract(DECORATED, types={'function'}, level=level).filter('main') == full.filter('main')
+    selected = hem.extract(DECORATED, types={'method'}, level=level)
+    assert selected.filter('Greeter.hello') == full.filter('Greeter.hello')
+    selected_class = hem.extract(DECORATED, types={'class'}, level=level).filter('Greeter')
+    assert [c.name for c in selected_class.children] == \
+        [c.name for c in full.filter('Greeter').children if c.type == CodeElementType.DECORATOR]
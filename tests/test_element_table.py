@@ -0,0 +1,98 @@
+import pytest
+
+from codehem import CodeHem
+from codehem.models import CodeElementType, ElementTable
+
+
+CODE = '''
+class Small:
+    def a(self):
+        return 1
+
+class Big:
+    def a(self):
+        return 1
+
+    def b(self):
+        x = 1
+        y = 2
+        return x + y
+
+    def c(self):
+        return 3
+
+def helper():
+    return 4
+'''
+
+
+def test_table_rows_follow_element_tree():
+    hem = CodeHem("python")
+    result = hem.extract(CODE)
+    table = ElementTable.from_result(result, "sample.py")
+    classes = table.select(type="class")
+    assert [table.names[table.name_id[i]] for i in classes] == ["Small", "Big"]
+    big = classes[1]
+    methods = table.select(type=CodeElementType.METHOD, rows=range(big, len(table)))
+    assert [table.parent[i] for i in methods] == [big, big, big]
+    row = table.row(table.select(name="helper")[0])
+    assert row["type"] == CodeElementType.FUNCTION
+    assert row["parent"] is None and row["file"] == "sample.py"
+    assert CODE.encode()[row["start_byte"]:row["end_byte"]].decode() == result.filter("helper").content
+
+
+def test_table_filters_and_aggregates():
+    hem = CodeHem("python")
+    table = ElementTable.from_result(hem.extract(CODE), "sample.py")
+    long_methods = table.select(type="method", min_lines=4)
+    assert [table.names[table.name_id[i]] for i in long_methods] == ["b"]
+    members = table.group_count("parent", rows=table.select(type="method", parent_type="class"))
+    by_class = {table.names[table.name_id[parent]]: count for parent, count in members.items()}
+    assert by_class == {"Small": 1, "Big": 3}
+    assert table.aggregate("lines", "type", "max")["method"] == 4
+    assert table.group_count("type")["function"] == 1
+
+
+def test_workspace_element_table(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.py").write_text("def f():\n    return 1\n")
+    (repo / "b.py").write_text(CODE)
+    ws = CodeHem.open_workspace(str(repo))
+    table = ws.element_table()
+    assert table.files == ["a.py", "b.py"]
+    assert table.group_count("file", rows=table.select(type=["function", "method"])) == {"a.py": 1, "b.py": 5}
+
+
+def test_concatenated_tables_match_one_table():
+    hem = CodeHem("python")
+    results = {"a.py": hem.extract("def helper():\n    return 1\n"), "b.py": hem.extract(CODE)}
+    combined = ElementTable.from_tables(ElementTable.from_result(result, path) for path, result in results.items())
+    direct = ElementTable.from_results(results)
+    assert combined.files == direct.files
+    assert [combined.row(i) for i in range(len(combined))] == [direct.row(i) for i in range(len(direct))]
+
+
+def test_numpy_and_pure_python_paths_agree(monkeypatch):
+    pytest.importorskip("numpy")
+    from codehem.models import element_table
+
+    hem = CodeHem("python")
+    table = ElementTable.from_results({"a.py": hem.extract("def helper():\n    return 1\n"), "b.py": hem.extract(CODE)})
+    methods = list(table.select(type="method"))
+    rows = methods[::-1] + methods[:1]  # Out of order, with a duplicate
+
+    def run():
+        return (
+            list(table.select(type=["method", "function"])),
+            list(table.select(type="method", parent_type="class", min_lines=2, max_lines=4)),
+            list(table.select(name=["a", "b", "c"], file="b.py", rows=rows)),
+            table.group_count("type"),
+            table.group_count("parent", rows=table.select(type="method")),
+            {func: table.aggregate("lines", "file", func) for func in ("count", "sum", "min", "max", "mean")},
+            table.aggregate("start_byte", "name", "max", rows=rows),
+        )
+
+    vectorized = run()
+    monkeypatch.setattr(element_table, "np", None)
+    assert run() == vectorized
@@ -0,0 +1,51 @@
+import pytest
+
+from codehem import CodeHem
+
+PY_SOURCES = [(f'mod{i}.py', f'class C{i}:\n    def m(self):\n        return {i}\n\ndef f{i}():\n    pass\n')
+              for i in range(12)]
+
+
+def _names(outcome):
+    return sorted(element.name for element in outcome.result.elements)
+
+
+@pytest.mark.parametrize('workers,executor', [(1, 'thread'), (3, 'thread'), (2, 'process')])
+def test_extract_many_matches_extract(workers, executor):
+    hem = CodeHem('python')
+    outcomes = list(CodeHem.extract_many(PY_SOURCES, workers=workers, executor=executor, chunk_size=2))
+    assert [outcome.index for outcome in outcomes] == list(range(len(PY_SOURCES)))
+    for outcome, (name, code) in zip(outcomes, PY_SOURCES):
+        assert outcome.ok and outcome.path == name and outcome.language == 'python'
+        assert _names(outcome) == sorted(element.name for element in hem.extract(code).elements)
+
+
+def test_extract_many_unordered_and_options():
+    outcomes = list(CodeHem.extract_many(PY_SOURCES, workers=3, executor='thread', ordered=False,
+                                         chunk_size=1, types=['class']))
+    assert sorted(outcome.index for outcome in outcomes) == list(range(len(PY_SOURCES)))
+    assert all(_names(outcome) == [f'C{outcome.index}'] for outcome in outcomes)
+
+
+def test_extract_many_reports_errors_per_item(tmp_path):
+    path = tmp_path / 'sample.ts'
+    path.write_text('export function area(r: number): number {\n  return r;\n}\n')
+    items = [str(path), str(tmp_path / 'missing.py'), ('notes.txt', '???'), ('inline.py', 'def g():\n    pass\n')]
+    outcomes = list(CodeHem.extract_many(items, workers=1))
+    assert outcomes[0].ok and outcomes[0].language == 'typescript'
+    assert [element.name for element in outcomes[0].result.elements] == ['area']
+    assert not outcomes[1].ok and 'missing.py' in outcomes[1].error
+    assert outcomes[2].error == 'unsupported_or_detection_failed'
+    assert outcomes[3].ok and outcomes[3].result.elements[0].name == 'g'
+
+
+def test_extract_many_timeout():
+    big = ('big.py', '\n'.join(f'class K{i}:\n    def m(self):\n        return {i}\n' for i in range(400)))
+    outcomes = list(CodeHem.extract_many([big, PY_SOURCES[0]], workers=1, timeout=0.001))
+    assert outcomes[0].error == 'timeout' and outcomes[0].result is None
+    assert [outcome.index for outcome in outcomes] == [0, 1]
+
+
+def test_extract_many_rejects_unknown_executor():
+    with pytest.raises(ValueError):
+        list(CodeHem.extract_many(PY_SOURCES, executor='gpu'))
@@ -0,0 +1,62 @@
+from codehem import CodeHem
+from codehem.core.components.base_implementations import clear_raw_cache
+from codehem.core.utils import instrumentation
+
+
+CODE = """\
+import os
+
+class Greeter:
+    @property
+    def name(self) -> str:
+        return "g"
+
+    def hello(self, name: str) -> str:
+        return f"hi {name}"
+
+def main(argv: list) -> int:
+    return 0
+"""
+
+TS_CODE = "class A {\n  m(x: number): number { return x; }\n}\nfunction f(a: string) { return a; }\n"
+
+
+def _child_types(element):
+    return [child.type.value for child in element.children]
+
+
+def test_outline_and_members_skip_details():
+    clear_raw_cache()
+    hem = CodeHem('python')
+    outline = hem.extract(CODE, level='outline')
+    assert sorted(e.name for e in outline.elements) == ['Greeter', 'imports', 'main']
+    assert hem.filter(outline, 'Greeter').children == []
+    assert _child_types(hem.filter(outline, 'main')) == []
+
+    members = hem.extract(CODE, level='members')
+    assert hem.filter(members, 'Greeter.hello') is not None
+    assert _child_types(hem.filter(members, 'Greeter.hello')) == []
+
+    full = hem.extract(CODE, level='full')
+    assert _child_types(hem.filter(full, 'Greeter.hello')) == ['return_value']
+    assert _child_types(hem.filter(full, 'main')) == ['return_value']
+
+
+def test_full_level_after_outline_matches_default():
+    for language, code in (('python', CODE), ('typescript', TS_CODE)):
+        hem = CodeHem(language)
+        clear_raw_cache()
+        expected = hem.extract(code).model_dump()
+        clear_raw_cache()
+        hem.extract(code, level='outline')
+        instrumentation.reset()
+        CodeHem.enable_metrics()
+        try:
+            upgraded = hem.extract(code, level='full')
+        finally:
+            CodeHem.enable_metrics(False)
+        counters = CodeHem.metrics(reset=True)['counters']
+        assert upgraded.model_dump() == expected
+        # The cached tree is reused
+        assert 'parse.bytes' not in counters
+        assert counters['extract.cache_hit'] == 1
@@ -0,0 +1,66 @@
+from codehem import CodeHem
+from codehem.models.code_element import CodeElement, CodeElementsResult
+from codehem.models.fast_element import FastCodeElement, FastCodeElementsResult
+
+
+PY_CODE = '''
+import os
+
+class A:
+    x: int = 1
+
+    @property
+    def value(self) -> int:
+        return self.x
+
+    def m(self, a: int) -> str:
+        return str(a)
+
+def f():
+    return 2
+'''
+
+TS_CODE = '''
+import { x } from "./x";
+
+export class Service {
+    private count: number = 0;
+
+    run(input: string): string {
+        return input;
+    }
+}
+
+export function helper(): number {
+    return 1;
+}
+'''
+
+
+def _dump(result):
+    # tree-sitter nodes in additional_data differ between runs; compare the rest
+    return [el.model_dump(exclude={'range': {'node'}, 'additional_data': True}) for el in result.elements]
+
+
+def test_fast_result_converts_to_default_result():
+    for language, code in (('python', PY_CODE), ('typescript', TS_CODE)):
+        hem = CodeHem(language)
+        fast = hem.extract(code, fast=True)
+        default = hem.extract(code)
+        assert isinstance(fast, FastCodeElementsResult)
+        assert all(isinstance(el, FastCodeElement) for el in fast.elements)
+        assert isinstance(default, CodeElementsResult)
+        assert all(isinstance(el, CodeElement) for el in default.elements)
+        converted = fast.to_model()
+        assert _dump(converted) == _dump(default)
+        assert converted.merkle_root == fast.merkle_root == default.merkle_root
+
+
+def test_fast_result_supports_result_helpers():
+    hem = CodeHem('python')
+    fast = hem.extract(PY_CODE, fast=True)
+    cls = fast.filter('A')
+    assert [m.name for m in cls.children if m.is_method] == ['m']
+    assert [f.name for f in fast.functions] == ['f']
+    assert cls.merkle_hash == cls.to_model().merkle_hash
+    assert cls.fragment_hash(cls.content) == cls.to_model().fragment_hash(cls.content)
@@ -0,0 +1,68 @@
+import pytest
+
+from codehem import CodeHem
+from codehem.core.utils import instrumentation
+from codehem.core.utils.instrumentation import MetricsSink, instrumented, span
+
+
+CODE = "class A:\n    def m(self):\n        return 1\n\ndef f():\n    return 2\n"
+
+
+@pytest.fixture
+def metrics():
+    instrumentation.reset()
+    CodeHem.enable_metrics()
+    yield
+    CodeHem.enable_metrics(False)
+    instrumentation.reset()
+
+
+def test_disabled_records_nothing():
+    instrumentation.reset()
+    CodeHem("python").extract(CODE)
+    assert CodeHem.metrics() == {"enabled": False, "spans": {}, "counters": {}}
+
+
+def test_extract_and_patch_spans(metrics):
+    hem = CodeHem("python")
+    hem.extract(CODE)
+    hem.apply_patch(CODE, "f", "def f():\n    return 3")
+    snapshot = CodeHem.metrics(reset=True)
+    spans = snapshot["spans"]
+    for name in ("extract", "parse", "query", "extract.functions", "extract.classes", "process_all",
+                 "process_classes", "to_model", "apply_patch"):
+        assert spans[name]["count"] >= 1, name
+    extract = spans["extract"]
+    assert extract["self_ms"] < extract["total_ms"]
+    assert snapshot["counters"]["parse.bytes"] == len(CODE)
+    assert CodeHem.metrics()["spans"] == {}
+
+
+def test_nested_spans_and_sinks(metrics):
+    events = []
+
+    class Sink(MetricsSink):
+        def on_span(self, name, path, duration, self_duration):
+            events.append((name, path))
+
+        def on_counter(self, name, value):
+            events.append((name, value))
+
+    @instrumented("inner")
+    def inner():
+        instrumentation.count("calls")
+
+    sink = Sink()
+    instrumentation.add_sink(sink)
+    try:
+        with span("outer"):
+            inner()
+            inner()
+    finally:
+        instrumentation.remove_sink(sink)
+    assert events == [("calls", 1), ("inner", ("outer",)), ("calls", 1), ("inner", ("outer",)), ("outer", ())]
+    snapshot = instrumentation.snapshot()
+    assert snapshot["spans"]["inner"]["count"] == 2
+    assert snapshot["counters"] == {"calls": 2}
+    outer = snapshot["spans"]["outer"]
+    assert outer["self_ms"] == pytest.approx(outer["total_ms"] - snapshot["spans"]["inner"]["total_ms"], abs=1e-3)
@@ -0,0 +1,54 @@
+from codehem import CodeHem
+
+
+CODE = """\
+import os
+
+class Greeter:
+    def hello(self, name: str) -> str:
+        return f"hi {name}"
+
+    def bye(self) -> str:
+        return "bye ż"
+
+def main():
+    return Greeter().hello("x")
+"""
+
+
+def _walk(elements):
+    for element in elements:
+        yield element
+        yield from _walk(element.children)
+
+
+def test_lazy_content_is_decoded_on_first_access():
+    hem = CodeHem('python')
+    result = hem.extract(CODE, lazy_content=True)
+    cls = hem.filter(result, 'Greeter')
+    assert not cls.is_content_materialized
+    assert cls.content.startswith("class Greeter:")
+    assert cls.is_content_materialized
+    assert not hem.filter(result, 'Greeter.bye').is_content_materialized
+
+
+def test_lazy_result_matches_eager_result():
+    for language, code in (('python', CODE), ('typescript', "class A {\n  m(): number { return 1; }\n}\n")):
+        hem = CodeHem(language)
+        eager = hem.extract(code)
+        lazy = hem.extract(code, lazy_content=True)
+        assert lazy.merkle_root == eager.merkle_root
+        assert [e.content for e in _walk(lazy.elements)] == [e.content for e in _walk(eager.elements)]
+        dumped = hem.extract(code, lazy_content=True).model_dump()
+        assert [e['content'] for e in dumped['elements']] == [e.content for e in eager.elements]
+
+
+def test_lazy_elements_compare_equal_to_eager_ones():
+    hem = CodeHem('python')
+    eager = hem.extract(CODE)
+    lazy = hem.extract(CODE, lazy_content=True)
+    assert lazy.elements == eager.elements
+    dumped = hem.extract(CODE, lazy_content=True)
+    dumped.model_dump()
+    assert dumped.elements == eager.elements
+    assert list(dumped.elements[1].model_dump()) == list(eager.elements[1].model_dump())
@@ -0,0 +1,47 @@
+import pytest
+from tree_sitter import Node
+
+from codehem import CodeHem
+from codehem.core.utils import node_retention
+from codehem.core.utils.node_retention import NodeRef
+
+
+CODE = "import os\nfrom x import y\n\nclass A:\n    def m(self):\n        return 1\n"
+
+
+def _import_nodes(result):
+    return [item.get("node") for item in result.elements[0].additional_data["individual_imports"]]
+
+
+def test_default_results_drop_nodes():
+    hem = CodeHem("python")
+    result = hem.extract(CODE)
+    assert _import_nodes(result) == [None, None]
+    assert all(el.range.node is None for el in result.elements)
+    # Without live nodes the whole result serializes
+    assert '"name":"A"' in result.model_dump_json()
+    cached = hem.extraction.extract_all(CODE)
+    assert not any(isinstance(node, Node) for node in _import_nodes(cached))
+
+
+def test_full_retention_keeps_live_nodes():
+    result = CodeHem("python").extract(CODE, node_retention="full")
+    assert all(isinstance(node, Node) for node in _import_nodes(result))
+
+
+def test_weak_retention_resolves_until_tree_evicted(monkeypatch):
+    monkeypatch.setattr(node_retention, "LIVE_TREE_LIMIT", 1)
+    hem = CodeHem("python")
+    result = hem.extract(CODE, node_retention="weak")
+    ref = _import_nodes(result)[0]
+    assert isinstance(ref, NodeRef)
+    node = ref.resolve()
+    assert node.type == "import_statement" and node.text == b"import os"
+    hem.extract("def other():\n    pass\n", node_retention="weak")
+    hem.extract("import sys\n", node_retention="weak")
+    assert not ref.alive and ref.resolve() is None
+
+
+def test_unknown_retention_policy_is_rejected():
+    with pytest.raises(ValueError):
+        CodeHem("python").extract(CODE, node_retention="sometimes")
@@ -38,3 +38,43 @@ def test_apply_patch_conflict():
     wrong_hash = '0' * 64
     with pytest.raises(WriteConflictError):
         hem.apply_patch(SAMPLE_CODE, xpath, 'print()', original_hash=wrong_hash)
+
+
+def test_element_hash_is_memoized_without_reextraction(monkeypatch):
+    hem = CodeHem('python')
+    xpath = 'foo[function]'
+    original_hash = hem.get_element_hash(SAMPLE_CODE, xpath)
+    calls = []
+    original_raw = hem.extraction._extract_file_raw
+    monkeypatch.setattr(
+        hem.extraction,
+        '_extract_file_raw',
+        lambda code: calls.append(code) or original_raw(code),
+    )
+    assert hem.get_element_hash(SAMPLE_CODE, xpath) == original_hash
+    hem.apply_patch(SAMPLE_CODE, xpath, "def foo():\n    return 2", original_hash=original_hash)
+    assert calls == []
+
+
+def test_blake2b_hash_algorithm():
+    hem = CodeHem('python', hash_algorithm='blake2b')
+    xpath = 'foo[function]'
+    original_hash = hem.get_element_hash(SAMPLE_CODE, xpath)
+    assert len(original_hash) == 128
+    result = hem.apply_patch(SAMPLE_CODE, xpath, "def foo():\n    return 2", original_hash=original_hash)
+    assert result['new_hash'] == hem.get_element_hash(result['code'], xpath)
+    with pytest.raises(ValueError):
+        CodeHem('python', hash_algorithm='md5')
+
+
+def test_conflict_check_needs_no_second_lookup(monkeypatch):
+    code = (
+        "import functools\n\nclass A:\n    @property\n    def value(self):\n        return 1\n\n"
+        "    def run(self):\n        return 2\n\n@functools.lru_cache\ndef foo():\n    return 1\n"
+    )
+    hem = CodeHem('python')
+    xpaths = ['A[class]', 'A.run[method]', 'A.value[property_getter]', 'foo[function]']
+    hashes = {xpath: hem.get_element_hash(code, xpath) for xpath in xpaths}
+    monkeypatch.setattr(CodeHem, 'get_element_hash', lambda *args: pytest.fail('second lookup'))
+    for xpath, original_hash in hashes.items():
+        assert hem.apply_patch(code, xpath, 'pass', original_hash=original_hash)['status'] == 'ok'
@@ -0,0 +1,115 @@
+import io
+import json
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from codehem.server import INVALID_PARAMS, METHOD_NOT_FOUND, PARSE_ERROR, WRITE_CONFLICT, CodeHemServer
+
+
+CODE = "class A:\n    def m(self):\n        return 1\n\ndef f():\n    return 2\n"
+
+
+def _call(server, method, request_id=1, **params):
+    return server.handle({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+
+
+def test_extract_query_and_get_text():
+    server = CodeHemServer()
+    extracted = _call(server, "extract", code=CODE)["result"]
+    assert extracted["language"] == "python"
+    assert sorted(el["name"] for el in extracted["elements"]) == ["A", "f"]
+    assert _call(server, "query", code=CODE, xpath="A.m")["result"]["type"] == "method"
+    assert _call(server, "get_text", code=CODE, xpath="f")["result"] == "def f():\n    return 2"
+    assert _call(server, "detect", code=CODE)["result"]["functions"] == 1
+
+
+def test_errors_and_notifications():
+    server = CodeHemServer()
+    assert _call(server, "nope")["error"]["code"] == METHOD_NOT_FOUND
+    assert _call(server, "extract")["error"]["code"] == INVALID_PARAMS
+    assert json.loads(server.handle_line("{oops"))["error"]["code"] == PARSE_ERROR
+    assert server.handle({"jsonrpc": "2.0", "method": "ping"}) is None
+    conflict = _call(server, "patch", code=CODE, xpath="f", new_code="def f():\n    return 3", original_hash="bad")
+    assert conflict["error"]["code"] == WRITE_CONFLICT
+
+
+def test_patch_through_workspace(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "sample.py").write_text(CODE)
+    server = CodeHemServer(workspace_root=str(repo))
+    assert _call(server, "workspace.find", name="f", kind="function")["result"] == {
+        "file": "sample.py", "xpath": "FILE.f[function]"}
+    _call(server, "patch", path="sample.py", xpath="f", new_code="def f():\n    return 3")
+    assert "return 3" in (repo / "sample.py").read_text()
+    assert _call(server, "workspace.refresh", path="sample.py")["result"] == {"changed": False}
+
+
+def test_stdio_stops_on_shutdown():
+    requests = [
+        {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+        {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+        {"jsonrpc": "2.0", "id": 3, "method": "ping"},
+    ]
+    out = io.StringIO()
+    CodeHemServer().serve_stdio(io.StringIO("\n".join(map(json.dumps, requests)) + "\n"), out)
+    assert [json.loads(line)["id"] for line in out.getvalue().splitlines()] == [1, 2]
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets")
+def test_unix_socket_round_trip(tmp_path):
+    path = str(tmp_path / "codehem.sock")
+    server = CodeHemServer()
+    thread = threading.Thread(target=server.serve_unix_socket, args=(path,), daemon=True)
+    thread.start()
+    for _ in range(100):
+        if os.path.exists(path):
+            break
+        time.sleep(0.02)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        stream = client.makefile("rw", encoding="utf8")
+        stream.write(json.dumps({"jsonrpc": "2.0", "id": 1, "method": "get_text",
+                                 "params": {"code": CODE, "xpath": "A.m"}}) + "\n")
+        stream.write(json.dumps({"jsonrpc": "2.0", "id": 2, "method": "shutdown"}) + "\n")
+        stream.flush()
+        assert json.loads(stream.readline())["result"].endswith("return 1")
+        assert json.loads(stream.readline())["result"] is True
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets")
+def test_unix_socket_only_replaces_stale_sockets(tmp_path):
+    regular = tmp_path / "notes.txt"
+    regular.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        CodeHemServer().serve_unix_socket(str(regular))
+    assert regular.read_text() == "keep me"
+
+    path = str(tmp_path / "codehem.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as live:
+        live.bind(path)
+        live.listen(1)
+        with pytest.raises(FileExistsError):
+            CodeHemServer().serve_unix_socket(path)
+    assert os.path.exists(path)  # Left behind by a closed listener: stale
+
+    server = CodeHemServer()
+    thread = threading.Thread(target=server.serve_unix_socket, args=(path,), daemon=True)
+    thread.start()
+    for _ in range(100):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(path)
+                client.sendall((json.dumps({"jsonrpc": "2.0", "id": 1, "method": "shutdown"}) + "\n").encode("utf8"))
+                client.recv(1024)
+            break
+        except OSError:
+            time.sleep(0.02)
+    thread.join(timeout=5)
+    assert not thread.is_alive()
@@ -0,0 +1,107 @@
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from codehem import CodeHem
+from codehem.core.engine.languages import get_parser
+
+PY_CODE = "\n".join(
+    f"class Service{i}:\n    @property\n    def value(self) -> int:\n        return {i}\n\n"
+    f"    def run(self, x: int = {i}) -> int:\n        return x\n\ndef helper{i}(a, b):\n    return a + b\n"
+    for i in range(12)
+)
+TS_CODE = "\n".join(
+    f"export class Widget{i} {{\n  static count = {i};\n  get size(): number {{ return {i}; }}\n"
+    f"  render(x: number): number {{ return x; }}\n}}\n\nexport function make{i}(a: number): number {{\n  return a;\n}}\n"
+    for i in range(12)
+)
+SOURCES = [('python', PY_CODE), ('typescript', TS_CODE)]
+
+
+def _work(language, code, variant):
+    hem = CodeHem(language)
+    source = code + f"\n// {variant}\n" if language == 'typescript' else code + f"\n# {variant}\n"
+    return (
+        hem.extract(source).model_dump(),
+        hem.extract(source, level='outline').model_dump(),
+        hem.get_text_by_xpath(source, 'Service3.value[property_getter]' if language == 'python' else 'Widget3.render'),
+        hem.find_by_xpath(source, 'helper7' if language == 'python' else 'make7'),
+    )
+
+
+def _expected():
+    return {language: _work(language, code, 'v') for language, code in SOURCES}
+
+
+def test_threads_share_caches_safely():
+    expected = _expected()
+    barrier = threading.Barrier(8)
+
+    def worker(n):
+        barrier.wait()
+        language, code = SOURCES[n % 2]
+        # Half the threads hit the same content (shared cache entries), half use their own
+        return language, _work(language, code, 'v' if n < 4 else f'own{n}')
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(worker, range(8)))
+    for language, (full, outline, text, location) in results:
+        exp_full, exp_outline, exp_text, exp_location = expected[language]
+        assert len(full['elements']) == len(exp_full['elements'])
+        assert [e['name'] for e in outline['elements']] == [e['name'] for e in exp_outline['elements']]
+        assert text == exp_text and location == exp_location
+
+
+def test_parsers_are_per_thread():
+    parsers = []
+    thread = threading.Thread(target=lambda: parsers.append(get_parser('python')))
+    thread.start()
+    thread.join()
+    assert get_parser('python') is get_parser('python')
+    assert parsers[0] is not get_parser('python')
+
+
+def test_concurrent_cold_start():
+    # Fresh interpreter: threads race to load languages and create their services
+    code = (
+        "import threading\n"
+        "from concurrent.futures import ThreadPoolExecutor\n"
+        "from codehem import CodeHem\n"
+        "from codehem.core.language_service import LanguageService\n"
+        "from codehem.core.registry import registry\n"
+        "barrier = threading.Barrier(8)\n"
+        "def work(n):\n"
+        "    barrier.wait()\n"
+        "    language = ('python', 'typescript')[n % 2]\n"
+        "    hem = CodeHem(language)\n"
+        "    code = 'class A:\\n    def f(self):\\n        pass\\n' if n % 2 == 0 else 'class A {\\n  f(): void {}\\n}\\n'\n"
+        "    return language, id(registry.get_language_service(language)), [e.name for e in hem.extract(code).elements]\n"
+        "with ThreadPoolExecutor(8) as pool:\n"
+        "    results = list(pool.map(work, range(8)))\n"
+        "print(len({(l, s) for l, s, _ in results}), all(names == ['A'] for _, _, names in results))\n"
+        "print(sorted(LanguageService._instances) == ['python', 'typescript'])\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split()
+    assert out == ["2", "True", "True"]
+
+
+def test_thread_scaling_benchmark():
+    hem = CodeHem('python')
+    hem.extract(PY_CODE)  # Warm up services and queries
+
+    def run(workers):
+        # Distinct content per run, so no run reuses cached results of another
+        codes = [PY_CODE + f"\n# scale {workers} {i}\n" for i in range(16)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda code: len(hem.extract(code).elements), codes))
+        return time.perf_counter() - start, results
+
+    serial, serial_counts = run(1)
+    parallel, parallel_counts = run(4)
+    assert parallel_counts == serial_counts
+    if not getattr(sys, '_is_gil_enabled', lambda: True)():
+        # Only a free-threaded build can run extractions in parallel
+        assert serial / parallel > 1.5
@@ -47,3 +47,36 @@ def test_workspace_apply_patch_locked(tmp_path):
     assert not errors
     content = sample.read_text()
     assert "return" in content
+
+
+def test_workspace_refresh_uses_merkle_roots(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    sample = repo / "sample.py"
+    sample.write_text("def calculate(x):\n    return x * 2\n")
+
+    ws = CodeHem.open_workspace(str(repo))
+    root = ws.file_hashes["sample.py"]
+    assert ws.refresh("sample.py") is False
+
+    sample.write_text("def compute(x):\n    return x * 3\n")
+    assert ws.refresh("sample.py") is True
+    assert ws.file_hashes["sample.py"] != root
+    assert ws.find(name="calculate", kind="function") is None
+    assert ws.find(name="compute", kind="function") == ("sample.py", "FILE.compute[function]")
+
+
+def test_workspace_refresh_forgets_deleted_files(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "keep.py").write_text("def keep():\n    return 1\n")
+    gone = repo / "gone.py"
+    gone.write_text("def gone():\n    return 2\n")
+
+    ws = CodeHem.open_workspace(str(repo))
+    assert ws.find("gone", "function") == ("gone.py", "FILE.gone[function]")
+    gone.unlink()
+    assert ws.refresh("gone.py") is True
+    assert ws.find("gone", "function") is None
+    assert "gone.py" not in ws.file_hashes and "gone.py" not in ws.tables
+    assert ws.find("keep", "function") == ("keep.py", "FILE.keep[function]")
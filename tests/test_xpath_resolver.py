@@ -0,0 +1,128 @@
+from codehem import CodeHem
+from codehem.core.engine.xpath_parser import XPathParser
+from codehem.core.engine.xpath_resolver import get_xpath_resolver
+from codehem.core.utils import instrumentation
+
+
+PY_CODE = """\
+import os
+
+@dataclass
+class Greeter:
+    greeting = "hi"
+
+    def __init__(self):
+        self.count = 0
+
+    @property
+    def name(self) -> str:
+        return "g"
+
+    @name.setter
+    def name(self, value):
+        pass
+
+    @staticmethod
+    def make():
+        def helper():
+            pass
+        return Greeter()
+
+@cache
+def main():
+    return 0
+
+def outer():
+    def helper():
+        pass
+"""
+
+TS_CODE = """\
+export class Circle {
+  static count = 0;
+  private r: number;
+
+  get radius(): number { return this.r; }
+  set radius(v: number) { this.r = v; }
+
+  area(): number {
+    return 3.14;
+  }
+}
+
+export function helper(x: number): number {
+  return x;
+}
+"""
+
+
+def _xpaths(result):
+    for element in result.elements:
+        if element.type.value == 'import':
+            continue
+        yield element.name
+        yield f'{element.name}[{element.type.value}]'
+        for child in element.children:
+            if child.type.value in ('parameter', 'return_value', 'decorator'):
+                continue
+            for suffix in ('', f'[{child.type.value}]', '[property]', '[method]'):
+                yield f'{element.name}.{child.name}{suffix}'
+
+
+def test_resolver_matches_extraction():
+    for language, code in (('python', PY_CODE), ('typescript', TS_CODE)):
+        hem = CodeHem(language)
+        resolver = get_xpath_resolver(language)
+        answered = 0
+        for xpath in _xpaths(hem.extraction.extract_all(code)):
+            xpath = 'FILE.' + xpath
+            skeleton = resolver.resolve(code, XPathParser.parse(xpath))
+            element = skeleton.filter(xpath) if skeleton is not None else None
+            if element is None:
+                continue
+            answered += 1
+            expected = hem.extraction.extract_all(code).filter(xpath)
+            assert (element.type, element.range.start_line, element.range.end_line) == \
+                (expected.type, expected.range.start_line, expected.range.end_line), xpath
+        assert answered > 5
+
+
+def test_resolver_defers_when_ambiguous():
+    resolver = get_xpath_resolver('python')
+    # Two functions named 'helper' and instance attributes are left to extraction
+    assert resolver.resolve(PY_CODE, XPathParser.parse('FILE.helper')) is None
+    assert resolver.resolve(PY_CODE, XPathParser.parse('FILE.Greeter.count[property]')) is None
+    hem = CodeHem('python')
+    expected = hem.extraction.extract_all(PY_CODE).filter('FILE.helper')
+    assert hem.find_by_xpath(PY_CODE, 'helper') == (expected.range.start_line, expected.range.end_line)
+
+
+def test_single_element_lookups_skip_extraction():
+    hem = CodeHem('python')
+    code = PY_CODE + "\n# variant\n"
+    instrumentation.reset()
+    CodeHem.enable_metrics()
+    try:
+        assert hem.get_text_by_xpath(code, 'Greeter.name[property_getter][body]').strip() == 'return "g"'
+        patched = hem.apply_patch(code, 'main', 'def main():\n    return 1')
+    finally:
+        CodeHem.enable_metrics(False)
+    snapshot = CodeHem.metrics(reset=True)
+    assert 'return 1' in patched['code']
+    assert 'extract.raw' not in snapshot['spans']
+    assert snapshot['counters']['xpath.resolved'] >= 2
+
+
+def test_lookups_fall_back_when_the_resolver_fails(monkeypatch):
+    def broken(self, code, xpath_nodes):
+        raise RuntimeError('resolver bug')
+
+    for language, code, xpath in (
+        ('python', PY_CODE + "\n# broken\n", 'Greeter.name[property_getter][body]'),
+        ('typescript', TS_CODE + "\n// broken\n", 'Circle.area'),
+    ):
+        hem = CodeHem(language)
+        expected = hem.get_text_by_xpath(code, xpath)
+        monkeypatch.setattr(type(get_xpath_resolver(language)), 'resolve', broken)
+        assert expected and hem.get_text_by_xpath(code, xpath) == expected
+        monkeypatch.undo()